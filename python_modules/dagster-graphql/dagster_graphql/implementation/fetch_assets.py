@@ -13,6 +13,7 @@
 from dagster import _check as check
 from dagster._core.definitions.asset_graph import AssetGraph
 from dagster._core.definitions.freshness_policy import FreshnessPolicy
+from dagster._core.definitions.partition import PartitionsDefinition, PartitionsSubset
 from dagster._core.events import ASSET_EVENTS
 from dagster._core.host_representation.external import ExternalRepository
 from dagster._core.host_representation.external_data import (
@@ -20,6 +21,7 @@
     ExternalPartitionDimensionDefinition,
 )
 from dagster._core.host_representation.repository_location import RepositoryLocation
+from dagster._core.storage.partition_status_cache import get_and_update_asset_status_cache_values
 from dagster._core.storage.tags import get_dimension_from_partition_tag
 from dagster._utils.caching_instance_queryer import CachingInstanceQueryer
 
@@ -224,6 +226,13 @@ def get_asset_observations(
     check.opt_float_param(before_timestamp, "before_timestamp")
     check.opt_float_param(after_timestamp, "after_timestamp")
     instance = graphene_info.context.instance
+
+    if limit == 1 and not partitions and before_timestamp is None and after_timestamp is None:
+        # the latest observation is kept on the asset record by storages that track it
+        asset_records = instance.get_asset_records([asset_key])
+        if asset_records and asset_records[0].asset_entry.last_observation:
+            return [asset_records[0].asset_entry.last_observation]
+
     event_records = instance.get_event_records(
         EventRecordsFilter(
             event_type=DagsterEventType.ASSET_OBSERVATION,
@@ -243,11 +252,14 @@ def get_asset_run_ids(graphene_info, asset_key):
     return instance.run_ids_for_asset_key(asset_key)
 
 
-def get_assets_for_run_id(graphene_info, run_id):
+def get_assets_for_run_id(graphene_info, run_id, batch_loader=None):
     from ..schema.pipelines.pipeline import GrapheneAsset
 
     check.str_param(run_id, "run_id")
 
+    if batch_loader:
+        return [GrapheneAsset(key=asset_key) for asset_key in batch_loader.get_asset_keys(run_id)]
+
     records = graphene_info.context.instance.all_logs(run_id, of_type=ASSET_EVENTS)
     asset_keys = set(
         [
@@ -371,6 +383,23 @@ def get_materialization_cts_by_partition(
     return ordered_materialization_counts
 
 
+def get_partition_subsets(
+    graphene_info, asset_key: AssetKey, partitions_def: PartitionsDefinition
+) -> Tuple[PartitionsSubset, PartitionsSubset, PartitionsSubset]:
+    """Returns the materialized, failed and in-progress partitions of the asset, from the partition
+    status cache of the asset, which is brought up to date with the asset events stored since it
+    was last updated.
+    """
+    cache_value = get_and_update_asset_status_cache_values(
+        graphene_info.context.instance, {asset_key: partitions_def}
+    )[asset_key]
+    return (
+        cache_value.deserialize_materialized_partition_subsets(partitions_def),
+        cache_value.deserialize_failed_partition_subsets(partitions_def),
+        cache_value.deserialize_in_progress_partition_subsets(partitions_def),
+    )
+
+
 def get_freshness_info(
     asset_key: AssetKey,
     freshness_policy: FreshnessPolicy,
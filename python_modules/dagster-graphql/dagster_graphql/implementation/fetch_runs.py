@@ -17,6 +17,7 @@
 
 from .events import from_event_record
 from .external import ensure_valid_config, get_external_pipeline_or_raise
+from .loader import RunScopedBatchLoader
 from .utils import UserFacingGraphQLError, capture_error
 
 if TYPE_CHECKING:
@@ -92,9 +93,13 @@ def get_run_group(graphene_info, run_id):
         record.pipeline_run.run_id: record
         for record in instance.get_run_records(RunsFilter(run_ids=run_group_run_ids))
     }
+    batch_loader = RunScopedBatchLoader(instance, records_by_id.values())
     return GrapheneRunGroup(
         root_run_id=root_run_id,
-        runs=[GrapheneRun(records_by_id.get(run_id)) for run_id in run_group_run_ids],
+        runs=[
+            GrapheneRun(records_by_id.get(run_id), batch_loader)
+            for run_id in run_group_run_ids
+        ],
     )
 
 
@@ -107,10 +112,10 @@ def get_runs(graphene_info, filters, cursor=None, limit=None):
 
     instance = graphene_info.context.instance
 
-    return [
-        GrapheneRun(record)
-        for record in instance.get_run_records(filters=filters, cursor=cursor, limit=limit)
-    ]
+    records = instance.get_run_records(filters=filters, cursor=cursor, limit=limit)
+    # resolves the stats, assets and execution plans of the runs on the page in bulk
+    batch_loader = RunScopedBatchLoader(instance, records)
+    return [GrapheneRun(record, batch_loader) for record in records]
 
 
 PENDING_STATUSES = [
@@ -225,12 +230,30 @@ def _get_in_progress_runs_for_assets(
     in_progress_run_ids_by_asset = defaultdict(set)
     unstarted_run_ids_by_asset = defaultdict(set)
 
+    instance = graphene_info.context.instance
+
+    # runs launched from the same job and selection share an execution plan snapshot, and the step
+    # stats of every run that has started are fetched in one query
+    step_keys_by_snapshot_id: Dict[str, Sequence[str]] = {}
+    for record in in_progress_records:
+        snapshot_id = record.pipeline_run.execution_plan_snapshot_id
+        if snapshot_id not in step_keys_by_snapshot_id:
+            step_keys_by_snapshot_id[snapshot_id] = instance.get_execution_plan_snapshot(
+                snapshot_id
+            ).step_keys_to_execute
+
+    step_stats_by_run_id = instance.event_log_storage.get_step_stats_for_runs(
+        [
+            record.pipeline_run.run_id
+            for record in in_progress_records
+            if record.pipeline_run.status in IN_PROGRESS_STATUSES
+        ]
+    )
+
     for record in in_progress_records:
         run = record.pipeline_run
         asset_selection = run.asset_selection
-        run_step_keys = graphene_info.context.instance.get_execution_plan_snapshot(
-            run.execution_plan_snapshot_id
-        ).step_keys_to_execute
+        run_step_keys = step_keys_by_snapshot_id[run.execution_plan_snapshot_id]
 
         selected_assets = (
             set.union(*[asset_key_by_step_key[run_step_key] for run_step_key in run_step_keys])
@@ -239,9 +262,12 @@ def _get_in_progress_runs_for_assets(
         )  # only display in progress/unstarted indicators for selected assets
 
         if run.status in IN_PROGRESS_STATUSES:
-            step_stats = graphene_info.context.instance.get_run_step_stats(
-                run.run_id, run_step_keys
-            )
+            run_step_key_set = set(run_step_keys)
+            step_stats = [
+                step_stat
+                for step_stat in step_stats_by_run_id.get(run.run_id, [])
+                if step_stat.step_key in run_step_key_set
+            ]
             # Build mapping of asset to all the step stats that generate the asset
             step_stats_by_asset: Dict[AssetKey, List[RunStepKeyStatsSnapshot]] = defaultdict(list)
             for step_stat in step_stats:
@@ -290,9 +316,11 @@ def get_run_groups(graphene_info, filters=None, cursor=None, limit=None):
         for record in instance.get_run_records(RunsFilter(run_ids=list(run_ids)))
     }
 
+    batch_loader = RunScopedBatchLoader(instance, records_by_ids.values())
     for root_run_id in run_groups:
         run_groups[root_run_id]["runs"] = [
-            GrapheneRun(records_by_ids.get(run.run_id)) for run in run_groups[root_run_id]["runs"]
+            GrapheneRun(records_by_ids.get(run.run_id), batch_loader)
+            for run in run_groups[root_run_id]["runs"]
         ]
 
     return [
@@ -336,18 +364,24 @@ def get_execution_plan(graphene_info, selector, run_config, mode):
 
 
 @capture_error
-def get_stats(graphene_info, run_id):
+def get_stats(graphene_info, run_id, batch_loader=None):
     from ..schema.pipelines.pipeline_run_stats import GrapheneRunStatsSnapshot
 
-    stats = graphene_info.context.instance.get_run_stats(run_id)
+    if batch_loader:
+        stats = batch_loader.get_run_stats(run_id)
+    else:
+        stats = graphene_info.context.instance.get_run_stats(run_id)
     stats.id = "stats-{run_id}"
     return GrapheneRunStatsSnapshot(stats)
 
 
-def get_step_stats(graphene_info, run_id, step_keys=None):
+def get_step_stats(graphene_info, run_id, step_keys=None, batch_loader=None):
     from ..schema.logs.events import GrapheneRunStepStats
 
-    step_stats = graphene_info.context.instance.get_run_step_stats(run_id, step_keys)
+    if batch_loader and not step_keys:
+        step_stats = batch_loader.get_step_stats(run_id)
+    else:
+        step_stats = graphene_info.context.instance.get_run_step_stats(run_id, step_keys)
     return [GrapheneRunStepStats(stats) for stats in step_stats]
 
 
@@ -15,7 +15,9 @@
     extract_logical_version_from_entry,
     extract_logical_version_provenance_from_entry,
 )
+from dagster._core.events import ASSET_EVENTS
 from dagster._core.events.log import EventLogEntry
+from dagster._core.execution.stats import RunStepKeyStatsSnapshot
 from dagster._core.host_representation import ExternalRepository
 from dagster._core.host_representation.external_data import (
     ExternalAssetDependedBy,
@@ -23,7 +25,14 @@
     ExternalAssetNode,
 )
 from dagster._core.scheduler.instigation import InstigatorType
-from dagster._core.storage.pipeline_run import JobBucket, RunRecord, RunsFilter, TagBucket
+from dagster._core.snap import ExecutionPlanSnapshot
+from dagster._core.storage.pipeline_run import (
+    JobBucket,
+    PipelineRunStatsSnapshot,
+    RunRecord,
+    RunsFilter,
+    TagBucket,
+)
 from dagster._core.storage.tags import REPOSITORY_LABEL_TAG, SCHEDULE_NAME_TAG, SENSOR_NAME_TAG
 from dagster._core.workspace.context import WorkspaceRequestContext
 from dagster._utils.cached_method import cached_method
@@ -311,6 +320,102 @@ def _fetch(self) -> None:
             self._records[record.pipeline_run.run_id] = record
 
 
+class RunDataType(Enum):
+    RUN_STATS = "run_stats"
+    STEP_STATS = "step_stats"
+    ASSET_KEYS = "asset_keys"
+    EXECUTION_PLAN_SNAPSHOTS = "execution_plan_snapshots"
+
+
+class RunScopedBatchLoader:
+    """
+    A batch loader that fetches an assortment of data for a set of runs, e.g. the runs on a page of
+    the runs feed.  This loader is expected to be instantiated once with the run records that are
+    resolved together, and then passed to the graphene object for each of those runs.
+
+    Each type of data is fetched for every run the first time it is requested for any run, in a
+    single query across runs where the storage supports it, instead of one query per run.
+    """
+
+    def __init__(self, instance: DagsterInstance, records: Iterable[RunRecord]):
+        self._instance = instance
+        self._records: Dict[str, RunRecord] = {
+            record.pipeline_run.run_id: record for record in records
+        }
+        self._data: Dict[RunDataType, Mapping[str, Any]] = {}
+
+    def _get(self, data_type: RunDataType, run_id: str) -> Any:
+        check.inst_param(data_type, "data_type", RunDataType)
+        check.str_param(run_id, "run_id")
+        if run_id not in self._records:
+            check.failed(
+                f"Run id {run_id} not recognized for this loader.  Expected one of: "
+                f"{list(self._records.keys())}"
+            )
+        if data_type not in self._data:
+            self._fetch(data_type)
+        return self._data[data_type].get(run_id)
+
+    def _fetch(self, data_type: RunDataType) -> None:
+        check.inst_param(data_type, "data_type", RunDataType)
+
+        run_ids = list(self._records.keys())
+        event_log_storage = self._instance.event_log_storage
+        fetched: Mapping[str, Any]
+
+        if data_type == RunDataType.RUN_STATS:
+            fetched = event_log_storage.get_stats_for_runs(run_ids)
+
+        elif data_type == RunDataType.STEP_STATS:
+            fetched = event_log_storage.get_step_stats_for_runs(run_ids)
+
+        elif data_type == RunDataType.ASSET_KEYS:
+            logs_by_run_id = event_log_storage.get_logs_for_runs(run_ids, of_type=ASSET_EVENTS)
+            fetched = {
+                run_id: list(
+                    {
+                        record.dagster_event.asset_key: None
+                        for record in logs
+                        if record.is_dagster_event and record.dagster_event.asset_key
+                    }.keys()
+                )
+                for run_id, logs in logs_by_run_id.items()
+            }
+
+        elif data_type == RunDataType.EXECUTION_PLAN_SNAPSHOTS:
+            # runs of the same job and config share an execution plan snapshot, so that each
+            # distinct snapshot only needs to be loaded once
+            snapshots_by_id: Dict[str, Optional[ExecutionPlanSnapshot]] = {}
+            for record in self._records.values():
+                snapshot_id = record.pipeline_run.execution_plan_snapshot_id
+                if snapshot_id and snapshot_id not in snapshots_by_id:
+                    snapshots_by_id[snapshot_id] = self._instance.get_execution_plan_snapshot(
+                        snapshot_id
+                    )
+            fetched = {
+                run_id: snapshots_by_id.get(record.pipeline_run.execution_plan_snapshot_id)
+                for run_id, record in self._records.items()
+                if record.pipeline_run.execution_plan_snapshot_id
+            }
+
+        else:
+            check.failed(f"Unknown data type for {self.__class__.__name__}: {data_type}")
+
+        self._data[data_type] = fetched
+
+    def get_run_stats(self, run_id: str) -> PipelineRunStatsSnapshot:
+        return self._get(RunDataType.RUN_STATS, run_id)
+
+    def get_step_stats(self, run_id: str) -> Sequence[RunStepKeyStatsSnapshot]:
+        return self._get(RunDataType.STEP_STATS, run_id)
+
+    def get_asset_keys(self, run_id: str) -> Sequence[AssetKey]:
+        return self._get(RunDataType.ASSET_KEYS, run_id)
+
+    def get_execution_plan_snapshot(self, run_id: str) -> Optional[ExecutionPlanSnapshot]:
+        return self._get(RunDataType.EXECUTION_PLAN_SNAPSHOTS, run_id)
+
+
 class BatchMaterializationLoader:
     """
     A batch loader that fetches materializations for asset keys.  This loader is expected to be
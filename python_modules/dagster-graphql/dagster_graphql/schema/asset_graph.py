@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, List, Optional, Sequence, Union, cast
+from typing import TYPE_CHECKING, List, Optional, Sequence, Tuple, Union, cast
 
 import graphene
 from dagster_graphql.implementation.events import iterate_metadata_entries
@@ -25,6 +25,7 @@
     DEFAULT_LOGICAL_VERSION,
     extract_logical_version_from_entry,
 )
+from dagster._core.definitions.partition import PartitionsDefinition, PartitionsSubset
 from dagster._core.host_representation import ExternalRepository, RepositoryLocation
 from dagster._core.host_representation.external import ExternalPipeline
 from dagster._core.host_representation.external_data import (
@@ -40,6 +41,7 @@
     get_freshness_info,
     get_materialization_cts_by_partition,
     get_materialization_cts_grouped_by_dimension,
+    get_partition_subsets,
 )
 from ..implementation.loader import (
     BatchMaterializationLoader,
@@ -53,9 +55,11 @@
 from .freshness_policy import GrapheneAssetFreshnessInfo, GrapheneFreshnessPolicy
 from .logs.events import GrapheneMaterializationEvent, GrapheneObservationEvent
 from .pipelines.pipeline import (  # GraphenePartitionMaterializationS,
+    GrapheneAssetPartitionStatuses,
     GrapheneMaterializationCountGroupedByDimension,
     GrapheneMaterializationCountSingleDimension,
     GraphenePartitionMaterializationCounts,
+    GraphenePartitionStats,
     GraphenePipeline,
     GrapheneRun,
 )
@@ -176,6 +180,8 @@ class GrapheneAssetNode(graphene.ObjectType):
         partitions=graphene.List(graphene.String),
     )
     partitionMaterializationCounts = graphene.NonNull(GraphenePartitionMaterializationCounts)
+    assetPartitionStatuses = graphene.Field(GrapheneAssetPartitionStatuses)
+    partitionStats = graphene.Field(GraphenePartitionStats)
     metadata_entries = non_null_list(GrapheneMetadataEntry)
     op = graphene.Field(GrapheneSolidDefinition)
     opName = graphene.String()
@@ -227,6 +233,7 @@ def __init__(
         )
         self._external_pipeline = None  # lazily loaded
         self._node_definition_snap = None  # lazily loaded
+        self._partition_subsets = None  # lazily loaded
 
         super().__init__(
             id=get_unique_asset_id(
@@ -291,6 +298,34 @@ def get_partition_keys(self) -> Sequence[str]:
                 ]
         return []
 
+    def get_partitions_def(self) -> Optional[PartitionsDefinition]:
+        partitions_def_data = self._external_asset_node.partitions_def_data
+        if isinstance(
+            partitions_def_data,
+            (
+                ExternalStaticPartitionsDefinitionData,
+                ExternalTimeWindowPartitionsDefinitionData,
+                ExternalMultiPartitionsDefinitionData,
+            ),
+        ):
+            return partitions_def_data.get_partitions_definition()
+        return None
+
+    def get_partition_subsets(
+        self, graphene_info
+    ) -> Optional[Tuple[PartitionsSubset, PartitionsSubset, PartitionsSubset]]:
+        """The materialized, failed and in-progress partitions of the asset, if it is
+        partitioned.
+        """
+        partitions_def = self.get_partitions_def()
+        if partitions_def is None:
+            return None
+        if self._partition_subsets is None:
+            self._partition_subsets = get_partition_subsets(
+                graphene_info, self._external_asset_node.asset_key, partitions_def
+            )
+        return self._partition_subsets
+
     def is_multipartitioned(self) -> bool:
         external_multipartitions_def = self._external_asset_node.partitions_def_data
 
@@ -613,6 +648,33 @@ def resolve_partitionMaterializationCounts(
                 )
             )
 
+    def resolve_assetPartitionStatuses(
+        self, graphene_info
+    ) -> Optional[GrapheneAssetPartitionStatuses]:
+        partition_subsets = self.get_partition_subsets(graphene_info)
+        if partition_subsets is None:
+            return None
+
+        materialized, failed, in_progress = partition_subsets
+        return GrapheneAssetPartitionStatuses(
+            materializedPartitions=list(materialized.get_partition_keys()),
+            failedPartitions=list(failed.get_partition_keys()),
+            materializingPartitions=list(in_progress.get_partition_keys()),
+        )
+
+    def resolve_partitionStats(self, graphene_info) -> Optional[GraphenePartitionStats]:
+        partition_subsets = self.get_partition_subsets(graphene_info)
+        if partition_subsets is None:
+            return None
+
+        materialized, failed, in_progress = partition_subsets
+        return GraphenePartitionStats(
+            numMaterialized=len(list(materialized.get_partition_keys())),
+            numFailed=len(list(failed.get_partition_keys())),
+            numMaterializing=len(list(in_progress.get_partition_keys())),
+            numPartitions=len(check.not_none(self.get_partitions_def()).get_partition_keys()),
+        )
+
     def resolve_metadata_entries(self, _graphene_info) -> Sequence[GrapheneMetadataEntry]:
         return list(iterate_metadata_entries(self._external_asset_node.metadata_entries))
 
@@ -6,6 +6,7 @@
 from dagster._core.storage.tags import BACKFILL_ID_TAG
 
 from ..implementation.fetch_partition_sets import partition_statuses_from_run_partition_data
+from ..implementation.loader import RunScopedBatchLoader
 from .asset_key import GrapheneAssetKey
 from .errors import (
     GrapheneInvalidOutputError,
@@ -222,7 +223,8 @@ def resolve_runs(self, graphene_info):
         from .pipelines.pipeline import GrapheneRun
 
         records = self._get_records(graphene_info)
-        return [GrapheneRun(record) for record in records]
+        batch_loader = RunScopedBatchLoader(graphene_info.context.instance, records)
+        return [GrapheneRun(record, batch_loader) for record in records]
 
     def resolve_numPartitions(self, _graphene_info):
         return len(self._backfill_job.partition_names)
@@ -24,7 +24,7 @@
 from ..implementation.fetch_instigators import get_tick_log_events
 from ..implementation.fetch_schedules import get_schedule_next_tick
 from ..implementation.fetch_sensors import get_sensor_next_tick
-from ..implementation.loader import RepositoryScopedBatchLoader
+from ..implementation.loader import RepositoryScopedBatchLoader, RunScopedBatchLoader
 from .errors import GrapheneError, GraphenePythonError
 from .logs.log_level import GrapheneLogLevel
 from .repository_origin import GrapheneRepositoryOrigin
@@ -374,7 +374,8 @@ def resolve_runs(self, graphene_info, **kwargs):
                     self._instigator_state.name, limit
                 )
             )
-            return [GrapheneRun(record) for record in records]
+            run_loader = RunScopedBatchLoader(graphene_info.context.instance, records)
+            return [GrapheneRun(record, run_loader) for record in records]
 
         repository_label = self._instigator_state.origin.external_repository_origin.get_label()
         if self._instigator_state.instigator_type == InstigatorType.SENSOR:
@@ -391,13 +392,12 @@ def resolve_runs(self, graphene_info, **kwargs):
                     REPOSITORY_LABEL_TAG: repository_label,
                 }
             )
-        return [
-            GrapheneRun(record)
-            for record in graphene_info.context.instance.get_run_records(
-                filters=filters,
-                limit=kwargs.get("limit"),
-            )
-        ]
+        records = graphene_info.context.instance.get_run_records(
+            filters=filters,
+            limit=kwargs.get("limit"),
+        )
+        run_loader = RunScopedBatchLoader(graphene_info.context.instance, records)
+        return [GrapheneRun(record, run_loader) for record in records]
 
     def resolve_runsCount(self, graphene_info):
         if self._instigator_state.instigator_type == InstigatorType.SENSOR:
@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional
 
 import graphene
 from dagster_graphql.implementation.events import iterate_metadata_entries
@@ -19,7 +19,11 @@
 from ...implementation.fetch_runs import get_runs, get_stats, get_step_stats
 from ...implementation.fetch_schedules import get_schedules_for_pipeline
 from ...implementation.fetch_sensors import get_sensors_for_pipeline
-from ...implementation.loader import BatchRunLoader, RepositoryScopedBatchLoader
+from ...implementation.loader import (
+    BatchRunLoader,
+    RepositoryScopedBatchLoader,
+    RunScopedBatchLoader,
+)
 from ...implementation.utils import UserFacingGraphQLError, capture_error
 from ..asset_key import GrapheneAssetKey
 from ..dagster_types import GrapheneDagsterType, GrapheneDagsterTypeOrError, to_dagster_type
@@ -110,6 +114,25 @@ class Meta:
         name = "PartitionMaterializationCounts"
 
 
+class GrapheneAssetPartitionStatuses(graphene.ObjectType):
+    materializedPartitions = non_null_list(graphene.String)
+    failedPartitions = non_null_list(graphene.String)
+    materializingPartitions = non_null_list(graphene.String)
+
+    class Meta:
+        name = "AssetPartitionStatuses"
+
+
+class GraphenePartitionStats(graphene.ObjectType):
+    numMaterialized = graphene.NonNull(graphene.Int)
+    numFailed = graphene.NonNull(graphene.Int)
+    numMaterializing = graphene.NonNull(graphene.Int)
+    numPartitions = graphene.NonNull(graphene.Int)
+
+    class Meta:
+        name = "PartitionStats"
+
+
 class GrapheneAsset(graphene.ObjectType):
     id = graphene.NonNull(graphene.String)
     key = graphene.NonNull(GrapheneAssetKey)
@@ -303,7 +326,7 @@ class Meta:
         interfaces = (GraphenePipelineRun,)
         name = "Run"
 
-    def __init__(self, record: RunRecord):
+    def __init__(self, record: RunRecord, batch_loader: Optional[RunScopedBatchLoader] = None):
         check.inst_param(record, "record", RunRecord)
         pipeline_run = record.pipeline_run
         super().__init__(
@@ -315,6 +338,12 @@ def __init__(self, record: RunRecord):
         self._run_record = record
         self._run_stats = None
 
+        # optional run data loader, provided by a parent graphene object or fetch function that
+        # resolves multiple runs (e.g. a page of the runs feed)
+        self._batch_loader = check.opt_inst_param(
+            batch_loader, "batch_loader", RunScopedBatchLoader
+        )
+
     def resolve_id(self, _graphene_info):
         return self._pipeline_run.run_id
 
@@ -349,10 +378,10 @@ def resolve_pipelineSnapshotId(self, _graphene_info):
         return self._pipeline_run.pipeline_snapshot_id
 
     def resolve_stats(self, graphene_info):
-        return get_stats(graphene_info, self.run_id)
+        return get_stats(graphene_info, self.run_id, batch_loader=self._batch_loader)
 
     def resolve_stepStats(self, graphene_info):
-        return get_step_stats(graphene_info, self.run_id)
+        return get_step_stats(graphene_info, self.run_id, batch_loader=self._batch_loader)
 
     def resolve_computeLogs(self, _graphene_info, stepKey):
         return GrapheneComputeLogs(runId=self.run_id, stepKey=stepKey)
@@ -371,11 +400,12 @@ def resolve_executionPlan(self, graphene_info):
         ):
             return None
 
-        instance = graphene_info.context.instance
-
-        execution_plan_snapshot = instance.get_execution_plan_snapshot(
-            self._pipeline_run.execution_plan_snapshot_id
-        )
+        if self._batch_loader:
+            execution_plan_snapshot = self._batch_loader.get_execution_plan_snapshot(self.run_id)
+        else:
+            execution_plan_snapshot = graphene_info.context.instance.get_execution_plan_snapshot(
+                self._pipeline_run.execution_plan_snapshot_id
+            )
         return (
             GrapheneExecutionPlan(
                 ExternalExecutionPlan(execution_plan_snapshot=execution_plan_snapshot)
@@ -420,7 +450,7 @@ def resolve_canTerminate(self, _graphene_info):
         )
 
     def resolve_assets(self, graphene_info):
-        return get_assets_for_run_id(graphene_info, self.run_id)
+        return get_assets_for_run_id(graphene_info, self.run_id, batch_loader=self._batch_loader)
 
     def resolve_assetMaterializations(self, graphene_info):
         # convenience field added for users querying directly via GraphQL
@@ -447,6 +477,11 @@ def _get_run_record(self, instance):
             self._run_record = instance.get_run_records(RunsFilter(run_ids=[self.run_id]))[0]
         return self._run_record
 
+    def _get_run_stats(self, instance):
+        if self._batch_loader:
+            return self._batch_loader.get_run_stats(self.run_id)
+        return instance.get_run_stats(self.run_id)
+
     def resolve_startTime(self, graphene_info):
         run_record = self._get_run_record(graphene_info.context.instance)
         # If a user has not migrated in 0.13.15, then run_record will not have start_time and end_time. So it will be necessary to fill this data using the run_stats. Since we potentially make this call multiple times, we cache the result.
@@ -456,7 +491,7 @@ def resolve_startTime(self, graphene_info):
                 return run_record.end_time
 
             if self._run_stats is None or self._run_stats.start_time is None:
-                self._run_stats = graphene_info.context.instance.get_run_stats(self.runId)
+                self._run_stats = self._get_run_stats(graphene_info.context.instance)
 
             if self._run_stats.start_time is None and self._run_stats.end_time:
                 return self._run_stats.end_time
@@ -468,7 +503,7 @@ def resolve_endTime(self, graphene_info):
         run_record = self._get_run_record(graphene_info.context.instance)
         if run_record.end_time is None and self._pipeline_run.status in COMPLETED_STATUSES:
             if self._run_stats is None or self._run_stats.end_time is None:
-                self._run_stats = graphene_info.context.instance.get_run_stats(self.runId)
+                self._run_stats = self._get_run_stats(graphene_info.context.instance)
             return self._run_stats.end_time
         return run_record.end_time
 
@@ -790,7 +825,8 @@ def resolve_runs(self, graphene_info, **kwargs):
             records = self._batch_loader.get_run_records_for_job(
                 self._external_pipeline.name, kwargs.get("limit")
             )
-            return [GrapheneRun(record) for record in records]
+            run_loader = RunScopedBatchLoader(graphene_info.context.instance, records)
+            return [GrapheneRun(record, run_loader) for record in records]
 
         # otherwise, fall back to the default implementation
         return super().resolve_runs(graphene_info, **kwargs)
@@ -220,6 +220,25 @@
     }
 """
 
+GET_LATEST_ASSET_OBSERVATION = """
+    query AssetGraphQuery($assetKey: AssetKeyInput!) {
+        assetOrError(assetKey: $assetKey) {
+            ... on Asset {
+                assetObservations(limit: 1) {
+                    runId
+                    timestamp
+                    metadataEntries {
+                        label
+                        ... on TextMetadataEntry {
+                            text
+                        }
+                    }
+                }
+            }
+        }
+    }
+"""
+
 GET_MATERIALIZATION_COUNT_BY_PARTITION = """
     query AssetNodeQuery($pipelineSelector: PipelineSelector!) {
         assetNodes(pipeline: $pipelineSelector) {
@@ -233,6 +252,25 @@
     }
 """
 
+GET_PARTITION_STATUSES = """
+    query AssetNodeQuery($pipelineSelector: PipelineSelector!) {
+        assetNodes(pipeline: $pipelineSelector) {
+            id
+            assetPartitionStatuses {
+                materializedPartitions
+                failedPartitions
+                materializingPartitions
+            }
+            partitionStats {
+                numMaterialized
+                numFailed
+                numMaterializing
+                numPartitions
+            }
+        }
+    }
+"""
+
 GET_MATERIALIZATION_COUNT_BY_DIMENSION_PARTITION = """
     query MaterializationCountByDimension($assetKeys: [AssetKeyInput!]) {
         assetNodes(assetKeys: $assetKeys) {
@@ -839,6 +877,60 @@ def test_materialization_count_by_partition(self, graphql_context):
         assert materialization_counts[0] == 0  # a
         assert materialization_counts[2] == 2  # c
 
+    def test_partition_statuses(self, graphql_context):
+        # unpartitioned assets have no partition statuses
+        selector = infer_pipeline_selector(graphql_context, "two_assets_job")
+        result = execute_dagster_graphql(
+            graphql_context,
+            GET_PARTITION_STATUSES,
+            variables={"pipelineSelector": selector},
+        )
+        assert result.data
+        assert result.data["assetNodes"][0]["assetPartitionStatuses"] is None
+        assert result.data["assetNodes"][0]["partitionStats"] is None
+
+        selector = infer_pipeline_selector(graphql_context, "partition_materialization_job")
+        result = execute_dagster_graphql(
+            graphql_context,
+            GET_PARTITION_STATUSES,
+            variables={"pipelineSelector": selector},
+        )
+        assert result.data
+        asset_node = result.data["assetNodes"][0]
+        assert asset_node["assetPartitionStatuses"] == {
+            "materializedPartitions": [],
+            "failedPartitions": [],
+            "materializingPartitions": [],
+        }
+        assert asset_node["partitionStats"] == {
+            "numMaterialized": 0,
+            "numFailed": 0,
+            "numMaterializing": 0,
+            "numPartitions": 4,
+        }
+
+        _create_run(graphql_context, "partition_materialization_job")
+        _create_run(graphql_context, "partition_materialization_job")
+
+        result = execute_dagster_graphql(
+            graphql_context,
+            GET_PARTITION_STATUSES,
+            variables={"pipelineSelector": selector},
+        )
+        assert result.data
+        asset_node = result.data["assetNodes"][0]
+        assert asset_node["assetPartitionStatuses"] == {
+            "materializedPartitions": ["c"],
+            "failedPartitions": [],
+            "materializingPartitions": [],
+        }
+        assert asset_node["partitionStats"] == {
+            "numMaterialized": 1,
+            "numFailed": 0,
+            "numMaterializing": 0,
+            "numPartitions": 4,
+        }
+
     def test_asset_observations(self, graphql_context):
         _create_run(graphql_context, "observation_job")
         result = execute_dagster_graphql(
@@ -864,6 +956,23 @@ def test_asset_observations(self, graphql_context):
 
         assert observations[0]["label"] == "asset_yields_observation"
 
+    def test_latest_asset_observation(self, graphql_context):
+        first_run_id = _create_run(graphql_context, "observation_job")
+        second_run_id = _create_run(graphql_context, "observation_job")
+        assert first_run_id != second_run_id
+
+        result = execute_dagster_graphql(
+            graphql_context,
+            GET_LATEST_ASSET_OBSERVATION,
+            variables={"assetKey": {"path": ["asset_yields_observation"]}},
+        )
+
+        assert result.data
+        observations = result.data["assetOrError"]["assetObservations"]
+        assert len(observations) == 1
+        assert observations[0]["runId"] == second_run_id
+        assert observations[0]["metadataEntries"][0]["text"] == "FOO"
+
     def test_asset_op(self, graphql_context, snapshot):
         _create_run(graphql_context, "two_assets_job")
         result = execute_dagster_graphql(
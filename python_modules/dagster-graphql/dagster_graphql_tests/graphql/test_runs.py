@@ -1,4 +1,5 @@
 import copy
+import tempfile
 
 import yaml
 from dagster_graphql.test.utils import (
@@ -217,6 +218,64 @@
 """
 
 
+RUN_DATA_FRAGMENT = """
+fragment RunDataFragment on Run {
+  runId
+  stats {
+    ... on RunStatsSnapshot {
+      stepsSucceeded
+      stepsFailed
+      materializations
+      expectations
+      startTime
+      endTime
+    }
+  }
+  stepStats {
+    stepKey
+    status
+    startTime
+    endTime
+  }
+  assets {
+    key {
+      path
+    }
+  }
+  executionPlan {
+    steps {
+      key
+    }
+  }
+}
+"""
+
+BATCHED_RUNS_DATA_QUERY = (
+    """
+{
+  runsOrError {
+    ... on Runs {
+      results {
+        ...RunDataFragment
+      }
+    }
+  }
+}
+"""
+    + RUN_DATA_FRAGMENT
+)
+
+RUN_DATA_QUERY = (
+    """
+query RunDataQuery($runId: ID!) {
+  runOrError(runId: $runId) {
+    ...RunDataFragment
+  }
+}
+"""
+    + RUN_DATA_FRAGMENT
+)
+
 def _get_runs_data(result, run_id):
     for run_data in result.data["pipelineOrError"]["runs"]:
         if run_data["runId"] == run_id:
@@ -923,3 +982,71 @@ def test_asset_batching():
             counts = counter.counts()
             assert counts
             assert counts.get("DagsterInstance.get_run_records") == 1
+
+
+def test_run_data_batching():
+    with tempfile.TemporaryDirectory() as temp_dir, instance_for_test(
+        overrides={
+            # a storage that is not sharded by run, so that data is queried across runs at once
+            "event_log_storage": {
+                "module": "dagster._core.storage.event_log",
+                "class": "ConsolidatedSqliteEventLogStorage",
+                "config": {"base_dir": temp_dir},
+            }
+        }
+    ) as instance:
+        repo = get_asset_repo()
+        foo_job = repo.get_job("foo_job")
+        run_ids = [foo_job.execute_in_process(instance=instance).run_id for _ in range(3)]
+
+        event_log_storage = instance.event_log_storage
+        storage_counter = Counter()
+
+        def _count_calls(method_name):
+            method = getattr(event_log_storage, method_name)
+
+            def _counted(*args, **kwargs):
+                storage_counter.increment(method_name)
+                return method(*args, **kwargs)
+
+            setattr(event_log_storage, method_name, _counted)
+
+        for method_name in [
+            "get_stats_for_run",
+            "get_stats_for_runs",
+            "get_step_stats_for_run",
+            "get_step_stats_for_runs",
+            "get_logs_for_run",
+            "get_logs_for_runs",
+        ]:
+            _count_calls(method_name)
+
+        with define_out_of_process_context(__file__, "asset_repo", instance) as context:
+            traced_counter.set(Counter())
+            result = execute_dagster_graphql(context, BATCHED_RUNS_DATA_QUERY)
+            assert result.data
+            batched_runs = result.data["runsOrError"]["results"]
+            assert set(run["runId"] for run in batched_runs) == set(run_ids)
+
+            # a single query across the runs for each kind of data, instead of one per run
+            assert storage_counter.counts() == {
+                "get_stats_for_runs": 1,
+                "get_step_stats_for_runs": 1,
+                "get_logs_for_runs": 1,
+            }
+            # the runs share an execution plan snapshot, which is only loaded once
+            counts = traced_counter.get().counts()
+            assert counts.get("DagsterInstance.get_execution_plan_snapshot") == 1
+            assert "DagsterInstance.get_run_stats" not in counts
+            assert "DagsterInstance.get_run_step_stats" not in counts
+
+            # the same data is resolved for each run on its own, without the batch loader
+            for batched_run in batched_runs:
+                result = execute_dagster_graphql(
+                    context, RUN_DATA_QUERY, variables={"runId": batched_run["runId"]}
+                )
+                assert result.data
+                assert result.data["runOrError"] == batched_run
+                assert batched_run["assets"] == [{"key": {"path": ["foo"]}}]
+                assert batched_run["stats"]["materializations"] == 1
+                assert [step["stepKey"] for step in batched_run["stepStats"]] == ["foo"]
@@ -6,7 +6,6 @@
     ExternalRepositoryData,
     ExternalRepositoryErrorData,
 )
-from dagster._serdes import deserialize_as
 
 if TYPE_CHECKING:
     from dagster._core.host_representation import RepositoryLocation
@@ -17,28 +16,24 @@ def sync_get_streaming_external_repositories_data_grpc(
     api_client: "DagsterGrpcClient", repository_location: "RepositoryLocation"
 ) -> Mapping[str, ExternalRepositoryData]:
     from dagster._core.host_representation import ExternalRepositoryOrigin, RepositoryLocation
+    from dagster._grpc.external_repository_stream import (
+        deserialize_external_repository_data_chunks,
+    )
 
     check.inst_param(repository_location, "repository_location", RepositoryLocation)
 
     repo_datas = {}
     for repository_name in repository_location.repository_names:  # type: ignore
-        external_repository_chunks = list(
-            api_client.streaming_external_repository(
-                external_repository_origin=ExternalRepositoryOrigin(
-                    repository_location.origin,
-                    repository_name,
-                )
+        external_repository_chunks = api_client.streaming_external_repository(
+            external_repository_origin=ExternalRepositoryOrigin(
+                repository_location.origin,
+                repository_name,
             )
         )
 
-        result = deserialize_as(
-            "".join(
-                [
-                    chunk["serialized_external_repository_chunk"]
-                    for chunk in external_repository_chunks
-                ]
-            ),
-            (ExternalRepositoryData, ExternalRepositoryErrorData),
+        # decoded as the chunks arrive, rather than after joining them all together
+        result = deserialize_external_repository_data_chunks(
+            chunk["serialized_external_repository_chunk"] for chunk in external_repository_chunks
         )
 
         if isinstance(result, ExternalRepositoryErrorData):
@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Iterator, Sequence, Tuple, Union
 
 import dagster._check as check
 from dagster._core.definitions.schedule_definition import ScheduleExecutionData
@@ -6,7 +6,7 @@
 from dagster._core.host_representation.external_data import ExternalScheduleExecutionErrorData
 from dagster._core.host_representation.handle import RepositoryHandle
 from dagster._core.instance import DagsterInstance
-from dagster._grpc.types import ExternalScheduleExecutionArgs
+from dagster._grpc.types import ExternalScheduleExecutionArgs, ExternalScheduleExecutionBatchArgs
 from dagster._serdes import deserialize_as
 from dagster._seven.compat.pendulum import PendulumDateTime
 
@@ -67,3 +67,27 @@ def sync_get_external_schedule_execution_data_grpc(
         raise DagsterUserCodeProcessError.from_error_info(result.error)
 
     return result
+
+
+def sync_get_external_schedule_execution_data_batch_grpc(
+    api_client: "DagsterGrpcClient",
+    instance: DagsterInstance,
+    schedule_execution_args: Sequence[ExternalScheduleExecutionArgs],
+) -> Iterator[Tuple[int, Union[ScheduleExecutionData, ExternalScheduleExecutionErrorData]]]:
+    """Evaluates several schedules in a single request, yielding the index of each schedule in
+    ``schedule_execution_args`` along with its result as soon as its evaluation finishes. Errors
+    are returned in place of the execution data for the schedules that failed, rather than raised,
+    so that one failing schedule does not affect the others in the batch."""
+    check.sequence_param(
+        schedule_execution_args, "schedule_execution_args", of_type=ExternalScheduleExecutionArgs
+    )
+
+    for index, serialized_result in api_client.external_schedule_execution_batch(
+        external_schedule_execution_batch_args=ExternalScheduleExecutionBatchArgs(
+            instance_ref=instance.get_ref(),
+            schedule_execution_args=schedule_execution_args,
+        )
+    ):
+        yield index, deserialize_as(
+            serialized_result, (ScheduleExecutionData, ExternalScheduleExecutionErrorData)
+        )
@@ -1,11 +1,11 @@
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Iterator, Optional, Sequence, Tuple, Union
 
 import dagster._check as check
 from dagster._core.definitions.sensor_definition import SensorExecutionData
 from dagster._core.errors import DagsterUserCodeProcessError
 from dagster._core.host_representation.external_data import ExternalSensorExecutionErrorData
 from dagster._core.host_representation.handle import RepositoryHandle
-from dagster._grpc.types import SensorExecutionArgs
+from dagster._grpc.types import SensorExecutionArgs, SensorExecutionBatchArgs
 from dagster._serdes import deserialize_as
 
 if TYPE_CHECKING:
@@ -73,3 +73,25 @@ def sync_get_external_sensor_execution_data_grpc(
         raise DagsterUserCodeProcessError.from_error_info(result.error)
 
     return result
+
+
+def sync_get_external_sensor_execution_data_batch_grpc(
+    api_client: "DagsterGrpcClient",
+    instance: "DagsterInstance",
+    sensor_execution_args: Sequence[SensorExecutionArgs],
+) -> Iterator[Tuple[int, Union[SensorExecutionData, ExternalSensorExecutionErrorData]]]:
+    """Evaluates several sensors in a single request, yielding the index of each sensor in
+    ``sensor_execution_args`` along with its result as soon as its evaluation finishes. Errors are
+    returned in place of the execution data for the sensors that failed, rather than raised, so
+    that one failing sensor does not affect the others in the batch."""
+    check.sequence_param(sensor_execution_args, "sensor_execution_args", of_type=SensorExecutionArgs)
+
+    for index, serialized_result in api_client.external_sensor_execution_batch(
+        sensor_execution_batch_args=SensorExecutionBatchArgs(
+            instance_ref=instance.get_ref(),
+            sensor_execution_args=sensor_execution_args,
+        )
+    ):
+        yield index, deserialize_as(
+            serialized_result, (SensorExecutionData, ExternalSensorExecutionErrorData)
+        )
@@ -517,6 +517,16 @@ def _execute_step_command_body(
     "is managed directly from Dagit",
     envvar="DAGSTER_LAZY_LOAD_USER_CODE",
 )
+@click.option(
+    "--lazy-load-definitions",
+    is_flag=True,
+    required=False,
+    default=False,
+    help="Only load the names of the repositories when the server is launched, and construct "
+    "each job, schedule, sensor, and partition set the first time a request refers to it. Useful "
+    "for servers that only serve a handful of requests, e.g. for a single run.",
+    envvar="DAGSTER_LAZY_LOAD_DEFINITIONS",
+)
 @python_origin_target_argument
 @click.option(
     "--use-python-environment-entry-point",
@@ -622,6 +632,7 @@ def grpc_command(
     location_name=None,
     instance_ref=None,
     inject_env_vars_from_instance=False,
+    lazy_load_definitions=False,
     **kwargs,
 ):
     from dagster._core.test_utils import mock_system_timezone
@@ -689,6 +700,7 @@ def grpc_command(
             inject_env_vars_from_instance=inject_env_vars_from_instance,
             instance_ref=deserialize_as(instance_ref, InstanceRef) if instance_ref else None,
             location_name=location_name,
+            lazy_load_definitions=lazy_load_definitions,
         )
 
         code_desc = " "
@@ -714,6 +726,126 @@ def grpc_command(
             logger.info("Shutting down %s", server_desc)
 
 
+@api_cli.command(
+    name="grpc-zygote",
+    help="[INTERNAL] Load the code for a location once and fork Dagster gRPC servers from it on "
+    "request.",
+)
+@click.option(
+    "--control-socket",
+    type=click.Path(),
+    required=True,
+    help="Unix socket on which to listen for requests to fork new servers.",
+)
+@python_origin_target_argument
+@click.option(
+    "--use-python-environment-entry-point",
+    is_flag=True,
+    required=False,
+    default=False,
+    help="If this flag is set, forked servers will signal to clients that they should launch "
+    "dagster commands using `<this server's python executable> -m dagster`, instead of the "
+    "default `dagster` entry point.",
+)
+@click.option(
+    "--empty-working-directory",
+    is_flag=True,
+    required=False,
+    default=False,
+    help="Indicates that the working directory should be empty and should not set to the current "
+    "directory as a default",
+)
+@click.option(
+    "--lazy-load-definitions",
+    is_flag=True,
+    required=False,
+    default=False,
+    help="Only load the names of the repositories up front, and construct each definition the "
+    "first time a request refers to it.",
+)
+@click.option(
+    "--override-system-timezone",
+    type=click.STRING,
+    required=False,
+    help="[INTERNAL] Override the system timezone for tests.",
+)
+@click.option(
+    "--log-level",
+    type=click.STRING,
+    required=False,
+    default="INFO",
+    help="Level at which to log output from the zygote and the servers forked from it",
+)
+@click.option(
+    "--inject-env-vars-from-instance",
+    is_flag=True,
+    required=False,
+    default=False,
+    help="Whether to load env vars from the instance and inject them into the environment.",
+)
+@click.option(
+    "--location-name",
+    type=click.STRING,
+    required=False,
+    help="Name of the code location this zygote corresponds to.",
+)
+@click.option(
+    "--instance-ref",
+    type=click.STRING,
+    required=False,
+    help="[INTERNAL] Serialized InstanceRef to use for accessing the instance",
+)
+def grpc_zygote_command(
+    control_socket,
+    use_python_environment_entry_point=False,
+    lazy_load_definitions=False,
+    override_system_timezone=None,
+    log_level="INFO",
+    inject_env_vars_from_instance=False,
+    location_name=None,
+    instance_ref=None,
+    **kwargs,
+):
+    from dagster._core.test_utils import mock_system_timezone
+    from dagster._grpc.zygote import run_zygote
+
+    if seven.IS_WINDOWS:
+        raise click.UsageError("Forking gRPC servers from a zygote is not supported on Windows.")
+
+    configure_loggers(log_level=coerce_valid_log_level(log_level))
+
+    loadable_target_origin = LoadableTargetOrigin(
+        executable_path=sys.executable,
+        attribute=kwargs["attribute"],
+        working_directory=(
+            None
+            if kwargs.get("empty_working_directory")
+            else get_working_directory_from_kwargs(kwargs)
+        ),
+        module_name=kwargs["module_name"],
+        python_file=kwargs["python_file"],
+        package_name=kwargs["package_name"],
+    )
+
+    with ExitStack() as exit_stack:
+        if override_system_timezone:
+            exit_stack.enter_context(mock_system_timezone(override_system_timezone))
+
+        run_zygote(
+            control_socket=control_socket,
+            loadable_target_origin=loadable_target_origin,
+            entry_point=(
+                get_python_environment_entry_point(sys.executable)
+                if use_python_environment_entry_point
+                else DEFAULT_DAGSTER_ENTRY_POINT
+            ),
+            lazy_load_definitions=lazy_load_definitions,
+            inject_env_vars_from_instance=inject_env_vars_from_instance,
+            instance_ref=deserialize_as(instance_ref, InstanceRef) if instance_ref else None,
+            location_name=location_name,
+        )
+
+
 @api_cli.command(name="grpc-health-check", help="Check the status of a dagster GRPC server")
 @click.option(
     "--port",
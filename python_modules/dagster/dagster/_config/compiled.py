@@ -0,0 +1,288 @@
+"""Compiles config types into processors that validate and post-process config in a single pass.
+
+Processing config with :py:func:`validate_config` followed by :py:func:`post_process_config` walks
+the config value twice, dispatching on the kind of each config type and allocating a traversal
+context for every value along the way. A compiled processor is a tree of closures, built once per
+config type, that does the same work in one walk.
+
+Compiled processors only establish whether a config value is valid. When it is not, callers fall
+back to the traversal-based functions, which report detailed errors.
+"""
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+from dagster._utils import frozendict, frozenlist
+
+from .config_type import ConfigScalarKind, ConfigType, ConfigTypeKind
+from .evaluate_value_result import EvaluateValueResult
+
+ConfigProcessor = Callable[[Any], Any]
+
+
+class _InvalidConfigValue(Exception):
+    """Raised from a compiled processor when the config value does not match its config type."""
+
+
+def process_config_compiled(
+    config_type: ConfigType, config_value: object
+) -> Optional[EvaluateValueResult[Any]]:
+    """Validates and post-processes the config value using the compiled processor for the config
+    type.
+
+    Returns None if the config value is invalid or could not be post-processed, in which case the
+    value should be processed with :py:func:`process_config` to report the errors.
+    """
+    processor = get_compiled_processor(config_type)
+    try:
+        return EvaluateValueResult.for_value(processor(config_value))
+    except Exception:  # pylint: disable=broad-except
+        # Any failure, including a failure raised by a post_process implementation, is left to
+        # the traversal-based path, which either reports it as an error or raises it.
+        return None
+
+
+def get_compiled_processor(config_type: ConfigType) -> ConfigProcessor:
+    # memoized on the config type, so that processors are shared by all the definitions using a
+    # config type (e.g. Shapes, which are interned by their key)
+    processor = config_type._compiled_processor  # pylint: disable=protected-access
+    if processor is None:
+        processor = _compile(config_type)
+        config_type._compiled_processor = processor  # pylint: disable=protected-access
+    return processor
+
+
+def _compile(config_type: ConfigType) -> ConfigProcessor:
+    kind = config_type.kind
+    if kind == ConfigTypeKind.ANY:
+        processor = _compile_any()
+    elif kind == ConfigTypeKind.NONEABLE:
+        processor = _compile_noneable(config_type)
+    elif kind == ConfigTypeKind.SCALAR:
+        processor = _compile_scalar(config_type)
+    elif kind == ConfigTypeKind.ENUM:
+        processor = _compile_enum(config_type)
+    elif kind == ConfigTypeKind.SELECTOR:
+        processor = _compile_selector(config_type)
+    elif ConfigTypeKind.is_shape(kind):
+        processor = _compile_shape(config_type)
+    elif kind == ConfigTypeKind.ARRAY:
+        processor = _compile_array(config_type)
+    elif kind == ConfigTypeKind.MAP:
+        processor = _compile_map(config_type)
+    elif kind == ConfigTypeKind.SCALAR_UNION:
+        processor = _compile_scalar_union(config_type)
+    else:
+        raise Exception(f"Unsupported ConfigTypeKind {kind}")
+
+    if type(config_type).post_process is ConfigType.post_process:
+        return processor
+
+    post_process = config_type.post_process
+
+    def _process_and_post_process(config_value: Any) -> Any:
+        return post_process(processor(config_value))
+
+    return _process_and_post_process
+
+
+def _compile_any() -> ConfigProcessor:
+    def _process(config_value: Any) -> Any:
+        return config_value
+
+    return _process
+
+
+def _compile_noneable(config_type: ConfigType) -> ConfigProcessor:
+    inner_processor = get_compiled_processor(config_type.inner_type)  # type: ignore
+
+    def _process(config_value: Any) -> Any:
+        if config_value is None:
+            return None
+        return inner_processor(config_value)
+
+    return _process
+
+
+def _is_valid_int(config_value: Any) -> bool:
+    return not isinstance(config_value, bool) and isinstance(config_value, int)
+
+
+def _is_valid_string(config_value: Any) -> bool:
+    return isinstance(config_value, str)
+
+
+def _is_valid_bool(config_value: Any) -> bool:
+    return isinstance(config_value, bool)
+
+
+def _is_valid_float(config_value: Any) -> bool:
+    return isinstance(config_value, (int, float))
+
+
+def _is_not_none(config_value: Any) -> bool:
+    return config_value is not None
+
+
+_SCALAR_VALIDATORS: Mapping[Optional[ConfigScalarKind], Callable[[Any], bool]] = {
+    ConfigScalarKind.INT: _is_valid_int,
+    ConfigScalarKind.STRING: _is_valid_string,
+    ConfigScalarKind.BOOL: _is_valid_bool,
+    ConfigScalarKind.FLOAT: _is_valid_float,
+    None: _is_not_none,
+}
+
+
+def _compile_scalar(config_type: ConfigType) -> ConfigProcessor:
+    is_valid = _SCALAR_VALIDATORS[getattr(config_type, "scalar_kind", None)]
+
+    def _process(config_value: Any) -> Any:
+        if not is_valid(config_value):
+            raise _InvalidConfigValue()
+        return config_value
+
+    return _process
+
+
+def _compile_enum(config_type: ConfigType) -> ConfigProcessor:
+    config_values = frozenset(config_type.config_values)  # type: ignore
+
+    def _process(config_value: Any) -> Any:
+        if not isinstance(config_value, str) or config_value not in config_values:
+            raise _InvalidConfigValue()
+        return config_value
+
+    return _process
+
+
+def _compile_selector(config_type: ConfigType) -> ConfigProcessor:
+    fields = config_type.fields  # type: ignore
+    field_processors: Dict[str, Tuple[ConfigProcessor, bool]] = {
+        name: (
+            get_compiled_processor(field.config_type),
+            ConfigTypeKind.has_fields(field.config_type.kind),
+        )
+        for name, field in fields.items()
+    }
+
+    # an empty selector is only valid if it has a single optional field, which is then selected
+    default_selection: Optional[Tuple[str, Any]] = None
+    if len(fields) == 1:
+        name, field = next(iter(fields.items()))
+        if not field.is_required:
+            default_selection = (name, field.default_value if field.default_provided else None)
+
+    def _process(config_value: Any) -> Any:
+        if config_value == {}:
+            if default_selection is None:
+                raise _InvalidConfigValue()
+            field_name, field_value = default_selection
+        else:
+            if not isinstance(config_value, dict) or len(config_value) != 1:
+                raise _InvalidConfigValue()
+            ((field_name, field_value),) = config_value.items()
+
+        if field_name not in field_processors:
+            raise _InvalidConfigValue()
+        field_processor, has_fields = field_processors[field_name]
+        return frozendict(
+            {field_name: field_processor({} if field_value is None and has_fields else field_value)}
+        )
+
+    return _process
+
+
+def _compile_shape(config_type: ConfigType) -> ConfigProcessor:
+    fields = config_type.fields  # type: ignore
+    field_aliases: Mapping[str, str] = getattr(config_type, "field_aliases", None) or {}
+    check_for_extra_fields = config_type.kind == ConfigTypeKind.STRICT_SHAPE
+    defined_field_names = frozenset(fields.keys()) | frozenset(field_aliases.values())
+
+    field_processors: List[Tuple[str, ConfigProcessor, Optional[str], bool, bool, Any]] = [
+        (
+            name,
+            get_compiled_processor(field.config_type),
+            field_aliases.get(name),
+            field.is_required,
+            field.default_provided,
+            field.default_value if field.default_provided else None,
+        )
+        for name, field in fields.items()
+    ]
+
+    def _process(config_value: Any) -> Any:
+        if not isinstance(config_value, dict):
+            raise _InvalidConfigValue()
+        if check_for_extra_fields and not config_value.keys() <= defined_field_names:
+            raise _InvalidConfigValue()
+
+        processed = {}
+        for (
+            name,
+            field_processor,
+            alias,
+            is_required,
+            default_provided,
+            default_value,
+        ) in field_processors:
+            if name in config_value:
+                if alias is not None and alias in config_value:
+                    raise _InvalidConfigValue()
+                processed[name] = field_processor(config_value[name])
+            elif alias is not None and alias in config_value:
+                processed[name] = field_processor(config_value[alias])
+            elif is_required:
+                raise _InvalidConfigValue()
+            elif default_provided:
+                processed[name] = field_processor(default_value)
+
+        # fields that are not part of a permissive shape are passed through without processing
+        if not check_for_extra_fields:
+            for name, value in config_value.items():
+                if name not in fields:
+                    processed[name] = value
+
+        return frozendict(processed)
+
+    return _process
+
+
+def _compile_array(config_type: ConfigType) -> ConfigProcessor:
+    inner_processor = get_compiled_processor(config_type.inner_type)  # type: ignore
+
+    def _process(config_value: Any) -> Any:
+        if not isinstance(config_value, list):
+            raise _InvalidConfigValue()
+        if not config_value:
+            return []
+        return frozenlist([inner_processor(item) for item in config_value])
+
+    return _process
+
+
+def _compile_map(config_type: ConfigType) -> ConfigProcessor:
+    key_processor = get_compiled_processor(config_type.key_type)  # type: ignore
+    inner_processor = get_compiled_processor(config_type.inner_type)  # type: ignore
+
+    def _process(config_value: Any) -> Any:
+        if not isinstance(config_value, dict):
+            raise _InvalidConfigValue()
+        if not config_value:
+            return {}
+        for key in config_value.keys():
+            key_processor(key)
+        return frozendict({key: inner_processor(item) for key, item in config_value.items()})
+
+    return _process
+
+
+def _compile_scalar_union(config_type: ConfigType) -> ConfigProcessor:
+    scalar_processor = get_compiled_processor(config_type.scalar_type)  # type: ignore
+    non_scalar_processor = get_compiled_processor(config_type.non_scalar_type)  # type: ignore
+
+    def _process(config_value: Any) -> Any:
+        if config_value is None:
+            raise _InvalidConfigValue()
+        if isinstance(config_value, (dict, list)):
+            return non_scalar_processor(config_value)
+        return scalar_processor(config_value)
+
+    return _process
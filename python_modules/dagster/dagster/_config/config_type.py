@@ -81,6 +81,10 @@ def __init__(
 
         # memoized snap representation
         self._snap: Optional["ConfigTypeSnap"] = None
+        # memoized snapshot of this type and all of the types it contains
+        self._schema_snapshot: Optional["ConfigSchemaSnapshot"] = None
+        # memoized compiled processor, see dagster._config.compiled
+        self._compiled_processor: Optional[typing.Callable[[typing.Any], typing.Any]] = None
 
     @property
     def description(self) -> Optional[str]:
@@ -115,7 +119,12 @@ def type_iterator(self) -> Iterator["ConfigType"]:
     def get_schema_snapshot(self) -> "ConfigSchemaSnapshot":
         from .snap import ConfigSchemaSnapshot
 
-        return ConfigSchemaSnapshot({ct.key: ct.get_snapshot() for ct in self.type_iterator()})
+        if self._schema_snapshot is None:
+            self._schema_snapshot = ConfigSchemaSnapshot(
+                {ct.key: ct.get_snapshot() for ct in self.type_iterator()}
+            )
+
+        return self._schema_snapshot
 
 
 @whitelist_for_serdes
@@ -3,6 +3,7 @@
 import dagster._check as check
 from dagster._utils import ensure_single_item, frozendict
 
+from .compiled import process_config_compiled
 from .config_type import ConfigScalarKind, ConfigType, ConfigTypeKind
 from .errors import (
     EvaluationError,
@@ -427,6 +428,13 @@ def process_config(
 ) -> EvaluateValueResult[Mapping[str, object]]:
     config_type = resolve_to_config_type(config_type)
     config_type = check.inst(cast(ConfigType, config_type), ConfigType)
+
+    # Valid config is processed in a single pass by the compiled processor for the config type.
+    # Otherwise, validate and post-process separately to collect the errors.
+    compiled_evr = process_config_compiled(config_type, config_dict)
+    if compiled_evr is not None:
+        return compiled_evr
+
     validate_evr = validate_config(config_type, config_dict)
     if not validate_evr.success:
         return validate_evr
@@ -1,178 +1,353 @@
-from .composition import PendingNodeInvocation
-from .config import ConfigMapping
-from .dependency import (
-    DependencyDefinition,
-    MultiDependencyDefinition,
-    Node,
-    NodeHandle,
-    NodeInput,
-    NodeInvocation,
-    NodeOutput,
-    SolidInvocation,
-)
-from .events import (
-    AssetKey,
-    AssetMaterialization,
-    AssetObservation,
-    DynamicOutput,
-    ExpectationResult,
-    Failure,
-    HookExecutionResult,
-    Materialization,
-    Output,
-    RetryRequested,
-    TypeCheck,
-)
-from .executor_definition import (
-    ExecutorDefinition,
-    ExecutorRequirement,
-    default_executors,
-    executor,
-    in_process_executor,
-    multi_or_in_process_executor,
-    multiple_process_executor_requirements,
-    multiprocess_executor,
-)
-from .hook_definition import HookDefinition
-from .input import GraphIn, In, InputDefinition, InputMapping
-from .logger_definition import LoggerDefinition, build_init_logger_context, logger
-from .metadata import (
-    BoolMetadataValue,
-    DagsterAssetMetadataValue,
-    DagsterRunMetadataValue,
-    FloatMetadataValue,
-    IntMetadataValue,
-    JsonMetadataValue,
-    MarkdownMetadataValue,
-    MetadataEntry,
-    MetadataValue,
-    PathMetadataValue,
-    PythonArtifactMetadataValue,
-    TableColumn,
-    TableColumnConstraints,
-    TableConstraints,
-    TableMetadataValue,
-    TableRecord,
-    TableSchema,
-    TableSchemaMetadataValue,
-    TextMetadataValue,
-    UrlMetadataValue,
-)
-from .output import (
-    DynamicOut,
-    DynamicOutputDefinition,
-    GraphOut,
-    Out,
-    OutputDefinition,
-    OutputMapping,
-)
-from .pipeline_base import IPipeline
-from .reconstruct import (
-    ReconstructablePipeline,
-    build_reconstructable_job,
-    build_reconstructable_pipeline,
-    reconstructable,
-)
-from .repository_definition import RepositoryData, RepositoryDefinition
-from .resolved_asset_deps import ResolvedAssetDependencies
-from .resource_definition import ResourceDefinition, make_values_resource, resource
-from .run_config_schema import RunConfigSchema, create_run_config_schema
-from .run_request import InstigatorType, RunRequest, SkipReason
-from .schedule_definition import (
-    DefaultScheduleStatus,
-    ScheduleDefinition,
-    ScheduleEvaluationContext,
-    ScheduleExecutionContext,
-)
-from .sensor_definition import (
-    DefaultSensorStatus,
-    SensorDefinition,
-    SensorEvaluationContext,
-    SensorExecutionContext,
-)
-from .solid_container import create_execution_structure
+import importlib
+from typing import TYPE_CHECKING, Any, Mapping
 
-# isort: split
-from .asset_group import AssetGroup
-from .asset_in import AssetIn
-from .asset_out import AssetOut
-from .asset_selection import AssetSelection
-from .assets import AssetsDefinition
-from .assets_job import build_assets_job
-from .decorators import (
-    asset,
-    asset_sensor,
-    composite_solid,
-    config_mapping,
-    daily_schedule,
-    failure_hook,
-    graph,
-    hook_decorator,
-    hourly_schedule,
-    job,
-    lambda_solid,
-    monthly_schedule,
-    multi_asset,
-    op,
-    pipeline,
-    repository,
-    schedule,
-    sensor,
-    solid,
-    success_hook,
-    weekly_schedule,
-)
-from .graph_definition import GraphDefinition
-from .job_definition import JobDefinition
-from .load_assets_from_modules import (
-    load_assets_from_current_module,
-    load_assets_from_modules,
-    load_assets_from_package_module,
-    load_assets_from_package_name,
-)
-from .materialize import materialize, materialize_to_memory
-from .mode import ModeDefinition
-from .op_definition import OpDefinition
-from .partition import (
-    DynamicPartitionsDefinition,
-    Partition,
-    PartitionScheduleDefinition,
-    PartitionSetDefinition,
-    PartitionedConfig,
-    PartitionsDefinition,
-    StaticPartitionsDefinition,
-    dynamic_partitioned_config,
-    static_partitioned_config,
-)
-from .partition_key_range import PartitionKeyRange
-from .partition_mapping import (
-    AllPartitionMapping,
-    IdentityPartitionMapping,
-    LastPartitionMapping,
-    PartitionMapping,
-)
-from .partitioned_schedule import build_schedule_from_partitioned_job, schedule_from_partitions
-from .pipeline_definition import PipelineDefinition
-from .preset import PresetDefinition
-from .run_status_sensor_definition import (
-    RunFailureSensorContext,
-    RunStatusSensorContext,
-    RunStatusSensorDefinition,
-    run_failure_sensor,
-    run_status_sensor,
-)
-from .solid_definition import CompositeSolidDefinition, NodeDefinition
-from .source_asset import SourceAsset
-from .time_window_partition_mapping import TimeWindowPartitionMapping
-from .time_window_partitions import (
-    DailyPartitionsDefinition,
-    HourlyPartitionsDefinition,
-    MonthlyPartitionsDefinition,
-    TimeWindow,
-    TimeWindowPartitionsDefinition,
-    WeeklyPartitionsDefinition,
-    daily_partitioned_config,
-    hourly_partitioned_config,
-    monthly_partitioned_config,
-    weekly_partitioned_config,
-)
+if TYPE_CHECKING:
+    from .composition import PendingNodeInvocation
+    from .config import ConfigMapping
+    from .dependency import (
+        DependencyDefinition,
+        MultiDependencyDefinition,
+        Node,
+        NodeHandle,
+        NodeInput,
+        NodeInvocation,
+        NodeOutput,
+        SolidInvocation,
+    )
+    from .events import (
+        AssetKey,
+        AssetMaterialization,
+        AssetObservation,
+        DynamicOutput,
+        ExpectationResult,
+        Failure,
+        HookExecutionResult,
+        Materialization,
+        Output,
+        RetryRequested,
+        TypeCheck,
+    )
+    from .executor_definition import (
+        ExecutorDefinition,
+        ExecutorRequirement,
+        default_executors,
+        executor,
+        in_process_executor,
+        multi_or_in_process_executor,
+        multiple_process_executor_requirements,
+        multiprocess_executor,
+    )
+    from .hook_definition import HookDefinition
+    from .input import GraphIn, In, InputDefinition, InputMapping
+    from .logger_definition import LoggerDefinition, build_init_logger_context, logger
+    from .metadata import (
+        BoolMetadataValue,
+        DagsterAssetMetadataValue,
+        DagsterRunMetadataValue,
+        FloatMetadataValue,
+        IntMetadataValue,
+        JsonMetadataValue,
+        MarkdownMetadataValue,
+        MetadataEntry,
+        MetadataValue,
+        PathMetadataValue,
+        PythonArtifactMetadataValue,
+        TableColumn,
+        TableColumnConstraints,
+        TableConstraints,
+        TableMetadataValue,
+        TableRecord,
+        TableSchema,
+        TableSchemaMetadataValue,
+        TextMetadataValue,
+        UrlMetadataValue,
+    )
+    from .output import (
+        DynamicOut,
+        DynamicOutputDefinition,
+        GraphOut,
+        Out,
+        OutputDefinition,
+        OutputMapping,
+    )
+    from .pipeline_base import IPipeline
+    from .reconstruct import (
+        ReconstructablePipeline,
+        build_reconstructable_job,
+        build_reconstructable_pipeline,
+        reconstructable,
+    )
+    from .repository_definition import RepositoryData, RepositoryDefinition
+    from .resolved_asset_deps import ResolvedAssetDependencies
+    from .resource_definition import ResourceDefinition, make_values_resource, resource
+    from .run_config_schema import RunConfigSchema, create_run_config_schema
+    from .run_request import InstigatorType, RunRequest, SkipReason
+    from .schedule_definition import (
+        DefaultScheduleStatus,
+        ScheduleDefinition,
+        ScheduleEvaluationContext,
+        ScheduleExecutionContext,
+    )
+    from .sensor_definition import (
+        DefaultSensorStatus,
+        SensorDefinition,
+        SensorEvaluationContext,
+        SensorExecutionContext,
+    )
+    from .solid_container import create_execution_structure
+    from .asset_group import AssetGroup
+    from .asset_in import AssetIn
+    from .asset_out import AssetOut
+    from .asset_selection import AssetSelection
+    from .assets import AssetsDefinition
+    from .assets_job import build_assets_job
+    from .decorators import (
+        asset,
+        asset_sensor,
+        composite_solid,
+        config_mapping,
+        daily_schedule,
+        failure_hook,
+        graph,
+        hook_decorator,
+        hourly_schedule,
+        job,
+        lambda_solid,
+        monthly_schedule,
+        multi_asset,
+        op,
+        pipeline,
+        repository,
+        schedule,
+        sensor,
+        solid,
+        success_hook,
+        weekly_schedule,
+    )
+    from .graph_definition import GraphDefinition
+    from .job_definition import JobDefinition
+    from .load_assets_from_modules import (
+        load_assets_from_current_module,
+        load_assets_from_package_module,
+        load_assets_from_package_name,
+    )
+    from .materialize import materialize_to_memory
+    from .mode import ModeDefinition
+    from .op_definition import OpDefinition
+    from .partition import (
+        DynamicPartitionsDefinition,
+        Partition,
+        PartitionScheduleDefinition,
+        PartitionSetDefinition,
+        PartitionedConfig,
+        PartitionsDefinition,
+        StaticPartitionsDefinition,
+        dynamic_partitioned_config,
+        static_partitioned_config,
+    )
+    from .partition_key_range import PartitionKeyRange
+    from .partition_mapping import (
+        AllPartitionMapping,
+        IdentityPartitionMapping,
+        LastPartitionMapping,
+        PartitionMapping,
+    )
+    from .partitioned_schedule import build_schedule_from_partitioned_job, schedule_from_partitions
+    from .pipeline_definition import PipelineDefinition
+    from .preset import PresetDefinition
+    from .run_status_sensor_definition import (
+        RunFailureSensorContext,
+        RunStatusSensorContext,
+        RunStatusSensorDefinition,
+        run_failure_sensor,
+        run_status_sensor,
+    )
+    from .solid_definition import CompositeSolidDefinition, NodeDefinition
+    from .source_asset import SourceAsset
+    from .time_window_partition_mapping import TimeWindowPartitionMapping
+    from .time_window_partitions import (
+        DailyPartitionsDefinition,
+        HourlyPartitionsDefinition,
+        MonthlyPartitionsDefinition,
+        TimeWindow,
+        TimeWindowPartitionsDefinition,
+        WeeklyPartitionsDefinition,
+        daily_partitioned_config,
+        hourly_partitioned_config,
+        monthly_partitioned_config,
+        weekly_partitioned_config,
+    )
+
+# Submodules are imported on first access, so that importing one of them, e.g. to construct an
+# AssetKey, does not import every other definition module. `load_assets_from_modules` and
+# `materialize` aren't exported, since they share their names with the submodules defining them.
+_EXPORTS: Mapping[str, str] = {
+    "AssetGroup": ".asset_group",
+    "AssetIn": ".asset_in",
+    "AssetOut": ".asset_out",
+    "AssetSelection": ".asset_selection",
+    "AssetsDefinition": ".assets",
+    "build_assets_job": ".assets_job",
+    "PendingNodeInvocation": ".composition",
+    "ConfigMapping": ".config",
+    "asset": ".decorators",
+    "asset_sensor": ".decorators",
+    "composite_solid": ".decorators",
+    "config_mapping": ".decorators",
+    "daily_schedule": ".decorators",
+    "failure_hook": ".decorators",
+    "graph": ".decorators",
+    "hook_decorator": ".decorators",
+    "hourly_schedule": ".decorators",
+    "job": ".decorators",
+    "lambda_solid": ".decorators",
+    "monthly_schedule": ".decorators",
+    "multi_asset": ".decorators",
+    "op": ".decorators",
+    "pipeline": ".decorators",
+    "repository": ".decorators",
+    "schedule": ".decorators",
+    "sensor": ".decorators",
+    "solid": ".decorators",
+    "success_hook": ".decorators",
+    "weekly_schedule": ".decorators",
+    "DependencyDefinition": ".dependency",
+    "MultiDependencyDefinition": ".dependency",
+    "Node": ".dependency",
+    "NodeHandle": ".dependency",
+    "NodeInput": ".dependency",
+    "NodeInvocation": ".dependency",
+    "NodeOutput": ".dependency",
+    "SolidInvocation": ".dependency",
+    "AssetKey": ".events",
+    "AssetMaterialization": ".events",
+    "AssetObservation": ".events",
+    "DynamicOutput": ".events",
+    "ExpectationResult": ".events",
+    "Failure": ".events",
+    "HookExecutionResult": ".events",
+    "Materialization": ".events",
+    "Output": ".events",
+    "RetryRequested": ".events",
+    "TypeCheck": ".events",
+    "ExecutorDefinition": ".executor_definition",
+    "ExecutorRequirement": ".executor_definition",
+    "default_executors": ".executor_definition",
+    "executor": ".executor_definition",
+    "in_process_executor": ".executor_definition",
+    "multi_or_in_process_executor": ".executor_definition",
+    "multiple_process_executor_requirements": ".executor_definition",
+    "multiprocess_executor": ".executor_definition",
+    "GraphDefinition": ".graph_definition",
+    "HookDefinition": ".hook_definition",
+    "GraphIn": ".input",
+    "In": ".input",
+    "InputDefinition": ".input",
+    "InputMapping": ".input",
+    "JobDefinition": ".job_definition",
+    "load_assets_from_current_module": ".load_assets_from_modules",
+    "load_assets_from_package_module": ".load_assets_from_modules",
+    "load_assets_from_package_name": ".load_assets_from_modules",
+    "LoggerDefinition": ".logger_definition",
+    "build_init_logger_context": ".logger_definition",
+    "logger": ".logger_definition",
+    "materialize_to_memory": ".materialize",
+    "BoolMetadataValue": ".metadata",
+    "DagsterAssetMetadataValue": ".metadata",
+    "DagsterRunMetadataValue": ".metadata",
+    "FloatMetadataValue": ".metadata",
+    "IntMetadataValue": ".metadata",
+    "JsonMetadataValue": ".metadata",
+    "MarkdownMetadataValue": ".metadata",
+    "MetadataEntry": ".metadata",
+    "MetadataValue": ".metadata",
+    "PathMetadataValue": ".metadata",
+    "PythonArtifactMetadataValue": ".metadata",
+    "TableColumn": ".metadata",
+    "TableColumnConstraints": ".metadata",
+    "TableConstraints": ".metadata",
+    "TableMetadataValue": ".metadata",
+    "TableRecord": ".metadata",
+    "TableSchema": ".metadata",
+    "TableSchemaMetadataValue": ".metadata",
+    "TextMetadataValue": ".metadata",
+    "UrlMetadataValue": ".metadata",
+    "ModeDefinition": ".mode",
+    "OpDefinition": ".op_definition",
+    "DynamicOut": ".output",
+    "DynamicOutputDefinition": ".output",
+    "GraphOut": ".output",
+    "Out": ".output",
+    "OutputDefinition": ".output",
+    "OutputMapping": ".output",
+    "DynamicPartitionsDefinition": ".partition",
+    "Partition": ".partition",
+    "PartitionScheduleDefinition": ".partition",
+    "PartitionSetDefinition": ".partition",
+    "PartitionedConfig": ".partition",
+    "PartitionsDefinition": ".partition",
+    "StaticPartitionsDefinition": ".partition",
+    "dynamic_partitioned_config": ".partition",
+    "static_partitioned_config": ".partition",
+    "PartitionKeyRange": ".partition_key_range",
+    "AllPartitionMapping": ".partition_mapping",
+    "IdentityPartitionMapping": ".partition_mapping",
+    "LastPartitionMapping": ".partition_mapping",
+    "PartitionMapping": ".partition_mapping",
+    "build_schedule_from_partitioned_job": ".partitioned_schedule",
+    "schedule_from_partitions": ".partitioned_schedule",
+    "IPipeline": ".pipeline_base",
+    "PipelineDefinition": ".pipeline_definition",
+    "PresetDefinition": ".preset",
+    "ReconstructablePipeline": ".reconstruct",
+    "build_reconstructable_job": ".reconstruct",
+    "build_reconstructable_pipeline": ".reconstruct",
+    "reconstructable": ".reconstruct",
+    "RepositoryData": ".repository_definition",
+    "RepositoryDefinition": ".repository_definition",
+    "ResolvedAssetDependencies": ".resolved_asset_deps",
+    "ResourceDefinition": ".resource_definition",
+    "make_values_resource": ".resource_definition",
+    "resource": ".resource_definition",
+    "RunConfigSchema": ".run_config_schema",
+    "create_run_config_schema": ".run_config_schema",
+    "InstigatorType": ".run_request",
+    "RunRequest": ".run_request",
+    "SkipReason": ".run_request",
+    "RunFailureSensorContext": ".run_status_sensor_definition",
+    "RunStatusSensorContext": ".run_status_sensor_definition",
+    "RunStatusSensorDefinition": ".run_status_sensor_definition",
+    "run_failure_sensor": ".run_status_sensor_definition",
+    "run_status_sensor": ".run_status_sensor_definition",
+    "DefaultScheduleStatus": ".schedule_definition",
+    "ScheduleDefinition": ".schedule_definition",
+    "ScheduleEvaluationContext": ".schedule_definition",
+    "ScheduleExecutionContext": ".schedule_definition",
+    "DefaultSensorStatus": ".sensor_definition",
+    "SensorDefinition": ".sensor_definition",
+    "SensorEvaluationContext": ".sensor_definition",
+    "SensorExecutionContext": ".sensor_definition",
+    "create_execution_structure": ".solid_container",
+    "CompositeSolidDefinition": ".solid_definition",
+    "NodeDefinition": ".solid_definition",
+    "SourceAsset": ".source_asset",
+    "TimeWindowPartitionMapping": ".time_window_partition_mapping",
+    "DailyPartitionsDefinition": ".time_window_partitions",
+    "HourlyPartitionsDefinition": ".time_window_partitions",
+    "MonthlyPartitionsDefinition": ".time_window_partitions",
+    "TimeWindow": ".time_window_partitions",
+    "TimeWindowPartitionsDefinition": ".time_window_partitions",
+    "WeeklyPartitionsDefinition": ".time_window_partitions",
+    "daily_partitioned_config": ".time_window_partitions",
+    "hourly_partitioned_config": ".time_window_partitions",
+    "monthly_partitioned_config": ".time_window_partitions",
+    "weekly_partitioned_config": ".time_window_partitions",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError("module '{}' has no attribute '{}'".format(__name__, name))
@@ -4,7 +4,9 @@
     TYPE_CHECKING,
     AbstractSet,
     Dict,
+    Iterable,
     Iterator,
+    List,
     Mapping,
     NamedTuple,
     Optional,
@@ -17,7 +19,13 @@
 
 import dagster._check as check
 from dagster._core.errors import DagsterInvalidInvocationError, DagsterInvariantViolationError
-from dagster._core.selector.subset_selector import DependencyGraph, generate_asset_dep_graph
+from dagster._core.selector.subset_selector import (
+    DependencyGraph,
+    Direction,
+    fetch_sinks,
+    fetch_sources,
+    generate_asset_dep_graph,
+)
 
 from .assets import AssetsDefinition
 from .events import AssetKey, AssetKeyPartitionKey
@@ -59,7 +67,7 @@ def __new__(
         group_names_by_key: Mapping[AssetKey, Optional[str]],
         freshness_policies_by_key: Mapping[AssetKey, Optional[FreshnessPolicy]],
     ):
-        return super(AssetGraph, cls).__new__(
+        asset_graph = super(AssetGraph, cls).__new__(
             cls,
             asset_dep_graph=asset_dep_graph,
             source_asset_keys=source_asset_keys,
@@ -68,6 +76,8 @@ def __new__(
             group_names_by_key=group_names_by_key,
             freshness_policies_by_key=freshness_policies_by_key,
         )
+        asset_graph._index = _AssetGraphIndex(asset_dep_graph, group_names_by_key)
+        return asset_graph
 
     @staticmethod
     def from_assets(all_assets: Sequence[Union[AssetsDefinition, SourceAsset]]) -> "AssetGraph":
@@ -345,12 +355,198 @@ def upstream_key_iterator(self, asset_key: AssetKey) -> Iterator[AssetKey]:
                     visited.add(parent_key)
 
     def toposort_asset_keys(self) -> Sequence[AbstractSet[AssetKey]]:
-        return [
-            {key for key in level} for level in toposort.toposort(self.asset_dep_graph["upstream"])
-        ]
+        return self._index.get_toposorted_asset_keys()
+
+    def get_asset_keys_in_groups(self, group_names: Iterable[str]) -> AbstractSet[AssetKey]:
+        """Returns all assets that belong to any of the given groups"""
+        asset_keys_by_group = self._index.get_asset_keys_by_group()
+        result: Set[AssetKey] = set()
+        for group_name in group_names:
+            result.update(asset_keys_by_group.get(group_name, ()))
+        return result
+
+    def get_upstream_asset_keys(
+        self, asset_keys: AbstractSet[AssetKey], depth: Optional[int] = None
+    ) -> AbstractSet[AssetKey]:
+        """Returns all assets that are upstream of any of the given assets, up to the given depth.
+        The given assets are only included if they are upstream of one of the others.
+        """
+        return _fetch_connected(self.asset_dep_graph["upstream"], asset_keys, depth)
+
+    def get_downstream_asset_keys(
+        self, asset_keys: AbstractSet[AssetKey], depth: Optional[int] = None
+    ) -> AbstractSet[AssetKey]:
+        """Returns all assets that are downstream of any of the given assets, down to the given
+        depth. The given assets are only included if they are downstream of one of the others.
+        """
+        return _fetch_connected(self.asset_dep_graph["downstream"], asset_keys, depth)
+
+    def get_sinks_within(self, asset_keys: AbstractSet[AssetKey]) -> AbstractSet[AssetKey]:
+        """Returns the given assets that have no downstream assets among the given assets"""
+        descendant_bits_by_key = self._index.get_reachable_bits_by_key("downstream")
+        if descendant_bits_by_key is None:
+            return fetch_sinks(self.asset_dep_graph, asset_keys)
+        selection_bits = self._index.to_bits(asset_keys)
+        return {
+            key for key in asset_keys if not descendant_bits_by_key.get(key, 0) & selection_bits
+        }
+
+    def get_sources_within(self, asset_keys: AbstractSet[AssetKey]) -> AbstractSet[AssetKey]:
+        """Returns the given assets that have no upstream assets among the given assets"""
+        ancestor_bits_by_key = self._index.get_reachable_bits_by_key("upstream")
+        if ancestor_bits_by_key is None:
+            return fetch_sources(self.asset_dep_graph, asset_keys)
+        selection_bits = self._index.to_bits(asset_keys)
+        return {key for key in asset_keys if not ancestor_bits_by_key.get(key, 0) & selection_bits}
 
     def __hash__(self):
         return id(self)
 
     def __eq__(self, other):
         return self is other
+
+
+def _fetch_connected(
+    dep_graph: Mapping[AssetKey, AbstractSet[AssetKey]],
+    asset_keys: AbstractSet[AssetKey],
+    depth: Optional[int],
+) -> AbstractSet[AssetKey]:
+    # a breadth-first search that starts from all of the given keys at once, so that each asset is
+    # visited at most once no matter how many of the given keys it is connected to
+    result: Set[AssetKey] = set()
+    visited = set(asset_keys)
+    frontier = list(asset_keys)
+    curr_depth = 0
+    while frontier and (depth is None or curr_depth < depth):
+        next_frontier = []
+        for asset_key in frontier:
+            for connected_key in dep_graph.get(asset_key, ()):
+                result.add(connected_key)
+                if connected_key not in visited:
+                    visited.add(connected_key)
+                    next_frontier.append(connected_key)
+        frontier = next_frontier
+        curr_depth += 1
+    return result
+
+
+class _AssetGraphIndex:
+    """
+    Lookups over an asset dependency graph that are built the first time they are needed and then
+    reused, so that e.g. asset selections that are resolved on every sensor tick don't re-traverse
+    the graph each time.
+
+    Ancestors and descendants are stored as bitsets, with one bit per asset assigned in topological
+    order, so that checking whether an asset has any ancestors or descendants within a set of
+    assets is a single integer operation.
+    """
+
+    def __init__(
+        self,
+        asset_dep_graph: DependencyGraph,
+        group_names_by_key: Mapping[AssetKey, Optional[str]],
+    ):
+        self._asset_dep_graph = asset_dep_graph
+        self._group_names_by_key = group_names_by_key
+        self._asset_keys_by_group: Optional[Mapping[Optional[str], AbstractSet[AssetKey]]] = None
+        self._toposorted_asset_keys: Optional[Sequence[AbstractSet[AssetKey]]] = None
+        self._bit_by_key: Optional[Mapping[AssetKey, int]] = None
+        self._reachable_bits_by_key_by_direction: Dict[
+            Direction, Optional[Mapping[AssetKey, int]]
+        ] = {}
+
+    def get_asset_keys_by_group(self) -> Mapping[Optional[str], AbstractSet[AssetKey]]:
+        if self._asset_keys_by_group is None:
+            asset_keys_by_group: Dict[Optional[str], Set[AssetKey]] = {}
+            for asset_key, group_name in self._group_names_by_key.items():
+                asset_keys_by_group.setdefault(group_name, set()).add(asset_key)
+            self._asset_keys_by_group = asset_keys_by_group
+        return self._asset_keys_by_group
+
+    def get_toposorted_asset_keys(self) -> Sequence[AbstractSet[AssetKey]]:
+        if self._toposorted_asset_keys is None:
+            self._toposorted_asset_keys = self._build_toposorted_asset_keys()
+        return self._toposorted_asset_keys
+
+    def _build_toposorted_asset_keys(self) -> Sequence[AbstractSet[AssetKey]]:
+        # Produces the same levels as toposort.toposort, which re-scans all remaining assets for
+        # every level, and so is quadratic in the length of the longest chain of assets
+        upstream = self._asset_dep_graph["upstream"]
+        num_unsorted_parents: Dict[AssetKey, int] = {}
+        children: Dict[AssetKey, List[AssetKey]] = {}
+        for asset_key, parent_keys in upstream.items():
+            num_unsorted_parents.setdefault(asset_key, 0)
+            for parent_key in parent_keys:
+                if parent_key == asset_key:
+                    continue
+                num_unsorted_parents[asset_key] += 1
+                num_unsorted_parents.setdefault(parent_key, 0)
+                children.setdefault(parent_key, []).append(asset_key)
+
+        levels: List[AbstractSet[AssetKey]] = []
+        level = {key for key, num_parents in num_unsorted_parents.items() if num_parents == 0}
+        while level:
+            levels.append(level)
+            next_level = set()
+            for asset_key in level:
+                for child_key in children.get(asset_key, ()):
+                    num_unsorted_parents[child_key] -= 1
+                    if num_unsorted_parents[child_key] == 0:
+                        next_level.add(child_key)
+            level = next_level
+
+        if sum(len(level) for level in levels) != len(num_unsorted_parents):
+            sorted_keys = set().union(*levels)
+            raise toposort.CircularDependencyError(
+                {
+                    asset_key: set(parent_keys) - sorted_keys
+                    for asset_key, parent_keys in upstream.items()
+                    if asset_key not in sorted_keys
+                }
+            )
+        return levels
+
+    def to_bits(self, asset_keys: Iterable[AssetKey]) -> int:
+        bit_by_key = check.not_none(self._bit_by_key)
+        bits = 0
+        for asset_key in asset_keys:
+            bits |= bit_by_key.get(asset_key, 0)
+        return bits
+
+    def get_reachable_bits_by_key(self, direction: Direction) -> Optional[Mapping[AssetKey, int]]:
+        """
+        Returns a bitset for each asset of all the assets that can be reached from it in the given
+        direction, or None if the graph has a cycle and so has no topological order to build them
+        in.
+        """
+        if direction not in self._reachable_bits_by_key_by_direction:
+            self._reachable_bits_by_key_by_direction[direction] = self._build_reachable_bits_by_key(
+                direction
+            )
+        return self._reachable_bits_by_key_by_direction[direction]
+
+    def _build_reachable_bits_by_key(self, direction: Direction) -> Optional[Mapping[AssetKey, int]]:
+        try:
+            toposorted_asset_keys = self.get_toposorted_asset_keys()
+        except toposort.CircularDependencyError:
+            return None
+
+        ordered_keys: List[AssetKey] = [key for level in toposorted_asset_keys for key in level]
+        if self._bit_by_key is None:
+            self._bit_by_key = {key: 1 << i for i, key in enumerate(ordered_keys)}
+        bit_by_key = self._bit_by_key
+
+        # visit each asset after all the assets it's connected to in the given direction, so that
+        # its bitset is the union of theirs
+        if direction == "downstream":
+            ordered_keys.reverse()
+        dep_graph = self._asset_dep_graph[direction]
+        reachable_bits_by_key: Dict[AssetKey, int] = {}
+        for asset_key in ordered_keys:
+            bits = 0
+            for connected_key in dep_graph.get(asset_key, ()):
+                bits |= bit_by_key.get(connected_key, 0) | reachable_bits_by_key.get(
+                    connected_key, 0
+                )
+            reachable_bits_by_key[asset_key] = bits
+        return reachable_bits_by_key
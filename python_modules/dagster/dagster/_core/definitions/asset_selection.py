@@ -1,12 +1,9 @@
-import operator
 from abc import ABC, abstractmethod
-from functools import reduce
 from typing import AbstractSet, Optional, Sequence, Union
 
 import dagster._check as check
 from dagster._annotations import public
 from dagster._core.errors import DagsterInvalidSubsetError
-from dagster._core.selector.subset_selector import fetch_connected, fetch_sinks, fetch_sources
 
 from .asset_graph import AssetGraph
 from .assets import AssetsDefinition
@@ -190,7 +187,7 @@ def __init__(self, child: AssetSelection):
 
     def resolve_inner(self, asset_graph: AssetGraph) -> AbstractSet[AssetKey]:
         selection = self._child.resolve_inner(asset_graph)
-        return fetch_sinks(asset_graph.asset_dep_graph, selection)
+        return asset_graph.get_sinks_within(selection)
 
 
 class SourceAssetSelection(AssetSelection):
@@ -199,7 +196,7 @@ def __init__(self, child: AssetSelection):
 
     def resolve_inner(self, asset_graph: AssetGraph) -> AbstractSet[AssetKey]:
         selection = self._child.resolve_inner(asset_graph)
-        return fetch_sources(asset_graph.asset_dep_graph, selection)
+        return asset_graph.get_sources_within(selection)
 
 
 class DownstreamAssetSelection(AssetSelection):
@@ -216,22 +213,8 @@ def __init__(
 
     def resolve_inner(self, asset_graph: AssetGraph) -> AbstractSet[AssetKey]:
         selection = self._child.resolve_inner(asset_graph)
-        return operator.sub(
-            reduce(
-                operator.or_,
-                [
-                    {asset_key}
-                    | fetch_connected(
-                        item=asset_key,
-                        graph=asset_graph.asset_dep_graph,
-                        direction="downstream",
-                        depth=self.depth,
-                    )
-                    for asset_key in selection
-                ],
-            ),
-            selection if not self.include_self else set(),
-        )
+        downstream_keys = asset_graph.get_downstream_asset_keys(selection, depth=self.depth)
+        return selection | downstream_keys if self.include_self else downstream_keys - selection
 
 
 class GroupsAssetSelection(AssetSelection):
@@ -239,11 +222,7 @@ def __init__(self, *groups: str):
         self._groups = groups
 
     def resolve_inner(self, asset_graph: AssetGraph) -> AbstractSet[AssetKey]:
-        return {
-            asset_key
-            for asset_key, group in asset_graph.group_names_by_key.items()
-            if group in self._groups
-        }
+        return asset_graph.get_asset_keys_in_groups(self._groups)
 
 
 class KeysAssetSelection(AssetSelection):
@@ -293,19 +272,5 @@ def __init__(
 
     def resolve_inner(self, asset_graph: AssetGraph) -> AbstractSet[AssetKey]:
         selection = self._child.resolve_inner(asset_graph)
-        return operator.sub(
-            reduce(
-                operator.or_,
-                [
-                    {asset_key}
-                    | fetch_connected(
-                        item=asset_key,
-                        graph=asset_graph.asset_dep_graph,
-                        direction="upstream",
-                        depth=self.depth,
-                    )
-                    for asset_key in selection
-                ],
-            ),
-            selection if not self.include_self else set(),
-        )
+        upstream_keys = asset_graph.get_upstream_asset_keys(selection, depth=self.depth)
+        return selection | upstream_keys if self.include_self else upstream_keys - selection
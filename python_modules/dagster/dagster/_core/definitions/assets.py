@@ -178,6 +178,10 @@ def __init__(
             value_type=FreshnessPolicy,
         )
 
+        # computed on first use, since the same assets definition is converted to source assets for
+        # every asset job that does not select it
+        self._source_assets: Optional[Sequence[SourceAsset]] = None
+
     def __call__(self, *args: object, **kwargs: object) -> object:
         from dagster._core.definitions.decorators.solid_decorator import DecoratedSolidFunction
         from dagster._core.execution.context.compute import OpExecutionContext
@@ -774,6 +778,11 @@ def subset_for(
             )
 
     def to_source_assets(self) -> Sequence[SourceAsset]:
+        if self._source_assets is None:
+            self._source_assets = self._build_source_assets()
+        return self._source_assets
+
+    def _build_source_assets(self) -> Sequence[SourceAsset]:
         result = []
         with warnings.catch_warnings():
             warnings.simplefilter("ignore", category=ExperimentalWarning)
@@ -431,8 +431,9 @@ def _attempt_resolve_cycles(
     source_assets: Iterable["SourceAsset"],
 ) -> Sequence["AssetsDefinition"]:
     """
-    DFS starting at root nodes to color the asset dependency graph. Each time you leave your
-    current AssetsDefinition, the color increments.
+    Color the asset dependency graph such that each time a path leaves an AssetsDefinition, the
+    color increments. Each asset gets the greatest color over all of the paths that lead to it from
+    a root asset, which is computed in a single pass over the assets in topological order.
 
     At the end of this process, we'll have a coloring for the asset graph such that any asset which
     is downstream of another asset via a different AssetsDefinition will be guaranteed to have
@@ -456,34 +457,26 @@ def _attempt_resolve_cycles(
             assets_defs_by_asset_key[asset_key] = assets_def
 
     # color for each asset
-    colors = {}
-
-    # recursively color an asset and all of its downstream assets
-    def _dfs(key, cur_color):
-        colors[key] = cur_color
-        if key in assets_defs_by_asset_key:
-            cur_node_asset_keys = assets_defs_by_asset_key[key].keys
-        else:
-            # in a SourceAsset, treat all downstream as if they're in the same node
-            cur_node_asset_keys = asset_deps["downstream"][key]
-
-        for downstream_key in asset_deps["downstream"][key]:
-            # if the downstream asset is in the current node,keep the same color
-            if downstream_key in cur_node_asset_keys:
-                new_color = cur_color
-            else:
-                new_color = cur_color + 1
-
-            # if current color of the downstream asset is less than the new color, re-do dfs
-            if colors.get(downstream_key, -1) < new_color:
-                _dfs(downstream_key, new_color)
-
-    # validate that there are no cycles in the overall asset graph
-    toposorted = list(toposort(asset_deps["upstream"]))
+    colors: Dict[AssetKey, int] = {}
+
+    # validate that there are no cycles in the overall asset graph, and visit each asset after all
+    # of the assets upstream of it
+    for level in toposort(asset_deps["upstream"]):
+        for key in level:
+            color = 0
+            for upstream_key in asset_deps["upstream"].get(key, set()):
+                if upstream_key in assets_defs_by_asset_key:
+                    upstream_node_asset_keys = assets_defs_by_asset_key[upstream_key].keys
+                else:
+                    # in a SourceAsset, treat all downstream as if they're in the same node
+                    upstream_node_asset_keys = asset_deps["downstream"][upstream_key]
 
-    # dfs for each root node
-    for root_name in toposorted[0]:
-        _dfs(root_name, 0)
+                # if the asset is in the same node as its upstream asset, keep the same color
+                if key in upstream_node_asset_keys:
+                    color = max(color, colors[upstream_key])
+                else:
+                    color = max(color, colors[upstream_key] + 1)
+            colors[key] = color
 
     color_mapping_by_assets_defs: Dict[AssetsDefinition, Any] = defaultdict(
         lambda: defaultdict(set)
@@ -553,7 +546,10 @@ def check_resources_satisfy_requirements(
     all_assets: Sequence[Union[AssetsDefinition, SourceAsset]] = [*assets, *source_assets]
     for asset in all_assets:
         ensure_requirements_satisfied(
-            merge_dicts(resource_defs, asset.resource_defs), list(asset.get_resource_requirements())
+            merge_dicts(resource_defs, asset.resource_defs)
+            if asset.resource_defs
+            else resource_defs,
+            list(asset.get_resource_requirements()),
         )
 
 
@@ -569,5 +565,5 @@ def get_all_resource_defs(
     all_resource_defs = dict(resource_defs)
     all_assets: Sequence[Union[AssetsDefinition, SourceAsset]] = [*assets, *source_assets]
     for asset in all_assets:
-        all_resource_defs = merge_dicts(all_resource_defs, asset.resource_defs)
+        all_resource_defs.update(asset.resource_defs)
     return all_resource_defs
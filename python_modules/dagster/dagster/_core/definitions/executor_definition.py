@@ -6,7 +6,7 @@
 
 import dagster._check as check
 from dagster._annotations import public
-from dagster._builtins import Int
+from dagster._builtins import Bool, Int
 from dagster._config import Field, Selector, UserConfigSchema
 from dagster._core.definitions.configurable import (
     ConfiguredDefinitionConfigSchema,
@@ -23,10 +23,12 @@
 )
 
 if TYPE_CHECKING:
+    from dagster._core.executor.async_executor import AsyncExecutor
     from dagster._core.executor.base import Executor
     from dagster._core.executor.in_process import InProcessExecutor
     from dagster._core.executor.init import InitExecutorContext
     from dagster._core.executor.multiprocess import MultiprocessExecutor
+    from dagster._core.executor.threaded_executor import ThreadedExecutor
     from dagster._core.instance import DagsterInstance
 
 
@@ -415,6 +417,134 @@ def multiprocess_executor(init_context):
     return _core_multiprocess_executor_creation(init_context.executor_config)
 
 
+def _core_async_executor_creation(config: ExecutorConfig) -> "AsyncExecutor":
+    from dagster._core.executor.async_executor import AsyncExecutor
+
+    return AsyncExecutor(
+        retries=RetryMode.from_config(check.dict_elem(config, "retries")),  # type: ignore
+        max_concurrent=check.int_elem(config, "max_concurrent"),
+    )
+
+
+ASYNC_CONFIG = Field(
+    {
+        "max_concurrent": Field(
+            Int,
+            default_value=32,
+            description="The number of steps that may be executed concurrently.",
+        ),
+        "retries": get_retries_config(),
+    },
+    description=(
+        "Execute steps concurrently in a single process, running async ops on one event loop."
+    ),
+)
+
+
+@executor(
+    name="async",
+    config_schema=ASYNC_CONFIG,
+)
+def async_executor(init_context):
+    """The async executor executes steps concurrently in a single process.
+
+    Up to ``max_concurrent`` steps that are ready to execute are run at the same time, sharing the
+    resources initialized for the run. The compute functions of async ops are all run on a single
+    event loop, so that ops that spend most of their time awaiting network calls can make progress
+    concurrently, and the events of each step are reported in the order the step produced them.
+    To select it, include a fragment such as the following in your run config:
+
+    .. code-block:: yaml
+
+        execution:
+          config:
+            async:
+              max_concurrent: 64
+
+    Synchronous parts of step execution, such as loading inputs and handling outputs, are run on
+    a pool of ``max_concurrent`` threads, so they should not hold the GIL for long.
+
+    Execution priority can be configured using the ``dagster/priority`` tag via solid/op metadata,
+    where the higher the number the higher the priority. 0 is the default and both positive
+    and negative numbers can be used.
+    """
+    return _core_async_executor_creation(init_context.executor_config)
+
+
+def _core_threaded_executor_creation(config: ExecutorConfig) -> "ThreadedExecutor":
+    from dagster._core.executor.threaded_executor import ThreadedExecutor
+
+    return ThreadedExecutor(
+        retries=RetryMode.from_config(check.dict_elem(config, "retries")),  # type: ignore
+        max_concurrent=check.int_elem(config, "max_concurrent"),
+        prefetch_inputs=check.bool_elem(config, "prefetch_inputs"),
+    )
+
+
+THREADED_CONFIG = Field(
+    {
+        "max_concurrent": Field(
+            Int,
+            default_value=0,
+            description=(
+                "The number of threads that may execute steps concurrently. By default, this is "
+                "set to the default number of workers of `concurrent.futures.ThreadPoolExecutor`."
+            ),
+        ),
+        "prefetch_inputs": Field(
+            Bool,
+            default_value=False,
+            description=(
+                "Whether to start loading the inputs of the next step that is ready to execute "
+                "while all of the threads are busy, through IO managers that load inputs "
+                "concurrently."
+            ),
+        ),
+        "retries": get_retries_config(),
+    },
+    description="Execute steps concurrently on a pool of threads in a single process.",
+)
+
+
+@executor(
+    name="threaded",
+    config_schema=THREADED_CONFIG,
+)
+def threaded_executor(init_context):
+    """The threaded executor executes steps concurrently on a pool of threads in a single process.
+
+    Resources are initialized once for the run and shared by all of the steps, so they must be
+    safe to use from several threads at once. This executor is suited to ops that spend most of
+    their time in I/O or in native code that releases the GIL. To select it, include a fragment
+    such as the following in your run config:
+
+    .. code-block:: yaml
+
+        execution:
+          config:
+            threaded:
+              max_concurrent: 8
+
+    The ``max_concurrent`` arg is optional and tells the execution engine how many threads may
+    execute steps concurrently. By default, or if you set ``max_concurrent`` to be 0, this is the
+    default number of workers of :py:class:`python:concurrent.futures.ThreadPoolExecutor`.
+
+    The output that each step writes to ``sys.stdout`` and ``sys.stderr`` is captured separately
+    for the step, in addition to the logs captured for the whole process.
+
+    If ``prefetch_inputs`` is set, the inputs of the next step that is ready to execute start
+    loading while all of the threads are busy, through IO managers whose ``max_concurrent_loads``
+    is more than 1, such as the :py:func:`fs_io_manager` configured with ``max_concurrent_loads``.
+    With ``max_concurrent`` set to 1, this executes the steps one at a time, loading the inputs of
+    each step while the previous step computes.
+
+    Execution priority can be configured using the ``dagster/priority`` tag via solid/op metadata,
+    where the higher the number the higher the priority. 0 is the default and both positive
+    and negative numbers can be used.
+    """
+    return _core_threaded_executor_creation(init_context.executor_config)
+
+
 default_executors: Sequence[ExecutorDefinition] = [in_process_executor, multiprocess_executor]
 
 
@@ -93,26 +93,18 @@ def _create_adjacency_lists(
     nodes: Sequence[Node],
     dep_structure: DependencyStructure,
 ) -> Tuple[Mapping[str, Set[str]], Mapping[str, Set[str]]]:
-    visit_dict = {s.name: False for s in nodes}
     forward_edges: Dict[str, Set[str]] = {s.name: set() for s in nodes}
     backward_edges: Dict[str, Set[str]] = {s.name: set() for s in nodes}
 
-    def visit(node_name: str) -> None:
-        if visit_dict[node_name]:
-            return
-
-        visit_dict[node_name] = True
-
-        for node_output in dep_structure.all_upstream_outputs_from_node(node_name):
+    # every node is visited exactly once, so a single pass over the nodes suffices (recursing
+    # into upstream nodes would exceed the recursion limit for long chains of dependencies)
+    for s in nodes:
+        backward_node = s.name
+        for node_output in dep_structure.all_upstream_outputs_from_node(backward_node):
             forward_node = node_output.node.name
-            backward_node = node_name
             if forward_node in forward_edges:
                 forward_edges[forward_node].add(backward_node)
                 backward_edges[backward_node].add(forward_node)
-                visit(forward_node)
-
-    for s in nodes:
-        visit(s.name)
 
     return (forward_edges, backward_edges)
 
@@ -7,6 +7,7 @@
     AbstractSet,
     Any,
     Dict,
+    FrozenSet,
     List,
     Mapping,
     Optional,
@@ -76,10 +77,14 @@
     from dagster._core.instance import DagsterInstance
     from dagster._core.snap import PipelineSnapshot
 
+# number of asset subset jobs kept per job definition
+MAX_CACHED_ASSET_SELECTION_JOBS = 32
+
 
 class JobDefinition(PipelineDefinition):
 
     _cached_partition_set: Optional["PartitionSetDefinition"]
+    _cached_asset_selection_jobs: Dict[FrozenSet[AssetKey], "JobDefinition"]
     _subset_selection_data: Optional[Union[OpSelectionData, AssetSelectionData]]
     input_values: Mapping[str, object]
 
@@ -218,6 +223,7 @@ def __init__(
         )
 
         self._cached_partition_set: Optional["PartitionSetDefinition"] = None
+        self._cached_asset_selection_jobs = {}
         self._subset_selection_data = _subset_selection_data
         self.input_values = input_values
         for input_name in sorted(list(self.input_values.keys())):
@@ -438,6 +444,12 @@ def _get_job_def_for_asset_selection(
     ) -> "JobDefinition":
         asset_selection = check.opt_set_param(asset_selection, "asset_selection", AssetKey)
 
+        # subset jobs are rebuilt from the full set of assets, so reuse the job built for an
+        # identical selection (e.g. repeated launches of the same asset subset)
+        cache_key = frozenset(asset_selection)
+        if cache_key in self._cached_asset_selection_jobs:
+            return self._cached_asset_selection_jobs[cache_key]
+
         nonexistent_assets = [
             asset
             for asset in asset_selection
@@ -476,6 +488,9 @@ def _get_job_def_for_asset_selection(
             asset_selection_data=asset_selection_data,
             config=self.config_mapping or self.partitioned_config,
         )
+        if len(self._cached_asset_selection_jobs) >= MAX_CACHED_ASSET_SELECTION_JOBS:
+            self._cached_asset_selection_jobs.pop(next(iter(self._cached_asset_selection_jobs)))
+        self._cached_asset_selection_jobs[cache_key] = new_job
         return new_job
 
     def _get_job_def_for_op_selection(
@@ -1022,6 +1022,10 @@ def get_partition_keys_not_in_subset(
     ) -> Iterable[str]:
         raise NotImplementedError()
 
+    @abstractmethod
+    def get_partition_keys(self, current_time: Optional[datetime] = None) -> Iterable[str]:
+        raise NotImplementedError()
+
     @abstractmethod
     def with_partition_keys(self, partition_keys: Iterable[str]) -> "PartitionsSubset":
         raise NotImplementedError()
@@ -1041,6 +1045,9 @@ def get_partition_keys_not_in_subset(
     ) -> Iterable[str]:
         return set(self._partitions_def.get_partition_keys()) - self._subset
 
+    def get_partition_keys(self, current_time: Optional[datetime] = None) -> Iterable[str]:
+        return self._subset
+
     def with_partition_keys(self, partition_keys: Iterable[str]) -> "DefaultPartitionsSubset":
         return DefaultPartitionsSubset(self._partitions_def, self._subset | set(partition_keys))
 
@@ -1,3 +1,4 @@
+import threading
 from abc import ABC, abstractmethod
 from inspect import isfunction
 from types import FunctionType
@@ -159,11 +160,20 @@ def __init__(
 
         self._all_definitions: Optional[Sequence[RepositoryLevelDefinition]] = None
 
+        # Guards construction of lazily loaded definitions, which may be requested concurrently
+        # (e.g. by a gRPC server that loads definitions on demand)
+        self._load_lock = threading.RLock()
+
     def _get_lazy_definitions(self) -> Sequence[RepositoryLevelDefinition]:
-        if self._lazy_definitions is None:
-            self._lazy_definitions = self._lazy_definitions_fn()
-            for definition in self._lazy_definitions:
-                self._validate_and_cache_definition(definition, definition.name)
+        if self._lazy_definitions is not None:
+            return self._lazy_definitions
+
+        with self._load_lock:
+            if self._lazy_definitions is None:
+                lazy_definitions = self._lazy_definitions_fn()
+                for definition in lazy_definitions:
+                    self._validate_and_cache_definition(definition, definition.name)
+                self._lazy_definitions = lazy_definitions
 
         return self._lazy_definitions
 
@@ -223,15 +233,20 @@ def get_definition(self, definition_name: str) -> RepositoryLevelDefinition:
         if definition_name in self._definition_cache:
             return self._definition_cache[definition_name]
 
-        definition_source = self._definitions[definition_name]
+        with self._load_lock:
+            # another thread may have loaded the definition while we were waiting for the lock
+            if definition_name in self._definition_cache:
+                return self._definition_cache[definition_name]
 
-        if isinstance(definition_source, self._definition_class):
-            self._definition_cache[definition_name] = self._validation_fn(definition_source)
-            return definition_source
-        else:
-            definition = cast(Callable, definition_source)()
-            self._validate_and_cache_definition(definition, definition_name)
-            return definition
+            definition_source = self._definitions[definition_name]
+
+            if isinstance(definition_source, self._definition_class):
+                self._definition_cache[definition_name] = self._validation_fn(definition_source)
+                return definition_source
+            else:
+                definition = cast(Callable, definition_source)()
+                self._validate_and_cache_definition(definition, definition_name)
+                return definition
 
     def _validate_and_cache_definition(
         self, definition: RepositoryLevelDefinition, definition_dict_key: str
@@ -471,6 +486,9 @@ def has_sensor(self, sensor_name: str) -> bool:
     def get_source_assets_by_key(self) -> Mapping[AssetKey, SourceAsset]:
         return {}
 
+    def get_assets_defs_by_key(self) -> Mapping[AssetKey, "AssetsDefinition"]:
+        return {}
+
     def load_all_definitions(self):
         # force load of all lazy constructed code artifacts
         self.get_all_pipelines()
@@ -844,7 +862,15 @@ def from_list(
                     schedule_def, coerced_graphs, unresolved_jobs, pipelines_or_jobs, target
                 )
 
-        # resolve all the UnresolvedAssetJobDefinitions using the full set of assets
+        # resolve all the UnresolvedAssetJobDefinitions using the full set of assets, sharing a
+        # single AssetGraph between them
+        asset_graph = (
+            AssetGraph.from_assets(
+                [*combined_asset_group.assets, *combined_asset_group.source_assets]
+            )
+            if combined_asset_group and unresolved_jobs
+            else None
+        )
         for name, unresolved_job_def in unresolved_jobs.items():
             if not combined_asset_group:
                 raise DagsterInvalidDefinitionError(
@@ -855,6 +881,7 @@ def from_list(
                 assets=combined_asset_group.assets,
                 source_assets=combined_asset_group.source_assets,
                 default_executor_def=default_executor_def,
+                asset_graph=asset_graph,
             )
             pipelines_or_jobs[name] = resolved_job
 
@@ -1199,6 +1226,7 @@ def __init__(
         self._repository_load_data = check.opt_inst_param(
             repository_load_data, "repository_load_data", RepositoryLoadData
         )
+        self._asset_graph: Optional[AssetGraph] = None
 
     @property
     def repository_load_data(self) -> Optional[RepositoryLoadData]:
@@ -1454,9 +1482,12 @@ def get_asset_value_loader(
 
     @property
     def asset_graph(self) -> AssetGraph:
-        return AssetGraph.from_assets(
-            [*self._assets_defs_by_key.values(), *self.source_assets_by_key.values()]
-        )
+        # cached so that the lookups it builds are shared across e.g. sensor ticks
+        if self._asset_graph is None:
+            self._asset_graph = AssetGraph.from_assets(
+                [*self._assets_defs_by_key.values(), *self.source_assets_by_key.values()]
+            )
+        return self._asset_graph
 
     # If definition comes from the @repository decorator, then the __call__ method will be
     # overwritten. Therefore, we want to maintain the call-ability of repository definitions.
@@ -1,3 +1,5 @@
+import inspect
+from enum import Enum
 from functools import update_wrapper
 from typing import (
     TYPE_CHECKING,
@@ -63,6 +65,38 @@ def is_context_provided(fn: ResourceFunction) -> TypeGuard[ResourceFunctionWithC
     return len(get_function_params(fn)) >= 1
 
 
+class ResourceScope(Enum):
+    """The lifecycle of the instances of a resource.
+
+    PER_EXECUTION: The resource is initialized each time the steps of a run are executed in a
+        process, i.e. once for a run that is executed in a single process, or once for each step
+        that a step worker process executes, and torn down when they finish. This is the default.
+    PER_RUN_PROCESS: When a worker process executes steps one at a time, e.g. the steps that a
+        Celery worker picks up, the resource is initialized by the first step that uses it with a
+        given config, reused by the steps that the process executes later with the same config,
+        including the steps of other runs, and torn down when the process exits. The resource must
+        be safe to use from each of these steps, must not depend on the run that it is initialized
+        for, and may only depend on other resources with this scope. The resources of different
+        definitions are told apart by resource key, resource function and config, so the resource
+        function must be a plain function that doesn't close over variables of an enclosing
+        function or have default arguments; pass such values through the resource config instead.
+        Executors that start a new process for each step, such as the multiprocess executor or the
+        Kubernetes executor's step pods, don't benefit from this scope.
+    """
+
+    PER_EXECUTION = "PER_EXECUTION"
+    PER_RUN_PROCESS = "PER_RUN_PROCESS"
+
+
+def _is_stateless_function(fn: ResourceFunction) -> bool:
+    return (
+        inspect.isfunction(fn)
+        and not fn.__closure__
+        and not fn.__defaults__
+        and not fn.__kwdefaults__
+    )
+
+
 class ResourceDefinition(AnonymousConfigurableDefinition, RequiresResources):
     """Core class for defining resources.
 
@@ -91,6 +125,8 @@ class ResourceDefinition(AnonymousConfigurableDefinition, RequiresResources):
         version (Optional[str]): (Experimental) The version of the resource's definition fn. Two
             wrapped resource functions should only have the same version if they produce the same
             resource definition when provided with the same inputs.
+        scope (Optional[ResourceScope]): (Experimental) The lifecycle of the instances of the
+            resource. Defaults to ``ResourceScope.PER_EXECUTION``.
     """
 
     def __init__(
@@ -100,6 +136,7 @@ def __init__(
         description: Optional[str] = None,
         required_resource_keys: Optional[AbstractSet[str]] = None,
         version: Optional[str] = None,
+        scope: Optional[ResourceScope] = None,
     ):
         self._resource_fn = check.callable_param(resource_fn, "resource_fn")
         self._config_schema = convert_user_facing_definition_config_schema(config_schema)
@@ -110,6 +147,21 @@ def __init__(
         self._version = check.opt_str_param(version, "version")
         if version:
             experimental_arg_warning("version", "ResourceDefinition.__init__")
+        self._scope = check.opt_inst_param(
+            scope, "scope", ResourceScope, default=ResourceScope.PER_EXECUTION
+        )
+        if self._scope != ResourceScope.PER_EXECUTION:
+            experimental_arg_warning("scope", "ResourceDefinition.__init__")
+        if self._scope == ResourceScope.PER_RUN_PROCESS and not _is_stateless_function(
+            resource_fn
+        ):
+            raise DagsterInvalidDefinitionError(
+                f"Resource function '{getattr(resource_fn, '__name__', resource_fn)}' has the "
+                "PER_RUN_PROCESS scope, but isn't a plain function, closes over variables of an "
+                "enclosing function or has default arguments. Resources with the PER_RUN_PROCESS "
+                "scope are reused by every definition with the same resource key, resource "
+                "function and config, so any state they depend on must come from their config."
+            )
 
     @property
     def resource_fn(self) -> ResourceFunction:
@@ -134,6 +186,10 @@ def version(self) -> Optional[str]:
     def required_resource_keys(self) -> AbstractSet[str]:
         return self._required_resource_keys
 
+    @property
+    def scope(self) -> ResourceScope:
+        return self._scope
+
     @public
     @staticmethod
     def none_resource(description: Optional[str] = None) -> "ResourceDefinition":
@@ -200,6 +256,7 @@ def copy_for_configured(
             resource_fn=self.resource_fn,
             required_resource_keys=self.required_resource_keys,
             version=self.version,
+            scope=self.scope,
         )
 
     def __call__(self, *args, **kwargs):
@@ -260,6 +317,7 @@ def __init__(
         description: Optional[str] = None,
         required_resource_keys: Optional[AbstractSet[str]] = None,
         version: Optional[str] = None,
+        scope: Optional[ResourceScope] = None,
     ):
         self.config_schema = config_schema  # checked by underlying definition
         self.description = check.opt_str_param(description, "description")
@@ -267,6 +325,7 @@ def __init__(
         self.required_resource_keys = check.opt_set_param(
             required_resource_keys, "required_resource_keys"
         )
+        self.scope = check.opt_inst_param(scope, "scope", ResourceScope)
 
     def __call__(self, resource_fn: ResourceFunction) -> ResourceDefinition:
         check.callable_param(resource_fn, "resource_fn")
@@ -297,6 +356,7 @@ def __call__(self, resource_fn: ResourceFunction) -> ResourceDefinition:
             description=self.description or format_docstring_for_description(resource_fn),
             version=self.version,
             required_resource_keys=self.required_resource_keys,
+            scope=self.scope,
         )
 
         update_wrapper(resource_def, wrapped=resource_fn)
@@ -315,6 +375,7 @@ def resource(
     description: Optional[str] = ...,
     required_resource_keys: Optional[AbstractSet[str]] = ...,
     version: Optional[str] = ...,
+    scope: Optional[ResourceScope] = ...,
 ) -> Callable[[ResourceFunction], "ResourceDefinition"]:
     ...
 
@@ -324,6 +385,7 @@ def resource(
     description: Optional[str] = None,
     required_resource_keys: Optional[AbstractSet[str]] = None,
     version: Optional[str] = None,
+    scope: Optional[ResourceScope] = None,
 ) -> Union[Callable[[ResourceFunction], "ResourceDefinition"], "ResourceDefinition"]:
     """Define a resource.
 
@@ -344,6 +406,10 @@ def resource(
             resource functions should only have the same version if they produce the same resource
             definition when provided with the same inputs.
         required_resource_keys (Optional[Set[str]]): Keys for the resources required by this resource.
+        scope (Optional[ResourceScope]): (Experimental) The lifecycle of the instances of the
+            resource. Set to ``ResourceScope.PER_RUN_PROCESS`` to reuse the resource across the
+            steps that a worker process executes one at a time, e.g. to keep a pool of database
+            connections open between them. Defaults to ``ResourceScope.PER_EXECUTION``.
     """
 
     # This case is for when decorator is used bare, without arguments.
@@ -357,6 +423,7 @@ def _wrap(resource_fn: ResourceFunction) -> "ResourceDefinition":
             description=description,
             required_resource_keys=required_resource_keys,
             version=version,
+            scope=scope,
         )(resource_fn)
 
     return _wrap
@@ -1004,6 +1004,19 @@ def get_partition_keys_not_in_subset(
 
         return result
 
+    def get_partition_keys(self, current_time: Optional[datetime] = None) -> Iterable[str]:
+        result = []
+        for included_window in self._included_time_windows:
+            time_windows = self._partitions_def._iterate_time_windows(  # pylint: disable=protected-access
+                included_window.start
+            )
+            for window in time_windows:
+                if window.start >= included_window.end:
+                    break
+                result.append(window.start.strftime(self._partitions_def.fmt))
+
+        return result
+
     @property
     def included_time_windows(self) -> Sequence[TimeWindow]:
         return self._included_time_windows
@@ -21,6 +21,7 @@
         PartitionsDefinition,
         SourceAsset,
     )
+    from dagster._core.definitions.asset_graph import AssetGraph
 
 
 class UnresolvedAssetJobDefinition(
@@ -145,9 +146,13 @@ def resolve(
         assets: Sequence["AssetsDefinition"],
         source_assets: Sequence["SourceAsset"],
         default_executor_def: Optional["ExecutorDefinition"] = None,
+        asset_graph: Optional["AssetGraph"] = None,
     ) -> "JobDefinition":
         """
         Resolve this UnresolvedAssetJobDefinition into a JobDefinition.
+
+        If an AssetGraph built from the same assets and source assets is provided, it is used to
+        resolve the selection instead of building a new one.
         """
         return build_asset_selection_job(
             name=self.name,
@@ -156,7 +161,7 @@ def resolve(
             source_assets=source_assets,
             description=self.description,
             tags=self.tags,
-            asset_selection=self.selection.resolve([*assets, *source_assets]),
+            asset_selection=self.selection.resolve(asset_graph or [*assets, *source_assets]),
             partitions_def=self.partitions_def,
             executor_def=self.executor_def or default_executor_def,
         )
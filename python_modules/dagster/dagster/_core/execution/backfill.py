@@ -8,6 +8,7 @@
 from dagster._core.host_representation import (
     ExternalPartitionSet,
     ExternalPipeline,
+    ExternalRepository,
     PipelineSelector,
     RepositoryLocation,
 )
@@ -17,6 +18,7 @@
 )
 from dagster._core.host_representation.origin import ExternalPartitionSetOrigin
 from dagster._core.instance import DagsterInstance
+from dagster._core.storage.partition_status_cache import get_and_update_asset_status_cache_values
 from dagster._core.storage.pipeline_run import PipelineRun, PipelineRunStatus, RunsFilter
 from dagster._core.storage.tags import (
     PARENT_RUN_ID_TAG,
@@ -173,6 +175,16 @@ def submit_backfill_runs(
         ),
     )
     external_repo = repo_location.get_repository(repo_name)
+
+    if backfill_job.from_failure and backfill_job.asset_selection:
+        # only the partitions of the selected assets that failed can be re-executed, which are
+        # read from the asset status cache rather than from the last run of each partition
+        partition_names = _filter_failed_asset_partitions(
+            instance, external_repo, backfill_job.asset_selection, partition_names
+        )
+        if not partition_names:
+            return
+
     partition_set_name = backfill_job.partition_set_origin.partition_set_name
     external_partition_set = external_repo.get_external_partition_set(partition_set_name)
     result = repo_location.get_external_partition_set_execution_param_data(
@@ -213,6 +225,42 @@ def submit_backfill_runs(
         yield None
 
 
+def _filter_failed_asset_partitions(
+    instance: DagsterInstance,
+    external_repo: ExternalRepository,
+    asset_selection: Sequence[AssetKey],
+    partition_names: Sequence[str],
+) -> Sequence[str]:
+    """Returns the partitions in which any of the selected assets failed to materialize. The
+    partitions are returned unfiltered if any of the assets is not partitioned.
+    """
+    partitions_defs_by_key = {}
+    for asset_key in asset_selection:
+        external_asset_node = external_repo.get_external_asset_node(asset_key)
+        if external_asset_node is None or external_asset_node.partitions_def_data is None:
+            return partition_names
+        partitions_defs_by_key[
+            asset_key
+        ] = external_asset_node.partitions_def_data.get_partitions_definition()
+
+    failed_partition_names = set()
+    cache_values_by_key = get_and_update_asset_status_cache_values(
+        instance, partitions_defs_by_key
+    )
+    for asset_key, cache_value in cache_values_by_key.items():
+        failed_partition_names.update(
+            cache_value.deserialize_failed_partition_subsets(
+                partitions_defs_by_key[asset_key]
+            ).get_partition_keys()
+        )
+
+    return [
+        partition_name
+        for partition_name in partition_names
+        if partition_name in failed_partition_names
+    ]
+
+
 def create_backfill_run(
     instance: DagsterInstance,
     repo_location: RepositoryLocation,
@@ -5,10 +5,12 @@
 import subprocess
 import sys
 import tempfile
+import threading
 import time
 import uuid
 import warnings
 from contextlib import contextmanager
+from typing import IO, Iterator, Optional
 
 from dagster._core.execution import poll_compute_logs, watch_orphans
 from dagster._serdes.ipc import interrupt_ipc_subprocess, open_ipc_subprocess
@@ -29,6 +31,67 @@ def redirect_to_file(stream, filepath):
             yield
 
 
+# The streams that the output of the current thread is copied to while it executes a step, see
+# redirect_thread_output
+_thread_output = threading.local()
+
+
+class _ThreadOutputStream:
+    """Proxies a process output stream, copying everything written to it by a thread to the stream
+    registered for that thread, if any.
+    """
+
+    def __init__(self, stream: IO, io_attr: str):
+        self._stream = stream
+        self._io_attr = io_attr
+
+    def write(self, data):
+        thread_stream = getattr(_thread_output, self._io_attr, None)
+        if thread_stream is not None:
+            thread_stream.write(data)
+        return self._stream.write(data)
+
+    def flush(self):
+        thread_stream = getattr(_thread_output, self._io_attr, None)
+        if thread_stream is not None:
+            thread_stream.flush()
+        self._stream.flush()
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+
+@contextmanager
+def capture_thread_output() -> Iterator[None]:
+    """Allows the threads started within this context to capture their own writes to sys.stdout
+    and sys.stderr with redirect_thread_output, while still writing them to the process streams.
+
+    Output written directly to the underlying file descriptors, e.g. by subprocesses, can only be
+    captured for the process as a whole.
+    """
+    prev_stdout, prev_stderr = sys.stdout, sys.stderr
+    sys.stdout = _ThreadOutputStream(prev_stdout, "stdout")  # type: ignore
+    sys.stderr = _ThreadOutputStream(prev_stderr, "stderr")  # type: ignore
+    try:
+        yield
+    finally:
+        sys.stdout, sys.stderr = prev_stdout, prev_stderr
+
+
+@contextmanager
+def redirect_thread_output(stdout: Optional[IO], stderr: Optional[IO]) -> Iterator[None]:
+    """Copies the output of the current thread to the given streams. Only takes effect within
+    capture_thread_output.
+    """
+    prev_stdout = getattr(_thread_output, "stdout", None)
+    prev_stderr = getattr(_thread_output, "stderr", None)
+    _thread_output.stdout, _thread_output.stderr = stdout, stderr
+    try:
+        yield
+    finally:
+        _thread_output.stdout, _thread_output.stderr = prev_stdout, prev_stderr
+
+
 @contextmanager
 def mirror_stream_to_file(stream, filepath):
     ensure_file(filepath)
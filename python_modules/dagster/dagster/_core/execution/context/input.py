@@ -117,7 +117,7 @@ def __init__(
             self._resources_contain_cm = isinstance(self._resources, IContainsGenerator)
             self._cm_scope_entered = False
 
-        self._events: List["DagsterEvent"] = []
+        self._unconsumed_observations: List[AssetObservation] = []
         self._observations: List[AssetObservation] = []
         self._metadata_entries: List[Union[MetadataEntry, PartitionMetadataEntry]] = []
 
@@ -418,9 +418,14 @@ def consume_events(self) -> Iterator["DagsterEvent"]:
         If consume_events has not yet been called, this will yield all logged events since the call to `handle_input`. If consume_events has been called, it will yield all events since the last time consume_events was called. Designed for internal use. Users should never need to invoke this method.
         """
 
-        events = self._events
-        self._events = []
-        yield from events
+        from dagster._core.events import DagsterEvent
+
+        # the events are created as they are consumed, by the thread that executes the step,
+        # rather than by the thread that loaded the input
+        observations = self._unconsumed_observations
+        self._unconsumed_observations = []
+        for observation in observations:
+            yield DagsterEvent.asset_observation(self.step_context, observation)
 
     def add_input_metadata(
         self,
@@ -434,7 +439,6 @@ def add_input_metadata(
         Only valid if the context has an asset key.
         """
         from dagster._core.definitions.metadata import normalize_metadata
-        from dagster._core.events import DagsterEvent
 
         metadata = check.mapping_param(metadata, "metadata", key_type=str)
         self._metadata_entries.extend(normalize_metadata(metadata, []))
@@ -449,7 +453,7 @@ def add_input_metadata(
             )
             self._observations.append(observation)
             if self._step_context:
-                self._events.append(DagsterEvent.asset_observation(self._step_context, observation))
+                self._unconsumed_observations.append(observation)
 
     def get_observations(
         self,
@@ -46,9 +46,11 @@
 )
 from dagster._core.errors import DagsterInvariantViolationError
 from dagster._core.execution.plan.handle import ResolvedFromDynamicStepHandle, StepHandle
+from dagster._core.execution.input_prefetcher import InputPrefetcher
 from dagster._core.execution.plan.outputs import StepOutputHandle
 from dagster._core.execution.plan.step import ExecutionStep
 from dagster._core.execution.retries import RetryMode
+from dagster._core.execution.type_check_cache import TypeCheckCache
 from dagster._core.executor.base import Executor
 from dagster._core.log_manager import DagsterLogManager
 from dagster._core.storage.io_manager import IOManager
@@ -184,6 +186,8 @@ class ExecutionData(NamedTuple):
     resolved_run_config: ResolvedRunConfig
     pipeline_def: PipelineDefinition
     mode_def: ModeDefinition
+    type_check_cache: TypeCheckCache
+    input_prefetcher: InputPrefetcher
 
 
 class IStepContext(IPlanContext):
@@ -311,12 +315,17 @@ def for_step(
         self,
         step: ExecutionStep,
         known_state: Optional["KnownExecutionState"] = None,
+        defer_log_handling: bool = False,
     ) -> IStepContext:
+        log_manager = self._log_manager.with_tags(**step.logging_tags)
+        if defer_log_handling:
+            # the messages of the step are handled when flush_deferred is called on its log manager
+            log_manager = log_manager.with_deferred_handling()
 
         return StepExecutionContext(
             plan_data=self.plan_data,
             execution_data=self._execution_data,
-            log_manager=self._log_manager.with_tags(**step.logging_tags),
+            log_manager=log_manager,
             step=step,
             output_capture=self.output_capture,
             known_state=known_state,
@@ -334,6 +343,14 @@ def resolved_run_config(self) -> ResolvedRunConfig:
     def scoped_resources_builder(self) -> ScopedResourcesBuilder:
         return self._execution_data.scoped_resources_builder
 
+    @property
+    def type_check_cache(self) -> TypeCheckCache:
+        return self._execution_data.type_check_cache
+
+    @property
+    def input_prefetcher(self) -> InputPrefetcher:
+        return self._execution_data.input_prefetcher
+
     @property
     def log(self) -> DagsterLogManager:
         return self._log_manager
@@ -581,10 +598,13 @@ def for_input_manager(
         resource_config: Any = None,
         resources: Optional["Resources"] = None,
         artificial_output_context: Optional["OutputContext"] = None,
+        log_manager: Optional[DagsterLogManager] = None,
     ) -> InputContext:
         if source_handle and artificial_output_context:
             check.failed("Cannot specify both source_handle and artificial_output_context.")
 
+        log_manager = log_manager or self.log
+
         upstream_output: Optional[OutputContext] = None
 
         if source_handle is not None:
@@ -598,7 +618,7 @@ def for_input_manager(
                 self.resolved_run_config,
                 source_handle,
                 self._get_source_run_id(source_handle),
-                log_manager=self.log,
+                log_manager=log_manager,
                 step_context=self,
                 resources=None,
                 version=version,
@@ -615,7 +635,7 @@ def for_input_manager(
             metadata=metadata,
             upstream_output=upstream_output,
             dagster_type=dagster_type,
-            log_manager=self.log,
+            log_manager=log_manager,
             step_context=self,
             resource_config=resource_config,
             resources=resources,
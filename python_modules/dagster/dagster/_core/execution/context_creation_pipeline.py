@@ -34,11 +34,14 @@
     get_required_resource_keys_to_init,
     resource_initialization_manager,
 )
+from dagster._core.execution.input_prefetcher import InputPrefetcher
 from dagster._core.execution.retries import RetryMode
+from dagster._core.execution.type_check_cache import TypeCheckCache
 from dagster._core.executor.init import InitExecutorContext
 from dagster._core.instance import DagsterInstance
 from dagster._core.log_manager import DagsterLogManager
 from dagster._core.storage.pipeline_run import PipelineRun
+from dagster._core.storage.shared_memory_io_manager import remove_shared_memory_run_values
 from dagster._core.system_config.objects import ResolvedRunConfig
 from dagster._loggers import default_loggers, default_system_loggers
 from dagster._utils import EventGenerationManager
@@ -169,6 +172,8 @@ def create_execution_data(
         mode_def=context_creation_data.pipeline_def.get_mode_definition(
             context_creation_data.resolved_run_config.mode
         ),
+        type_check_cache=TypeCheckCache(),
+        input_prefetcher=InputPrefetcher(),
     )
 
 
@@ -343,6 +348,15 @@ def orchestration_context_event_generator(
         _validate_plan_with_context(execution_context, execution_plan)
 
         yield execution_context
+
+        # runs that will be resumed aren't finished yet, and still need their values
+        run = instance.get_run_by_id(pipeline_run.run_id)
+        if run is None or run.is_finished:
+            remove_shared_memory_run_values(
+                context_creation_data.mode_def,
+                context_creation_data.resolved_run_config,
+                pipeline_run.run_id,
+            )
     except DagsterError as dagster_error:
         dagster_error = cast(DagsterUserCodeExecutionError, dagster_error)
         user_facing_exc_info = (
@@ -0,0 +1,126 @@
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+import dagster._check as check
+from dagster._core.execution.plan.outputs import StepOutputHandle
+
+if TYPE_CHECKING:
+    from dagster._core.execution.context.input import InputContext
+    from dagster._core.execution.context.system import StepExecutionContext
+    from dagster._core.storage.input_manager import InputManager
+
+PrefetchKey = Tuple[str, str, StepOutputHandle]
+
+
+class InputPrefetcher:
+    """Loads the inputs of steps from upstream outputs ahead of the steps reading them, on a
+    bounded pool of threads per input manager.
+
+    Only the managers whose ``max_concurrent_loads`` is more than 1 are used concurrently. The
+    steps pick up the loads with ``pop`` and resolve them in their own threads, so that the errors,
+    log messages and events of the loads are reported by the steps as if they had loaded the
+    inputs themselves.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pools: Dict[int, Tuple["InputManager", ThreadPoolExecutor]] = {}
+        self._loads: Dict[PrefetchKey, Tuple["InputContext", "Future[Any]"]] = {}
+        self._is_shutdown = False
+
+    def _get_pool(self, input_manager: "InputManager") -> ThreadPoolExecutor:
+        # pools are keyed by the identity of the manager, which is held so that it isn't reused
+        entry = self._pools.get(id(input_manager))
+        if entry is None:
+            pool = ThreadPoolExecutor(
+                max_workers=input_manager.max_concurrent_loads,
+                thread_name_prefix="dagster_input_load",
+            )
+            entry = (input_manager, pool)
+            self._pools[id(input_manager)] = entry
+        return entry[1]
+
+    def prefetch(self, step_context: "StepExecutionContext") -> int:
+        """Starts loading the inputs of the step that are loaded from upstream outputs through
+        managers that load inputs concurrently. Returns the number of loads that were started.
+        """
+        from dagster._core.execution.plan.inputs import FromMultipleSources, FromStepOutput
+
+        num_started = 0
+        for step_input in step_context.step.step_inputs:
+            input_def = step_context.solid_def.input_def_named(step_input.name)
+            if input_def.dagster_type.is_nothing:
+                continue
+
+            sources = (
+                step_input.source.sources
+                if isinstance(step_input.source, FromMultipleSources)
+                else [step_input.source]
+            )
+            for source in sources:
+                if not isinstance(source, FromStepOutput):
+                    continue
+
+                key = (step_context.step.key, input_def.name, source.step_output_handle)
+                with self._lock:
+                    if self._is_shutdown:
+                        return num_started
+                    if key in self._loads:
+                        continue
+
+                try:
+                    if not step_context.can_load(source.step_output_handle):
+                        continue
+                    _, input_manager = source.get_input_manager(step_context, input_def)
+                    if input_manager.max_concurrent_loads <= 1:
+                        continue
+                    # the messages logged during the load are handled when the step picks it up,
+                    # since the handlers of the run may not be safe to use from other threads
+                    load_context = source.get_load_context(
+                        step_context,
+                        input_def,
+                        log_manager=step_context.log.with_deferred_handling(),
+                    )
+                except Exception:
+                    # the step reports the error when it loads the input itself
+                    continue
+
+                with self._lock:
+                    if self._is_shutdown:
+                        return num_started
+                    future = self._get_pool(input_manager).submit(
+                        input_manager.load_input, load_context
+                    )
+                    self._loads[key] = (load_context, future)
+                num_started += 1
+
+        return num_started
+
+    def pop(
+        self, step_key: str, input_name: str, step_output_handle: StepOutputHandle
+    ) -> Optional[Tuple["InputContext", "Future[Any]"]]:
+        """Returns the context and the future of the load of the input from the upstream output,
+        if it was prefetched, and stops tracking it.
+        """
+        check.str_param(step_key, "step_key")
+        check.str_param(input_name, "input_name")
+        check.inst_param(step_output_handle, "step_output_handle", StepOutputHandle)
+        with self._lock:
+            return self._loads.pop((step_key, input_name, step_output_handle), None)
+
+    def shutdown(self) -> None:
+        """Cancels the loads that haven't started and waits for the others to finish, so that no
+        inputs are loaded after the resources of the run are torn down.
+        """
+        with self._lock:
+            self._is_shutdown = True
+            futures: List["Future[Any]"] = [future for _, future in self._loads.values()]
+            pools = [pool for _, pool in self._pools.values()]
+            self._loads = {}
+            self._pools = {}
+
+        for future in futures:
+            future.cancel()
+        for pool in pools:
+            pool.shutdown(wait=True)
@@ -239,7 +239,10 @@ def get_step_by_key(self, step_key: str) -> ExecutionStep:
         step = self._plan.get_step_by_key(step_key)
         return cast(ExecutionStep, check.inst(step, ExecutionStep))
 
-    def get_steps_to_execute(self, limit: Optional[int] = None) -> Sequence[ExecutionStep]:
+    def peek_steps_to_execute(self, limit: Optional[int] = None) -> Sequence[ExecutionStep]:
+        """The steps that are ready to execute, in the order that get_steps_to_execute would return
+        them, without marking them as in flight.
+        """
         check.invariant(
             self._context_guard,
             "ActiveExecution must be used as a context manager",
@@ -255,6 +258,11 @@ def get_steps_to_execute(self, limit: Optional[int] = None) -> Sequence[Executio
         if limit is not None:
             steps = steps[:limit]
 
+        return steps
+
+    def get_steps_to_execute(self, limit: Optional[int] = None) -> Sequence[ExecutionStep]:
+        steps = self.peek_steps_to_execute(limit)
+
         for step in steps:
             self._in_flight.add(step.key)
             self._executable.remove(step.key)
@@ -1,6 +1,21 @@
 import asyncio
 import inspect
-from typing import Any, AsyncGenerator, Callable, Iterator, List, Mapping, Sequence, Set, Union
+import threading
+from concurrent.futures import CancelledError
+from contextlib import contextmanager
+from typing import (
+    Any,
+    AsyncGenerator,
+    Callable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
 
 from typing_extensions import TypeAlias
 
@@ -17,7 +32,11 @@
 )
 from dagster._core.definitions.asset_layer import AssetLayer
 from dagster._core.definitions.op_definition import OpComputeFunction
-from dagster._core.errors import DagsterExecutionStepExecutionError, DagsterInvariantViolationError
+from dagster._core.errors import (
+    DagsterExecutionInterruptedError,
+    DagsterExecutionStepExecutionError,
+    DagsterInvariantViolationError,
+)
 from dagster._core.events import DagsterEvent
 from dagster._core.execution.context.compute import SolidExecutionContext
 from dagster._core.execution.context.system import StepExecutionContext
@@ -105,7 +124,57 @@ def _validate_event(event: Any, step_context: StepExecutionContext) -> SolidOutp
     return event
 
 
+# Executors that run steps concurrently from several threads set the event loop that the async
+# compute functions of the steps run on, so that they can all make progress on a single loop
+_compute_event_loop = threading.local()
+
+
+@contextmanager
+def run_async_compute_on_event_loop(loop: asyncio.AbstractEventLoop) -> Iterator[None]:
+    """Runs the async compute functions of steps executed in the current thread on the given event
+    loop, which must be running in another thread.
+    """
+    check.inst_param(loop, "loop", asyncio.AbstractEventLoop)
+    prev_loop = getattr(_compute_event_loop, "loop", None)
+    _compute_event_loop.loop = loop
+    try:
+        yield
+    finally:
+        _compute_event_loop.loop = prev_loop
+
+
+async def _anext_or_stop(async_gen: AsyncGenerator) -> Tuple[bool, Any]:
+    try:
+        return False, await async_gen.__anext__()
+    except StopAsyncIteration:
+        return True, None
+
+
+def _gen_from_async_gen_on_loop(
+    async_gen: AsyncGenerator, loop: asyncio.AbstractEventLoop
+) -> Iterator:
+    while True:
+        try:
+            stopped, value = asyncio.run_coroutine_threadsafe(
+                _anext_or_stop(async_gen), loop
+            ).result()
+        except CancelledError:
+            # the executor cancels the async compute functions that are in flight when the run
+            # is interrupted
+            raise DagsterExecutionInterruptedError()
+        if stopped:
+            return
+        yield value
+
+
 def gen_from_async_gen(async_gen: AsyncGenerator) -> Iterator:
+    compute_event_loop: Optional[asyncio.AbstractEventLoop] = getattr(
+        _compute_event_loop, "loop", None
+    )
+    if compute_event_loop is not None:
+        yield from _gen_from_async_gen_on_loop(async_gen, compute_event_loop)
+        return
+
     loop = asyncio.get_event_loop()
     while True:
         try:
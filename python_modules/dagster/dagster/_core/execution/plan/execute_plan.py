@@ -1,6 +1,11 @@
+import asyncio
+import itertools
+import queue
 import sys
-from contextlib import ExitStack
-from typing import Iterator, Sequence, cast
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
+from typing import Dict, Iterator, List, Optional, Sequence, Set, Tuple, cast
 
 import dagster._check as check
 from dagster._core.definitions import Failure, HookExecutionResult, RetryRequested
@@ -13,8 +18,14 @@
     user_code_error_boundary,
 )
 from dagster._core.events import DagsterEvent, EngineEventData
-from dagster._core.execution.compute_logs import create_compute_log_file_key
+from dagster._core.execution.compute_logs import (
+    capture_thread_output,
+    create_compute_log_file_key,
+    redirect_thread_output,
+)
 from dagster._core.execution.context.system import PlanExecutionContext, StepExecutionContext
+from dagster._core.execution.plan.active import ActiveExecution
+from dagster._core.execution.plan.compute import run_async_compute_on_event_loop
 from dagster._core.execution.plan.execute_step import core_dagster_event_sequence_for_step
 from dagster._core.execution.plan.objects import (
     ErrorSource,
@@ -24,9 +35,13 @@
     step_failure_event_from_exc_info,
 )
 from dagster._core.execution.plan.plan import ExecutionPlan
-from dagster._core.storage.captured_log_manager import CapturedLogManager
+from dagster._core.storage.captured_log_manager import CapturedLogContext, CapturedLogManager
+from dagster._core.storage.compute_log_manager import ComputeIOType
 from dagster._utils.error import SerializableErrorInfo, serializable_error_info_from_exc_info
 
+# How often the concurrent plan iterator checks for interrupts while waiting for step events
+INTERRUPT_CHECK_INTERVAL = 0.1
+
 
 def inner_plan_execution_iterator(
     pipeline_context: PlanExecutionContext, execution_plan: ExecutionPlan
@@ -37,21 +52,14 @@ def inner_plan_execution_iterator(
     step_keys = [step.key for step in execution_plan.get_steps_to_execute_in_topo_order()]
     with execution_plan.start(retry_mode=pipeline_context.retry_mode) as active_execution:
         with ExitStack() as capture_stack:
+            # wait for the inputs that are still loading before the resources are torn down
+            capture_stack.callback(pipeline_context.input_prefetcher.shutdown)
+
             # begin capturing logs for the whole process if this is a captured log manager
             if isinstance(compute_log_manager, CapturedLogManager):
-                file_key = create_compute_log_file_key()
-                log_key = compute_log_manager.build_log_key_for_run(
-                    pipeline_context.run_id, file_key
+                yield from _capture_process_logs(
+                    pipeline_context, compute_log_manager, step_keys, capture_stack
                 )
-                try:
-                    log_context = capture_stack.enter_context(
-                        compute_log_manager.capture_logs(log_key)
-                    )
-                    yield DagsterEvent.capture_logs(
-                        pipeline_context, step_keys, log_key, log_context
-                    )
-                except Exception:
-                    yield from _handle_compute_log_setup_error(pipeline_context, sys.exc_info())
 
             # It would be good to implement a reference tracking algorithm here to
             # garbage collect results that are no longer needed by any steps
@@ -64,20 +72,7 @@ def inner_plan_execution_iterator(
                 )
                 step_event_list = []
 
-                missing_resources = [
-                    resource_key
-                    for resource_key in step_context.required_resource_keys
-                    if not hasattr(step_context.resources, resource_key)
-                ]
-                check.invariant(
-                    len(missing_resources) == 0,
-                    (
-                        "Expected step context for solid {solid_name} to have all required resources, but "
-                        "missing {missing_resources}."
-                    ).format(
-                        solid_name=step_context.solid.name, missing_resources=missing_resources
-                    ),
-                )
+                _check_step_resources(step_context)
 
                 with ExitStack() as step_stack:
                     if not isinstance(compute_log_manager, CapturedLogManager):
@@ -136,6 +131,315 @@ def inner_plan_execution_iterator(
                 yield from _handle_compute_log_teardown_error(pipeline_context, sys.exc_info())
 
 
+def concurrent_plan_execution_iterator(
+    pipeline_context: PlanExecutionContext,
+    execution_plan: ExecutionPlan,
+    max_concurrent: int,
+    event_loop: Optional[asyncio.AbstractEventLoop] = None,
+    capture_step_logs: bool = False,
+    prefetch_inputs: bool = False,
+) -> Iterator[DagsterEvent]:
+    """Executes the steps of the plan in the current process, running up to max_concurrent steps
+    at a time in a pool of threads.
+
+    The steps share the resources of the pipeline context. Each step's events are yielded in the
+    order the step produced them, interleaved with the events of the other steps in flight, and
+    the progress through the plan is tracked from this thread. The messages and events that the
+    steps log are handled from this thread too, so that the handlers of the run, e.g. the one that
+    writes to the event log storage, are only used from one thread.
+
+    If an event loop running in another thread is given, the async compute functions of all steps
+    are run on that loop, otherwise each step runs them on an event loop of its own.
+
+    If capture_step_logs is set, the output that each step writes to sys.stdout and sys.stderr
+    from its thread is also captured separately for that step.
+
+    If prefetch_inputs is set, the inputs of the next step that is ready to execute start loading
+    while all of the threads are busy, through the input managers that load inputs concurrently.
+    """
+    check.inst_param(pipeline_context, "pipeline_context", PlanExecutionContext)
+    check.inst_param(execution_plan, "execution_plan", ExecutionPlan)
+    check.int_param(max_concurrent, "max_concurrent")
+    check.invariant(max_concurrent > 0, "max_concurrent must be positive")
+    check.opt_inst_param(event_loop, "event_loop", asyncio.AbstractEventLoop)
+    check.bool_param(capture_step_logs, "capture_step_logs")
+    check.bool_param(prefetch_inputs, "prefetch_inputs")
+
+    compute_log_manager = pipeline_context.instance.compute_log_manager
+    step_keys = [step.key for step in execution_plan.get_steps_to_execute_in_topo_order()]
+    prefetched_step_keys: Set[str] = set()
+    with execution_plan.start(retry_mode=pipeline_context.retry_mode) as active_execution:
+        with ExitStack() as capture_stack:
+            # wait for the inputs that are still loading before the resources are torn down
+            capture_stack.callback(pipeline_context.input_prefetcher.shutdown)
+
+            # the logs of concurrent steps are interleaved on the same process streams, so they are
+            # captured for the whole process, and additionally per step from each step's thread
+            if isinstance(compute_log_manager, CapturedLogManager):
+                yield from _capture_process_logs(
+                    pipeline_context, compute_log_manager, step_keys, capture_stack
+                )
+                if capture_step_logs:
+                    capture_stack.enter_context(capture_thread_output())
+
+            # steps are tracked by launch rather than by key, since a step that is up for retry can
+            # be launched again before the thread that executed its previous attempt has finished
+            event_queue: "queue.Queue[Tuple[int, Optional[DagsterEvent]]]" = queue.Queue()
+            step_contexts: Dict[int, StepExecutionContext] = {}
+            step_event_lists: Dict[int, List[DagsterEvent]] = {}
+            errors: List[BaseException] = []
+            launch_ids = itertools.count()
+            interrupted = False
+            interrupt_event = threading.Event()
+
+            with ThreadPoolExecutor(
+                max_workers=max_concurrent, thread_name_prefix="dagster_step"
+            ) as thread_pool:
+                while (
+                    not interrupted and not errors and not active_execution.is_complete
+                ) or step_contexts:
+                    if not interrupted and active_execution.check_for_interrupts():
+                        yield DagsterEvent.engine_event(
+                            pipeline_context,
+                            "Received termination signal - waiting for steps in flight to finish",
+                            EngineEventData.interrupted(
+                                [step_context.step.key for step_context in step_contexts.values()]
+                            ),
+                        )
+                        interrupted = True
+                        active_execution.mark_interrupted()
+                        interrupt_event.set()
+                        if event_loop:
+                            _cancel_event_loop_tasks(event_loop)
+
+                    if not step_contexts:
+                        # process skips and abandons before deciding whether any steps can start
+                        yield from active_execution.plan_events_iterator(pipeline_context)
+
+                    if not interrupted and not errors:
+                        for step in active_execution.get_steps_to_execute(
+                            limit=max_concurrent - len(step_contexts)
+                        ):
+                            step_context = cast(
+                                StepExecutionContext,
+                                pipeline_context.for_step(
+                                    step,
+                                    active_execution.get_known_state(),
+                                    defer_log_handling=True,
+                                ),
+                            )
+                            _check_step_resources(step_context)
+                            launch_id = next(launch_ids)
+                            step_contexts[launch_id] = step_context
+                            step_event_lists[launch_id] = []
+                            thread_pool.submit(
+                                _execute_step_in_thread,
+                                launch_id,
+                                step_context,
+                                event_queue,
+                                errors,
+                                interrupt_event,
+                                event_loop,
+                                capture_step_logs
+                                and isinstance(compute_log_manager, CapturedLogManager),
+                            )
+
+                        if prefetch_inputs and len(step_contexts) == max_concurrent:
+                            _prefetch_inputs_of_next_steps(
+                                pipeline_context, active_execution, 1, prefetched_step_keys
+                            )
+
+                    if not step_contexts:
+                        if not interrupted and not errors and not active_execution.is_complete:
+                            # the only steps left are waiting to be retried
+                            active_execution.sleep_til_ready()
+                        continue
+
+                    try:
+                        # wake up periodically to check for interrupts while steps are running
+                        launch_id, step_event = event_queue.get(timeout=INTERRUPT_CHECK_INTERVAL)
+                    except queue.Empty:
+                        continue
+
+                    # handle the messages that the step logged up to and including the event
+                    step_contexts[launch_id].log.flush_deferred()
+
+                    if step_event is not None:
+                        step_event_lists[launch_id].append(step_event)
+                        yield step_event
+                        active_execution.handle_event(step_event)
+                        continue
+
+                    # the step has finished
+                    step_context = step_contexts.pop(launch_id)
+                    step_event_list = step_event_lists.pop(launch_id)
+                    if not any(
+                        other_context.step.key == step_context.step.key
+                        for other_context in step_contexts.values()
+                    ):
+                        active_execution.verify_complete(pipeline_context, step_context.step.key)
+
+                    # process skips from failures or uncovered inputs
+                    for event in active_execution.plan_events_iterator(pipeline_context):
+                        step_event_list.append(event)
+                        yield event
+
+                    # pass a list of step events to hooks
+                    for event in _trigger_hook(step_context, step_event_list):
+                        step_context.log.flush_deferred()
+                        yield event
+                    step_context.log.flush_deferred()
+
+            if errors:
+                raise errors[0]
+
+            if interrupted:
+                raise DagsterExecutionInterruptedError()
+
+            try:
+                capture_stack.close()
+            except Exception:
+                yield from _handle_compute_log_teardown_error(pipeline_context, sys.exc_info())
+
+
+def _execute_step_in_thread(
+    launch_id: int,
+    step_context: StepExecutionContext,
+    event_queue: "queue.Queue[Tuple[int, Optional[DagsterEvent]]]",
+    errors: List[BaseException],
+    interrupt_event: threading.Event,
+    event_loop: Optional[asyncio.AbstractEventLoop],
+    capture_step_logs: bool,
+) -> None:
+    try:
+        with ExitStack() as stack:
+            if event_loop:
+                stack.enter_context(run_async_compute_on_event_loop(event_loop))
+            else:
+                stack.enter_context(_thread_event_loop())
+
+            if capture_step_logs:
+                for event in _capture_step_thread_logs(step_context, stack):
+                    event_queue.put((launch_id, event))
+
+            step_events = check.generator(dagster_event_sequence_for_step(step_context))
+            for step_event in step_events:
+                check.inst(step_event, DagsterEvent)
+                event_queue.put((launch_id, step_event))
+                if interrupt_event.is_set() and not (
+                    step_event.is_step_success
+                    or step_event.is_step_failure
+                    or step_event.is_step_up_for_retry
+                ):
+                    # interrupts are only raised in the main thread, so they are raised within the
+                    # step here, which reports the step as failed before raising the interrupt
+                    try:
+                        interrupted_event = step_events.throw(DagsterExecutionInterruptedError())
+                    except StopIteration:
+                        break
+                    event_queue.put((launch_id, interrupted_event))
+    except BaseException as error:  # pylint: disable=broad-except
+        # raised once the steps in flight have finished, as the step would have been raised from
+        # when executing steps one at a time
+        errors.append(error)
+    finally:
+        event_queue.put((launch_id, None))
+
+
+@contextmanager
+def _thread_event_loop() -> Iterator[None]:
+    # only the main thread has an event loop by default
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        yield
+    finally:
+        asyncio.set_event_loop(None)
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        loop.close()
+
+
+def _capture_step_thread_logs(
+    step_context: StepExecutionContext, capture_stack: ExitStack
+) -> Iterator[DagsterEvent]:
+    compute_log_manager = cast(CapturedLogManager, step_context.instance.compute_log_manager)
+    log_key = compute_log_manager.build_log_key_for_run(
+        step_context.run_id, create_compute_log_file_key()
+    )
+    try:
+        stdout = capture_stack.enter_context(
+            compute_log_manager.open_log_stream(log_key, ComputeIOType.STDOUT)
+        )
+        stderr = capture_stack.enter_context(
+            compute_log_manager.open_log_stream(log_key, ComputeIOType.STDERR)
+        )
+        capture_stack.enter_context(redirect_thread_output(stdout, stderr))
+        yield DagsterEvent.capture_logs(
+            step_context, [step_context.step.key], log_key, CapturedLogContext(log_key)
+        )
+    except Exception:
+        yield from _handle_compute_log_setup_error(step_context, sys.exc_info())
+
+
+def _cancel_event_loop_tasks(event_loop: asyncio.AbstractEventLoop) -> None:
+    def _cancel_tasks():
+        for task in asyncio.all_tasks(event_loop):
+            task.cancel()
+
+    event_loop.call_soon_threadsafe(_cancel_tasks)
+
+
+def _prefetch_inputs_of_next_steps(
+    pipeline_context: PlanExecutionContext,
+    active_execution: ActiveExecution,
+    limit: int,
+    prefetched_step_keys: Set[str],
+) -> None:
+    for step in active_execution.peek_steps_to_execute(limit=limit):
+        if step.key in prefetched_step_keys:
+            continue
+        prefetched_step_keys.add(step.key)
+        try:
+            step_context = cast(
+                StepExecutionContext,
+                pipeline_context.for_step(step, active_execution.get_known_state()),
+            )
+            pipeline_context.input_prefetcher.prefetch(step_context)
+        except Exception:
+            # the step reports the error when it executes
+            pass
+
+
+def _check_step_resources(step_context: StepExecutionContext) -> None:
+    missing_resources = [
+        resource_key
+        for resource_key in step_context.required_resource_keys
+        if not hasattr(step_context.resources, resource_key)
+    ]
+    check.invariant(
+        len(missing_resources) == 0,
+        (
+            "Expected step context for solid {solid_name} to have all required resources, but "
+            "missing {missing_resources}."
+        ).format(solid_name=step_context.solid.name, missing_resources=missing_resources),
+    )
+
+
+def _capture_process_logs(
+    pipeline_context: PlanExecutionContext,
+    compute_log_manager: CapturedLogManager,
+    step_keys: Sequence[str],
+    capture_stack: ExitStack,
+) -> Iterator[DagsterEvent]:
+    file_key = create_compute_log_file_key()
+    log_key = compute_log_manager.build_log_key_for_run(pipeline_context.run_id, file_key)
+    try:
+        log_context = capture_stack.enter_context(compute_log_manager.capture_logs(log_key))
+        yield DagsterEvent.capture_logs(pipeline_context, step_keys, log_key, log_context)
+    except Exception:
+        yield from _handle_compute_log_setup_error(pipeline_context, sys.exc_info())
+
+
 def _handle_compute_log_setup_error(context, exc_info):
     yield DagsterEvent.engine_event(
         plan_context=context,
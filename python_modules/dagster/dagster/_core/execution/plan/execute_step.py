@@ -64,6 +64,7 @@
 from dagster._core.execution.plan.objects import StepSuccessData, TypeCheckData
 from dagster._core.execution.plan.outputs import StepOutputData, StepOutputHandle
 from dagster._core.execution.resolve_versions import resolve_step_output_versions
+from dagster._core.execution.step_profiler import StepPhase, StepProfiler
 from dagster._core.storage.tags import MEMOIZED_RUN_TAG
 from dagster._core.types.dagster_type import DagsterType
 from dagster._utils import ensure_gen, iterate_with_context
@@ -245,7 +246,17 @@ def _type_checked_event_sequence_for_input(
         ),
         log_manager=type_check_context.log,
     ):
-        type_check = do_type_check(type_check_context, dagster_type, input_value)
+        if step_context.type_check_cache.has_passed(input_value, dagster_type):
+            # the same object passed the type check as an output earlier in the run
+            type_check = TypeCheck(
+                success=True,
+                description=(
+                    "Skipped the type check, as the value already passed the type check for "
+                    f"{dagster_type.display_name} in this run."
+                ),
+            )
+        else:
+            type_check = do_type_check(type_check_context, dagster_type, input_value)
 
     yield _create_step_input_event(
         step_context, input_name, type_check=type_check, success=type_check.success
@@ -290,6 +301,9 @@ def _type_check_output(
     ):
         type_check = do_type_check(type_check_context, dagster_type, output.value)
 
+    if type_check.success and not dagster_type.is_builtin:
+        step_context.type_check_cache.add(output.value, dagster_type)
+
     yield DagsterEvent.step_output_event(
         step_context=step_context,
         step_output_data=StepOutputData(
@@ -330,16 +344,33 @@ def core_dagster_event_sequence_for_step(
     """
     check.inst_param(step_context, "step_context", StepExecutionContext)
 
+    profiler = StepProfiler.for_run_tags(step_context.pipeline_run.tags)
+    try:
+        for step_event in _core_dagster_event_sequence_for_step(step_context, profiler):
+            yield step_event
+    finally:
+        # stops profiling steps that fail or are interrupted
+        profiler.stop()
+
+
+def _core_dagster_event_sequence_for_step(
+    step_context: StepExecutionContext, profiler: StepProfiler
+) -> Iterator[DagsterEvent]:
     if step_context.previous_attempt_count > 0:
         yield DagsterEvent.step_restarted_event(step_context, step_context.previous_attempt_count)
     else:
         yield DagsterEvent.step_start_event(step_context)
 
+    profiler.start()
     inputs = {}
 
     if step_context.step_materializes_assets:
         step_context.fetch_external_input_asset_records()
 
+    profiler.set_phase(StepPhase.LOAD_INPUTS)
+    # start loading the inputs that can be loaded concurrently before loading them in order
+    step_context.input_prefetcher.prefetch(step_context)
+
     for step_input in step_context.step.step_inputs:
         input_def = step_context.solid_def.input_def_named(step_input.name)
         dagster_type = input_def.dagster_type
@@ -375,6 +406,7 @@ def core_dagster_event_sequence_for_step(
         core_gen = step_context.solid_def.compute_fn
 
     with time_execution_scope() as timer_result:
+        profiler.set_phase(StepPhase.COMPUTE)
         user_event_sequence = check.generator(
             execute_core_compute(
                 step_context,
@@ -391,8 +423,11 @@ def core_dagster_event_sequence_for_step(
             if isinstance(user_event, DagsterEvent):
                 yield user_event
             elif isinstance(user_event, (Output, DynamicOutput)):
-                for evt in _type_check_and_store_output(step_context, user_event, input_lineage):
-                    yield evt
+                with profiler.phase(StepPhase.HANDLE_OUTPUTS):
+                    for evt in _type_check_and_store_output(
+                        step_context, user_event, input_lineage
+                    ):
+                        yield evt
             # for now, I'm ignoring AssetMaterializations yielded manually, but we might want
             # to do something with these in the above path eventually
             elif isinstance(user_event, (AssetMaterialization, Materialization)):
@@ -408,8 +443,12 @@ def core_dagster_event_sequence_for_step(
                     )
                 )
 
+    profiler.stop()
     yield DagsterEvent.step_success_event(
-        step_context, StepSuccessData(duration_ms=timer_result.millis)
+        step_context,
+        StepSuccessData(
+            duration_ms=timer_result.millis, metadata_entries=profiler.get_metadata_entries()
+        ),
     )
 
 
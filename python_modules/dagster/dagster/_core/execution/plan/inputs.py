@@ -11,6 +11,7 @@
     Optional,
     Sequence,
     Set,
+    Tuple,
     Union,
     cast,
 )
@@ -37,9 +38,12 @@
 from .utils import build_resources_for_manager, op_execution_error_boundary
 
 if TYPE_CHECKING:
+    from concurrent.futures import Future
+
     from dagster._core.events import DagsterEvent
     from dagster._core.execution.context.input import InputContext
     from dagster._core.execution.context.system import StepExecutionContext
+    from dagster._core.log_manager import DagsterLogManager
     from dagster._core.storage.input_manager import InputManager
 
 
@@ -444,6 +448,7 @@ def get_load_context(
         self,
         step_context: "StepExecutionContext",
         input_def: InputDefinition,
+        log_manager: Optional["DagsterLogManager"] = None,
     ) -> "InputContext":
         io_manager_key = step_context.execution_plan.get_manager_key(
             self.step_output_handle, step_context.pipeline_def
@@ -462,14 +467,15 @@ def get_load_context(
             self.step_output_handle,
             resource_config,
             resources,
+            log_manager=log_manager,
         )
 
-    def load_input_object(
+    def get_input_manager(
         self,
         step_context: "StepExecutionContext",
         input_def: InputDefinition,
-    ) -> Iterator["DagsterEvent"]:
-        from dagster._core.events import DagsterEvent
+    ) -> Tuple[str, "InputManager"]:
+        """Returns the key and the instance of the manager that loads the input."""
         from dagster._core.storage.input_manager import InputManager
 
         source_handle = self.step_output_handle
@@ -497,8 +503,27 @@ def load_input_object(
                 f"Please ensure that the resource returned for resource key "
                 f'"{manager_key}" is an IOManager.',
             )
-        load_input_context = self.get_load_context(step_context, input_def)
-        yield from _load_input_with_input_manager(input_manager, load_input_context)
+        return manager_key, input_manager
+
+    def load_input_object(
+        self,
+        step_context: "StepExecutionContext",
+        input_def: InputDefinition,
+    ) -> Iterator["DagsterEvent"]:
+        from dagster._core.events import DagsterEvent
+
+        source_handle = self.step_output_handle
+        manager_key, input_manager = self.get_input_manager(step_context, input_def)
+
+        # the input may have been loaded concurrently with the other inputs of the step
+        prefetched = step_context.input_prefetcher.pop(
+            step_context.step.key, input_def.name, source_handle
+        )
+        if prefetched:
+            load_input_context, load_future = prefetched
+        else:
+            load_input_context, load_future = self.get_load_context(step_context, input_def), None
+        yield from _load_input_with_input_manager(input_manager, load_input_context, load_future)
 
         metadata_entries = load_input_context.consume_metadata_entries()
 
@@ -839,7 +864,11 @@ def get_asset_lineage(
         ]
 
 
-def _load_input_with_input_manager(input_manager: "InputManager", context: "InputContext"):
+def _load_input_with_input_manager(
+    input_manager: "InputManager",
+    context: "InputContext",
+    load_future: Optional["Future[Any]"] = None,
+):
     from dagster._core.execution.context.system import StepExecutionContext
 
     step_context = cast(StepExecutionContext, context.step_context)
@@ -853,7 +882,14 @@ def _load_input_with_input_manager(input_manager: "InputManager", context: "Inpu
         step_key=step_context.step.key,
         input_name=context.name,
     ):
-        value = input_manager.load_input(context)
+        if load_future:
+            try:
+                value = load_future.result()
+            finally:
+                # the messages logged while the input was loading on another thread
+                context.log.flush_deferred()
+        else:
+            value = input_manager.load_input(context)
     # close user code boundary before returning value
     for event in context.consume_events():
         yield event
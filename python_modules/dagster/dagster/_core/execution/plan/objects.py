@@ -1,9 +1,9 @@
 from enum import Enum
-from typing import TYPE_CHECKING, NamedTuple, Optional, Sequence
+from typing import TYPE_CHECKING, NamedTuple, Optional, Sequence, Set
 
 import dagster._check as check
 from dagster._core.definitions.metadata import MetadataEntry
-from dagster._serdes import whitelist_for_serdes
+from dagster._serdes import DefaultNamedTupleSerializer, whitelist_for_serdes
 from dagster._utils.error import SerializableErrorInfo, serializable_error_info_from_exc_info
 from dagster._utils.types import ExcInfo
 
@@ -144,9 +144,24 @@ def __new__(cls, error, seconds_to_wait=None):
         )
 
 
-@whitelist_for_serdes
-class StepSuccessData(NamedTuple("_StepSuccessData", [("duration_ms", float)])):
-    def __new__(cls, duration_ms):
+class StepSuccessDataSerializer(DefaultNamedTupleSerializer):
+    @classmethod
+    def skip_when_empty(cls) -> Set[str]:
+        return {"metadata_entries"}  # Maintain stable serialized events for back-compat purposes
+
+
+@whitelist_for_serdes(serializer=StepSuccessDataSerializer)
+class StepSuccessData(
+    NamedTuple(
+        "_StepSuccessData",
+        [("duration_ms", float), ("metadata_entries", Sequence[MetadataEntry])],
+    )
+):
+    def __new__(cls, duration_ms, metadata_entries=None):
         return super(StepSuccessData, cls).__new__(
-            cls, duration_ms=check.float_param(duration_ms, "duration_ms")
+            cls,
+            duration_ms=check.float_param(duration_ms, "duration_ms"),
+            metadata_entries=check.opt_sequence_param(
+                metadata_entries, "metadata_entries", of_type=MetadataEntry
+            ),
         )
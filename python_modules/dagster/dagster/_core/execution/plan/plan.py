@@ -49,7 +49,7 @@
 from dagster._core.system_config.objects import ResolvedRunConfig
 from dagster._core.utils import toposort
 
-from ..context.output import get_output_context
+from ..context.output import OutputContext, get_output_context
 from ..resolve_versions import resolve_step_output_versions
 from .compute import create_step_outputs
 from .inputs import (
@@ -942,6 +942,10 @@ def build_memoized_plan(
             resource_config=resource_config,
             log_manager=log_manager,
         ) as resources:
+            # the outputs are checked in one batch per io manager
+            output_contexts_by_io_manager_key: Dict[
+                str, List[Tuple[StepOutputHandle, OutputContext]]
+            ] = defaultdict(list)
             for step_output_handle, io_manager_key in io_manager_keys.items():
                 io_manager = getattr(resources, io_manager_key)
                 if not isinstance(io_manager, MemoizableIOManager):
@@ -963,8 +967,23 @@ def build_memoized_plan(
                     resources=resources,
                     version=step_output_versions[step_output_handle],
                 )
-                if not io_manager.has_output(context):
-                    unmemoized_step_keys.add(step_output_handle.step_key)
+                output_contexts_by_io_manager_key[io_manager_key].append(
+                    (step_output_handle, context)
+                )
+
+            for io_manager_key, handles_and_contexts in output_contexts_by_io_manager_key.items():
+                io_manager = getattr(resources, io_manager_key)
+                has_outputs = io_manager.has_outputs(
+                    [context for _, context in handles_and_contexts]
+                )
+                check.invariant(
+                    len(has_outputs) == len(handles_and_contexts),
+                    f"has_outputs of IO manager '{io_manager_key}' returned {len(has_outputs)} "
+                    f"results for {len(handles_and_contexts)} outputs",
+                )
+                for (step_output_handle, _), has_output in zip(handles_and_contexts, has_outputs):
+                    if not has_output:
+                        unmemoized_step_keys.add(step_output_handle.step_key)
 
         if selected_step_keys is not None:
             # Take the intersection unmemoized steps and selected steps
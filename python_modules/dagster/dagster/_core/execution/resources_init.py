@@ -1,6 +1,10 @@
+import atexit
 import inspect
+import os
+import threading
 from collections import deque
 from contextlib import ContextDecorator
+from types import FunctionType
 from typing import (
     AbstractSet,
     Any,
@@ -8,9 +12,11 @@
     Deque,
     Dict,
     Generator,
+    List,
     Mapping,
     Optional,
     Set,
+    Tuple,
     Union,
     cast,
 )
@@ -19,10 +25,12 @@
 from dagster._core.definitions.pipeline_definition import PipelineDefinition
 from dagster._core.definitions.resource_definition import (
     ResourceDefinition,
+    ResourceScope,
     ScopedResourcesBuilder,
     is_context_provided,
 )
 from dagster._core.errors import (
+    DagsterInvalidDefinitionError,
     DagsterInvariantViolationError,
     DagsterResourceFunctionError,
     DagsterUserCodeExecutionError,
@@ -36,6 +44,7 @@
 )
 from dagster._core.execution.plan.plan import ExecutionPlan, StepHandleUnion
 from dagster._core.execution.plan.step import ExecutionStep, IExecutionStep
+from dagster._core.execution.resolve_versions import resolve_config_version
 from dagster._core.instance import DagsterInstance
 from dagster._core.log_manager import DagsterLogManager
 from dagster._core.storage.pipeline_run import PipelineRun
@@ -123,6 +132,109 @@ def _get_deps_helper(resource_key):
     return reqd_resources
 
 
+def ensure_process_scoped_resource_deps(resource_defs: Mapping[str, ResourceDefinition]) -> None:
+    for resource_key, resource_def in resource_defs.items():
+        if resource_def.scope != ResourceScope.PER_RUN_PROCESS:
+            continue
+        for reqd_resource_key in resource_def.required_resource_keys:
+            reqd_resource_def = resource_defs.get(reqd_resource_key)
+            if reqd_resource_def and reqd_resource_def.scope != ResourceScope.PER_RUN_PROCESS:
+                raise DagsterInvalidDefinitionError(
+                    f"Resource with key '{resource_key}' has the PER_RUN_PROCESS scope, but "
+                    f"requires the resource with key '{reqd_resource_key}', which doesn't. "
+                    "Resources with the PER_RUN_PROCESS scope can only require resources with "
+                    "the same scope, as they outlive the steps that initialize them."
+                )
+
+
+ProcessResourceKey = Tuple[str, str, str]
+
+
+class ProcessResourceCache:
+    """The resources with the PER_RUN_PROCESS scope that have been initialized by the steps
+    executed in the current process, keyed by resource key, resource function and resource config,
+    which are torn down when the process exits.
+
+    The resources aren't keyed by run, so that a worker process that executes the steps of many
+    runs holds a single instance of each resource and config rather than one for each run.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+        self._resources: Dict[ProcessResourceKey, "InitializedResource"] = {}
+        self._managers: List[EventGenerationManager] = []
+        self._registered_teardown = False
+
+    def _check_pid(self) -> None:
+        # a forked process doesn't own the resources of its parent, e.g. their connections, so
+        # it initializes its own
+        if os.getpid() != self._pid:
+            self._pid = os.getpid()
+            self._resources = {}
+            self._managers = []
+
+    def get(self, key: ProcessResourceKey) -> Optional["InitializedResource"]:
+        with self._lock:
+            self._check_pid()
+            return self._resources.get(key)
+
+    def add(
+        self,
+        key: ProcessResourceKey,
+        initialized_resource: "InitializedResource",
+        manager: EventGenerationManager,
+    ) -> bool:
+        """Caches the resource, and takes over its teardown. Returns False if a resource was cached
+        for the key in the meantime, in which case the caller remains responsible for it.
+        """
+        with self._lock:
+            self._check_pid()
+            if key in self._resources:
+                return False
+            self._resources[key] = initialized_resource
+            self._managers.append(manager)
+            if not self._registered_teardown:
+                atexit.register(self.teardown)
+                self._registered_teardown = True
+            return True
+
+    def teardown(self) -> None:
+        with self._lock:
+            self._check_pid()
+            managers = self._managers
+            self._resources = {}
+            self._managers = []
+
+        # in the reverse order of initialization, so that resources outlive their dependents
+        while managers:
+            manager = managers.pop()
+            try:
+                # there is no run to report the events of the teardown to
+                for _ in manager.generate_teardown_events():
+                    pass
+            except Exception:  # pylint: disable=broad-except
+                pass
+
+
+_PROCESS_RESOURCE_CACHE = ProcessResourceCache()
+
+
+def _resource_fn_name(resource_def: ResourceDefinition) -> str:
+    # tells apart the resources that different jobs define under the same key. The functions of
+    # PER_RUN_PROCESS resources don't close over any state, so their definition identifies them.
+    resource_fn = cast(FunctionType, resource_def.resource_fn)
+    code = resource_fn.__code__
+    return (
+        f"{resource_fn.__module__}.{resource_fn.__qualname__}"
+        f"@{code.co_filename}:{code.co_firstlineno}"
+    )
+
+
+def get_process_resource_cache() -> ProcessResourceCache:
+    return _PROCESS_RESOURCE_CACHE
+
+
 def _core_resource_initialization_event_generator(
     resource_defs: Mapping[str, ResourceDefinition],
     resource_configs: Mapping[str, ResourceConfig],
@@ -156,6 +268,16 @@ def _core_resource_initialization_event_generator(
             )
 
         resource_dependencies = resolve_resource_dependencies(resource_defs)
+        ensure_process_scoped_resource_deps(resource_defs)
+
+        # resources with the PER_RUN_PROCESS scope are reused across the single steps that are
+        # executed in this process. When several steps are executed together, the resources are
+        # already shared by them.
+        use_process_cache = bool(
+            pipeline_run
+            and execution_plan
+            and execution_plan.step_handle_for_single_step_plans()
+        )
 
         for level in toposort(resource_dependencies):
             for resource_name in level:
@@ -163,6 +285,20 @@ def _core_resource_initialization_event_generator(
                 if not resource_name in resource_keys_to_init:
                     continue
 
+                process_cache_key = None
+                if use_process_cache and resource_def.scope == ResourceScope.PER_RUN_PROCESS:
+                    process_cache_key = (
+                        resource_name,
+                        _resource_fn_name(resource_def),
+                        resolve_config_version(resource_configs[resource_name].config),
+                    )
+                    cached_resource = get_process_resource_cache().get(process_cache_key)
+                    if cached_resource:
+                        resource_instances[resource_name] = cached_resource.resource
+                        resource_init_times[resource_name] = "reused"
+                        contains_generator = contains_generator or cached_resource.is_generator
+                        continue
+
                 resource_fn = cast(Callable[[InitResourceContext], Any], resource_def.resource_fn)
                 resources = ScopedResourcesBuilder(resource_instances).build(
                     resource_def.required_resource_keys
@@ -189,7 +325,10 @@ def _core_resource_initialization_event_generator(
                 resource_instances[resource_name] = initialized_resource.resource
                 resource_init_times[resource_name] = initialized_resource.duration
                 contains_generator = contains_generator or initialized_resource.is_generator
-                resource_managers.append(manager)
+                if not process_cache_key or not get_process_resource_cache().add(
+                    process_cache_key, initialized_resource, manager
+                ):
+                    resource_managers.append(manager)
 
         if emit_persistent_events and resource_keys_to_init:
             yield DagsterEvent.resource_init_success(
@@ -4,8 +4,10 @@
 
 import dagster._check as check
 from dagster._core.definitions import ExpectationResult
+from dagster._core.definitions.metadata import MetadataEntry
 from dagster._core.events import MARKER_EVENTS, DagsterEventType, StepExpectationResultData
 from dagster._core.events.log import EventLogEntry
+from dagster._core.execution.plan.objects import StepSuccessData
 from dagster._core.storage.pipeline_run import PipelineRunStatsSnapshot
 from dagster._serdes import whitelist_for_serdes
 from dagster._utils import datetime_as_float
@@ -112,6 +114,10 @@ def build_run_step_stats_from_events(
         if dagster_event.event_type == DagsterEventType.STEP_SUCCESS:
             by_step_key[step_key]["end_time"] = event.timestamp
             by_step_key[step_key]["status"] = StepEventStatus.SUCCESS
+            # recorded for the runs tagged with dagster/profile_steps
+            by_step_key[step_key]["profile_entries"] = cast(
+                StepSuccessData, dagster_event.event_specific_data
+            ).metadata_entries
         if dagster_event.event_type == DagsterEventType.STEP_SKIPPED:
             by_step_key[step_key]["end_time"] = event.timestamp
             by_step_key[step_key]["status"] = StepEventStatus.SKIPPED
@@ -216,6 +222,7 @@ class RunStepKeyStatsSnapshot(
             ("attempts", Optional[int]),
             ("attempts_list", Sequence[RunStepMarker]),
             ("markers", Sequence[RunStepMarker]),
+            ("profile_entries", Sequence[MetadataEntry]),
         ],
     )
 ):
@@ -231,6 +238,7 @@ def __new__(
         attempts: Optional[int] = None,
         attempts_list: Optional[Sequence[RunStepMarker]] = None,
         markers: Optional[Sequence[RunStepMarker]] = None,
+        profile_entries: Optional[Sequence[MetadataEntry]] = None,
     ):
         return super(RunStepKeyStatsSnapshot, cls).__new__(
             cls,
@@ -250,4 +258,7 @@ def __new__(
             attempts=check.opt_int_param(attempts, "attempts"),
             attempts_list=check.opt_sequence_param(attempts_list, "attempts_list", RunStepMarker),
             markers=check.opt_sequence_param(markers, "markers", RunStepMarker),
+            profile_entries=check.opt_sequence_param(
+                profile_entries, "profile_entries", MetadataEntry
+            ),
         )
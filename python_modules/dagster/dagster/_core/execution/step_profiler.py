@@ -0,0 +1,169 @@
+import cProfile
+import io
+import pstats
+import sys
+import time
+from contextlib import contextmanager
+from enum import Enum
+from typing import Dict, Iterator, List, Mapping, Optional
+
+from dagster._core.definitions.metadata import MetadataEntry, MetadataValue
+from dagster._core.storage.tags import PROFILE_STEPS_TAG
+
+try:
+    import resource
+except ImportError:
+    # not available on windows
+    resource = None  # type: ignore
+
+# the value of the profile_steps tag that also records a summary of the stacks of the steps
+PROFILE_STEPS_WITH_STACKS = "stacks"
+
+STACK_SUMMARY_NUM_FUNCTIONS = 20
+
+
+class StepPhase(Enum):
+    LOAD_INPUTS = "load_inputs"
+    COMPUTE = "compute"
+    HANDLE_OUTPUTS = "handle_outputs"
+
+
+class StepProfiler:
+    """Records where a step spends its time, for the runs that are tagged with
+    ``dagster/profile_steps``: wall vs CPU time, the peak resident memory of the process, and the
+    time spent loading inputs, in the compute function and handling outputs, including in the IO
+    managers. With the tag set to ``stacks``, a summary of the functions that the step spent the
+    most time in is recorded with cProfile.
+
+    The CPU time is that of the thread executing the step, so that the steps that the threaded
+    executor runs at the same time are told apart. The time of each phase includes the handling of
+    the events that are yielded during it, like ``duration_ms`` of step successes.
+
+    ``process_peak_rss_mb`` is the peak resident memory of the process executing the step over its
+    lifetime, up to the end of the step, rather than the memory used by the step. It reflects the
+    step's own usage when the step is executed in a process of its own, like with the multiprocess
+    executor, but may have been reached by an earlier step or by another step executing at the
+    same time otherwise.
+    """
+
+    def __init__(self, enabled: bool = False, record_stacks: bool = False):
+        self._enabled = enabled
+        self._record_stacks = enabled and record_stacks
+        self._is_running = False
+        self._profile: Optional[cProfile.Profile] = None
+        self._phase_ms: Dict[StepPhase, float] = {phase: 0.0 for phase in StepPhase}
+        self._current_phase: Optional[StepPhase] = None
+        self._phase_start = 0.0
+        self._start = 0.0
+        self._cpu_start = 0.0
+        self._wall_ms: Optional[float] = None
+        self._cpu_ms: Optional[float] = None
+        self._stack_summary: Optional[str] = None
+
+    @staticmethod
+    def for_run_tags(tags: Mapping[str, str]) -> "StepProfiler":
+        value = tags.get(PROFILE_STEPS_TAG)
+        if value is None or value.lower() == "false":
+            return StepProfiler()
+        return StepProfiler(enabled=True, record_stacks=value.lower() == PROFILE_STEPS_WITH_STACKS)
+
+    def start(self) -> None:
+        if not self._enabled:
+            return
+
+        if self._record_stacks:
+            profile = cProfile.Profile()
+            try:
+                profile.enable()
+                self._profile = profile
+            except ValueError:
+                # another profiler is already active
+                pass
+
+        self._is_running = True
+        self._start = time.perf_counter()
+        self._cpu_start = time.thread_time()
+
+    def stop(self) -> None:
+        """Stops profiling the step. Has no effect once the profiler has stopped."""
+        if not self._is_running:
+            return
+
+        self.set_phase(None)
+        self._is_running = False
+        self._wall_ms = (time.perf_counter() - self._start) * 1000
+        self._cpu_ms = (time.thread_time() - self._cpu_start) * 1000
+
+        if self._profile is not None:
+            self._profile.disable()
+            self._stack_summary = _summarize_profile(self._profile)
+            self._profile = None
+
+    def set_phase(self, phase: Optional[StepPhase]) -> None:
+        """Charges the time from now on to the phase, until the phase is changed again."""
+        if not self._is_running:
+            return
+
+        now = time.perf_counter()
+        if self._current_phase is not None:
+            self._phase_ms[self._current_phase] += (now - self._phase_start) * 1000
+        self._current_phase = phase
+        self._phase_start = now
+
+    @contextmanager
+    def phase(self, phase: StepPhase) -> Iterator[None]:
+        """Charges the time spent in the block to the phase, and not to the phase that the block
+        is nested in.
+        """
+        outer_phase = self._current_phase
+        self.set_phase(phase)
+        try:
+            yield
+        finally:
+            self.set_phase(outer_phase)
+
+    def get_metadata_entries(self) -> List[MetadataEntry]:
+        """The metadata entries recording the profile of the step, once it has finished."""
+        if not self._enabled or self._wall_ms is None or self._cpu_ms is None:
+            return []
+
+        entries = [
+            MetadataEntry("wall_time_ms", value=MetadataValue.float(self._wall_ms)),
+            MetadataEntry("cpu_time_ms", value=MetadataValue.float(self._cpu_ms)),
+        ]
+        entries.extend(
+            MetadataEntry(f"{phase.value}_ms", value=MetadataValue.float(self._phase_ms[phase]))
+            for phase in StepPhase
+        )
+
+        process_peak_rss_bytes = _get_process_peak_rss_bytes()
+        if process_peak_rss_bytes is not None:
+            entries.append(
+                MetadataEntry(
+                    "process_peak_rss_mb",
+                    value=MetadataValue.float(process_peak_rss_bytes / (1024 * 1024)),
+                )
+            )
+
+        if self._stack_summary is not None:
+            entries.append(
+                MetadataEntry("stack_summary", value=MetadataValue.text(self._stack_summary))
+            )
+
+        return entries
+
+
+def _get_process_peak_rss_bytes() -> Optional[int]:
+    # the peak over the lifetime of the process, which the OS doesn't reset between steps
+    if resource is None:
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # reported in bytes on macos and in kilobytes on linux
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+def _summarize_profile(profile: cProfile.Profile) -> str:
+    stream = io.StringIO()
+    stats = pstats.Stats(profile, stream=stream)
+    stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(STACK_SUMMARY_NUM_FUNCTIONS)
+    return stream.getvalue().strip()
@@ -0,0 +1,51 @@
+import threading
+import weakref
+from typing import Any, Dict, Set, Tuple
+
+import dagster._check as check
+from dagster._core.types.dagster_type import DagsterType
+
+
+class TypeCheckCache:
+    """Records the values that passed the type checks of step outputs during a run, so that the
+    steps that load the same objects as inputs of the same Dagster types in the same process, e.g.
+    with the mem_io_manager, don't type check them again.
+
+    Values are tracked by identity using weak references, so values that don't support weak
+    references (e.g. ints, lists and dicts, which are usually cheap to type check) are not cached,
+    and the cache doesn't keep values alive.
+    """
+
+    def __init__(self):
+        # reentrant, as garbage collection can run the callbacks of the weak references while
+        # the lock is held
+        self._lock = threading.RLock()
+        self._passed: Dict[int, Tuple["weakref.ref[Any]", Set[str]]] = {}
+
+    def _remove(self, value_id: int, ref: "weakref.ref[Any]") -> None:
+        with self._lock:
+            entry = self._passed.get(value_id)
+            if entry is not None and entry[0] is ref:
+                del self._passed[value_id]
+
+    def add(self, value: Any, dagster_type: DagsterType) -> None:
+        """Records that the value passed the type check of the Dagster type."""
+        check.inst_param(dagster_type, "dagster_type", DagsterType)
+        value_id = id(value)
+        with self._lock:
+            entry = self._passed.get(value_id)
+            if entry is None or entry[0]() is not value:
+                try:
+                    ref = weakref.ref(value, lambda ref: self._remove(value_id, ref))
+                except TypeError:
+                    return
+                entry = (ref, set())
+                self._passed[value_id] = entry
+            entry[1].add(dagster_type.key)
+
+    def has_passed(self, value: Any, dagster_type: DagsterType) -> bool:
+        """Whether the value has already passed the type check of the Dagster type."""
+        check.inst_param(dagster_type, "dagster_type", DagsterType)
+        with self._lock:
+            entry = self._passed.get(id(value))
+            return entry is not None and entry[0]() is value and dagster_type.key in entry[1]
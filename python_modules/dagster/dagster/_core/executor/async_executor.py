@@ -0,0 +1,49 @@
+import asyncio
+import threading
+from contextlib import contextmanager
+from functools import partial
+from typing import Callable, Iterator
+
+import dagster._check as check
+from dagster._core.events import DagsterEvent
+from dagster._core.execution.plan.execute_plan import concurrent_plan_execution_iterator
+from dagster._core.execution.retries import RetryMode
+
+from .threaded_executor import ThreadedExecutor
+
+
+class AsyncExecutor(ThreadedExecutor):
+    def __init__(self, retries: RetryMode, max_concurrent: int):
+        check.int_param(max_concurrent, "max_concurrent")
+        check.invariant(max_concurrent > 0, "max_concurrent must be positive")
+        super().__init__(retries=retries, max_concurrent=max_concurrent)
+
+    def _describe_workers(self) -> str:
+        return "on an event loop, up to {max_concurrent} steps at a time".format(
+            max_concurrent=self.max_concurrent
+        )
+
+    @contextmanager
+    def _plan_execution_iterator(self) -> Iterator[Callable[..., Iterator[DagsterEvent]]]:
+        with _event_loop_in_thread() as event_loop:
+            yield partial(
+                concurrent_plan_execution_iterator,
+                max_concurrent=self.max_concurrent,
+                event_loop=event_loop,
+            )
+
+
+@contextmanager
+def _event_loop_in_thread() -> Iterator[asyncio.AbstractEventLoop]:
+    # the steps are executed from worker threads, which submit the async compute functions of the
+    # ops to this loop and wait for their results
+    loop = asyncio.new_event_loop()
+    loop_thread = threading.Thread(target=loop.run_forever, name="dagster_event_loop", daemon=True)
+    loop_thread.start()
+    try:
+        yield loop
+    finally:
+        loop.call_soon_threadsafe(loop.stop)
+        loop_thread.join()
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        loop.close()
@@ -0,0 +1,94 @@
+import os
+from contextlib import contextmanager
+from functools import partial
+from typing import Callable, Iterator
+
+import dagster._check as check
+from dagster._core.events import DagsterEvent, EngineEventData
+from dagster._core.execution.api import ExecuteRunWithPlanIterable
+from dagster._core.execution.context.system import PlanOrchestrationContext
+from dagster._core.execution.context_creation_pipeline import PlanExecutionContextManager
+from dagster._core.execution.plan.execute_plan import concurrent_plan_execution_iterator
+from dagster._core.execution.plan.plan import ExecutionPlan
+from dagster._core.execution.retries import RetryMode
+from dagster._utils.timing import format_duration, time_execution_scope
+
+from .base import Executor
+
+
+def default_max_threads() -> int:
+    # the same default as concurrent.futures.ThreadPoolExecutor
+    return min(32, (os.cpu_count() or 1) + 4)
+
+
+class ThreadedExecutor(Executor):
+    def __init__(self, retries: RetryMode, max_concurrent: int, prefetch_inputs: bool = False):
+        self._retries = check.inst_param(retries, "retries", RetryMode)
+        max_concurrent = check.int_param(max_concurrent, "max_concurrent")
+        self._max_concurrent = max_concurrent if max_concurrent > 0 else default_max_threads()
+        self._prefetch_inputs = check.bool_param(prefetch_inputs, "prefetch_inputs")
+
+    @property
+    def retries(self):
+        return self._retries
+
+    @property
+    def max_concurrent(self) -> int:
+        return self._max_concurrent
+
+    def _describe_workers(self) -> str:
+        """Describes what the steps are executed on, in the engine events of the run."""
+        return "on up to {max_concurrent} threads".format(max_concurrent=self._max_concurrent)
+
+    @contextmanager
+    def _plan_execution_iterator(self) -> Iterator[Callable[..., Iterator[DagsterEvent]]]:
+        """Yields the iterator that executes the steps of the plan, for the duration of the run."""
+        yield partial(
+            concurrent_plan_execution_iterator,
+            max_concurrent=self._max_concurrent,
+            capture_step_logs=True,
+            prefetch_inputs=self._prefetch_inputs,
+        )
+
+    def execute(self, plan_context, execution_plan):
+        check.inst_param(plan_context, "plan_context", PlanOrchestrationContext)
+        check.inst_param(execution_plan, "execution_plan", ExecutionPlan)
+
+        step_keys_to_execute = execution_plan.step_keys_to_execute
+
+        yield DagsterEvent.engine_event(
+            plan_context,
+            "Executing steps in process {workers} (pid: {pid})".format(
+                workers=self._describe_workers(), pid=os.getpid()
+            ),
+            event_specific_data=EngineEventData.in_process(os.getpid(), step_keys_to_execute),
+        )
+
+        with time_execution_scope() as timer_result:
+            with self._plan_execution_iterator() as iterator:
+                yield from iter(
+                    ExecuteRunWithPlanIterable(
+                        execution_plan=plan_context.execution_plan,
+                        iterator=iterator,
+                        execution_context_manager=PlanExecutionContextManager(
+                            pipeline=plan_context.pipeline,
+                            retry_mode=plan_context.retry_mode,
+                            execution_plan=plan_context.execution_plan,
+                            run_config=plan_context.run_config,
+                            pipeline_run=plan_context.pipeline_run,
+                            instance=plan_context.instance,
+                            raise_on_error=plan_context.raise_on_error,
+                            output_capture=plan_context.output_capture,
+                        ),
+                    )
+                )
+
+        yield DagsterEvent.engine_event(
+            plan_context,
+            "Finished steps in process {workers} (pid: {pid}) in {duration_ms}".format(
+                workers=self._describe_workers(),
+                pid=os.getpid(),
+                duration_ms=format_duration(timer_result.millis),
+            ),
+            event_specific_data=EngineEventData.in_process(os.getpid(), step_keys_to_execute),
+        )
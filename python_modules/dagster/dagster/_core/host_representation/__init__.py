@@ -6,60 +6,125 @@
 It also contains classes that represent historical representations
 that have been persisted. e.g. HistoricalPipeline
 """
-from .external import (
-    ExternalExecutionPlan,
-    ExternalPartitionSet,
-    ExternalPipeline,
-    ExternalRepository,
-    ExternalSchedule,
-    ExternalSensor,
-)
-from .external_data import (
-    ExternalExecutionParamsData,
-    ExternalExecutionParamsErrorData,
-    ExternalJobRef,
-    ExternalPartitionConfigData,
-    ExternalPartitionExecutionErrorData,
-    ExternalPartitionNamesData,
-    ExternalPartitionSetData,
-    ExternalPartitionSetExecutionParamData,
-    ExternalPartitionTagsData,
-    ExternalPipelineData,
-    ExternalPipelineSubsetResult,
-    ExternalPresetData,
-    ExternalRepositoryData,
-    ExternalScheduleData,
-    ExternalScheduleExecutionErrorData,
-    ExternalSensorExecutionErrorData,
-    ExternalTargetData,
-    external_pipeline_data_from_def,
-    external_repository_data_from_def,
-)
-from .handle import PipelineHandle, RepositoryHandle
-from .historical import HistoricalPipeline
-from .origin import (
-    IN_PROCESS_NAME,
-    ExternalInstigatorOrigin,
-    ExternalPipelineOrigin,
-    ExternalRepositoryOrigin,
-    GrpcServerRepositoryLocationOrigin,
-    InProcessRepositoryLocationOrigin,
-    ManagedGrpcPythonEnvRepositoryLocationOrigin,
-    RepositoryLocationOrigin,
-)
-from .pipeline_index import PipelineIndex
-from .repository_location import (
-    GrpcServerRepositoryLocation,
-    InProcessRepositoryLocation,
-    RepositoryLocation,
-)
-from .represented import RepresentedPipeline
-from .selector import (
-    GraphSelector,
-    InstigatorSelector,
-    JobSelector,
-    PipelineSelector,
-    RepositorySelector,
-    ScheduleSelector,
-    SensorSelector,
-)
+import importlib
+from typing import TYPE_CHECKING, Any, Mapping
+
+if TYPE_CHECKING:
+    from .external import (
+        ExternalExecutionPlan,
+        ExternalPartitionSet,
+        ExternalPipeline,
+        ExternalRepository,
+        ExternalSchedule,
+        ExternalSensor,
+    )
+    from .external_data import (
+        ExternalExecutionParamsData,
+        ExternalExecutionParamsErrorData,
+        ExternalJobRef,
+        ExternalPartitionConfigData,
+        ExternalPartitionExecutionErrorData,
+        ExternalPartitionNamesData,
+        ExternalPartitionSetData,
+        ExternalPartitionSetExecutionParamData,
+        ExternalPartitionTagsData,
+        ExternalPipelineData,
+        ExternalPipelineSubsetResult,
+        ExternalPresetData,
+        ExternalRepositoryData,
+        ExternalScheduleData,
+        ExternalScheduleExecutionErrorData,
+        ExternalSensorExecutionErrorData,
+        ExternalTargetData,
+        external_pipeline_data_from_def,
+        external_repository_data_from_def,
+    )
+    from .handle import PipelineHandle, RepositoryHandle
+    from .historical import HistoricalPipeline
+    from .origin import (
+        IN_PROCESS_NAME,
+        ExternalInstigatorOrigin,
+        ExternalPipelineOrigin,
+        ExternalRepositoryOrigin,
+        GrpcServerRepositoryLocationOrigin,
+        InProcessRepositoryLocationOrigin,
+        ManagedGrpcPythonEnvRepositoryLocationOrigin,
+        RepositoryLocationOrigin,
+    )
+    from .pipeline_index import PipelineIndex
+    from .repository_location import (
+        GrpcServerRepositoryLocation,
+        InProcessRepositoryLocation,
+        RepositoryLocation,
+    )
+    from .represented import RepresentedPipeline
+    from .selector import (
+        GraphSelector,
+        InstigatorSelector,
+        JobSelector,
+        PipelineSelector,
+        RepositorySelector,
+        ScheduleSelector,
+        SensorSelector,
+    )
+
+# Submodules are imported on first access, so that importing one of them does not import every
+# other one.
+_EXPORTS: Mapping[str, str] = {
+    "ExternalExecutionPlan": ".external",
+    "ExternalPartitionSet": ".external",
+    "ExternalPipeline": ".external",
+    "ExternalRepository": ".external",
+    "ExternalSchedule": ".external",
+    "ExternalSensor": ".external",
+    "ExternalExecutionParamsData": ".external_data",
+    "ExternalExecutionParamsErrorData": ".external_data",
+    "ExternalJobRef": ".external_data",
+    "ExternalPartitionConfigData": ".external_data",
+    "ExternalPartitionExecutionErrorData": ".external_data",
+    "ExternalPartitionNamesData": ".external_data",
+    "ExternalPartitionSetData": ".external_data",
+    "ExternalPartitionSetExecutionParamData": ".external_data",
+    "ExternalPartitionTagsData": ".external_data",
+    "ExternalPipelineData": ".external_data",
+    "ExternalPipelineSubsetResult": ".external_data",
+    "ExternalPresetData": ".external_data",
+    "ExternalRepositoryData": ".external_data",
+    "ExternalScheduleData": ".external_data",
+    "ExternalScheduleExecutionErrorData": ".external_data",
+    "ExternalSensorExecutionErrorData": ".external_data",
+    "ExternalTargetData": ".external_data",
+    "external_pipeline_data_from_def": ".external_data",
+    "external_repository_data_from_def": ".external_data",
+    "PipelineHandle": ".handle",
+    "RepositoryHandle": ".handle",
+    "HistoricalPipeline": ".historical",
+    "ExternalInstigatorOrigin": ".origin",
+    "ExternalPipelineOrigin": ".origin",
+    "ExternalRepositoryOrigin": ".origin",
+    "GrpcServerRepositoryLocationOrigin": ".origin",
+    "IN_PROCESS_NAME": ".origin",
+    "InProcessRepositoryLocationOrigin": ".origin",
+    "ManagedGrpcPythonEnvRepositoryLocationOrigin": ".origin",
+    "RepositoryLocationOrigin": ".origin",
+    "PipelineIndex": ".pipeline_index",
+    "GrpcServerRepositoryLocation": ".repository_location",
+    "InProcessRepositoryLocation": ".repository_location",
+    "RepositoryLocation": ".repository_location",
+    "RepresentedPipeline": ".represented",
+    "GraphSelector": ".selector",
+    "InstigatorSelector": ".selector",
+    "JobSelector": ".selector",
+    "PipelineSelector": ".selector",
+    "RepositorySelector": ".selector",
+    "ScheduleSelector": ".selector",
+    "SensorSelector": ".selector",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError("module '{}' has no attribute '{}'".format(__name__, name))
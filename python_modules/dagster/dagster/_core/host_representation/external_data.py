@@ -6,7 +6,19 @@
 """
 from abc import ABC, abstractmethod
 from collections import defaultdict
-from typing import Dict, List, Mapping, NamedTuple, Optional, Sequence, Set, Tuple, Union, cast
+from typing import (
+    AbstractSet,
+    Dict,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+    cast,
+)
 
 import pendulum
 
@@ -22,6 +34,7 @@
     ScheduleDefinition,
     SourceAsset,
 )
+from dagster._core.definitions.asset_graph import AssetGraph
 from dagster._core.definitions.asset_layer import AssetOutputInfo
 from dagster._core.definitions.asset_sensor_definition import AssetSensorDefinition
 from dagster._core.definitions.assets_job import ASSET_BASE_JOB_PREFIX
@@ -962,7 +975,9 @@ def external_repository_data_from_def(
             key=lambda sd: sd.name,
         ),
         external_asset_graph_data=external_asset_graph_from_defs(
-            pipelines, source_assets_by_key=repository_def.source_assets_by_key
+            pipelines,
+            source_assets_by_key=repository_def.source_assets_by_key,
+            asset_graph=repository_def.asset_graph,
         ),
         external_pipeline_datas=pipeline_datas,
         external_job_refs=job_refs,
@@ -970,8 +985,17 @@ def external_repository_data_from_def(
 
 
 def external_asset_graph_from_defs(
-    pipelines: Sequence[PipelineDefinition], source_assets_by_key: Mapping[AssetKey, SourceAsset]
+    pipelines: Sequence[PipelineDefinition],
+    source_assets_by_key: Mapping[AssetKey, SourceAsset],
+    asset_graph: Optional[AssetGraph] = None,
 ) -> Sequence[ExternalAssetNode]:
+    # Index every asset across all jobs in a single pass.  An asset that belongs to several jobs
+    # (e.g. the base asset job and any number of asset selection jobs) is only fully processed the
+    # first time it is encountered; every subsequent job only contributes its job membership.
+    # The upstream asset keys of the assets of the repository are looked up once in its asset
+    # graph. Assets that are only defined within a job, e.g. by build_assets_job, take the upstream
+    # asset keys that were resolved within each job containing them.
+    repository_asset_keys = asset_graph.all_asset_keys if asset_graph else set()
     node_defs_by_asset_key: Dict[
         AssetKey, List[Tuple[NodeOutputHandle, PipelineDefinition]]
     ] = defaultdict(list)
@@ -979,51 +1003,95 @@ def external_asset_graph_from_defs(
     freshness_policy_by_asset_key: Dict[AssetKey, FreshnessPolicy] = dict()
     metadata_by_asset_key: Dict[AssetKey, MetadataUserInput] = dict()
 
-    deps: Dict[AssetKey, Dict[AssetKey, ExternalAssetDependency]] = defaultdict(dict)
-    dep_by: Dict[AssetKey, Dict[AssetKey, ExternalAssetDependedBy]] = defaultdict(dict)
-    all_upstream_asset_keys: Set[AssetKey] = set()
+    # upstream asset keys for each asset, in the order they were first encountered
+    upstream_keys_by_asset_key: Dict[AssetKey, Dict[AssetKey, None]] = {}
+    upstream_key_sets_by_asset_key: Dict[AssetKey, List[AbstractSet[AssetKey]]] = {}
     op_names_by_asset_key: Dict[AssetKey, Sequence[str]] = {}
     code_version_by_asset_key: Dict[AssetKey, Optional[str]] = dict()
     group_name_by_asset_key: Dict[AssetKey, str] = {}
+    indexed_asset_keys: Set[AssetKey] = set()
+    job_source_assets_by_key: List[Mapping[AssetKey, SourceAsset]] = []
 
     for pipeline_def in pipelines:
-        asset_info_by_node_output = pipeline_def.asset_layer.asset_info_by_node_output_handle
+        asset_layer = pipeline_def.asset_layer
 
-        for node_output_handle, asset_info in asset_info_by_node_output.items():
+        for node_output_handle, asset_info in asset_layer.asset_info_by_node_output_handle.items():
             if not asset_info.is_required:
                 continue
             output_key = asset_info.key
-            if output_key not in op_names_by_asset_key:
+            node_defs_by_asset_key[output_key].append((node_output_handle, pipeline_def))
+
+            if output_key not in asset_info_by_asset_key:
+                asset_info_by_asset_key[output_key] = asset_info
+                code_version_by_asset_key[output_key] = asset_info.code_version
                 op_names_by_asset_key[output_key] = [
                     str(handle)
-                    for handle in pipeline_def.asset_layer.dependency_node_handles_by_asset_key.get(
+                    for handle in asset_layer.dependency_node_handles_by_asset_key.get(
                         output_key, []
                     )
                 ]
-            code_version_by_asset_key[output_key] = asset_info.code_version
-            upstream_asset_keys = pipeline_def.asset_layer.upstream_assets_for_asset(output_key)
-            all_upstream_asset_keys.update(upstream_asset_keys)
-            node_defs_by_asset_key[output_key].append((node_output_handle, pipeline_def))
-            asset_info_by_asset_key[output_key] = asset_info
-
-            for upstream_key in upstream_asset_keys:
-                deps[output_key][upstream_key] = ExternalAssetDependency(
-                    upstream_asset_key=upstream_key
-                )
-                dep_by[upstream_key][output_key] = ExternalAssetDependedBy(
-                    downstream_asset_key=output_key
+                upstream_asset_keys = (
+                    cast(AssetGraph, asset_graph).get_parents(output_key)
+                    if output_key in repository_asset_keys
+                    else asset_layer.upstream_assets_for_asset(output_key)
                 )
+                upstream_keys_by_asset_key[output_key] = dict.fromkeys(upstream_asset_keys)
+                upstream_key_sets_by_asset_key[output_key] = [upstream_asset_keys]
+            elif output_key not in repository_asset_keys:
+                upstream_asset_keys = asset_layer.upstream_assets_for_asset(output_key)
+                if all(
+                    upstream_asset_keys != seen_keys
+                    for seen_keys in upstream_key_sets_by_asset_key[output_key]
+                ):
+                    upstream_keys_by_asset_key[output_key].update(
+                        dict.fromkeys(upstream_asset_keys)
+                    )
+                    upstream_key_sets_by_asset_key[output_key].append(upstream_asset_keys)
 
-        # for assets_def in pipeline_def.asset_layer.assets_defs_by_key.values():
-        for assets_def in pipeline_def.asset_layer.assets_defs_by_key.values():
+        for assets_def in asset_layer.assets_defs_by_key.values():
+            # each job holds its own (possibly subsetted) copy of an asset's definition, so skip
+            # any definition whose assets have already been indexed from a previous job
+            if assets_def.keys <= indexed_asset_keys:
+                continue
+            indexed_asset_keys.update(assets_def.keys)
             metadata_by_asset_key.update(assets_def.metadata_by_key)
             freshness_policy_by_asset_key.update(assets_def.freshness_policies_by_key)
-        group_name_by_asset_key.update(pipeline_def.asset_layer.group_names_by_assets())
+            group_name_by_asset_key.update(
+                {
+                    key: assets_def.group_names_by_key[key]
+                    for key in assets_def.keys
+                    if key in assets_def.group_names_by_key
+                }
+            )
+
+        job_source_assets_by_key.append(asset_layer.source_assets_by_key)
+
+    deps: Dict[AssetKey, Dict[AssetKey, ExternalAssetDependency]] = defaultdict(dict)
+    dep_by: Dict[AssetKey, Dict[AssetKey, ExternalAssetDependedBy]] = defaultdict(dict)
+    all_upstream_asset_keys: Set[AssetKey] = set()
+    for output_key, upstream_keys in upstream_keys_by_asset_key.items():
+        all_upstream_asset_keys.update(upstream_keys)
+        downstream_dep = ExternalAssetDependedBy(downstream_asset_key=output_key)
+        for upstream_key in upstream_keys:
+            deps[output_key][upstream_key] = ExternalAssetDependency(
+                upstream_asset_key=upstream_key
+            )
+            dep_by[upstream_key][output_key] = downstream_dep
 
     asset_keys_without_definitions = all_upstream_asset_keys.difference(
         node_defs_by_asset_key.keys()
     ).difference(source_assets_by_key.keys())
 
+    # assets that are only referenced as upstream dependencies take their group name from the
+    # source asset that stands in for them within a job
+    for asset_key in asset_keys_without_definitions:
+        if asset_key in group_name_by_asset_key:
+            continue
+        for source_assets_in_job in job_source_assets_by_key:
+            if asset_key in source_assets_in_job:
+                group_name_by_asset_key[asset_key] = source_assets_in_job[asset_key].group_name
+                break
+
     asset_nodes = [
         ExternalAssetNode(
             asset_key=asset_key,
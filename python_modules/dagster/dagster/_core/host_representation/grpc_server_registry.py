@@ -3,22 +3,24 @@
 import uuid
 from abc import abstractmethod
 from contextlib import AbstractContextManager
-from typing import TYPE_CHECKING, Generic, NamedTuple, Optional, TypeVar, Union, cast
+from typing import TYPE_CHECKING, Dict, Generic, NamedTuple, Optional, Set, TypeVar, Union, cast
 
 import pendulum
 
 import dagster._check as check
+import dagster._seven as seven
 from dagster._core.errors import DagsterUserCodeProcessError
 from dagster._core.host_representation.origin import (
     ManagedGrpcPythonEnvRepositoryLocationOrigin,
     RepositoryLocationOrigin,
 )
 from dagster._core.types.loadable_target_origin import LoadableTargetOrigin
-from dagster._grpc.server import GrpcServerProcess
+from dagster._grpc.zygote import ForkedGrpcServerProcess, GrpcServerZygote
 from dagster._utils.error import SerializableErrorInfo, serializable_error_info_from_exc_info
 
 if TYPE_CHECKING:
     from dagster._grpc.client import DagsterGrpcClient
+    from dagster._grpc.server import GrpcServerProcess
 
 
 class GrpcServerEndpoint(
@@ -74,7 +76,10 @@ class ProcessRegistryEntry(
     NamedTuple(
         "_ProcessRegistryEntry",
         [
-            ("process_or_error", Union[GrpcServerProcess, SerializableErrorInfo]),
+            (
+                "process_or_error",
+                Union["GrpcServerProcess", ForkedGrpcServerProcess, SerializableErrorInfo],
+            ),
             ("loadable_target_origin", LoadableTargetOrigin),
             ("creation_timestamp", float),
             ("server_id", Optional[str]),
@@ -82,10 +87,14 @@ class ProcessRegistryEntry(
     )
 ):
     def __new__(cls, process_or_error, loadable_target_origin, creation_timestamp, server_id):
+        from dagster._grpc.server import GrpcServerProcess
+
         return super(ProcessRegistryEntry, cls).__new__(
             cls,
             check.inst_param(
-                process_or_error, "process_or_error", (GrpcServerProcess, SerializableErrorInfo)
+                process_or_error,
+                "process_or_error",
+                (GrpcServerProcess, ForkedGrpcServerProcess, SerializableErrorInfo),
             ),
             check.inst_param(
                 loadable_target_origin, "loadable_target_origin", LoadableTargetOrigin
@@ -113,6 +122,14 @@ def __init__(
         heartbeat_ttl,
         # How long to wait for the server to start up and receive connections before timing out
         startup_timeout,
+        # Whether servers should only construct definitions when a request refers to them, rather
+        # than constructing every definition in the repository at startup
+        lazy_load_definitions=False,
+        # Whether to keep a zygote process per origin that has already imported its code, and fork
+        # new servers from it instead of launching (and importing the code in) a fresh process.
+        # Zygotes are replaced in the background every reload_interval, and reload_grpc_endpoint
+        # always starts a new zygote, so code changes are still picked up.
+        use_zygotes=False,
     ):
 
         self.instance = instance
@@ -130,9 +147,24 @@ def __init__(
         self._reload_interval = check.int_param(reload_interval, "reload_interval")
         self._heartbeat_ttl = check.int_param(heartbeat_ttl, "heartbeat_ttl")
         self._startup_timeout = check.int_param(startup_timeout, "startup_timeout")
+        self._lazy_load_definitions = check.bool_param(
+            lazy_load_definitions, "lazy_load_definitions"
+        )
+        # Forking isn't available on Windows, so zygotes are ignored there and servers are
+        # launched as usual
+        self._use_zygotes = check.bool_param(use_zygotes, "use_zygotes") and not seven.IS_WINDOWS
 
+        # Guards _active_entries, _all_processes, _origin_locks, and _zygotes
         self._lock = threading.Lock()
 
+        # GrpcServerZygote map of the zygotes that new servers are forked from, keyed by origin ID
+        self._zygotes: Dict[str, GrpcServerZygote] = {}
+        self._refreshing_zygote_origin_ids: Set[str] = set()
+
+        # Per-origin locks, held while a server for that origin is being created, so that servers
+        # for different origins can start up concurrently
+        self._origin_locks: Dict[str, threading.Lock] = {}
+
         self._all_processes = []
 
         self._cleanup_thread_shutdown_event = None
@@ -162,14 +194,15 @@ def reload_grpc_endpoint(
         check.inst_param(
             repository_location_origin, "repository_location_origin", RepositoryLocationOrigin
         )
-        with self._lock:
-            origin_id = repository_location_origin.get_id()
-            if origin_id in self._active_entries:
-                # Free the map entry for this origin so that _get_grpc_endpoint will create
-                # a new process
-                del self._active_entries[origin_id]
+        origin_id = repository_location_origin.get_id()
+        with self._get_origin_lock(origin_id):
+            with self._lock:
+                if origin_id in self._active_entries:
+                    # Free the map entry for this origin so that _get_grpc_endpoint will create
+                    # a new process
+                    del self._active_entries[origin_id]
 
-            return self._get_grpc_endpoint(repository_location_origin)
+            return self._get_grpc_endpoint(repository_location_origin, reload_code=True)
 
     def get_grpc_endpoint(
         self, repository_location_origin: ManagedGrpcPythonEnvRepositoryLocationOrigin
@@ -178,9 +211,15 @@ def get_grpc_endpoint(
             repository_location_origin, "repository_location_origin", RepositoryLocationOrigin
         )
 
-        with self._lock:
+        with self._get_origin_lock(repository_location_origin.get_id()):
             return self._get_grpc_endpoint(repository_location_origin)
 
+    def _get_origin_lock(self, origin_id: str) -> threading.Lock:
+        with self._lock:
+            if origin_id not in self._origin_locks:
+                self._origin_locks[origin_id] = threading.Lock()
+            return self._origin_locks[origin_id]
+
     def _get_loadable_target_origin(
         self, repository_location_origin: ManagedGrpcPythonEnvRepositoryLocationOrigin
     ):
@@ -191,8 +230,102 @@ def _get_loadable_target_origin(
         )
         return repository_location_origin.loadable_target_origin
 
+    def _create_zygote(
+        self, location_name: str, loadable_target_origin: LoadableTargetOrigin
+    ) -> GrpcServerZygote:
+        return GrpcServerZygote(
+            instance_ref=self.instance.get_ref(),
+            location_name=location_name,
+            loadable_target_origin=loadable_target_origin,
+            startup_timeout=self._startup_timeout,
+            lazy_load_definitions=self._lazy_load_definitions,
+        )
+
+    def _get_zygote(
+        self,
+        repository_location_origin: ManagedGrpcPythonEnvRepositoryLocationOrigin,
+        loadable_target_origin: LoadableTargetOrigin,
+        reload_code: bool,
+    ) -> GrpcServerZygote:
+        origin_id = repository_location_origin.get_id()
+        with self._lock:
+            zygote = self._zygotes.get(origin_id)
+
+        if (
+            zygote
+            and not reload_code
+            and zygote.is_alive()
+            and zygote.loadable_target_origin == loadable_target_origin
+        ):
+            return zygote
+
+        new_zygote = self._create_zygote(
+            repository_location_origin.location_name, loadable_target_origin
+        )
+        self._replace_zygote(origin_id, new_zygote)
+        return new_zygote
+
+    def _replace_zygote(self, origin_id: str, new_zygote: GrpcServerZygote) -> None:
+        with self._lock:
+            old_zygote = self._zygotes.get(origin_id)
+            self._zygotes[origin_id] = new_zygote
+
+        if old_zygote:
+            old_zygote.shutdown()
+
+    def _refresh_zygote(self, origin_id: str, old_zygote: GrpcServerZygote) -> None:
+        # Runs in the background, so servers keep being forked from the previous zygote until
+        # the new one has finished loading the code
+        try:
+            self._replace_zygote(
+                origin_id,
+                self._create_zygote(
+                    check.not_none(old_zygote.location_name), old_zygote.loadable_target_origin
+                ),
+            )
+        except Exception:
+            # The next request for this origin will try to create a zygote again (and surface
+            # the error)
+            pass
+        finally:
+            with self._lock:
+                self._refreshing_zygote_origin_ids.discard(origin_id)
+
+    def _create_server_process(
+        self,
+        repository_location_origin: ManagedGrpcPythonEnvRepositoryLocationOrigin,
+        loadable_target_origin: LoadableTargetOrigin,
+        server_id: str,
+        reload_code: bool,
+    ) -> Union["GrpcServerProcess", ForkedGrpcServerProcess]:
+        # imported here so that grpc is only imported once servers are actually launched
+        from dagster._grpc.server import GrpcServerProcess
+
+        if self._use_zygotes:
+            return self._get_zygote(
+                repository_location_origin, loadable_target_origin, reload_code
+            ).fork_server(
+                heartbeat=True,
+                heartbeat_timeout=self._heartbeat_ttl,
+                fixed_server_id=server_id,
+                startup_timeout=self._startup_timeout,
+            )
+
+        return GrpcServerProcess(
+            instance_ref=self.instance.get_ref(),
+            location_name=repository_location_origin.location_name,
+            loadable_target_origin=loadable_target_origin,
+            heartbeat=True,
+            heartbeat_timeout=self._heartbeat_ttl,
+            fixed_server_id=server_id,
+            startup_timeout=self._startup_timeout,
+            lazy_load_definitions=self._lazy_load_definitions,
+        )
+
     def _get_grpc_endpoint(
-        self, repository_location_origin: ManagedGrpcPythonEnvRepositoryLocationOrigin
+        self,
+        repository_location_origin: ManagedGrpcPythonEnvRepositoryLocationOrigin,
+        reload_code: bool = False,
     ) -> GrpcServerEndpoint:
         origin_id = repository_location_origin.get_id()
         loadable_target_origin = self._get_loadable_target_origin(repository_location_origin)
@@ -201,39 +334,41 @@ def _get_grpc_endpoint(
                 f"No Python file/module information available for location {repository_location_origin.location_name}"
             )
 
-        if not origin_id in self._active_entries:
+        with self._lock:
+            active_entry = self._active_entries.get(origin_id)
+
+        if not active_entry:
             refresh_server = True
         else:
-            active_entry = self._active_entries[origin_id]
             refresh_server = loadable_target_origin != active_entry.loadable_target_origin
 
-        server_process: Union[GrpcServerProcess, SerializableErrorInfo]
+        server_process: Union["GrpcServerProcess", ForkedGrpcServerProcess, SerializableErrorInfo]
         new_server_id: Optional[str]
         if refresh_server:
             try:
                 new_server_id = str(uuid.uuid4())
-                server_process = GrpcServerProcess(
-                    instance_ref=self.instance.get_ref(),
-                    location_name=repository_location_origin.location_name,
-                    loadable_target_origin=loadable_target_origin,
-                    heartbeat=True,
-                    heartbeat_timeout=self._heartbeat_ttl,
-                    fixed_server_id=new_server_id,
-                    startup_timeout=self._startup_timeout,
+                server_process = self._create_server_process(
+                    repository_location_origin,
+                    loadable_target_origin,
+                    new_server_id,
+                    reload_code=reload_code,
                 )
-                self._all_processes.append(server_process)
+                with self._lock:
+                    self._all_processes.append(server_process)
             except Exception:
                 server_process = serializable_error_info_from_exc_info(sys.exc_info())
                 new_server_id = None
 
-            self._active_entries[origin_id] = ProcessRegistryEntry(
+            active_entry = ProcessRegistryEntry(
                 process_or_error=server_process,
                 loadable_target_origin=loadable_target_origin,
                 creation_timestamp=pendulum.now("UTC").timestamp(),
                 server_id=new_server_id,
             )
+            with self._lock:
+                self._active_entries[origin_id] = active_entry
 
-        active_entry = self._active_entries[origin_id]
+        active_entry = cast(ProcessRegistryEntry, active_entry)
 
         if isinstance(active_entry.process_or_error, SerializableErrorInfo):
             raise DagsterUserCodeProcessError(
@@ -270,6 +405,17 @@ def _clear_old_processes(self, shutdown_event, reload_interval):
                 for origin_id in origin_ids_to_clear:
                     del self._active_entries[origin_id]
 
+                # Start loading the latest code in a new zygote for any zygotes that have been
+                # around for longer than the reload interval
+                zygotes_to_refresh = []
+                for origin_id, zygote in self._zygotes.items():
+                    if (
+                        current_time - zygote.creation_timestamp > reload_interval
+                        and origin_id not in self._refreshing_zygote_origin_ids
+                    ):
+                        self._refreshing_zygote_origin_ids.add(origin_id)
+                        zygotes_to_refresh.append((origin_id, zygote))
+
                 # Remove any dead processes from the all_processes map
                 dead_process_indexes = []
                 for index in range(len(self._all_processes)):
@@ -280,6 +426,14 @@ def _clear_old_processes(self, shutdown_event, reload_interval):
                 for index in reversed(dead_process_indexes):
                     del self._all_processes[index]
 
+            for origin_id, zygote in zygotes_to_refresh:
+                threading.Thread(
+                    target=self._refresh_zygote,
+                    args=(origin_id, zygote),
+                    name="grpc-server-zygote-refresh",
+                    daemon=True,
+                ).start()
+
     def __exit__(self, exception_type, exception_value, traceback):
         if self._cleanup_thread:
             cast(threading.Event, self._cleanup_thread_shutdown_event).set()
@@ -288,6 +442,13 @@ def __exit__(self, exception_type, exception_value, traceback):
         for process in self._all_processes:
             process.create_ephemeral_client().cleanup_server()
 
+        with self._lock:
+            zygotes = list(self._zygotes.values())
+            self._zygotes = {}
+
+        for zygote in zygotes:
+            zygote.shutdown()
+
     def wait_for_processes(self):
         # Wait for any processes created by this registry. Generally not needed outside
         # of tests, since the processes have heartbeats and will end on their own once
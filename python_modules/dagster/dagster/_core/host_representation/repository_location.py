@@ -3,7 +3,18 @@
 import threading
 from abc import abstractmethod
 from contextlib import AbstractContextManager
-from typing import TYPE_CHECKING, Any, Dict, Mapping, Optional, Sequence, Tuple, Union, cast
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterator,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    cast,
+)
 
 import dagster._check as check
 from dagster._api.get_server_id import sync_get_server_id
@@ -18,8 +29,14 @@
 )
 from dagster._api.snapshot_pipeline import sync_get_external_pipeline_subset_grpc
 from dagster._api.snapshot_repository import sync_get_streaming_external_repositories_data_grpc
-from dagster._api.snapshot_schedule import sync_get_external_schedule_execution_data_grpc
-from dagster._api.snapshot_sensor import sync_get_external_sensor_execution_data_grpc
+from dagster._api.snapshot_schedule import (
+    sync_get_external_schedule_execution_data_batch_grpc,
+    sync_get_external_schedule_execution_data_grpc,
+)
+from dagster._api.snapshot_sensor import (
+    sync_get_external_sensor_execution_data_batch_grpc,
+    sync_get_external_sensor_execution_data_grpc,
+)
 from dagster._core.code_pointer import CodePointer
 from dagster._core.definitions.reconstruct import ReconstructablePipeline
 from dagster._core.definitions.repository_definition import RepositoryDefinition
@@ -57,7 +74,12 @@
     get_partition_set_execution_param_data,
     get_partition_tags,
 )
-from dagster._grpc.types import GetCurrentImageResult, GetCurrentRunsResult
+from dagster._grpc.types import (
+    ExternalScheduleExecutionArgs,
+    GetCurrentImageResult,
+    GetCurrentRunsResult,
+    SensorExecutionArgs,
+)
 from dagster._serdes import deserialize_as
 from dagster._seven.compat.pendulum import PendulumDateTime
 from dagster._utils import merge_dicts
@@ -204,6 +226,26 @@ def get_external_sensor_execution_data(
     ) -> "SensorExecutionData":
         pass
 
+    @abstractmethod
+    def get_external_schedule_execution_data_batch(
+        self,
+        instance: DagsterInstance,
+        schedule_execution_args: Sequence[ExternalScheduleExecutionArgs],
+    ) -> Iterator[Tuple[int, Union["ScheduleExecutionData", ExternalScheduleExecutionErrorData]]]:
+        """Evaluates several schedules in this location at once. Yields the index of each schedule
+        in the given args along with its execution data (or the error), as soon as its evaluation
+        finishes."""
+
+    @abstractmethod
+    def get_external_sensor_execution_data_batch(
+        self,
+        instance: DagsterInstance,
+        sensor_execution_args: Sequence[SensorExecutionArgs],
+    ) -> Iterator[Tuple[int, Union["SensorExecutionData", ExternalSensorExecutionErrorData]]]:
+        """Evaluates several sensors in this location at once. Yields the index of each sensor in
+        the given args along with its execution data (or the error), as soon as its evaluation
+        finishes."""
+
     @abstractmethod
     def get_external_notebook_data(self, notebook_path: str) -> bytes:
         pass
@@ -494,6 +536,49 @@ def get_external_sensor_execution_data(
 
         return result
 
+    def get_external_schedule_execution_data_batch(
+        self,
+        instance: DagsterInstance,
+        schedule_execution_args: Sequence[ExternalScheduleExecutionArgs],
+    ) -> Iterator[Tuple[int, Union["ScheduleExecutionData", ExternalScheduleExecutionErrorData]]]:
+        check.inst_param(instance, "instance", DagsterInstance)
+        check.sequence_param(
+            schedule_execution_args,
+            "schedule_execution_args",
+            of_type=ExternalScheduleExecutionArgs,
+        )
+
+        instance_ref = instance.get_ref()
+        for i, args in enumerate(schedule_execution_args):
+            yield i, get_external_schedule_execution(
+                self._get_repo_def(args.repository_origin.repository_name),
+                instance_ref=instance_ref,
+                schedule_name=args.schedule_name,
+                scheduled_execution_timestamp=args.scheduled_execution_timestamp,
+                scheduled_execution_timezone=args.scheduled_execution_timezone,
+            )
+
+    def get_external_sensor_execution_data_batch(
+        self,
+        instance: DagsterInstance,
+        sensor_execution_args: Sequence[SensorExecutionArgs],
+    ) -> Iterator[Tuple[int, Union["SensorExecutionData", ExternalSensorExecutionErrorData]]]:
+        check.inst_param(instance, "instance", DagsterInstance)
+        check.sequence_param(
+            sensor_execution_args, "sensor_execution_args", of_type=SensorExecutionArgs
+        )
+
+        instance_ref = instance.get_ref()
+        for i, args in enumerate(sensor_execution_args):
+            yield i, get_external_sensor_execution(
+                self._get_repo_def(args.repository_origin.repository_name),
+                instance_ref,
+                args.sensor_name,
+                args.last_completion_time,
+                args.last_run_key,
+                args.cursor,
+            )
+
     def get_external_partition_set_execution_param_data(
         self,
         repository_handle: RepositoryHandle,
@@ -829,6 +914,28 @@ def get_external_sensor_execution_data(
             cursor,
         )
 
+    def get_external_schedule_execution_data_batch(
+        self,
+        instance: DagsterInstance,
+        schedule_execution_args: Sequence[ExternalScheduleExecutionArgs],
+    ) -> Iterator[Tuple[int, Union["ScheduleExecutionData", ExternalScheduleExecutionErrorData]]]:
+        check.inst_param(instance, "instance", DagsterInstance)
+
+        yield from sync_get_external_schedule_execution_data_batch_grpc(
+            self.client, instance, schedule_execution_args
+        )
+
+    def get_external_sensor_execution_data_batch(
+        self,
+        instance: DagsterInstance,
+        sensor_execution_args: Sequence[SensorExecutionArgs],
+    ) -> Iterator[Tuple[int, Union["SensorExecutionData", ExternalSensorExecutionErrorData]]]:
+        check.inst_param(instance, "instance", DagsterInstance)
+
+        yield from sync_get_external_sensor_execution_data_batch_grpc(
+            self.client, instance, sensor_execution_args
+        )
+
     def get_external_partition_set_execution_param_data(
         self,
         repository_handle: RepositoryHandle,
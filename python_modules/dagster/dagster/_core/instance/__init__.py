@@ -74,6 +74,7 @@
 from .config import (
     DAGSTER_CONFIG_YAML_FILENAME,
     DEFAULT_LOCAL_CODE_SERVER_STARTUP_TIMEOUT,
+    DEFAULT_MAX_CONCURRENT_LOCATION_LOADS,
     get_default_tick_retention_settings,
     get_tick_retention_settings,
     is_dagster_home_set,
@@ -715,6 +716,20 @@ def code_server_process_startup_timeout(self) -> int:
             "local_startup_timeout", DEFAULT_LOCAL_CODE_SERVER_STARTUP_TIMEOUT
         )
 
+    @property
+    def code_server_max_concurrent_location_loads(self) -> int:
+        return self.code_server_settings.get(
+            "max_concurrent_location_loads", DEFAULT_MAX_CONCURRENT_LOCATION_LOADS
+        )
+
+    @property
+    def code_server_use_zygotes(self) -> bool:
+        return self.code_server_settings.get("use_zygotes", False)
+
+    @property
+    def code_server_lazy_load_definitions(self) -> bool:
+        return self.code_server_settings.get("lazy_load_definitions", False)
+
     @property
     def run_monitoring_max_resume_run_attempts(self) -> int:
         default_max_resume_run_attempts = 3 if self.run_launcher.supports_resume_run else 0
@@ -151,6 +151,7 @@ def python_logs_config_schema() -> Field:
 
 
 DEFAULT_LOCAL_CODE_SERVER_STARTUP_TIMEOUT = 180
+DEFAULT_MAX_CONCURRENT_LOCATION_LOADS = 8
 
 
 def get_default_tick_retention_settings(
@@ -289,7 +290,13 @@ def dagster_instance_config_schema() -> Mapping[str, Field]:
             }
         ),
         "code_servers": Field(
-            {"local_startup_timeout": Field(int, is_required=False)}, is_required=False
+            {
+                "local_startup_timeout": Field(int, is_required=False),
+                "max_concurrent_location_loads": Field(int, is_required=False),
+                "use_zygotes": Field(bool, is_required=False),
+                "lazy_load_definitions": Field(bool, is_required=False),
+            },
+            is_required=False,
         ),
         "secrets": secrets_loader_config_schema(),
         "retention": retention_config_schema(),
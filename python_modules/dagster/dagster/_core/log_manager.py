@@ -2,7 +2,8 @@
 
 import datetime
 import logging
-from typing import TYPE_CHECKING, Any, Mapping, NamedTuple, Optional, Sequence, Union
+import threading
+from typing import TYPE_CHECKING, Any, List, Mapping, NamedTuple, Optional, Sequence, Union
 
 import dagster._check as check
 from dagster._core.utils import coerce_valid_log_level, make_new_run_id
@@ -277,6 +278,49 @@ def emit(self, record: logging.LogRecord):
             self._should_capture = True
 
 
+class DeferredDagsterLogHandler(DagsterLogHandler):
+    """A DagsterLogHandler that holds the records it receives until it is flushed, so that the
+    messages logged from a thread that must not write to the run's handlers, e.g. a thread that
+    loads inputs ahead of a step or a thread that executes a step alongside others, are handled by
+    the thread that flushes them.
+    """
+
+    def __init__(
+        self,
+        logging_metadata: DagsterLoggingMetadata,
+        loggers: Sequence[logging.Logger],
+        handlers: Sequence[logging.Handler],
+    ):
+        self._deferred_records: List[logging.LogRecord] = []
+        self._flushing_thread: Optional[threading.Thread] = None
+        super().__init__(logging_metadata=logging_metadata, loggers=loggers, handlers=handlers)
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        # only the messages logged by the handlers of the run while the records are flushed are
+        # not captured, since other threads keep logging to this handler in the meantime
+        return threading.current_thread() is not self._flushing_thread and not isinstance(
+            getattr(record, DAGSTER_META_KEY, None), dict
+        )
+
+    def emit(self, record: logging.LogRecord):
+        self._deferred_records.append(record)
+
+    def flush(self):
+        # records are emitted from other threads while holding the lock of the handler
+        self.acquire()
+        try:
+            records, self._deferred_records = self._deferred_records, []
+        finally:
+            self.release()
+
+        self._flushing_thread = threading.current_thread()
+        try:
+            for record in records:
+                super().emit(record)
+        finally:
+            self._flushing_thread = None
+
+
 class DagsterLogManager(logging.Logger):
     """Centralized dispatch for logging from user code.
 
@@ -401,6 +445,24 @@ def log(self, level: Union[str, int], msg: object, *args: Any, **kwargs: Any) ->
         if self.isEnabledFor(level) or ("extra" in kwargs and DAGSTER_META_KEY in kwargs["extra"]):
             self._log(level, msg, args, **kwargs)
 
+    def with_deferred_handling(self) -> DagsterLogManager:
+        """Returns a DagsterLogManager with the same tags and loggers, whose messages are held until
+        flush_deferred is called on it.
+        """
+        return DagsterLogManager(
+            dagster_handler=DeferredDagsterLogHandler(
+                logging_metadata=self._dagster_handler.logging_metadata,
+                loggers=self._dagster_handler._loggers,  # pylint: disable=protected-access
+                handlers=self._dagster_handler._handlers,  # pylint: disable=protected-access
+            ),
+            managed_loggers=self._managed_loggers,
+            level=self.level,
+        )
+
+    def flush_deferred(self) -> None:
+        """Handles the messages held by a DagsterLogManager with deferred handling."""
+        self._dagster_handler.flush()
+
     def with_tags(self, **new_tags: str) -> DagsterLogManager:
         """Add new tags in "new_tags" to the set of tags attached to this log manager instance, and
         return a new DagsterLogManager with the merged set of tags.
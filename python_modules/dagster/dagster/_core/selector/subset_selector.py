@@ -115,14 +115,14 @@ def generate_asset_dep_graph(
     for assets_def in assets_defs:
         for asset_key in assets_def.keys:
             upstream[asset_key] = set()
-            downstream[asset_key] = downstream.get(asset_key, set())
+            downstream.setdefault(asset_key, set())
             # for each asset upstream of this one, set that as upstream, and this downstream of it
             upstream_asset_keys = resolved_asset_deps.get_resolved_upstream_asset_keys(
                 assets_def, asset_key
             )
             for upstream_key in upstream_asset_keys:
                 upstream[asset_key].add(upstream_key)
-                downstream[upstream_key] = downstream.get(upstream_key, set()) | {asset_key}
+                downstream.setdefault(upstream_key, set()).add(asset_key)
     return {"upstream": upstream, "downstream": downstream}
 
 
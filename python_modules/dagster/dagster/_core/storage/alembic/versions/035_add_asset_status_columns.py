@@ -0,0 +1,22 @@
+"""add asset status columns
+
+Revision ID: e62c379ac8f4
+Revises: 6df03f4b1efb
+Create Date: 2022-12-01 10:41:27.915412
+
+"""
+from dagster._core.storage.migration.utils import add_asset_status_columns
+
+# revision identifiers, used by Alembic.
+revision = "e62c379ac8f4"
+down_revision = "6df03f4b1efb"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    add_asset_status_columns()
+
+
+def downgrade():
+    pass
@@ -126,8 +126,7 @@ def _log_data_for_type(self, log_key, io_type, offset, max_bytes):
                 log_key, IO_TYPE_EXTENSION[io_type]
             )
             return self.local_manager.read_path(local_path, offset=offset, max_bytes=max_bytes)
-        if self.cloud_storage_has_logs(log_key, io_type, partial=True):
-            self.download_from_cloud_storage(log_key, io_type, partial=True)
+        if self._fetch_partial_file(log_key, io_type, offset):
             local_path = self.local_manager.get_captured_local_path(
                 log_key, IO_TYPE_EXTENSION[io_type], partial=True
             )
@@ -135,6 +134,20 @@ def _log_data_for_type(self, log_key, io_type, offset, max_bytes):
 
         return None, offset
 
+    def _fetch_partial_file(self, log_key, io_type, offset) -> bool:
+        # A previously downloaded partial upload that extends past the requested offset is served
+        # as is, so that readers consume partial uploads incrementally and the partial upload is
+        # only downloaded again once they have caught up with the local copy.
+        local_path = self.local_manager.get_captured_local_path(
+            log_key, IO_TYPE_EXTENSION[io_type], partial=True
+        )
+        if os.path.exists(local_path) and os.path.getsize(local_path) > (offset or 0):
+            return True
+        if self.cloud_storage_has_logs(log_key, io_type, partial=True):
+            self.download_from_cloud_storage(log_key, io_type, partial=True)
+            return True
+        return False
+
     def get_log_data(
         self,
         log_key: Sequence[str],
@@ -254,8 +267,7 @@ def read_logs_file(self, run_id, key, io_type, cursor=0, max_bytes=MAX_BYTES_FIL
             self.download_from_cloud_storage(log_key, io_type)
             data = self.local_manager.read_logs_file(run_id, key, io_type, cursor, max_bytes)
             return self._from_local_file_data(run_id, key, io_type, data)
-        elif self.cloud_storage_has_logs(log_key, io_type, partial=True):
-            self.download_from_cloud_storage(log_key, io_type, partial=True)
+        elif self._fetch_partial_file(log_key, io_type, cursor):
             partial_path = self.local_manager.get_captured_local_path(
                 log_key, IO_TYPE_EXTENSION[io_type], partial=True
             )
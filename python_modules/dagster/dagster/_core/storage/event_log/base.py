@@ -1,7 +1,7 @@
 import base64
 from abc import ABC, abstractmethod
 from enum import Enum
-from typing import Callable, Iterable, Mapping, NamedTuple, Optional, Sequence, Set, Union
+from typing import Callable, Dict, Iterable, Mapping, NamedTuple, Optional, Sequence, Set, Union
 
 import dagster._check as check
 from dagster._core.assets import AssetDetails
@@ -15,6 +15,7 @@
     build_run_step_stats_from_events,
 )
 from dagster._core.instance import MayHaveInstanceWeakref
+from dagster._core.storage.partition_status_cache import AssetStatusCacheValue
 from dagster._core.storage.pipeline_run import PipelineRunStatsSnapshot
 from dagster._seven import json
 
@@ -79,15 +80,30 @@ class AssetEntry(
             ("last_materialization", Optional[EventLogEntry]),
             ("last_run_id", Optional[str]),
             ("asset_details", Optional[AssetDetails]),
+            ("last_materialization_storage_id", Optional[int]),
+            ("last_observation", Optional[EventLogEntry]),
+            ("cached_status", Optional[AssetStatusCacheValue]),
         ],
     )
 ):
+    """The latest status of an asset, as maintained by the event log storage as asset events are
+    stored.
+
+    ``last_run_id`` is the id of the latest run that planned or produced a materialization of the
+    asset. The storage id of the latest materialization and the latest observation are only
+    available on storages that have been migrated to track them. ``cached_status`` is the cached
+    summary of the status of the asset's partitions, if one has been stored.
+    """
+
     def __new__(
         cls,
         asset_key: AssetKey,
         last_materialization: Optional[EventLogEntry] = None,
         last_run_id: Optional[str] = None,
         asset_details: Optional[AssetDetails] = None,
+        last_materialization_storage_id: Optional[int] = None,
+        last_observation: Optional[EventLogEntry] = None,
+        cached_status: Optional[AssetStatusCacheValue] = None,
     ):
         return super(AssetEntry, cls).__new__(
             cls,
@@ -97,6 +113,15 @@ def __new__(
             ),
             last_run_id=check.opt_str_param(last_run_id, "last_run_id"),
             asset_details=check.opt_inst_param(asset_details, "asset_details", AssetDetails),
+            last_materialization_storage_id=check.opt_int_param(
+                last_materialization_storage_id, "last_materialization_storage_id"
+            ),
+            last_observation=check.opt_inst_param(
+                last_observation, "last_observation", EventLogEntry
+            ),
+            cached_status=check.opt_inst_param(
+                cached_status, "cached_status", AssetStatusCacheValue
+            ),
         )
 
 
@@ -178,6 +203,39 @@ def get_step_stats_for_run(
 
         return build_run_step_stats_from_events(run_id, logs)
 
+    def get_logs_for_runs(
+        self,
+        run_ids: Sequence[str],
+        of_type: Optional[Union[DagsterEventType, Set[DagsterEventType]]] = None,
+    ) -> Mapping[str, Sequence[EventLogEntry]]:
+        """Get all of the logs corresponding to each of a set of runs, keyed by run id.
+
+        Storages that can query across runs should override this to fetch the logs in bulk.
+
+        Args:
+            run_ids (Sequence[str]): The ids of the runs for which to fetch logs.
+            of_type (Optional[DagsterEventType]): the dagster event type to filter the logs.
+        """
+        return {
+            run_id: list(self.get_logs_for_run(run_id, of_type=of_type)) for run_id in run_ids
+        }
+
+    def get_stats_for_runs(self, run_ids: Sequence[str]) -> Mapping[str, PipelineRunStatsSnapshot]:
+        """Get a summary of events that have ocurred in each of a set of runs, keyed by run id.
+
+        Storages that can query across runs should override this to fetch the stats in bulk.
+        """
+        return {run_id: self.get_stats_for_run(run_id) for run_id in run_ids}
+
+    def get_step_stats_for_runs(
+        self, run_ids: Sequence[str]
+    ) -> Mapping[str, Sequence[RunStepKeyStatsSnapshot]]:
+        """Get per-step stats for each of a set of runs, keyed by run id.
+
+        Storages that can query across runs should override this to fetch the stats in bulk.
+        """
+        return {run_id: self.get_step_stats_for_run(run_id) for run_id in run_ids}
+
     @abstractmethod
     def store_event(self, event: EventLogEntry):
         """Store an event corresponding to a pipeline run.
@@ -329,6 +387,60 @@ def get_materialization_count_by_partition(
     ) -> Mapping[AssetKey, Mapping[str, int]]:
         pass
 
+    def get_latest_storage_id_by_partition(
+        self,
+        asset_key: AssetKey,
+        event_type: DagsterEventType,
+        after_cursor: Optional[int] = None,
+    ) -> Mapping[str, int]:
+        """Get the storage id of the latest event of the given type for each partition of an asset,
+        considering only the events stored after the given cursor.
+
+        Storages that can aggregate over the event log should override this to avoid loading the
+        events themselves.
+        """
+        latest_storage_id_by_partition: Dict[str, int] = {}
+        for record in self.get_event_records(
+            EventRecordsFilter(
+                event_type=event_type, asset_key=asset_key, after_cursor=after_cursor
+            ),
+            ascending=True,
+        ):
+            dagster_event = record.event_log_entry.dagster_event
+            if dagster_event and dagster_event.partition:
+                latest_storage_id_by_partition[dagster_event.partition] = record.storage_id
+        return latest_storage_id_by_partition
+
+    def get_event_records_for_asset_keys(
+        self,
+        event_type: DagsterEventType,
+        after_cursor_by_asset_key: Mapping[AssetKey, Optional[int]],
+    ) -> Mapping[AssetKey, Sequence[EventLogRecord]]:
+        """Get the records of the events of the given type for each of a set of assets, in
+        ascending order, considering only the events stored after the cursor given for each asset.
+
+        Storages that can query across assets should override this to fetch the records in bulk.
+        """
+        return {
+            asset_key: list(
+                self.get_event_records(
+                    EventRecordsFilter(
+                        event_type=event_type, asset_key=asset_key, after_cursor=after_cursor
+                    ),
+                    ascending=True,
+                )
+            )
+            for asset_key, after_cursor in after_cursor_by_asset_key.items()
+        }
+
+    def can_cache_asset_status_data(self) -> bool:
+        return False
+
+    def update_asset_cached_status_data(
+        self, asset_key: AssetKey, cache_values: AssetStatusCacheValue
+    ) -> None:
+        raise NotImplementedError()
+
     def alembic_version(self):
         return None
 
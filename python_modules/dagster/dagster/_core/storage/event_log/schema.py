@@ -52,6 +52,9 @@
     db.Column("tags", db.TEXT),  # guarded by secondary index check
     db.Column("create_timestamp", db.DateTime, server_default=get_current_timestamp()),
     db.Column("cached_status_data", db.TEXT),
+    # latest status columns, guarded by column existence check
+    db.Column("last_materialization_storage_id", db.Integer),
+    db.Column("last_observation", db.TEXT),
 )
 
 AssetEventTagsTable = db.Table(
@@ -27,6 +27,7 @@
 from dagster._serdes.errors import DeserializationError
 from dagster._utils import datetime_as_float, utc_datetime_from_naive, utc_datetime_from_timestamp
 
+from ..partition_status_cache import AssetStatusCacheValue
 from ..pipeline_run import PipelineRunStatsSnapshot
 from .base import (
     AssetEntry,
@@ -122,8 +123,50 @@ def has_asset_key_index_cols(self):
             column_names = [x.get("name") for x in db.inspect(conn).get_columns(AssetKeyTable.name)]
             return "last_materialization_timestamp" in column_names
 
-    def store_asset_event(self, event: EventLogEntry):
+    def _has_asset_key_column(self, column_name: str) -> bool:
+        # columns are never dropped once added by a migration, so only positive results are cached
+        migrated_columns = getattr(self, "_migrated_asset_key_columns", None)
+        if migrated_columns is None:
+            migrated_columns = self._migrated_asset_key_columns = set()
+        if column_name not in migrated_columns:
+            with self.index_connection() as conn:
+                column_names = [
+                    x.get("name") for x in db.inspect(conn).get_columns(AssetKeyTable.name)
+                ]
+            if column_name in column_names:
+                migrated_columns.add(column_name)
+        return column_name in migrated_columns
+
+    def has_asset_status_cols(self):
+        return self._has_asset_key_column("last_materialization_storage_id")
+
+    def can_cache_asset_status_data(self) -> bool:
+        return self._has_asset_key_column("cached_status_data")
+
+    def update_asset_cached_status_data(
+        self, asset_key: AssetKey, cache_values: AssetStatusCacheValue
+    ) -> None:
+        check.inst_param(asset_key, "asset_key", AssetKey)
+        check.inst_param(cache_values, "cache_values", AssetStatusCacheValue)
+
+        if not self.can_cache_asset_status_data():
+            return
+
+        with self.index_connection() as conn:
+            conn.execute(
+                AssetKeyTable.update()  # pylint: disable=no-value-for-parameter
+                .where(
+                    db.or_(
+                        AssetKeyTable.c.asset_key == asset_key.to_string(),
+                        AssetKeyTable.c.asset_key == asset_key.to_string(legacy=True),
+                    )
+                )
+                .values(cached_status_data=serialize_dagster_namedtuple(cache_values))
+            )
+
+    def store_asset_event(self, event: EventLogEntry, event_id: Optional[int] = None):
         check.inst_param(event, "event", EventLogEntry)
+        check.opt_int_param(event_id, "event_id")
         if not (event.dagster_event and event.dagster_event.asset_key):
             return
 
@@ -139,7 +182,9 @@ def store_asset_event(self, event: EventLogEntry):
         #
         # https://github.com/dagster-io/dagster/issues/3945
 
-        values = self._get_asset_entry_values(event, self.has_asset_key_index_cols())
+        values = self._get_asset_entry_values(
+            event, event_id, self.has_asset_key_index_cols(), self.has_asset_status_cols()
+        )
         insert_statement = AssetKeyTable.insert().values(
             asset_key=event.dagster_event.asset_key.to_string(), **values
         )
@@ -157,7 +202,13 @@ def store_asset_event(self, event: EventLogEntry):
             except db.exc.IntegrityError:
                 conn.execute(update_statement)
 
-    def _get_asset_entry_values(self, event: EventLogEntry, has_asset_key_index_cols):
+    def _get_asset_entry_values(
+        self,
+        event: EventLogEntry,
+        event_id: Optional[int],
+        has_asset_key_index_cols: bool,
+        has_asset_status_cols: bool = False,
+    ):
         # The AssetKeyTable contains a `last_materialization_timestamp` column that is exclusively
         # used to determine if an asset exists (last materialization timestamp > wipe timestamp).
         # This column is used nowhere else, and as of AssetObservation/AssetMaterializationPlanned
@@ -179,6 +230,10 @@ def _get_asset_entry_values(self, event: EventLogEntry, has_asset_key_index_cols
                     "last_run_id": event.run_id,
                 }
             )
+            if has_asset_status_cols:
+                # cleared when the storage id of the event is not known, so that it is not
+                # mistaken for the storage id of an earlier materialization
+                entry_values.update({"last_materialization_storage_id": event_id})
             if has_asset_key_index_cols:
                 entry_values.update(
                     {
@@ -203,6 +258,8 @@ def _get_asset_entry_values(self, event: EventLogEntry, has_asset_key_index_cols
                     }
                 )
         elif dagster_event.is_asset_observation:
+            if has_asset_status_cols:
+                entry_values.update({"last_observation": serialize_dagster_namedtuple(event)})
             if has_asset_key_index_cols:
                 entry_values.update(
                     {
@@ -343,13 +400,12 @@ def store_event(self, event):
             and event.dagster_event_type in ASSET_EVENTS
             and event.dagster_event.asset_key
         ):
-            self.store_asset_event(event)
-
             if event_id is None:
                 raise DagsterInvariantViolationError(
                     "Cannot store asset event tags for null event id."
                 )
 
+            self.store_asset_event(event, event_id)
             self.store_asset_event_tags(event, event_id)
 
     def get_records_for_run(
@@ -464,6 +520,43 @@ def get_stats_for_run(self, run_id):
         with self.run_connection(run_id) as conn:
             results = conn.execute(query).fetchall()
 
+        return self._build_run_stats(run_id, results)
+
+    def get_stats_for_runs(self, run_ids):
+        check.sequence_param(run_ids, "run_ids", of_type=str)
+        if self.is_run_sharded:
+            return super().get_stats_for_runs(run_ids)
+
+        query = (
+            db.select(
+                [
+                    SqlEventLogStorageTable.c.run_id,
+                    SqlEventLogStorageTable.c.dagster_event_type,
+                    db.func.count().label("n_events_of_type"),
+                    db.func.max(SqlEventLogStorageTable.c.timestamp).label("last_event_timestamp"),
+                ]
+            )
+            .where(
+                db.and_(
+                    SqlEventLogStorageTable.c.run_id.in_(run_ids),
+                    SqlEventLogStorageTable.c.dagster_event_type != None,
+                )
+            )
+            .group_by("run_id", "dagster_event_type")
+        )
+
+        with self.run_connection(run_id=None) as conn:
+            results = conn.execute(query).fetchall()
+
+        results_by_run_id = defaultdict(list)
+        for (run_id, *result) in results:
+            results_by_run_id[run_id].append(result)
+
+        return {
+            run_id: self._build_run_stats(run_id, results_by_run_id[run_id]) for run_id in run_ids
+        }
+
+    def _build_run_stats(self, run_id, results) -> PipelineRunStatsSnapshot:
         try:
             counts = {}
             times = {}
@@ -498,25 +591,9 @@ def get_stats_for_run(self, run_id):
         except (seven.JSONDecodeError, DeserializationError) as err:
             raise DagsterEventLogInvalidForRun(run_id=run_id) from err
 
-    def get_step_stats_for_run(self, run_id, step_keys=None):
-        check.str_param(run_id, "run_id")
-        check.opt_list_param(step_keys, "step_keys", of_type=str)
-
-        # Originally, this was two different queries:
-        # 1) one query which aggregated top-level step stats by grouping by event type / step_key in
-        #    a single query, using pure SQL (e.g. start_time, end_time, status, attempt counts).
-        # 2) one query which fetched all the raw events for a specific event type and then inspected
-        #    the deserialized event object to aggregate stats derived from sequences of events.
-        #    (e.g. marker events, materializations, expectations resuls, attempts timing, etc.)
-        #
-        # For simplicity, we now just do the second type of query and derive the stats in Python
-        # from the raw events.  This has the benefit of being easier to read and also the benefit of
-        # being able to share code with the in-memory event log storage implementation.  We may
-        # choose to revisit this in the future, especially if we are able to do JSON-column queries
-        # in SQL as a way of bypassing the serdes layer in all cases.
-        raw_event_query = (
-            db.select([SqlEventLogStorageTable.c.event])
-            .where(SqlEventLogStorageTable.c.run_id == run_id)
+    def _step_stats_events_query(self, columns):
+        return (
+            db.select(columns)
             .where(SqlEventLogStorageTable.c.step_key != None)
             .where(
                 SqlEventLogStorageTable.c.dagster_event_type.in_(
@@ -536,6 +613,26 @@ def get_step_stats_for_run(self, run_id, step_keys=None):
             )
             .order_by(SqlEventLogStorageTable.c.id.asc())
         )
+
+    def get_step_stats_for_run(self, run_id, step_keys=None):
+        check.str_param(run_id, "run_id")
+        check.opt_list_param(step_keys, "step_keys", of_type=str)
+
+        # Originally, this was two different queries:
+        # 1) one query which aggregated top-level step stats by grouping by event type / step_key in
+        #    a single query, using pure SQL (e.g. start_time, end_time, status, attempt counts).
+        # 2) one query which fetched all the raw events for a specific event type and then inspected
+        #    the deserialized event object to aggregate stats derived from sequences of events.
+        #    (e.g. marker events, materializations, expectations resuls, attempts timing, etc.)
+        #
+        # For simplicity, we now just do the second type of query and derive the stats in Python
+        # from the raw events.  This has the benefit of being easier to read and also the benefit of
+        # being able to share code with the in-memory event log storage implementation.  We may
+        # choose to revisit this in the future, especially if we are able to do JSON-column queries
+        # in SQL as a way of bypassing the serdes layer in all cases.
+        raw_event_query = self._step_stats_events_query([SqlEventLogStorageTable.c.event]).where(
+            SqlEventLogStorageTable.c.run_id == run_id
+        )
         if step_keys:
             raw_event_query = raw_event_query.where(
                 SqlEventLogStorageTable.c.step_key.in_(step_keys)
@@ -555,6 +652,67 @@ def get_step_stats_for_run(self, run_id, step_keys=None):
         except (seven.JSONDecodeError, DeserializationError) as err:
             raise DagsterEventLogInvalidForRun(run_id=run_id) from err
 
+    def get_step_stats_for_runs(self, run_ids):
+        check.sequence_param(run_ids, "run_ids", of_type=str)
+        if self.is_run_sharded:
+            return super().get_step_stats_for_runs(run_ids)
+
+        raw_event_query = self._step_stats_events_query(
+            [SqlEventLogStorageTable.c.run_id, SqlEventLogStorageTable.c.event]
+        ).where(SqlEventLogStorageTable.c.run_id.in_(run_ids))
+
+        with self.run_connection(run_id=None) as conn:
+            results = conn.execute(raw_event_query).fetchall()
+
+        records_by_run_id = self._deserialize_records_by_run_id(results)
+        return {
+            run_id: build_run_step_stats_from_events(run_id, records_by_run_id[run_id])
+            for run_id in run_ids
+        }
+
+    def get_logs_for_runs(self, run_ids, of_type=None):
+        check.sequence_param(run_ids, "run_ids", of_type=str)
+        if self.is_run_sharded:
+            return super().get_logs_for_runs(run_ids, of_type)
+
+        check.invariant(
+            not of_type
+            or isinstance(of_type, DagsterEventType)
+            or isinstance(of_type, (frozenset, set))
+        )
+        dagster_event_types = (
+            {of_type}
+            if isinstance(of_type, DagsterEventType)
+            else check.opt_set_param(of_type, "dagster_event_type", of_type=DagsterEventType)
+        )
+
+        query = (
+            db.select([SqlEventLogStorageTable.c.run_id, SqlEventLogStorageTable.c.event])
+            .where(SqlEventLogStorageTable.c.run_id.in_(run_ids))
+            .order_by(SqlEventLogStorageTable.c.id.asc())
+        )
+        if dagster_event_types:
+            query = query.where(
+                SqlEventLogStorageTable.c.dagster_event_type.in_(
+                    [dagster_event_type.value for dagster_event_type in dagster_event_types]
+                )
+            )
+
+        with self.run_connection(run_id=None) as conn:
+            results = conn.execute(query).fetchall()
+
+        records_by_run_id = self._deserialize_records_by_run_id(results)
+        return {run_id: records_by_run_id[run_id] for run_id in run_ids}
+
+    def _deserialize_records_by_run_id(self, results) -> Mapping[str, List[EventLogEntry]]:
+        records_by_run_id: Dict[str, List[EventLogEntry]] = defaultdict(list)
+        for (run_id, json_str) in results:
+            try:
+                records_by_run_id[run_id].append(deserialize_as(json_str, EventLogEntry))
+            except (seven.JSONDecodeError, DeserializationError) as err:
+                raise DagsterEventLogInvalidForRun(run_id=run_id) from err
+        return records_by_run_id
+
     def _apply_migration(self, migration_name, migration_fn, print_fn, force):
         if self.has_secondary_index(migration_name):
             if not force:
@@ -936,6 +1094,29 @@ def _construct_asset_record_from_row(self, row, last_materialization: Optional[E
                     last_materialization=last_materialization,
                     last_run_id=row[3],
                     asset_details=AssetDetails.from_db_string(row[4]),
+                    last_materialization_storage_id=_get_from_row(
+                        row, "last_materialization_storage_id"
+                    ),
+                    last_observation=(
+                        cast(
+                            EventLogEntry,
+                            deserialize_json_to_dagster_namedtuple(
+                                _get_from_row(row, "last_observation")
+                            ),
+                        )
+                        if _get_from_row(row, "last_observation")
+                        else None
+                    ),
+                    cached_status=(
+                        cast(
+                            AssetStatusCacheValue,
+                            deserialize_json_to_dagster_namedtuple(
+                                _get_from_row(row, "cached_status_data")
+                            ),
+                        )
+                        if _get_from_row(row, "cached_status_data")
+                        else None
+                    ),
                 ),
             )
 
@@ -1102,6 +1283,15 @@ def _fetch_raw_asset_rows(self, asset_keys=None, prefix=None, limit=None, cursor
                     AssetKeyTable.c.tags,
                 ]
             )
+        if self.has_asset_status_cols():
+            columns.extend(
+                [
+                    AssetKeyTable.c.last_materialization_storage_id,
+                    AssetKeyTable.c.last_observation,
+                ]
+            )
+        if self.can_cache_asset_status_data():
+            columns.append(AssetKeyTable.c.cached_status_data)
 
         is_partial_query = asset_keys is not None or bool(prefix) or bool(limit) or bool(cursor)
         if self.has_asset_key_index_cols() and not is_partial_query:
@@ -1442,6 +1632,7 @@ def wipe_asset(self, asset_key):
         check.inst_param(asset_key, "asset_key", AssetKey)
 
         wipe_timestamp = pendulum.now("UTC").timestamp()
+        wiped_status_values = self._get_wiped_asset_status_values()
 
         if self.has_asset_key_index_cols():
             with self.index_connection() as conn:
@@ -1459,6 +1650,7 @@ def wipe_asset(self, asset_key):
                         ),
                         wipe_timestamp=utc_datetime_from_timestamp(wipe_timestamp),
                         last_run_id=None,
+                        **wiped_status_values,
                     )
                 )
 
@@ -1477,9 +1669,23 @@ def wipe_asset(self, asset_key):
                             AssetDetails(last_wipe_timestamp=wipe_timestamp)
                         ),
                         last_run_id=None,
+                        **wiped_status_values,
                     )
                 )
 
+    def _get_wiped_asset_status_values(self):
+        values: Dict[str, Any] = {}
+        if self.has_asset_status_cols():
+            values.update(
+                {
+                    "last_materialization_storage_id": None,
+                    "last_observation": None,
+                }
+            )
+        if self.can_cache_asset_status_data():
+            values.update({"cached_status_data": None})
+        return values
+
     def get_materialization_count_by_partition(
         self, asset_keys: Sequence[AssetKey]
     ) -> Mapping[AssetKey, Mapping[str, int]]:
@@ -1527,6 +1733,114 @@ def get_materialization_count_by_partition(
 
         return materialization_count_by_partition
 
+    def get_latest_storage_id_by_partition(
+        self,
+        asset_key: AssetKey,
+        event_type: DagsterEventType,
+        after_cursor: Optional[int] = None,
+    ) -> Mapping[str, int]:
+        check.inst_param(asset_key, "asset_key", AssetKey)
+        check.inst_param(event_type, "event_type", DagsterEventType)
+        check.opt_int_param(after_cursor, "after_cursor")
+
+        query = (
+            db.select(
+                [
+                    SqlEventLogStorageTable.c.partition,
+                    db.func.max(SqlEventLogStorageTable.c.id),
+                ]
+            )
+            .where(
+                db.and_(
+                    db.or_(
+                        SqlEventLogStorageTable.c.asset_key == asset_key.to_string(),
+                        SqlEventLogStorageTable.c.asset_key == asset_key.to_string(legacy=True),
+                    ),
+                    SqlEventLogStorageTable.c.partition != None,
+                    SqlEventLogStorageTable.c.dagster_event_type == event_type.value,
+                )
+            )
+            .group_by(SqlEventLogStorageTable.c.partition)
+        )
+        if after_cursor is not None:
+            query = query.where(SqlEventLogStorageTable.c.id > after_cursor)
+
+        assets_details = self._get_assets_details([asset_key])
+        query = self._add_assets_wipe_filter_to_query(query, assets_details, [asset_key])
+
+        with self.index_connection() as conn:
+            rows = conn.execute(query).fetchall()
+
+        return {cast(str, row[0]): cast(int, row[1]) for row in rows}
+
+    def get_event_records_for_asset_keys(
+        self,
+        event_type: DagsterEventType,
+        after_cursor_by_asset_key: Mapping[AssetKey, Optional[int]],
+    ) -> Mapping[AssetKey, Sequence[EventLogRecord]]:
+        check.inst_param(event_type, "event_type", DagsterEventType)
+        check.mapping_param(
+            after_cursor_by_asset_key, "after_cursor_by_asset_key", key_type=AssetKey
+        )
+        if self.is_run_sharded or not after_cursor_by_asset_key:
+            return super().get_event_records_for_asset_keys(event_type, after_cursor_by_asset_key)
+
+        asset_keys = list(after_cursor_by_asset_key.keys())
+        asset_key_by_string: Dict[str, AssetKey] = {}
+        asset_conditions = []
+        for asset_key, after_cursor in after_cursor_by_asset_key.items():
+            asset_key_strings = [asset_key.to_string(), asset_key.to_string(legacy=True)]
+            for asset_key_string in asset_key_strings:
+                asset_key_by_string[cast(str, asset_key_string)] = asset_key
+            asset_condition = SqlEventLogStorageTable.c.asset_key.in_(asset_key_strings)
+            if after_cursor is not None:
+                asset_condition = db.and_(
+                    asset_condition, SqlEventLogStorageTable.c.id > after_cursor
+                )
+            asset_conditions.append(asset_condition)
+
+        query = (
+            db.select(
+                [
+                    SqlEventLogStorageTable.c.id,
+                    SqlEventLogStorageTable.c.asset_key,
+                    SqlEventLogStorageTable.c.event,
+                ]
+            )
+            .where(
+                db.and_(
+                    SqlEventLogStorageTable.c.dagster_event_type == event_type.value,
+                    db.or_(*asset_conditions),
+                )
+            )
+            .order_by(SqlEventLogStorageTable.c.id.asc())
+        )
+        query = self._add_assets_wipe_filter_to_query(
+            query, self._get_assets_details(asset_keys), asset_keys
+        )
+
+        with self.index_connection() as conn:
+            results = conn.execute(query).fetchall()
+
+        records_by_asset_key: Dict[AssetKey, List[EventLogRecord]] = {
+            asset_key: [] for asset_key in asset_keys
+        }
+        for row_id, asset_key_string, json_str in results:
+            try:
+                event_record = deserialize_json_to_dagster_namedtuple(json_str)
+            except seven.JSONDecodeError:
+                logging.warning("Could not parse event record id `%s`.", row_id)
+                continue
+            if not isinstance(event_record, EventLogEntry):
+                logging.warning(
+                    "Could not resolve event record as EventLogEntry for id `%s`.", row_id
+                )
+                continue
+            records_by_asset_key[asset_key_by_string[asset_key_string]].append(
+                EventLogRecord(storage_id=row_id, event_log_entry=event_record)
+            )
+        return records_by_asset_key
+
 
 def _get_from_row(row, column):
     """utility function for extracting a column from a sqlalchemy row proxy, since '_asdict' is not
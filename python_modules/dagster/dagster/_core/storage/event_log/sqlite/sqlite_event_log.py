@@ -245,13 +245,12 @@ def store_event(self, event):
                 result = conn.execute(insert_event_statement)
                 event_id = result.inserted_primary_key[0]
 
-            self.store_asset_event(event)
-
             if event_id is None:
                 raise DagsterInvariantViolationError(
                     "Cannot store asset event tags for null event id."
                 )
 
+            self.store_asset_event(event, event_id)
             self.store_asset_event_tags(event, event_id)
 
     def get_event_records(
@@ -1,6 +1,7 @@
 import os
 import pickle
-from typing import Any
+import uuid
+from typing import Any, Mapping, Optional, Union
 
 from upath import UPath
 
@@ -13,17 +14,59 @@
 from dagster._core.execution.context.input import InputContext
 from dagster._core.execution.context.output import OutputContext
 from dagster._core.storage.io_manager import IOManager, io_manager
+from dagster._core.storage.serialization_formats import (
+    DEFAULT_SERIALIZATION_FORMATS,
+    PickleFormat,
+    SerializationFormat,
+    UnsupportedValueError,
+    is_local_path,
+    type_name,
+)
 from dagster._core.storage.upath_io_manager import UPathIOManager
 from dagster._utils import PICKLE_PROTOCOL, mkdir_p
+from dagster._utils.timing import time_execution_scope
 
 
 @io_manager(
-    config_schema={"base_dir": Field(StringSource, is_required=False)},  # type: ignore  # mypy bug
+    config_schema={
+        "base_dir": Field(StringSource, is_required=False),  # type: ignore  # mypy bug
+        "memory_map": Field(
+            bool,
+            is_required=False,
+            default_value=False,
+            description=(
+                "Store NumPy arrays in the .npy format, pandas DataFrames and Arrow tables in the "
+                "Arrow IPC format, and the buffers of other values out of band of their pickles, "
+                "so that values loaded from a local filesystem are memory-mapped rather than read "
+                "into memory. Loaded NumPy arrays are copy-on-write numpy.memmap arrays, and the "
+                "columns of loaded DataFrames may be read-only. Values stored by older versions "
+                "of Dagster or with this disabled can still be loaded."
+            ),
+        ),
+        "max_concurrent_loads": Field(
+            int,
+            is_required=False,
+            default_value=1,
+            description=(
+                "The number of inputs of a step, e.g. the inputs of an op that fans in many "
+                "upstream outputs, that are loaded at the same time on a pool of threads. "
+                "Defaults to 1, which loads them one after another."
+            ),
+        ),
+    },
     description="Built-in filesystem IO manager that stores and retrieves values using pickling.",
 )
 def fs_io_manager(init_context):
     """Built-in filesystem IO manager that stores and retrieves values using pickling.
 
+    With the "memory_map" configuration value set, NumPy arrays are stored in the ``.npy`` format,
+    and pandas DataFrames and Arrow tables in the Arrow IPC (Feather) format if pyarrow is
+    installed, so that they are memory-mapped rather than read into memory when they are loaded
+    from a local filesystem. Other values are pickled, with the buffers of values that support
+    pickle protocol 5 written out of band so that they can be memory-mapped too. Loaded arrays are
+    then copy-on-write memory maps, and the columns of loaded DataFrames may be read-only. The
+    format, size and serialization time of each value are recorded in the metadata of its output.
+
     The base directory that the pickle files live inside is determined by:
 
     * The IO manager's "base_dir" configuration value, if specified. Otherwise...
@@ -122,7 +165,11 @@ def job():
         "base_dir", init_context.instance.storage_directory()
     )
 
-    return PickledObjectFilesystemIOManager(base_dir=base_dir)
+    return PickledObjectFilesystemIOManager(
+        base_dir=base_dir,
+        memory_map=init_context.resource_config["memory_map"],
+        max_concurrent_loads=init_context.resource_config["max_concurrent_loads"],
+    )
 
 
 class PickledObjectFilesystemIOManager(UPathIOManager):
@@ -130,23 +177,108 @@ class PickledObjectFilesystemIOManager(UPathIOManager):
     Is compatible with local and remote filesystems via `universal-pathlib` and `fsspec`.
     Learn more about how to use remote filesystems here: https://github.com/fsspec/universal_pathlib
 
+    Values of the types that a serialization format is registered for are stored in that format,
+    and other values are pickled. The format of each file is identified by its first bytes when it
+    is loaded, so values stored in any format can be loaded regardless of the type annotation of
+    the input that they are loaded into, or of the formats and memory_map setting of the IO manager
+    that stored them.
+
     Args:
         base_dir (Optional[str]): base directory where all the step outputs which use this object
             manager will be stored in.
+        formats (Optional[Mapping[Union[type, str], SerializationFormat]]): the serialization
+            formats to store values of particular types in, keyed by the type or its fully
+            qualified name (e.g. ``"pandas.core.frame.DataFrame"``). Subclasses of the types are
+            pickled. Defaults to storing NumPy arrays in the ``.npy`` format, and pandas DataFrames
+            and Arrow tables in the Arrow IPC format if memory_map is set, and to pickling all
+            values otherwise.
+        memory_map (bool): whether to store values so that they are memory-mapped when they are
+            loaded from a local filesystem, with the buffers of pickled values written out of band.
+            Loaded NumPy arrays are then copy-on-write ``numpy.memmap`` arrays, and the columns of
+            loaded DataFrames may be read-only. Defaults to False, which stores values as plain
+            pickles.
+        max_concurrent_loads (Optional[int]): the number of inputs of a step that are loaded at the
+            same time on a pool of threads. Defaults to the ``max_concurrent_loads`` class
+            attribute, which is 1 unless a subclass overrides it.
         **kwargs: additional keyword arguments for `universal_pathlib.UPath`.
     """
 
     extension: str = ""  # TODO: maybe change this to .pickle? Leaving blank for compatibility.
 
-    def __init__(self, base_dir=None, **kwargs):
+    def __init__(
+        self,
+        base_dir=None,
+        formats: Optional[Mapping[Union[type, str], SerializationFormat]] = None,
+        memory_map: bool = False,
+        max_concurrent_loads: Optional[int] = None,
+        **kwargs,
+    ):
         self.base_dir = check.opt_str_param(base_dir, "base_dir")
+        check.bool_param(memory_map, "memory_map")
+        if max_concurrent_loads is not None:
+            self.max_concurrent_loads = check.int_param(
+                max_concurrent_loads, "max_concurrent_loads"
+            )
+        if formats is None:
+            formats = DEFAULT_SERIALIZATION_FORMATS if memory_map else {}
+        check.mapping_param(formats, "formats", value_type=SerializationFormat)
+        self._formats = {
+            type_name(python_type): serialization_format
+            for python_type, serialization_format in formats.items()
+        }
+        self._fallback_format = PickleFormat(out_of_band_buffers=memory_map)
+        # files are loaded in any of the formats that they can have been stored in, including by
+        # IO managers with other formats or memory_map settings
+        self._load_formats = list(
+            {
+                id(serialization_format): serialization_format
+                for serialization_format in [
+                    *self._formats.values(),
+                    *DEFAULT_SERIALIZATION_FORMATS.values(),
+                    self._fallback_format,
+                ]
+            }.values()
+        )
 
         super().__init__(base_path=UPath(base_dir, **kwargs))
 
-    def dump_to_path(self, context: OutputContext, obj: Any, path: UPath):
-        try:
+    def get_serialization_format(self, obj: Any) -> SerializationFormat:
+        return self._formats.get(type_name(type(obj)), self._fallback_format)
+
+    def _dump_with_format(
+        self, serialization_format: SerializationFormat, obj: Any, path: UPath
+    ) -> int:
+        if not is_local_path(path):
             with path.open("wb") as file:
-                pickle.dump(obj, file, PICKLE_PROTOCOL)
+                serialization_format.dump(obj, file)
+                return file.tell()
+
+        # write to a temporary file that replaces the file at the path, so that processes that have
+        # memory-mapped a previous value at the path keep reading the previous value
+        temp_path = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            with temp_path.open("wb") as file:
+                serialization_format.dump(obj, file)
+                size = file.tell()
+            os.replace(temp_path, path)
+        finally:
+            if temp_path.exists():
+                temp_path.unlink()
+        return size
+
+    def dump_to_path(self, context: OutputContext, obj: Any, path: UPath) -> Mapping[str, Any]:
+        serialization_format = self.get_serialization_format(obj)
+        try:
+            with time_execution_scope() as timer_result:
+                try:
+                    size = self._dump_with_format(serialization_format, obj, path)
+                except UnsupportedValueError as e:
+                    context.log.debug(
+                        f"Couldn't store value in the {serialization_format.name} format, "
+                        f"falling back to the {self._fallback_format.name} format: {e}"
+                    )
+                    serialization_format = self._fallback_format
+                    size = self._dump_with_format(serialization_format, obj, path)
         except (AttributeError, RecursionError, ImportError, pickle.PicklingError) as e:
             executor = context.step_context.pipeline_def.mode_definitions[0].executor_defs[0]
 
@@ -168,9 +300,28 @@ def dump_to_path(self, context: OutputContext, obj: Any, path: UPath):
                 "https://docs.dagster.io/deployment/executors#overview"
             ) from e
 
+        return {
+            "format": MetadataValue.text(serialization_format.name),
+            "size (bytes)": MetadataValue.int(size),
+            "serialization time (ms)": MetadataValue.float(timer_result.millis),
+        }
+
     def load_from_path(self, context: InputContext, path: UPath) -> Any:
+        formats = self._load_formats
         with path.open("rb") as file:
-            return pickle.load(file)
+            header = file.read(max(len(fmt.magic) for fmt in formats))
+
+        # files that don't start with the magic bytes of any format are pickles of protocols older
+        # than 2
+        serialization_format = next(
+            (
+                serialization_format
+                for serialization_format in formats
+                if header.startswith(serialization_format.magic)
+            ),
+            self._fallback_format,
+        )
+        return serialization_format.load(path)
 
 
 class CustomPathPickledObjectFilesystemIOManager(IOManager):
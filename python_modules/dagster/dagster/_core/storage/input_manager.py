@@ -28,6 +28,11 @@ class InputManager(ABC):
     Base interface for classes that are responsible for loading solid inputs.
     """
 
+    # The number of inputs that the manager may load at the same time. Managers that set this to
+    # more than 1 declare that load_input is safe to call from several threads at once, and the
+    # inputs that a step loads through them are loaded concurrently on a pool of that many threads.
+    max_concurrent_loads: int = 1
+
     @abstractmethod
     def load_input(self, context: "InputContext") -> object:
         """The user-defined read method that loads an input to a solid.
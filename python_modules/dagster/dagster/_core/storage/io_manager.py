@@ -121,6 +121,11 @@ class IOManager(InputManager, OutputManager):
 
     Extend this class to handle how objects are loaded and stored. Users should implement
     ``handle_output`` to store an object and ``load_input`` to retrieve an object.
+
+    IO managers whose ``load_input`` is safe to call from several threads at once can set the
+    ``max_concurrent_loads`` class attribute to more than 1, so that the inputs of a step that
+    they load, e.g. the inputs of an op that fans in many upstream outputs, are loaded concurrently
+    on a pool of that many threads.
     """
 
     @public  # type: ignore
@@ -23,6 +23,7 @@
     )
     from dagster._core.snap.execution_plan_snapshot import ExecutionPlanSnapshot
     from dagster._core.snap.pipeline_snapshot import PipelineSnapshot
+    from dagster._core.storage.partition_status_cache import AssetStatusCacheValue
     from dagster._core.storage.pipeline_run import (
         JobBucket,
         PipelineRun,
@@ -327,6 +328,21 @@ def get_step_stats_for_run(
     ) -> Sequence["RunStepKeyStatsSnapshot"]:
         return self._storage.event_storage.get_step_stats_for_run(run_id, step_keys)
 
+    def get_logs_for_runs(
+        self,
+        run_ids: Sequence[str],
+        of_type: Optional[Union["DagsterEventType", Set["DagsterEventType"]]] = None,
+    ) -> Mapping[str, Sequence["EventLogEntry"]]:
+        return self._storage.event_storage.get_logs_for_runs(run_ids, of_type)
+
+    def get_stats_for_runs(self, run_ids: Sequence[str]) -> Mapping[str, "PipelineRunStatsSnapshot"]:
+        return self._storage.event_storage.get_stats_for_runs(run_ids)
+
+    def get_step_stats_for_runs(
+        self, run_ids: Sequence[str]
+    ) -> Mapping[str, Sequence["RunStepKeyStatsSnapshot"]]:
+        return self._storage.event_storage.get_step_stats_for_runs(run_ids)
+
     def store_event(self, event: "EventLogEntry"):
         return self._storage.event_storage.store_event(event)
 
@@ -428,6 +444,36 @@ def get_materialization_count_by_partition(
     ) -> Mapping["AssetKey", Mapping[str, int]]:
         return self._storage.event_storage.get_materialization_count_by_partition(asset_keys)
 
+    def get_maximum_record_id(self) -> Optional[int]:
+        return self._storage.event_storage.get_maximum_record_id()
+
+    def get_latest_storage_id_by_partition(
+        self,
+        asset_key: "AssetKey",
+        event_type: "DagsterEventType",
+        after_cursor: Optional[int] = None,
+    ) -> Mapping[str, int]:
+        return self._storage.event_storage.get_latest_storage_id_by_partition(
+            asset_key, event_type, after_cursor
+        )
+
+    def get_event_records_for_asset_keys(
+        self,
+        event_type: "DagsterEventType",
+        after_cursor_by_asset_key: Mapping["AssetKey", Optional[int]],
+    ) -> Mapping["AssetKey", Sequence[EventLogRecord]]:
+        return self._storage.event_storage.get_event_records_for_asset_keys(
+            event_type, after_cursor_by_asset_key
+        )
+
+    def can_cache_asset_status_data(self) -> bool:
+        return self._storage.event_storage.can_cache_asset_status_data()
+
+    def update_asset_cached_status_data(
+        self, asset_key: "AssetKey", cache_values: "AssetStatusCacheValue"
+    ) -> None:
+        return self._storage.event_storage.update_asset_cached_status_data(asset_key, cache_values)
+
 
 class LegacyScheduleStorage(ScheduleStorage, ConfigurableClass):
     def __init__(self, storage, inst_data=None):
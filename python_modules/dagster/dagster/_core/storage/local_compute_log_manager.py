@@ -1,12 +1,14 @@
 import hashlib
 import os
 import shutil
+import stat
 import sys
-from collections import defaultdict
+import threading
+from collections import OrderedDict, defaultdict
 from contextlib import contextmanager
 from typing import IO, Generator, Optional, Sequence, Tuple, Union
 
-from watchdog.events import PatternMatchingEventHandler
+from watchdog.events import FileSystemEventHandler
 from watchdog.observers.polling import PollingObserver
 
 from dagster import Field, Float, StringSource
@@ -38,6 +40,12 @@
 
 MAX_FILENAME_LENGTH = 255
 
+# maximum number of log files kept open for reading by a single compute log manager
+MAX_OPEN_LOG_FILES = 128
+
+# interval (in seconds) over which filesystem events are coalesced before notifying subscribers
+NOTIFICATION_BATCH_INTERVAL = 0.1
+
 
 class LocalComputeLogManager(CapturedLogManager, ComputeLogManager, ConfigurableClass):
     """Stores copies of stdout & stderr for each compute step locally on disk."""
@@ -47,6 +55,7 @@ def __init__(self, base_dir, polling_timeout=None, inst_data=None):
         self._polling_timeout = check.opt_float_param(
             polling_timeout, "polling_timeout", DEFAULT_WATCHDOG_POLLING_TIMEOUT
         )
+        self._file_tailer = LocalLogFileTailer()
         self._subscription_manager = LocalComputeLogSubscriptionManager(self)
         self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
 
@@ -136,10 +145,12 @@ def delete_logs(
                 self.get_captured_local_path(log_key, "complete"),
             ]
             for path in paths:
+                self._file_tailer.close(path)
                 if os.path.exists(path) and os.path.isfile(path):
                     os.remove(path)
         elif prefix:
             dir_to_delete = os.path.join(self._base_dir, *prefix)
+            self._file_tailer.close_directory(dir_to_delete)
             if os.path.exists(dir_to_delete) and os.path.isdir(dir_to_delete):
                 # recursively delete all files in dir
                 shutil.rmtree(dir_to_delete)
@@ -180,18 +191,20 @@ def read_path(
         offset: int = 0,
         max_bytes: Optional[int] = None,
     ):
-        if not os.path.exists(path) or not os.path.isfile(path):
-            return None, offset
-
-        with open(path, "rb") as f:
-            f.seek(offset, os.SEEK_SET)
-            if max_bytes is None:
-                data = f.read()
-            else:
-                data = f.read(max_bytes)
-            new_offset = f.tell()
+        data, new_offset, _ = self._file_tailer.read(path, offset, max_bytes)
         return data, new_offset
 
+    @contextmanager
+    def batched_reads(self):
+        """Shares identical log reads made within this context, e.g. when notifying several
+        subscribers that follow the same log key from the same cursor."""
+        with self._file_tailer.batched_reads():
+            yield
+
+    def close_log_file(self, path: str):
+        """Releases any read handle held open for the log file at the given path."""
+        self._file_tailer.close(path)
+
     def get_captured_log_download_url(self, log_key, io_type):
         check.inst_param(io_type, "io_type", ComputeIOType)
         url = "/logs"
@@ -244,23 +257,17 @@ def get_local_path(self, run_id, key, io_type):
     def read_logs_file(self, run_id, key, io_type, cursor=0, max_bytes=MAX_BYTES_FILE_READ):
         path = self.get_local_path(run_id, key, io_type)
 
-        if not os.path.exists(path) or not os.path.isfile(path):
+        data, cursor, size = self._file_tailer.read(path, cursor, max_bytes)
+        if data is None:
             return ComputeLogFileData(path=path, data=None, cursor=0, size=0, download_url=None)
 
-        # See: https://docs.python.org/2/library/stdtypes.html#file.tell for Windows behavior
-        with open(path, "rb") as f:
-            f.seek(cursor, os.SEEK_SET)
-            data = f.read(max_bytes)
-            cursor = f.tell()
-            stats = os.fstat(f.fileno())
-
         # local download path
         download_url = self.download_url(run_id, key, io_type)
         return ComputeLogFileData(
             path=path,
             data=data.decode("utf-8"),
             cursor=cursor,
-            size=stats.st_size,
+            size=size,
             download_url=download_url,
         )
 
@@ -297,14 +304,136 @@ def on_unsubscribe(self, subscription):
 
     def dispose(self):
         self._subscription_manager.dispose()
+        self._file_tailer.close_all()
+
+
+class LocalLogFileTailer:
+    """Reads byte ranges from log files that are still being written to, keeping a bounded number
+    of read handles open so that following a growing file only seeks to the requested offset and
+    reads the appended bytes instead of re-opening the file for every update.
+
+    Handles are keyed by path and invalidated whenever the file at that path is removed or replaced.
+    """
+
+    def __init__(self, max_open_files: int = MAX_OPEN_LOG_FILES):
+        self._max_open_files = check.int_param(max_open_files, "max_open_files")
+        self._lock = threading.RLock()
+        self._open_files: "OrderedDict[str, Tuple[IO[bytes], Tuple[int, int]]]" = OrderedDict()
+        self._batch = threading.local()
+
+    @contextmanager
+    def batched_reads(self):
+        """Within this context, identical reads from the current thread are only served once, so
+        that subscribers following the same log from the same cursor share a single read."""
+        if getattr(self._batch, "reads", None) is not None:
+            yield
+            return
+
+        self._batch.reads = {}
+        try:
+            yield
+        finally:
+            self._batch.reads = None
+
+    def read(
+        self, path: str, offset: int = 0, max_bytes: Optional[int] = None
+    ) -> Tuple[Optional[bytes], int, int]:
+        """Returns the bytes read from the given offset, the offset after the read, and the current
+        size of the file.  Returns `None` for the data if the file does not exist."""
+        batch_reads = getattr(self._batch, "reads", None)
+        read_key = (path, offset, max_bytes)
+        if batch_reads is not None and read_key in batch_reads:
+            return batch_reads[read_key]
+
+        result = self._read(path, offset, max_bytes)
+        if batch_reads is not None:
+            batch_reads[read_key] = result
+        return result
+
+    def _read(
+        self, path: str, offset: int, max_bytes: Optional[int]
+    ) -> Tuple[Optional[bytes], int, int]:
+        with self._lock:
+            try:
+                file_stat = os.stat(path)
+            except OSError:
+                self.close(path)
+                return None, offset, 0
+
+            if not stat.S_ISREG(file_stat.st_mode):
+                self.close(path)
+                return None, offset, 0
+
+            f = self._get_open_file(path, (file_stat.st_dev, file_stat.st_ino))
+            if f is None:
+                return None, offset, 0
+
+            # See: https://docs.python.org/2/library/stdtypes.html#file.tell for Windows behavior
+            f.seek(offset, os.SEEK_SET)
+            data = f.read() if max_bytes is None else f.read(max_bytes)
+            return data, f.tell(), max(file_stat.st_size, f.tell())
+
+    def _get_open_file(self, path: str, file_id: Tuple[int, int]) -> Optional[IO[bytes]]:
+        if path in self._open_files:
+            f, open_file_id = self._open_files[path]
+            if open_file_id == file_id:
+                self._open_files.move_to_end(path)
+                return f
+            # the file was replaced since we opened it
+            self.close(path)
+
+        try:
+            f = open(path, "rb")  # pylint: disable=consider-using-with
+        except OSError:
+            return None
+
+        self._open_files[path] = (f, file_id)
+        while len(self._open_files) > self._max_open_files:
+            _, (evicted, _) = self._open_files.popitem(last=False)
+            evicted.close()
+        return f
+
+    def close(self, path: str):
+        with self._lock:
+            open_file = self._open_files.pop(path, None)
+            if open_file:
+                open_file[0].close()
+
+    def close_directory(self, directory: str):
+        directory = os.path.join(os.path.abspath(directory), "")
+        with self._lock:
+            for path in [
+                path for path in self._open_files if os.path.abspath(path).startswith(directory)
+            ]:
+                self.close(path)
+
+    def close_all(self):
+        with self._lock:
+            for path in list(self._open_files):
+                self.close(path)
 
 
 class LocalComputeLogSubscriptionManager:
+    """Pushes log updates to subscribers of in-progress captures.
+
+    A single filesystem observer watches each log directory with one event handler, regardless of
+    the number of log keys being followed in that directory.  Filesystem events are coalesced per
+    log key on a dispatch thread, and each batch of updates is read through the manager's shared
+    file tailer so that subscribers only read the byte ranges appended since their cursor.
+    """
+
     def __init__(self, manager):
         self._manager = manager
+        self._lock = threading.RLock()
         self._subscriptions = defaultdict(list)
-        self._watchers = {}
+        self._watched_log_keys = {}
+        self._handlers = {}
         self._observer = None
+        self._updated_watch_keys = set()
+        self._completed_watch_keys = set()
+        self._dispatch_condition = threading.Condition(self._lock)
+        self._dispatch_thread = None
+        self._shutdown = False
 
     def add_subscription(
         self, subscription: Union[ComputeLogSubscription, CapturedLogSubscription]
@@ -319,7 +448,8 @@ def add_subscription(
         else:
             log_key = self._log_key(subscription)
             watch_key = self._watch_key(log_key)
-            self._subscriptions[watch_key].append(subscription)
+            with self._lock:
+                self._subscriptions[watch_key].append(subscription)
             self.watch(subscription)
 
     def is_complete(self, subscription: Union[ComputeLogSubscription, CapturedLogSubscription]):
@@ -337,9 +467,14 @@ def remove_subscription(self, subscription):
         )
         log_key = self._log_key(subscription)
         watch_key = self._watch_key(log_key)
-        if subscription in self._subscriptions[watch_key]:
+        with self._lock:
+            if subscription not in self._subscriptions[watch_key]:
+                return
             self._subscriptions[watch_key].remove(subscription)
-            subscription.complete()
+            if not self._subscriptions[watch_key]:
+                del self._subscriptions[watch_key]
+                self.unwatch(log_key)
+        subscription.complete()
 
     def _log_key(self, subscription):
         check.inst_param(
@@ -355,16 +490,13 @@ def _watch_key(self, log_key: Sequence[str]) -> str:
 
     def remove_all_subscriptions(self, log_key):
         watch_key = self._watch_key(log_key)
-        for subscription in self._subscriptions.pop(watch_key, []):
+        with self._lock:
+            subscriptions = self._subscriptions.pop(watch_key, [])
+        for subscription in subscriptions:
             subscription.complete()
 
-    def watch(self, subscription):
-        log_key = self._log_key(subscription)
-        watch_key = self._watch_key(log_key)
-        if watch_key in self._watchers:
-            return
-
-        update_paths = [
+    def _update_paths(self, log_key):
+        return [
             self._manager.get_captured_local_path(log_key, IO_TYPE_EXTENSION[ComputeIOType.STDOUT]),
             self._manager.get_captured_local_path(log_key, IO_TYPE_EXTENSION[ComputeIOType.STDERR]),
             self._manager.get_captured_local_path(
@@ -374,53 +506,174 @@ def watch(self, subscription):
                 log_key, IO_TYPE_EXTENSION[ComputeIOType.STDERR], partial=True
             ),
         ]
-        complete_paths = [self._manager.complete_artifact_path(log_key)]
-        directory = os.path.dirname(
+
+    def _directory(self, log_key):
+        return os.path.dirname(
             self._manager.get_captured_local_path(log_key, ComputeIOType.STDERR),
         )
 
-        if not self._observer:
-            self._observer = PollingObserver(self._manager.polling_timeout)
-            self._observer.start()
+    def watch(self, subscription):
+        log_key = self._log_key(subscription)
+        watch_key = self._watch_key(log_key)
+        directory = self._directory(log_key)
 
-        ensure_dir(directory)
+        with self._lock:
+            if watch_key in self._watched_log_keys or self._shutdown:
+                return
 
-        self._watchers[watch_key] = self._observer.schedule(
-            LocalComputeLogFilesystemEventHandler(self, log_key, update_paths, complete_paths),
-            str(directory),
-        )
+            if not self._observer:
+                self._observer = PollingObserver(timeout=self._manager.polling_timeout)
+                self._observer.start()
+            self._start_dispatch_thread()
 
-    def notify_subscriptions(self, log_key):
+            ensure_dir(directory)
+
+            if directory not in self._handlers:
+                handler = LocalComputeLogFilesystemEventHandler(self)
+                watch = self._observer.schedule(handler, str(directory))
+                self._handlers[directory] = (handler, watch)
+
+            handler, _ = self._handlers[directory]
+            handler.add_log_key(
+                watch_key,
+                self._update_paths(log_key),
+                [self._manager.complete_artifact_path(log_key)],
+            )
+            self._watched_log_keys[watch_key] = log_key
+
+    def unwatch(self, log_key):
         watch_key = self._watch_key(log_key)
-        for subscription in self._subscriptions[watch_key]:
-            subscription.fetch()
+        directory = self._directory(log_key)
+        with self._lock:
+            if self._watched_log_keys.pop(watch_key, None) is None:
+                return
 
-    def unwatch(self, log_key, handler):
+            for path in self._update_paths(log_key):
+                self._manager.close_log_file(path)
+
+            if directory not in self._handlers:
+                return
+
+            handler, watch = self._handlers[directory]
+            handler.remove_log_key(watch_key)
+            if handler.is_empty():
+                del self._handlers[directory]
+                self._observer.unschedule(watch)
+
+    def on_log_updated(self, watch_key: str):
+        with self._dispatch_condition:
+            self._updated_watch_keys.add(watch_key)
+            self._dispatch_condition.notify()
+
+    def on_log_completed(self, watch_key: str):
+        with self._dispatch_condition:
+            self._completed_watch_keys.add(watch_key)
+            self._dispatch_condition.notify()
+
+    def notify_subscriptions(self, log_key):
         watch_key = self._watch_key(log_key)
-        if watch_key in self._watchers:
-            self._observer.remove_handler_for_watch(handler, self._watchers[watch_key])
-        del self._watchers[watch_key]
+        with self._lock:
+            subscriptions = list(self._subscriptions.get(watch_key, []))
+        with self._manager.batched_reads():
+            for subscription in subscriptions:
+                subscription.fetch()
+
+    def _start_dispatch_thread(self):
+        if self._dispatch_thread:
+            return
+
+        self._dispatch_thread = threading.Thread(
+            target=self._dispatch,
+            name="local-compute-log-subscription-dispatch",
+            daemon=True,
+        )
+        self._dispatch_thread.start()
+
+    def _dispatch(self):
+        while True:
+            with self._dispatch_condition:
+                while (
+                    not self._shutdown
+                    and not self._updated_watch_keys
+                    and not self._completed_watch_keys
+                ):
+                    self._dispatch_condition.wait()
+
+                if self._shutdown:
+                    return
+
+                # wait briefly so that events for the stdout / stderr files of the same log key,
+                # and for log keys written around the same time, are handled in a single pass
+                self._dispatch_condition.wait(NOTIFICATION_BATCH_INTERVAL)
+
+                updated = [
+                    self._watched_log_keys[watch_key]
+                    for watch_key in self._updated_watch_keys | self._completed_watch_keys
+                    if watch_key in self._watched_log_keys
+                ]
+                completed = [
+                    self._watched_log_keys[watch_key]
+                    for watch_key in self._completed_watch_keys
+                    if watch_key in self._watched_log_keys
+                ]
+                self._updated_watch_keys = set()
+                self._completed_watch_keys = set()
+
+            for log_key in updated:
+                self.notify_subscriptions(log_key)
+
+            for log_key in completed:
+                self.remove_all_subscriptions(log_key)
+                self.unwatch(log_key)
 
     def dispose(self):
+        with self._dispatch_condition:
+            self._shutdown = True
+            self._dispatch_condition.notify()
+
         if self._observer:
             self._observer.stop()
             self._observer.join(15)
 
 
-class LocalComputeLogFilesystemEventHandler(PatternMatchingEventHandler):
-    def __init__(self, manager, log_key, update_paths, complete_paths):
+class LocalComputeLogFilesystemEventHandler(FileSystemEventHandler):
+    """Handles filesystem events for every followed log key within a single directory."""
+
+    def __init__(self, manager):
         self.manager = manager
-        self.log_key = log_key
-        self.update_paths = update_paths
-        self.complete_paths = complete_paths
-        patterns = update_paths + complete_paths
-        super(LocalComputeLogFilesystemEventHandler, self).__init__(patterns=patterns)
+        self._lock = threading.Lock()
+        self._update_paths = {}
+        self._complete_paths = {}
+        super(LocalComputeLogFilesystemEventHandler, self).__init__()
+
+    def add_log_key(self, watch_key, update_paths, complete_paths):
+        with self._lock:
+            for path in update_paths:
+                self._update_paths[path] = watch_key
+            for path in complete_paths:
+                self._complete_paths[path] = watch_key
+
+    def remove_log_key(self, watch_key):
+        with self._lock:
+            self._update_paths = {
+                path: key for path, key in self._update_paths.items() if key != watch_key
+            }
+            self._complete_paths = {
+                path: key for path, key in self._complete_paths.items() if key != watch_key
+            }
+
+    def is_empty(self):
+        with self._lock:
+            return not self._update_paths and not self._complete_paths
 
     def on_created(self, event):
-        if event.src_path in self.complete_paths:
-            self.manager.remove_all_subscriptions(self.log_key)
-            self.manager.unwatch(self.log_key, self)
+        with self._lock:
+            watch_key = self._complete_paths.get(event.src_path)
+        if watch_key:
+            self.manager.on_log_completed(watch_key)
 
     def on_modified(self, event):
-        if event.src_path in self.update_paths:
-            self.manager.notify_subscriptions(self.log_key)
+        with self._lock:
+            watch_key = self._update_paths.get(event.src_path)
+        if watch_key:
+            self.manager.on_log_updated(watch_key)
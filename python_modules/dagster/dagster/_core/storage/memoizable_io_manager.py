@@ -1,7 +1,7 @@
 import os
 import pickle
 from abc import abstractmethod
-from typing import Union
+from typing import Sequence, Union
 
 import dagster._check as check
 from dagster._annotations import experimental, public
@@ -32,6 +32,23 @@ def has_output(self, context: OutputContext) -> bool:
             bool: True if there is data present that matches the provided context. False otherwise.
         """
 
+    @public
+    def has_outputs(self, contexts: Sequence[OutputContext]) -> Sequence[bool]:
+        """Returns whether data exists for each of the given outputs.
+
+        Memoized execution checks all of the outputs that use an IO manager in a single call to
+        this method. By default, it calls ``has_output`` for each output. Override it to check the
+        outputs in fewer requests, e.g. by listing a directory once.
+
+        Args:
+            contexts (Sequence[OutputContext]): The contexts of the outputs to check.
+
+        Returns:
+            Sequence[bool]: Whether there is data present for each of the provided contexts, in
+            the same order.
+        """
+        return [self.has_output(context) for context in contexts]
+
 
 class VersionedPickledObjectFilesystemIOManager(MemoizableIOManager):
     def __init__(self, base_dir=None):
@@ -417,3 +417,13 @@ def add_cached_status_data_column():
         return
 
     op.add_column("asset_keys", db.Column("cached_status_data", db.Text))
+
+
+def add_asset_status_columns():
+    if not has_table("asset_keys"):
+        return
+
+    if not has_column("asset_keys", "last_materialization_storage_id"):
+        op.add_column("asset_keys", db.Column("last_materialization_storage_id", db.Integer))
+    if not has_column("asset_keys", "last_observation"):
+        op.add_column("asset_keys", db.Column("last_observation", db.Text))
@@ -0,0 +1,279 @@
+import os
+from typing import Any, List, Mapping, Optional, Sequence, Tuple, Union
+
+from upath import UPath
+
+import dagster._check as check
+from dagster._annotations import experimental
+from dagster._config import Field, IntSource, StringSource
+from dagster._core.definitions.metadata import MetadataValue
+from dagster._core.errors import DagsterInvariantViolationError
+from dagster._core.execution.context.input import InputContext
+from dagster._core.execution.context.output import OutputContext
+from dagster._core.storage.fs_io_manager import PickledObjectFilesystemIOManager
+from dagster._core.storage.io_manager import io_manager
+from dagster._core.storage.serialization_formats import is_local_path
+
+# the fraction of max_size_bytes that eviction brings the size of the cache down to, so that it
+# doesn't run again for each output stored while the cache is full
+EVICTION_TARGET_FRACTION = 0.9
+
+
+@io_manager(
+    config_schema={
+        "base_dir": Field(StringSource, is_required=False),
+        "max_size_bytes": Field(
+            IntSource,
+            is_required=False,
+            description=(
+                "The maximum total size of the cached outputs. When storing an output takes the "
+                "cache over this size, the least recently used outputs are evicted."
+            ),
+        ),
+    },
+    description="IO manager that caches outputs by their version, for memoized execution.",
+)
+@experimental
+def output_cache_io_manager(init_context):
+    """IO manager that stores outputs in a cache directory addressed by their versions, for use
+    with memoized execution.
+
+    The version of an output combines the code version of its op, the versions of the op's inputs,
+    and the versions of its config and resources, so steps whose outputs are already in the cache
+    are skipped, whichever run or job stored them. The outputs that a memoized run needs are
+    checked with a single listing of the cache directory of each op.
+
+    The cache directory is determined by the IO manager's "base_dir" configuration value if
+    specified, otherwise an "output_cache/" directory underneath the storage directory of the
+    instance. It can be a local path or a path on a remote filesystem supported by
+    `universal-pathlib`, e.g. "s3://my-bucket/output_cache". Outputs are stored in the formats of
+    the :py:func:`fs_io_manager`.
+
+    If "max_size_bytes" is configured, the least recently used outputs are evicted from the cache
+    when storing an output takes its total size over that limit, until it is down to 90% of it.
+    The size of the cache is measured when the IO manager first stores an output, and then kept up
+    to date with the sizes of the outputs that it stores, so outputs stored concurrently by other
+    processes are only accounted for by the next IO manager to measure it. Outputs are marked as
+    used when they are stored, and when they are loaded from a local cache directory. On remote
+    filesystems, loading an output doesn't mark it as used, so outputs are evicted in the order in
+    which they were stored. Outputs that a run loads instead of executing their steps are marked as
+    used when the run checks the cache, and a run doesn't evict the outputs that its steps may still
+    load.
+
+    Whether each output was computed ("miss") or loaded from the cache without executing its step
+    ("hit") is recorded in the metadata of the output and input events.
+
+    Example usage:
+
+    .. code-block:: python
+
+        from dagster import SourceHashVersionStrategy, job, op, output_cache_io_manager
+
+        @op
+        def expensive_computation():
+            ...
+
+        @job(
+            resource_defs={
+                "io_manager": output_cache_io_manager.configured(
+                    {"base_dir": "/my/cache", "max_size_bytes": 10 * 1024**3}
+                )
+            },
+            version_strategy=SourceHashVersionStrategy(),
+        )
+        def my_job():
+            expensive_computation()
+    """
+    base_dir = init_context.resource_config.get(
+        "base_dir", os.path.join(init_context.instance.storage_directory(), "output_cache")
+    )
+    return OutputCacheIOManager(
+        base_dir=base_dir, max_size_bytes=init_context.resource_config.get("max_size_bytes")
+    )
+
+
+class OutputCacheIOManager(PickledObjectFilesystemIOManager):
+    """IO manager that stores each output at "<base_dir>/<op name>/<version>".
+
+    Args:
+        base_dir (str): The cache directory.
+        max_size_bytes (Optional[int]): The maximum total size of the cached outputs, beyond which
+            the least recently used outputs are evicted.
+        **kwargs: additional keyword arguments for `universal_pathlib.UPath`.
+    """
+
+    def __init__(self, base_dir: str, max_size_bytes: Optional[int] = None, **kwargs):
+        self.max_size_bytes = check.opt_int_param(max_size_bytes, "max_size_bytes")
+        # measured when the first output is stored, and then tracked as outputs are stored
+        self._cache_size_bytes: Optional[int] = None
+        super().__init__(base_dir=check.str_param(base_dir, "base_dir"), **kwargs)
+
+    def _get_path_without_extension(self, context: Union[InputContext, OutputContext]) -> UPath:
+        output_context = context.upstream_output if isinstance(context, InputContext) else context
+        if output_context is None or output_context.version is None:
+            raise DagsterInvariantViolationError(
+                "The output cache IO manager can only store and load the outputs of memoized "
+                "runs, which have versions. To enable memoization, provide a version strategy for "
+                "the job or a version for each op, or run the job with the MEMOIZED_RUN_TAG tag."
+            )
+
+        return self._base_path.joinpath(output_context.op_def.name, output_context.version)
+
+    def has_outputs(self, contexts: Sequence[OutputContext]) -> Sequence[bool]:
+        # each op directory is listed once, rather than checking each output
+        paths = [self._get_path(context) for context in contexts]
+        names_by_dir = {}
+        for path in paths:
+            if str(path.parent) not in names_by_dir:
+                names_by_dir[str(path.parent)] = (
+                    {child.name for child in path.parent.iterdir()}
+                    if path.parent.exists()
+                    else set()
+                )
+        has_outputs = [path.name in names_by_dir[str(path.parent)] for path in paths]
+
+        # the outputs found are loaded by the run instead of being computed, so they are marked as
+        # used, for eviction
+        for path, has_output in zip(paths, has_outputs):
+            if has_output and is_local_path(path):
+                try:
+                    os.utime(path)
+                except FileNotFoundError:
+                    pass
+        return has_outputs
+
+    def dump_to_path(self, context: OutputContext, obj: Any, path: UPath) -> Mapping[str, Any]:
+        metadata = dict(super().dump_to_path(context, obj, path))
+        metadata["output cache"] = MetadataValue.text("miss")
+        metadata["version"] = MetadataValue.text(check.not_none(context.version))
+
+        if self.max_size_bytes is not None:
+            metadata["evicted outputs"] = MetadataValue.int(
+                self._evict_if_full(context, self.max_size_bytes, path)
+            )
+        return metadata
+
+    def _evict_if_full(
+        self, context: OutputContext, max_size_bytes: int, stored_path: UPath
+    ) -> int:
+        if self._cache_size_bytes is None:
+            self._cache_size_bytes = sum(size for _, size, _ in self._list_outputs())
+        else:
+            self._cache_size_bytes += stored_path.stat().st_size
+
+        if self._cache_size_bytes <= max_size_bytes:
+            return 0
+
+        num_evicted, self._cache_size_bytes = self._evict(
+            int(max_size_bytes * EVICTION_TARGET_FRACTION),
+            keep_paths=[stored_path, *self._get_run_input_paths(context)],
+        )
+        return num_evicted
+
+    def _get_run_input_paths(self, context: OutputContext) -> List[UPath]:
+        """The paths of the outputs that the steps of the run may still load, including the outputs
+        of the steps that were skipped because they were in the cache. The steps that the step
+        storing the output depends on have already loaded their inputs.
+        """
+        try:
+            step_context = context.step_context
+        except DagsterInvariantViolationError:
+            # the context was built outside of a run, e.g. with build_output_context
+            return []
+
+        execution_plan = step_context.execution_plan
+        step_deps = execution_plan.get_all_step_deps()
+        done_step_keys = set()
+        step_keys_to_visit = [step_context.step.key]
+        while step_keys_to_visit:
+            step_key = step_keys_to_visit.pop()
+            if step_key not in done_step_keys:
+                done_step_keys.add(step_key)
+                step_keys_to_visit.extend(step_deps.get(step_key, []))
+
+        step_output_versions = execution_plan.step_output_versions
+        paths = []
+        for step in execution_plan.get_steps_to_execute_in_topo_order():
+            if step.key in done_step_keys:
+                continue
+            for step_input in step.step_inputs:
+                for step_output_handle in step_input.get_step_output_handle_dependencies():
+                    version = step_output_versions.get(step_output_handle)
+                    if version is None:
+                        continue
+                    solid_handle = execution_plan.get_step_by_key(
+                        step_output_handle.step_key
+                    ).solid_handle
+                    op_name = step_context.pipeline_def.get_solid(solid_handle).definition.name
+                    paths.append(
+                        self._base_path.joinpath(op_name, version).with_suffix(self.extension)
+                    )
+        return paths
+
+    def load_input(self, context: InputContext) -> Any:
+        obj = super().load_input(context)
+
+        try:
+            step_keys_to_execute = context.step_context.execution_plan.step_keys_to_execute
+        except DagsterInvariantViolationError:
+            # the context was built outside of a run, e.g. with build_input_context
+            return obj
+
+        # outputs of steps that were skipped because they were in the cache are hits
+        upstream_step_key = check.not_none(context.upstream_output).step_key
+        cache_status = "miss" if upstream_step_key in step_keys_to_execute else "hit"
+        context.add_input_metadata({"output cache": MetadataValue.text(cache_status)})
+        return obj
+
+    def load_from_path(self, context: InputContext, path: UPath) -> Any:
+        if is_local_path(path) and path.is_file():
+            # loading an output marks it as used, for eviction
+            os.utime(path)
+        return super().load_from_path(context, path)
+
+    def evict(self, max_size_bytes: int, keep_paths: Optional[Sequence[UPath]] = None) -> int:
+        """Removes the least recently used outputs until the total size of the cache is at most
+        max_size_bytes. Returns the number of outputs that were removed.
+        """
+        check.int_param(max_size_bytes, "max_size_bytes")
+        num_evicted, self._cache_size_bytes = self._evict(max_size_bytes, keep_paths=keep_paths)
+        return num_evicted
+
+    def _list_outputs(self) -> List[Tuple[float, int, UPath]]:
+        """The modification time, size and path of each output in the cache."""
+        if not self._base_path.exists():
+            return []
+
+        outputs = []
+        for path in self._base_path.glob("**/*"):
+            # skip files that are being written
+            if path.name.endswith(".tmp") or not path.is_file():
+                continue
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            outputs.append((stat.st_mtime, stat.st_size, path))
+        return outputs
+
+    def _evict(
+        self, max_size_bytes: int, keep_paths: Optional[Sequence[UPath]] = None
+    ) -> Tuple[int, int]:
+        """Returns the number of outputs that were removed, and the size of the cache after."""
+        keep = {str(path) for path in keep_paths or []}
+        outputs = self._list_outputs()
+
+        total_size = sum(size for _, size, _ in outputs)
+        num_evicted = 0
+        for _, size, path in sorted(outputs, key=lambda output: output[0]):
+            if total_size <= max_size_bytes:
+                break
+            if str(path) in keep:
+                continue
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            total_size -= size
+            num_evicted += 1
+        return num_evicted, total_size
@@ -0,0 +1,333 @@
+from typing import TYPE_CHECKING, Dict, List, Mapping, NamedTuple, Optional, Sequence, Set, Tuple
+
+import dagster._check as check
+from dagster._core.definitions.events import AssetKey
+from dagster._core.event_api import EventLogRecord
+from dagster._core.events import DagsterEventType
+from dagster._core.storage.pipeline_run import (
+    FINISHED_STATUSES,
+    DagsterRun,
+    DagsterRunStatus,
+    RunsFilter,
+)
+from dagster._core.storage.tags import PARTITION_NAME_TAG
+from dagster._serdes import whitelist_for_serdes
+from dagster._serdes.utils import hash_str
+
+if TYPE_CHECKING:
+    from dagster._core.definitions.partition import PartitionsDefinition, PartitionsSubset
+    from dagster._core.instance import DagsterInstance
+    from dagster._core.storage.event_log.base import AssetRecord
+
+
+@whitelist_for_serdes
+class AssetStatusCacheValue(
+    NamedTuple(
+        "_AssetStatusCacheValue",
+        [
+            ("latest_storage_id", int),
+            ("partitions_def_id", Optional[str]),
+            ("serialized_materialized_partition_subset", Optional[str]),
+            ("serialized_failed_partition_subset", Optional[str]),
+            ("serialized_in_progress_partition_subset", Optional[str]),
+            ("earliest_in_progress_materialization_event_id", Optional[int]),
+        ],
+    )
+):
+    """Summary of the status of the partitions of an asset, cached in the event log storage and
+    updated incrementally from the asset events stored after latest_storage_id.
+
+    Args:
+        latest_storage_id (int): The storage id watermark up to which asset events have been
+            accounted for.
+        partitions_def_id (Optional[str]): Identifies the partitions definition the subsets were
+            serialized with. The cached value is rebuilt when the partitions definition changes.
+        serialized_materialized_partition_subset (Optional[str]): The partitions that have been
+            materialized.
+        serialized_failed_partition_subset (Optional[str]): The partitions whose latest run
+            failed before materializing them.
+        serialized_in_progress_partition_subset (Optional[str]): The partitions targeted by runs
+            that have not yet finished.
+        earliest_in_progress_materialization_event_id (Optional[int]): The storage id of the
+            earliest planned materialization whose run has not yet finished. Planned
+            materializations from this storage id onwards are reconsidered on the next update.
+    """
+
+    def __new__(
+        cls,
+        latest_storage_id: int,
+        partitions_def_id: Optional[str] = None,
+        serialized_materialized_partition_subset: Optional[str] = None,
+        serialized_failed_partition_subset: Optional[str] = None,
+        serialized_in_progress_partition_subset: Optional[str] = None,
+        earliest_in_progress_materialization_event_id: Optional[int] = None,
+    ):
+        return super(AssetStatusCacheValue, cls).__new__(
+            cls,
+            latest_storage_id=check.int_param(latest_storage_id, "latest_storage_id"),
+            partitions_def_id=check.opt_str_param(partitions_def_id, "partitions_def_id"),
+            serialized_materialized_partition_subset=check.opt_str_param(
+                serialized_materialized_partition_subset, "serialized_materialized_partition_subset"
+            ),
+            serialized_failed_partition_subset=check.opt_str_param(
+                serialized_failed_partition_subset, "serialized_failed_partition_subset"
+            ),
+            serialized_in_progress_partition_subset=check.opt_str_param(
+                serialized_in_progress_partition_subset, "serialized_in_progress_partition_subset"
+            ),
+            earliest_in_progress_materialization_event_id=check.opt_int_param(
+                earliest_in_progress_materialization_event_id,
+                "earliest_in_progress_materialization_event_id",
+            ),
+        )
+
+    def deserialize_materialized_partition_subsets(
+        self, partitions_def: "PartitionsDefinition"
+    ) -> "PartitionsSubset":
+        return _deserialize_subset(partitions_def, self.serialized_materialized_partition_subset)
+
+    def deserialize_failed_partition_subsets(
+        self, partitions_def: "PartitionsDefinition"
+    ) -> "PartitionsSubset":
+        return _deserialize_subset(partitions_def, self.serialized_failed_partition_subset)
+
+    def deserialize_in_progress_partition_subsets(
+        self, partitions_def: "PartitionsDefinition"
+    ) -> "PartitionsSubset":
+        return _deserialize_subset(partitions_def, self.serialized_in_progress_partition_subset)
+
+
+def _deserialize_subset(
+    partitions_def: "PartitionsDefinition", serialized: Optional[str]
+) -> "PartitionsSubset":
+    if serialized is None:
+        return partitions_def.empty_subset()
+    return partitions_def.deserialize_subset(serialized)
+
+
+def get_partitions_def_id(partitions_def: "PartitionsDefinition") -> str:
+    """Identifies the properties of a partitions definition that its serialized subsets depend on.
+
+    Subsets of time window partitions are stored as time ranges, which are only meaningful for the
+    same cron schedule, timezone and partition key format. Subsets of other partitions definitions
+    are stored as partition keys.
+    """
+    from dagster._core.definitions.time_window_partitions import TimeWindowPartitionsDefinition
+
+    if isinstance(partitions_def, TimeWindowPartitionsDefinition):
+        return hash_str(
+            "|".join(
+                [
+                    TimeWindowPartitionsDefinition.__name__,
+                    partitions_def.cron_schedule,
+                    partitions_def.timezone,
+                    partitions_def.fmt,
+                ]
+            )
+        )
+    return hash_str(type(partitions_def).__name__)
+
+
+def get_and_update_asset_status_cache_values(
+    instance: "DagsterInstance",
+    partitions_defs_by_key: Mapping[AssetKey, "PartitionsDefinition"],
+) -> Mapping[AssetKey, AssetStatusCacheValue]:
+    """Returns the cached status value of each of the given assets, from which its materialized,
+    failed and in-progress partitions are deserialized.
+
+    The cached value of each asset is brought up to date with the asset events stored since it was
+    last updated, and written back to the event log storage if it changed. The asset records, the
+    new planned materializations and their runs are fetched for all of the assets at once.
+    """
+    check.mapping_param(partitions_defs_by_key, "partitions_defs_by_key", key_type=AssetKey)
+    if not partitions_defs_by_key:
+        return {}
+
+    event_log_storage = instance.event_log_storage
+
+    # fetched before anything else, so that events stored while the cache is being updated are
+    # picked up again on the next update
+    latest_storage_id = event_log_storage.get_maximum_record_id() or 0
+
+    asset_records_by_key: Dict[AssetKey, "AssetRecord"] = {
+        asset_record.asset_entry.asset_key: asset_record
+        for asset_record in instance.get_asset_records(list(partitions_defs_by_key.keys()))
+    }
+
+    stale_values: Dict[AssetKey, Optional[AssetStatusCacheValue]] = {}
+    cache_values: Dict[AssetKey, AssetStatusCacheValue] = {}
+    for asset_key, partitions_def in partitions_defs_by_key.items():
+        asset_record = asset_records_by_key.get(asset_key)
+        if asset_record is None:
+            # the asset has no events, or has been wiped
+            cache_values[asset_key] = AssetStatusCacheValue(
+                latest_storage_id=latest_storage_id,
+                partitions_def_id=get_partitions_def_id(partitions_def),
+            )
+            continue
+
+        cached_value = asset_record.asset_entry.cached_status
+        if cached_value is not None and (
+            cached_value.partitions_def_id != get_partitions_def_id(partitions_def)
+        ):
+            cached_value = None
+
+        if (
+            cached_value is not None
+            and cached_value.latest_storage_id >= latest_storage_id
+            and cached_value.earliest_in_progress_materialization_event_id is None
+        ):
+            cache_values[asset_key] = cached_value
+        else:
+            stale_values[asset_key] = cached_value
+
+    planned_records_by_key = (
+        event_log_storage.get_event_records_for_asset_keys(
+            DagsterEventType.ASSET_MATERIALIZATION_PLANNED,
+            {
+                asset_key: _get_update_cursor(cached_value)
+                for asset_key, cached_value in stale_values.items()
+            },
+        )
+        if stale_values
+        else {}
+    )
+
+    planned_run_ids = list(
+        {
+            record.event_log_entry.run_id
+            for records in planned_records_by_key.values()
+            for record in records
+        }
+    )
+    runs_by_id: Dict[str, DagsterRun] = (
+        {
+            run_record.pipeline_run.run_id: run_record.pipeline_run
+            for run_record in instance.get_run_records(RunsFilter(run_ids=planned_run_ids))
+        }
+        if planned_run_ids
+        else {}
+    )
+
+    for asset_key, cached_value in stale_values.items():
+        cache_value = _build_status_cache_value(
+            instance,
+            asset_records_by_key[asset_key],
+            partitions_defs_by_key[asset_key],
+            cached_value,
+            latest_storage_id,
+            planned_records_by_key[asset_key],
+            runs_by_id,
+        )
+        if event_log_storage.can_cache_asset_status_data() and cache_value != cached_value:
+            event_log_storage.update_asset_cached_status_data(asset_key, cache_value)
+        cache_values[asset_key] = cache_value
+
+    return cache_values
+
+
+def _get_update_cursor(cached_value: Optional[AssetStatusCacheValue]) -> Optional[int]:
+    if cached_value is None:
+        return None
+
+    if cached_value.earliest_in_progress_materialization_event_id is None:
+        return cached_value.latest_storage_id
+
+    return min(
+        cached_value.latest_storage_id,
+        cached_value.earliest_in_progress_materialization_event_id - 1,
+    )
+
+
+def _build_status_cache_value(
+    instance: "DagsterInstance",
+    asset_record: "AssetRecord",
+    partitions_def: "PartitionsDefinition",
+    cached_value: Optional[AssetStatusCacheValue],
+    latest_storage_id: int,
+    planned_records: Sequence[EventLogRecord],
+    runs_by_id: Mapping[str, DagsterRun],
+) -> AssetStatusCacheValue:
+    valid_partition_keys = set(partitions_def.get_partition_keys())
+
+    if cached_value is None:
+        materialized_subset = partitions_def.empty_subset()
+        failed_partition_keys: Set[str] = set()
+    else:
+        materialized_subset = cached_value.deserialize_materialized_partition_subsets(
+            partitions_def
+        )
+        failed_partition_keys = set(
+            cached_value.deserialize_failed_partition_subsets(partitions_def).get_partition_keys()
+        )
+
+    # materializations are scanned from the same cursor as planned materializations, so that a run
+    # that materialized its partition after failing a previous attempt is not marked as failed.
+    # There is nothing to scan if the latest materialization tracked on the asset record is older
+    # than the cursor.
+    update_cursor = _get_update_cursor(cached_value)
+    last_materialization_storage_id = asset_record.asset_entry.last_materialization_storage_id
+    if (
+        update_cursor is not None
+        and last_materialization_storage_id is not None
+        and last_materialization_storage_id <= update_cursor
+    ):
+        materialization_storage_id_by_partition: Dict[str, int] = {}
+    else:
+        event_log_storage = instance.event_log_storage
+        materialization_storage_id_by_partition = {
+            partition: storage_id
+            for partition, storage_id in event_log_storage.get_latest_storage_id_by_partition(
+                asset_record.asset_entry.asset_key,
+                DagsterEventType.ASSET_MATERIALIZATION,
+                after_cursor=update_cursor,
+            ).items()
+            if partition in valid_partition_keys
+        }
+    materialized_subset = materialized_subset.with_partition_keys(
+        materialization_storage_id_by_partition.keys()
+    )
+    failed_partition_keys -= set(materialization_storage_id_by_partition.keys())
+
+    latest_planned_by_partition: Dict[str, Tuple[int, DagsterRun]] = {}
+    for record in planned_records:
+        run = runs_by_id.get(record.event_log_entry.run_id)
+        if run is None:
+            continue
+        partition = run.tags.get(PARTITION_NAME_TAG)
+        if partition is None or partition not in valid_partition_keys:
+            continue
+        latest_planned_by_partition[partition] = (record.storage_id, run)
+
+    in_progress_partition_keys: List[str] = []
+    earliest_in_progress_materialization_event_id: Optional[int] = None
+    for partition, (storage_id, run) in latest_planned_by_partition.items():
+        materialized_after_planned = (
+            materialization_storage_id_by_partition.get(partition, -1) > storage_id
+        )
+        if run.status not in FINISHED_STATUSES:
+            failed_partition_keys.discard(partition)
+            if not materialized_after_planned:
+                in_progress_partition_keys.append(partition)
+            earliest_in_progress_materialization_event_id = (
+                storage_id
+                if earliest_in_progress_materialization_event_id is None
+                else min(earliest_in_progress_materialization_event_id, storage_id)
+            )
+        elif run.status == DagsterRunStatus.SUCCESS or materialized_after_planned:
+            failed_partition_keys.discard(partition)
+        else:
+            failed_partition_keys.add(partition)
+
+    return AssetStatusCacheValue(
+        latest_storage_id=latest_storage_id,
+        partitions_def_id=get_partitions_def_id(partitions_def),
+        serialized_materialized_partition_subset=materialized_subset.serialize(),
+        serialized_failed_partition_subset=partitions_def.empty_subset()
+        .with_partition_keys(failed_partition_keys)
+        .serialize(),
+        serialized_in_progress_partition_subset=partitions_def.empty_subset()
+        .with_partition_keys(in_progress_partition_keys)
+        .serialize(),
+        earliest_in_progress_materialization_event_id=earliest_in_progress_materialization_event_id,
+    )
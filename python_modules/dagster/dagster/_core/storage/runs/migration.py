@@ -17,6 +17,7 @@
 RUN_START_END = "run_start_end_overwritten"  # was run_start_end, but renamed to overwrite bad timestamps written
 RUN_REPO_LABEL_TAGS = "run_repo_label_tags"
 BULK_ACTION_TYPES = "bulk_action_types"
+PIPELINE_SNAPSHOT_COMPONENTS = "pipeline_snapshot_components"
 
 # for `dagster instance migrate`, paired with schema changes
 REQUIRED_DATA_MIGRATIONS = {
@@ -27,6 +28,7 @@
 # for `dagster instance reindex`, optionally run for better read performance
 OPTIONAL_DATA_MIGRATIONS = {
     RUN_START_END: lambda: migrate_run_start_end,
+    PIPELINE_SNAPSHOT_COMPONENTS: lambda: migrate_pipeline_snapshot_components,
 }
 
 CHUNK_SIZE = 100
@@ -102,6 +104,21 @@ def migrate_run_partition(storage, print_fn=None):
         storage.add_run_tags(run.run_id, run.tags)
 
 
+def migrate_pipeline_snapshot_components(_storage, print_fn=None):
+    """
+    Opts the run storage in to storing the config schema, dagster type and dependency structure
+    snapshots of pipeline snapshots once, in rows shared by the pipeline snapshots that contain
+    them.
+    Only the pipeline snapshots added afterwards are stored this way. Processes running a version of
+    dagster that predates this migration cannot read them, so existing storages only opt in when
+    `dagster instance reindex` is run, which should be once every process using the instance has
+    been upgraded. Storages created from scratch opt in straight away.
+    """
+
+    if print_fn:
+        print_fn("Pipeline snapshots will be stored with shared components from now on.")
+
+
 def migrate_run_start_end(storage, print_fn=None):
     """
     Utility method that updates the start and end times of historical runs using the completed event log.
@@ -1,16 +1,30 @@
 import logging
+import threading
 import uuid
 import zlib
 from abc import abstractmethod
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 from datetime import datetime
 from enum import Enum
-from typing import Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Set, Tuple, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
 
 import pendulum
 import sqlalchemy as db
 
 import dagster._check as check
+import dagster._seven as seven
 from dagster._core.errors import (
     DagsterInvariantViolationError,
     DagsterRunAlreadyExists,
@@ -37,8 +51,12 @@
 from dagster._serdes import (
     deserialize_as,
     deserialize_json_to_dagster_namedtuple,
+    deserialize_value,
+    pack_value,
     serialize_dagster_namedtuple,
+    unpack_value,
 )
+from dagster._serdes.utils import hash_str
 from dagster._seven import JSONDecodeError
 from dagster._utils import merge_dicts, utc_datetime_from_timestamp
 
@@ -52,7 +70,12 @@
     TagBucket,
 )
 from .base import RunStorage
-from .migration import OPTIONAL_DATA_MIGRATIONS, REQUIRED_DATA_MIGRATIONS, RUN_PARTITIONS
+from .migration import (
+    OPTIONAL_DATA_MIGRATIONS,
+    PIPELINE_SNAPSHOT_COMPONENTS,
+    REQUIRED_DATA_MIGRATIONS,
+    RUN_PARTITIONS,
+)
 from .schema import (
     BulkActionsTable,
     DaemonHeartbeatsTable,
@@ -68,6 +91,53 @@
 class SnapshotType(Enum):
     PIPELINE = "PIPELINE"
     EXECUTION_PLAN = "EXECUTION_PLAN"
+    # a pipeline snapshot stored without its components, which are stored in their own rows
+    PIPELINE_WITH_COMPONENT_REFS = "PIPELINE_WITH_COMPONENT_REFS"
+    PIPELINE_COMPONENT = "PIPELINE_COMPONENT"
+
+
+# The parts of a pipeline snapshot that are usually shared by many jobs (e.g. every asset job in a
+# repository has the same config schema and dagster type snapshots), which are stored once, in
+# rows keyed by the snapshot id of the component, and referenced by the pipeline snapshots.
+PIPELINE_SNAPSHOT_COMPONENT_FIELDS = (
+    "config_schema_snapshot",
+    "dagster_type_namespace_snapshot",
+    "dep_structure_snapshot",
+)
+COMPONENT_SNAPSHOT_IDS_KEY = "__component_snapshot_ids__"
+
+
+class _SnapshotComponentCache:
+    """Thread-safe LRU cache of deserialized pipeline snapshot components. Components are keyed by
+    their content-addressed snapshot id, so a cached component never goes stale, and the cache is
+    shared by every run storage in the process.
+    """
+
+    def __init__(self, max_size: int):
+        self._max_size = max_size
+        self._lock = threading.Lock()
+        self._components: "OrderedDict[str, Any]" = OrderedDict()
+
+    def get(self, component_id: str) -> Optional[Any]:
+        with self._lock:
+            component = self._components.get(component_id)
+            if component is not None:
+                self._components.move_to_end(component_id)
+            return component
+
+    def set(self, component_id: str, component: Any) -> None:
+        with self._lock:
+            self._components[component_id] = component
+            self._components.move_to_end(component_id)
+            while len(self._components) > self._max_size:
+                self._components.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._components.clear()
+
+
+_SNAPSHOT_COMPONENT_CACHE = _SnapshotComponentCache(max_size=64)
 
 
 class SqlRunStorage(RunStorage):  # pylint: disable=no-init
@@ -722,10 +792,29 @@ def add_pipeline_snapshot(
         if not snapshot_id:
             snapshot_id = create_pipeline_snapshot_id(pipeline_snapshot)
 
-        return self._add_snapshot(
+        if not self.has_built_index(PIPELINE_SNAPSHOT_COMPONENTS):
+            # stored whole, so that processes running older versions of dagster can read it
+            return self._add_snapshot(
+                snapshot_id=snapshot_id,
+                snapshot_obj=pipeline_snapshot,
+                snapshot_type=SnapshotType.PIPELINE,
+            )
+
+        storage_dict = pack_value(pipeline_snapshot)
+        component_ids = {}
+        for field_name in PIPELINE_SNAPSHOT_COMPONENT_FIELDS:
+            serialized_component = seven.json.dumps(storage_dict.pop(field_name))
+            # same as create_snapshot_id(component), without serializing the component again
+            component_id = hash_str(serialized_component)
+            component_ids[field_name] = component_id
+            self._add_snapshot_component(component_id, serialized_component)
+            _SNAPSHOT_COMPONENT_CACHE.set(component_id, getattr(pipeline_snapshot, field_name))
+
+        storage_dict[COMPONENT_SNAPSHOT_IDS_KEY] = component_ids
+        return self._add_snapshot_body(
             snapshot_id=snapshot_id,
-            snapshot_obj=pipeline_snapshot,
-            snapshot_type=SnapshotType.PIPELINE,
+            serialized_snapshot=seven.json.dumps(storage_dict),
+            snapshot_type=SnapshotType.PIPELINE_WITH_COMPONENT_REFS,
         )
 
     def get_pipeline_snapshot(self, pipeline_snapshot_id: str) -> PipelineSnapshot:
@@ -756,23 +845,41 @@ def get_execution_plan_snapshot(self, execution_plan_snapshot_id: str) -> Execut
         return self._get_snapshot(execution_plan_snapshot_id)
 
     def _add_snapshot(self, snapshot_id: str, snapshot_obj, snapshot_type: SnapshotType) -> str:
-        check.str_param(snapshot_id, "snapshot_id")
         check.not_none_param(snapshot_obj, "snapshot_obj")
+        return self._add_snapshot_body(
+            snapshot_id, serialize_dagster_namedtuple(snapshot_obj), snapshot_type
+        )
+
+    def _add_snapshot_body(
+        self, snapshot_id: str, serialized_snapshot: str, snapshot_type: SnapshotType
+    ) -> str:
+        check.str_param(snapshot_id, "snapshot_id")
+        check.str_param(serialized_snapshot, "serialized_snapshot")
         check.inst_param(snapshot_type, "snapshot_type", SnapshotType)
 
         with self.connect() as conn:
             snapshot_insert = (
                 SnapshotsTable.insert().values(  # pylint: disable=no-value-for-parameter
                     snapshot_id=snapshot_id,
-                    snapshot_body=zlib.compress(
-                        serialize_dagster_namedtuple(snapshot_obj).encode("utf-8")
-                    ),
+                    snapshot_body=zlib.compress(serialized_snapshot.encode("utf-8")),
                     snapshot_type=snapshot_type.value,
                 )
             )
             conn.execute(snapshot_insert)
             return snapshot_id
 
+    def _add_snapshot_component(self, component_id: str, serialized_component: str) -> None:
+        if self._has_snapshot_id(component_id):
+            return
+
+        try:
+            self._add_snapshot_body(
+                component_id, serialized_component, SnapshotType.PIPELINE_COMPONENT
+            )
+        except db.exc.IntegrityError:
+            # the same component was stored concurrently, e.g. for another job in the repository
+            pass
+
     def get_run_storage_id(self) -> str:
         query = db.select([InstanceInfo.c.run_storage_id])
         row = self.fetchone(query)
@@ -794,13 +901,56 @@ def _has_snapshot_id(self, snapshot_id: str) -> bool:
         return bool(row)
 
     def _get_snapshot(self, snapshot_id: str):
-        query = db.select([SnapshotsTable.c.snapshot_body]).where(
+        query = db.select([SnapshotsTable.c.snapshot_body, SnapshotsTable.c.snapshot_type]).where(
             SnapshotsTable.c.snapshot_id == snapshot_id
         )
 
         row = self.fetchone(query)
+        if not row:
+            return None
+
+        if row[1] == SnapshotType.PIPELINE_WITH_COMPONENT_REFS.value:
+            return self._get_pipeline_snapshot_with_component_refs(snapshot_id, row[0])
+
+        return defensively_unpack_pipeline_snapshot_query(logging, row)
+
+    def _get_pipeline_snapshot_with_component_refs(
+        self, snapshot_id: str, snapshot_body: bytes
+    ) -> PipelineSnapshot:
+        storage_dict = seven.json.loads(zlib.decompress(snapshot_body).decode("utf-8"))
+        component_ids = storage_dict.pop(COMPONENT_SNAPSHOT_IDS_KEY)
+        components = self._get_snapshot_components(list(component_ids.values()))
+        for field_name, component_id in component_ids.items():
+            if component_id not in components:
+                raise DagsterSnapshotDoesNotExist(
+                    f"Component {component_id} of snapshot {snapshot_id} does not exist in run "
+                    "storage"
+                )
+            # deserialized components are passed through as-is when unpacking the snapshot
+            storage_dict[field_name] = components[component_id]
+
+        return unpack_value(storage_dict)
+
+    def _get_snapshot_components(self, component_ids: Sequence[str]) -> Mapping[str, Any]:
+        components = {}
+        uncached_component_ids = []
+        for component_id in component_ids:
+            component = _SNAPSHOT_COMPONENT_CACHE.get(component_id)
+            if component is None:
+                uncached_component_ids.append(component_id)
+            else:
+                components[component_id] = component
+
+        if uncached_component_ids:
+            query = db.select([SnapshotsTable.c.snapshot_id, SnapshotsTable.c.snapshot_body]).where(
+                SnapshotsTable.c.snapshot_id.in_(uncached_component_ids)
+            )
+            for component_id, component_body in self.fetchall(query):
+                component = deserialize_value(zlib.decompress(component_body).decode("utf-8"))
+                _SNAPSHOT_COMPONENT_CACHE.set(component_id, component)
+                components[component_id] = component
 
-        return defensively_unpack_pipeline_snapshot_query(logging, row) if row else None
+        return components
 
     def get_run_partition_data(self, runs_filter: RunsFilter) -> Sequence[RunPartitionData]:
         if self.has_built_index(RUN_PARTITIONS) and self.has_run_stats_index_cols():
@@ -0,0 +1,263 @@
+import io
+import mmap
+import os
+import pickle
+import struct
+from abc import ABC, abstractmethod
+from typing import Any, BinaryIO, List, Mapping, Union
+
+import dagster._check as check
+from dagster._utils import PICKLE_PROTOCOL
+
+# Values are pickled with protocol 5 where it is available, so that objects that support
+# out-of-band buffers (e.g. NumPy arrays, pandas DataFrames and Arrow tables) can be written and
+# memory-mapped back without copying their buffers
+PICKLE_BUFFERS_PROTOCOL = min(pickle.HIGHEST_PROTOCOL, 5)
+
+# The out-of-band buffers of a value are written after its pickle stream, each aligned so that it
+# can be used as the memory of arrays of any element type, followed by a footer holding the length
+# of the pickle stream and of each buffer, and these magic bytes
+_PICKLE_BUFFERS_MAGIC = b"DAGPKL05"
+_ALIGNMENT = 64
+_LENGTH_FORMAT = "<Q"
+_LENGTH_SIZE = struct.calcsize(_LENGTH_FORMAT)
+
+# Added to the schema metadata of Arrow files written from pandas DataFrames, so that they are
+# loaded as DataFrames rather than as Arrow tables
+_ARROW_PANDAS_METADATA_KEY = b"dagster_pandas_dataframe"
+
+
+class UnsupportedValueError(Exception):
+    """Raised by a serialization format that can't store a particular value, so that the value is
+    stored using the fallback format instead.
+    """
+
+
+class SerializationFormat(ABC):
+    """A file format that the filesystem IO manager can store values of particular types in."""
+
+    @property
+    @abstractmethod
+    def name(self) -> str:
+        """The name of the format, which is recorded in the metadata of outputs."""
+
+    @property
+    @abstractmethod
+    def magic(self) -> bytes:
+        """The bytes that files written in this format start with, which identify the format of a
+        file when it is loaded.
+        """
+
+    @abstractmethod
+    def dump(self, obj: Any, file: BinaryIO) -> None:
+        """Writes the value to the file, raising an UnsupportedValueError if the format can't
+        store the value before anything has been written.
+        """
+
+    @abstractmethod
+    def load(self, path: Union[str, os.PathLike]) -> Any:
+        """Loads the value from the file at the path, memory-mapping it if the path is local."""
+
+
+def type_name(python_type: Union[type, str]) -> str:
+    """The fully qualified name that serialization formats are registered for a type under, which
+    allows formats to be registered for types from libraries that are not imported.
+    """
+    if isinstance(python_type, str):
+        return python_type
+    check.inst_param(python_type, "python_type", type)
+    return f"{python_type.__module__}.{python_type.__qualname__}"
+
+
+def is_local_path(path: Union[str, os.PathLike]) -> bool:
+    # paths on remote filesystems are UPaths with a protocol, e.g. "s3"
+    return getattr(path, "protocol", "") in ("", "file", "local")
+
+
+def map_file(path: Union[str, os.PathLike]) -> memoryview:
+    """Returns the contents of the file at the path, which are mapped into memory rather than
+    read if the path is local. The mapping is private, so writes to it are not shared with other
+    processes or written to the file.
+    """
+    if not is_local_path(path):
+        return memoryview(path.read_bytes())  # type: ignore
+
+    with open(os.fspath(path), "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            # empty files can't be mapped
+            return memoryview(b"")
+        return memoryview(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_COPY))
+
+
+def _padding(offset: int) -> int:
+    return -offset % _ALIGNMENT
+
+
+class PickleFormat(SerializationFormat):
+    """Stores values using pickling, with the buffers of values that support pickle protocol 5
+    written out of band after the pickle stream, so that they can be memory-mapped when the value
+    is loaded.
+
+    Values that don't have any out-of-band buffers are written as plain pickles.
+
+    Args:
+        out_of_band_buffers (bool): Whether to write the buffers of values out of band. If False,
+            values are written as plain pickles of the protocol that dagster pickles values with,
+            which can be loaded with ``pickle.load``. Defaults to True.
+    """
+
+    def __init__(self, out_of_band_buffers: bool = True):
+        self._out_of_band_buffers = check.bool_param(out_of_band_buffers, "out_of_band_buffers")
+
+    @property
+    def name(self) -> str:
+        return "pickle"
+
+    @property
+    def magic(self) -> bytes:
+        # the PROTO opcode that pickles of protocol 2 and later start with
+        return b"\x80"
+
+    def dump(self, obj: Any, file: BinaryIO) -> None:
+        if not self._out_of_band_buffers:
+            pickle.dump(obj, file, PICKLE_PROTOCOL)
+            return
+
+        buffers: List[memoryview] = []
+        start = file.tell()
+        if PICKLE_BUFFERS_PROTOCOL >= 5:
+            pickle.dump(
+                obj,
+                file,
+                protocol=PICKLE_BUFFERS_PROTOCOL,
+                buffer_callback=lambda buffer: buffers.append(buffer.raw()),
+            )
+        else:
+            pickle.dump(obj, file, protocol=PICKLE_BUFFERS_PROTOCOL)
+
+        if not buffers:
+            return
+
+        # the pickle stream is followed by the buffers, and a footer holding their lengths
+        pickle_length = file.tell() - start
+        offset = pickle_length
+        for buffer in buffers:
+            file.write(b"\0" * _padding(offset))
+            offset += _padding(offset)
+            file.write(buffer)
+            offset += buffer.nbytes
+
+        lengths = [pickle_length, *(buffer.nbytes for buffer in buffers), len(buffers)]
+        file.write(struct.pack(f"<{len(lengths)}Q", *lengths) + _PICKLE_BUFFERS_MAGIC)
+
+    def load(self, path: Union[str, os.PathLike]) -> Any:
+        view = map_file(path)
+        # pickles end with the STOP opcode, so can't end with the magic bytes of the footer
+        if bytes(view[-len(_PICKLE_BUFFERS_MAGIC) :]) != _PICKLE_BUFFERS_MAGIC:
+            return pickle.loads(view)
+
+        footer_end = len(view) - len(_PICKLE_BUFFERS_MAGIC)
+        (num_buffers,) = struct.unpack_from(_LENGTH_FORMAT, view, footer_end - _LENGTH_SIZE)
+        pickle_length, *buffer_lengths = struct.unpack_from(
+            f"<{num_buffers + 1}Q", view, footer_end - _LENGTH_SIZE * (num_buffers + 2)
+        )
+
+        buffers = []
+        offset = pickle_length
+        for length in buffer_lengths:
+            offset += _padding(offset)
+            buffers.append(view[offset : offset + length])
+            offset += length
+
+        return pickle.loads(view[:pickle_length], buffers=buffers)
+
+
+class NumpyFormat(SerializationFormat):
+    """Stores NumPy arrays in the ``.npy`` format, which are loaded as copy-on-write memory-mapped
+    arrays from local paths.
+    """
+
+    @property
+    def name(self) -> str:
+        return "npy"
+
+    @property
+    def magic(self) -> bytes:
+        return b"\x93NUMPY"
+
+    def dump(self, obj: Any, file: BinaryIO) -> None:
+        import numpy as np
+
+        if obj.dtype.hasobject:
+            raise UnsupportedValueError("Arrays of Python objects can't be stored in .npy files")
+        np.save(file, obj, allow_pickle=False)
+
+    def load(self, path: Union[str, os.PathLike]) -> Any:
+        import numpy as np
+
+        if not is_local_path(path):
+            return np.load(io.BytesIO(path.read_bytes()), allow_pickle=False)  # type: ignore
+
+        try:
+            return np.load(os.fspath(path), mmap_mode="c", allow_pickle=False)
+        except ValueError:
+            # empty arrays can't be memory-mapped
+            return np.load(os.fspath(path), allow_pickle=False)
+
+
+class ArrowFormat(SerializationFormat):
+    """Stores pandas DataFrames and Arrow tables in the Arrow IPC file format (Feather V2),
+    uncompressed, so that their columns are memory-mapped from local paths when they are loaded.
+    """
+
+    @property
+    def name(self) -> str:
+        return "arrow"
+
+    @property
+    def magic(self) -> bytes:
+        return b"ARROW1"
+
+    def dump(self, obj: Any, file: BinaryIO) -> None:
+        try:
+            import pyarrow as pa
+        except ImportError as e:
+            raise UnsupportedValueError("pyarrow is not installed") from e
+
+        if isinstance(obj, pa.Table):
+            table = obj
+        else:
+            try:
+                table = pa.Table.from_pandas(obj)
+            except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError) as e:
+                raise UnsupportedValueError(f"Couldn't convert DataFrame to Arrow: {e}") from e
+            table = table.replace_schema_metadata(
+                {**(table.schema.metadata or {}), _ARROW_PANDAS_METADATA_KEY: b"true"}
+            )
+
+        with pa.ipc.new_file(file, table.schema) as writer:
+            writer.write_table(table)
+
+    def load(self, path: Union[str, os.PathLike]) -> Any:
+        import pyarrow as pa
+
+        if is_local_path(path):
+            source = pa.memory_map(os.fspath(path), "r")
+        else:
+            source = pa.py_buffer(path.read_bytes())  # type: ignore
+
+        table = pa.ipc.open_file(source).read_all()
+        if _ARROW_PANDAS_METADATA_KEY in (table.schema.metadata or {}):
+            # split_blocks avoids consolidating columns, so that columns without nulls can share
+            # the mapped memory
+            return table.to_pandas(split_blocks=True)
+        return table
+
+
+DEFAULT_SERIALIZATION_FORMATS: Mapping[str, SerializationFormat] = {
+    "numpy.ndarray": NumpyFormat(),
+    "pandas.core.frame.DataFrame": ArrowFormat(),
+    # the name that DataFrames have from pandas 3
+    "pandas.DataFrame": ArrowFormat(),
+    "pyarrow.lib.Table": ArrowFormat(),
+}
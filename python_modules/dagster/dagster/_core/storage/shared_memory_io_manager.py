@@ -0,0 +1,233 @@
+import errno
+import os
+import shutil
+import tempfile
+import uuid
+from typing import Any, Optional, Sequence
+
+import dagster._check as check
+from dagster._annotations import experimental
+from dagster._config import Field, StringSource
+from dagster._core.definitions.metadata import MetadataValue
+from dagster._core.definitions.mode import ModeDefinition
+from dagster._core.errors import DagsterInvariantViolationError
+from dagster._core.execution.context.input import InputContext
+from dagster._core.execution.context.output import OutputContext
+from dagster._core.instance import DagsterInstance
+from dagster._core.storage.io_manager import IOManager, io_manager
+from dagster._core.storage.pipeline_run import RunsFilter
+from dagster._core.storage.serialization_formats import PickleFormat
+from dagster._core.system_config.objects import ResolvedRunConfig
+
+
+def default_shared_memory_dir() -> str:
+    """The directory the shared memory IO manager stores values in when no base_dir is configured,
+    on the shared memory filesystem where there is one.
+    """
+    shm_dir = "/dev/shm"
+    if os.path.isdir(shm_dir) and os.access(shm_dir, os.W_OK):
+        return os.path.join(shm_dir, "dagster")
+    return default_disk_dir()
+
+
+def default_disk_dir() -> str:
+    """The directory on disk the shared memory IO manager stores the values that don't fit in its
+    base directory in.
+    """
+    return os.path.join(tempfile.gettempdir(), "dagster_shared_memory")
+
+
+@io_manager(
+    config_schema={"base_dir": Field(StringSource, is_required=False)},  # type: ignore  # mypy bug
+    description=(
+        "Built-in IO manager that stores values in memory-mapped files, which processes on the "
+        "same host can load without copying."
+    ),
+)
+@experimental
+def shared_memory_io_manager(init_context):
+    """Built-in IO manager that stores values in memory-mapped files on the shared memory
+    filesystem, so that ops executed in different processes on the same host can pass large
+    values to each other without copying them.
+
+    Values are pickled with out-of-band buffers, so the buffers of NumPy arrays, pandas DataFrames
+    and Arrow tables are written once by the upstream step, and mapped into the memory of each
+    downstream step that loads them rather than read and unpickled into a copy. Loaded arrays
+    can be written to, which copies the written pages for the process that writes to them.
+
+    The base directory that the files live inside is determined by the IO manager's "base_dir"
+    configuration value if specified, otherwise "/dev/shm/dagster" if the shared memory
+    filesystem is available, otherwise a directory in the system temporary directory. Since these
+    directories are held in memory, the values of a run are removed when the run finishes. The
+    values of runs that stopped without finishing, e.g. because their process was killed, are
+    removed the next time that the IO manager is initialized.
+
+    When the base directory runs out of space, values are written to a directory in the system
+    temporary directory on disk instead, and a warning is logged. In a Docker container, the size
+    of "/dev/shm" is set with the ``--shm-size`` option of ``docker run``.
+
+    Since the values are not kept after their run has finished, this IO manager can't be used to
+    load assets materialized by other runs, or to re-execute steps from a finished run. All steps
+    must be executed on the same host, e.g. with the :py:func:`multiprocess_executor`.
+
+    Example usage:
+
+    .. code-block:: python
+
+        from dagster import job, multiprocess_executor, op, shared_memory_io_manager
+
+        @op
+        def make_array():
+            return np.zeros((10_000, 10_000))
+
+        @op
+        def sum_array(array):
+            return array.sum()
+
+        @job(
+            executor_def=multiprocess_executor,
+            resource_defs={"io_manager": shared_memory_io_manager},
+        )
+        def my_job():
+            sum_array(make_array())
+    """
+    io_manager_obj = _shared_memory_io_manager_from_config(init_context.resource_config)
+    if init_context.instance:
+        exclude_run_ids = [init_context.run_id] if init_context.run_id else []
+        io_manager_obj.remove_finished_runs(init_context.instance, exclude_run_ids=exclude_run_ids)
+    return io_manager_obj
+
+
+def _shared_memory_io_manager_from_config(config: Optional[dict]) -> "SharedMemoryIOManager":
+    base_dir = (config or {}).get("base_dir", default_shared_memory_dir())
+    fallback_dir = default_disk_dir()
+    return SharedMemoryIOManager(
+        base_dir=base_dir, fallback_dir=fallback_dir if fallback_dir != base_dir else None
+    )
+
+
+def remove_shared_memory_run_values(
+    mode_def: ModeDefinition, resolved_run_config: ResolvedRunConfig, run_id: str
+) -> None:
+    """Removes the values that the shared memory IO managers of the job stored for a run, once the
+    run has finished.
+    """
+    for resource_key, resource_def in mode_def.resource_defs.items():
+        # also matches the IO managers made with `configured`, which keep the resource function
+        if resource_def.resource_fn is not shared_memory_io_manager.resource_fn:
+            continue
+
+        resource_config = resolved_run_config.resources.get(resource_key)
+        _shared_memory_io_manager_from_config(
+            resource_config.config if resource_config else None
+        ).remove_run(run_id)
+
+
+class SharedMemoryIOManager(IOManager):
+    """IO manager that stores values in memory-mapped files in a directory per run.
+
+    Args:
+        base_dir (str): The directory that the directory of each run is created in.
+        fallback_dir (Optional[str]): The directory that the directory of each run is created in
+            for the values that don't fit in the base directory. When None, an error is raised for
+            them instead.
+    """
+
+    def __init__(self, base_dir: str, fallback_dir: Optional[str] = None):
+        self.base_dir = check.str_param(base_dir, "base_dir")
+        self.fallback_dir = check.opt_str_param(fallback_dir, "fallback_dir")
+        self._format = PickleFormat()
+
+    @property
+    def _dirs(self) -> Sequence[str]:
+        return [self.base_dir, self.fallback_dir] if self.fallback_dir else [self.base_dir]
+
+    def _get_path(self, base_dir: str, context) -> str:
+        return os.path.join(base_dir, *context.get_identifier())
+
+    def _write(self, obj: Any, path: str) -> int:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        # write to a temporary file that is moved into place, so that a concurrent reader never
+        # sees a partially written file
+        temp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+        try:
+            with open(temp_path, "wb") as file:
+                self._format.dump(obj, file)
+                size = file.tell()
+            os.replace(temp_path, path)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+        return size
+
+    def handle_output(self, context: OutputContext, obj: Any):
+        path = self._get_path(self.base_dir, context)
+        context.log.debug(f"Writing shared memory file at: {path}")
+        try:
+            size = self._write(obj, path)
+        except OSError as e:
+            if e.errno != errno.ENOSPC:
+                raise
+            if not self.fallback_dir:
+                raise DagsterInvariantViolationError(
+                    f"There is not enough space in {self.base_dir} to store the output. Make the "
+                    "shared memory filesystem larger, e.g. with the --shm-size option of docker "
+                    "run, or configure a base_dir with more space."
+                ) from e
+
+            path = self._get_path(self.fallback_dir, context)
+            context.log.warning(
+                f"There is not enough space in {self.base_dir} to store the output, so it is "
+                f"written to {path} on disk instead, and will be read from disk by the steps that "
+                "load it. Make the shared memory filesystem larger, e.g. with the --shm-size "
+                "option of docker run, to keep outputs like it in memory."
+            )
+            size = self._write(obj, path)
+
+        context.add_output_metadata(
+            {"path": MetadataValue.path(path), "size (bytes)": MetadataValue.int(size)}
+        )
+
+    def load_input(self, context: InputContext) -> Any:
+        paths = [self._get_path(base_dir, context.upstream_output) for base_dir in self._dirs]
+        path = next((path for path in paths if os.path.exists(path)), None)
+        if path is None:
+            raise DagsterInvariantViolationError(
+                f"No value found at {paths[0]}. The shared memory IO manager only keeps the values "
+                "of a run until the run has finished, so values can't be loaded from other runs, "
+                "and all of the steps of a run must be executed on the same host."
+            )
+
+        context.log.debug(f"Loading shared memory file from: {path}")
+        return self._format.load(path)
+
+    def remove_run(self, run_id: str) -> None:
+        """Removes the values of the run."""
+        check.str_param(run_id, "run_id")
+        for base_dir in self._dirs:
+            shutil.rmtree(os.path.join(base_dir, run_id), ignore_errors=True)
+
+    def remove_finished_runs(
+        self, instance: DagsterInstance, exclude_run_ids: Optional[Sequence[str]] = None
+    ) -> None:
+        """Removes the values of the runs in the base and fallback directories that have
+        finished.
+        """
+        check.inst_param(instance, "instance", DagsterInstance)
+        exclude_run_ids = check.opt_sequence_param(exclude_run_ids, "exclude_run_ids", of_type=str)
+
+        run_ids = {
+            run_id
+            for base_dir in self._dirs
+            if os.path.isdir(base_dir)
+            for run_id in os.listdir(base_dir)
+            if run_id not in exclude_run_ids and os.path.isdir(os.path.join(base_dir, run_id))
+        }
+        if not run_ids:
+            return
+
+        # directories that don't belong to a run of this instance are left alone
+        for run in instance.get_runs(RunsFilter(run_ids=list(run_ids))):
+            if run.is_finished:
+                self.remove_run(run.run_id)
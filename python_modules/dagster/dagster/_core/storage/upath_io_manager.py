@@ -2,7 +2,10 @@
 
 import inspect
 from abc import abstractmethod
-from typing import Any, Dict, Union
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from functools import partial
+from typing import Any, Callable, Deque, Dict, Iterator, Mapping, Optional, Tuple, Union
 
 from upath import UPath
 
@@ -20,12 +23,20 @@ class UPathIOManager(MemoizableIOManager):
      - handles loading a single upstream partition
      - handles loading multiple upstream partitions (with respect to <PyObject object="PartitionMapping" />)
      - the `get_metadata` method can be customized to add additional metadata to the output
+     - the `dump_to_path` method can return metadata about the written file, e.g. its size, which
+       is added to the output
      - the `allow_missing_partitions` metadata value can be set to `True` to skip missing partitions
        (the default behavior is to raise an error)
+     - the `max_concurrent_partition_loads` metadata value can be set to load multiple partitions
+       concurrently in a thread pool (defaults to the `max_concurrent_partition_loads` class
+       attribute, which loads one partition at a time)
+     - the `stream_partitions` metadata value can be set to `True` to receive multiple partitions as
+       an iterator of `(partition_key, obj)` pairs, which are loaded lazily as they are consumed
 
     """
 
     extension: str = ""  # override in child class
+    max_concurrent_partition_loads: int = 1  # override in child class
 
     def __init__(
         self,
@@ -36,8 +47,13 @@ def __init__(
         self._base_path = base_path
 
     @abstractmethod
-    def dump_to_path(self, context: OutputContext, obj: Any, path: UPath):
-        """Child classes should override this method to write the object to the filesystem."""
+    def dump_to_path(
+        self, context: OutputContext, obj: Any, path: UPath
+    ) -> Optional[Mapping[str, MetadataValue]]:
+        """Child classes should override this method to write the object to the filesystem.
+
+        May return metadata about the written file, which is added to the output.
+        """
 
     @abstractmethod
     def load_from_path(self, context: InputContext, path: UPath) -> Any:
@@ -108,24 +124,47 @@ def _load_single_input(self, path: UPath, context: InputContext) -> Any:
 
         return obj
 
-    def _load_multiple_inputs(self, context: InputContext) -> Dict[str, Any]:
-        # load multiple partitions
+    def _get_max_concurrent_partition_loads(self, context: InputContext) -> int:
+        max_concurrent_partition_loads = (
+            context.metadata.get(
+                "max_concurrent_partition_loads", self.max_concurrent_partition_loads
+            )
+            if context.metadata is not None
+            else self.max_concurrent_partition_loads
+        )
+        return check.int_param(max_concurrent_partition_loads, "max_concurrent_partition_loads")
+
+    @staticmethod
+    def _should_stream_partitions(context: InputContext) -> bool:
+        return bool(
+            context.metadata.get("stream_partitions", False)
+            if context.metadata is not None
+            else False
+        )
+
+    def _iter_multiple_inputs(self, context: InputContext) -> Iterator[Tuple[str, Any]]:
+        # load multiple partitions, yielding them in the order of the partition keys
         allow_missing_partitions = (
             context.metadata.get("allow_missing_partitions", False)
             if context.metadata is not None
             else False
         )
 
-        objs: Dict[str, Any] = {}
         paths = self._get_paths_for_partitions(context)
+        max_concurrent_partition_loads = self._get_max_concurrent_partition_loads(context)
 
         context.log.debug(f"Loading {len(paths)} partitions...")
 
-        for partition_key, path in paths.items():
-            context.log.debug(f"Loading partition from {path} using {self.__class__.__name__}")
+        if max_concurrent_partition_loads > 1:
+            loaded_partitions = self._iter_partitions_loaded_concurrently(
+                context, paths, max_concurrent_partition_loads
+            )
+        else:
+            loaded_partitions = self._iter_partitions_loaded_serially(context, paths)
+
+        for partition_key, path, load_partition in loaded_partitions:
             try:
-                obj = self.load_from_path(context=context, path=path)
-                objs[partition_key] = obj
+                obj = load_partition()
             except FileNotFoundError as e:
                 if not allow_missing_partitions:
                     raise e
@@ -133,9 +172,61 @@ def _load_multiple_inputs(self, context: InputContext) -> Dict[str, Any]:
                     f"Couldn't load partition {path} and skipped it "
                     f"because the input metadata includes allow_missing_partitions=True"
                 )
+                continue
+
+            yield partition_key, obj
 
+    def _iter_partitions_loaded_serially(
+        self, context: InputContext, paths: Dict[str, UPath]
+    ) -> Iterator[Tuple[str, UPath, Callable[[], Any]]]:
+        for partition_key, path in paths.items():
+            context.log.debug(f"Loading partition from {path} using {self.__class__.__name__}")
+            yield partition_key, path, partial(self.load_from_path, context=context, path=path)
+
+    def _iter_partitions_loaded_concurrently(
+        self, context: InputContext, paths: Dict[str, UPath], max_concurrent_partition_loads: int
+    ) -> Iterator[Tuple[str, UPath, Callable[[], Any]]]:
+        # loads are submitted ahead of the partition that is being consumed, in the order of the
+        # partition keys
+        pending: Deque[Tuple[str, UPath, Future]] = deque()
+        paths_iter = iter(paths.items())
+        executor = ThreadPoolExecutor(
+            max_workers=max_concurrent_partition_loads,
+            thread_name_prefix=f"{self.__class__.__name__}_partition_loader",
+        )
+
+        def _submit_next_load():
+            next_path = next(paths_iter, None)
+            if next_path is not None:
+                partition_key, path = next_path
+                context.log.debug(f"Loading partition from {path} using {self.__class__.__name__}")
+                pending.append(
+                    (
+                        partition_key,
+                        path,
+                        executor.submit(self.load_from_path, context=context, path=path),
+                    )
+                )
+
+        try:
+            for _ in range(max_concurrent_partition_loads):
+                _submit_next_load()
+
+            while pending:
+                partition_key, path, future = pending.popleft()
+                # the next load is only submitted once this partition has been loaded, so that at
+                # most max_concurrent_partition_loads loaded partitions are held in memory
+                wait([future])
+                _submit_next_load()
+                yield partition_key, path, future.result
+        finally:
+            for _, _, future in pending:
+                future.cancel()
+            executor.shutdown(wait=True)
+
+    def _load_multiple_inputs(self, context: InputContext) -> Dict[str, Any]:
         # TODO: context.add_output_metadata fails in the partitioned context. this should be fixed?
-        return objs
+        return dict(self._iter_multiple_inputs(context))
 
     def load_input(self, context: InputContext) -> Union[Any, Dict[str, Any]]:
         if not context.has_asset_key:
@@ -175,6 +266,10 @@ def load_input(self, context: InputContext) -> Union[Any, Dict[str, Any]]:
                 else:
                     # we are dealing with multiple partitions of an asset
 
+                    if self._should_stream_partitions(context):
+                        # the partitions are loaded as the op consumes them
+                        return self._iter_multiple_inputs(context)
+
                     if (
                         context.dagster_type.typing_type != Any
                     ):  # skip type checking if the type is Any
@@ -228,9 +323,11 @@ def handle_output(self, context: OutputContext, obj: Any):
             path = self._get_path(context)
         path.parent.mkdir(parents=True, exist_ok=True)
         context.log.debug(f"Writing file at: {path}")
-        self.dump_to_path(context=context, obj=obj, path=path)
+        dump_metadata = self.dump_to_path(context=context, obj=obj, path=path)
 
         metadata = {"path": MetadataValue.path(path)}
+        if dump_metadata:
+            metadata.update(dump_metadata)
         custom_metadata = self.get_metadata(context=context, obj=obj)
         metadata.update(custom_metadata)  # type: ignore
 
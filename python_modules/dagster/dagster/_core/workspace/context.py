@@ -3,9 +3,10 @@
 import time
 import warnings
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from contextlib import ExitStack
 from itertools import count
-from typing import TYPE_CHECKING, Dict, Mapping, Optional, Sequence, Union, cast
+from typing import TYPE_CHECKING, Dict, Iterator, Mapping, Optional, Sequence, Union, cast
 
 import dagster._check as check
 from dagster._core.errors import (
@@ -385,6 +386,7 @@ def __init__(
         version: str = "",
         read_only: bool = False,
         grpc_server_registry=None,
+        max_concurrent_location_loads: Optional[int] = None,
     ):
         self._stack = ExitStack()
 
@@ -400,6 +402,16 @@ def __init__(
 
         self._version = version
 
+        self._max_concurrent_location_loads = check.opt_int_param(
+            max_concurrent_location_loads,
+            "max_concurrent_location_loads",
+            default=instance.code_server_max_concurrent_location_loads,
+        )
+        check.invariant(
+            self._max_concurrent_location_loads > 0,
+            "max_concurrent_location_loads must be a positive integer",
+        )
+
         # Guards changes to _location_dict, _location_error_dict, and _location_origin_dict
         self._lock = threading.Lock()
 
@@ -422,13 +434,13 @@ def __init__(
                     reload_interval=0,
                     heartbeat_ttl=DAGIT_GRPC_SERVER_HEARTBEAT_TTL,
                     startup_timeout=instance.code_server_process_startup_timeout,
+                    lazy_load_definitions=instance.code_server_lazy_load_definitions,
+                    use_zygotes=instance.code_server_use_zygotes,
                 )
             )
 
         self._location_entry_dict: Dict[str, WorkspaceLocationEntry] = {}
-        self._update_workspace(
-            {origin.location_name: self._load_location(origin) for origin in self._origins}
-        )
+        self.reload_workspace()
 
     @property
     def workspace_load_target(self):
@@ -525,6 +537,7 @@ def _load_location(self, origin: RepositoryLocationOrigin) -> WorkspaceLocationE
         location_name = origin.location_name
         location = None
         error = None
+        start_time = time.time()
         try:
             location = self._create_location_from_origin(origin)
         except Exception:
@@ -534,6 +547,7 @@ def _load_location(self, origin: RepositoryLocationOrigin) -> WorkspaceLocationE
                     location_name=location_name, error_string=error.to_string()
                 )
             )
+        end_time = time.time()
 
         return WorkspaceLocationEntry(
             origin=origin,
@@ -543,9 +557,26 @@ def _load_location(self, origin: RepositoryLocationOrigin) -> WorkspaceLocationE
             display_metadata=location.get_display_metadata()
             if location
             else origin.get_display_metadata(),
-            update_timestamp=time.time(),
+            update_timestamp=end_time,
+            load_duration=end_time - start_time,
         )
 
+    def _load_locations(
+        self, origins: Sequence[RepositoryLocationOrigin]
+    ) -> Iterator[WorkspaceLocationEntry]:
+        # Load locations on a bounded thread pool, yielding each entry as soon as it is ready so
+        # that fast locations don't wait behind slow ones
+        if not origins:
+            return
+
+        with ThreadPoolExecutor(
+            max_workers=min(len(origins), self._max_concurrent_location_loads),
+            thread_name_prefix="workspace_location_load",
+        ) as executor:
+            futures = [executor.submit(self._load_location, origin) for origin in origins]
+            for future in as_completed(futures):
+                yield future.result()
+
     def create_snapshot(self):
         with self._lock:
             return self._location_entry_dict.copy()
@@ -590,38 +621,64 @@ def shutdown_repository_location(self, name: str):
             self._location_entry_dict[name].origin.shutdown_server()
 
     def reload_workspace(self):
-        updated_locations = {
-            origin.location_name: self._load_location(origin) for origin in self._origins
-        }
-        self._update_workspace(updated_locations)
+        origins = self._origins
+        origin_names = {origin.location_name for origin in origins}
+        existing_names = self.repository_location_names
+
+        for name in existing_names:
+            if name not in origin_names:
+                self._update_location_entry(name, None)
+
+        # Hold a spot for new locations so that the workspace keeps the order of its origins,
+        # regardless of the order in which the locations finish loading
+        for origin in origins:
+            if origin.location_name not in existing_names:
+                self._update_location_entry(
+                    origin.location_name,
+                    WorkspaceLocationEntry(
+                        origin=origin,
+                        repository_location=None,
+                        load_error=None,
+                        load_status=WorkspaceLocationLoadStatus.LOADING,
+                        display_metadata=origin.get_display_metadata(),
+                        update_timestamp=time.time(),
+                    ),
+                )
 
-    def _update_workspace(self, new_locations: Dict[str, WorkspaceLocationEntry]):
+        # Publish each location as soon as it finishes loading. This happens on the calling
+        # thread, so watch threads are still only ever set up by a single thread.
+        for entry in self._load_locations(origins):
+            self._update_location_entry(entry.origin.location_name, entry)
+
+    def _update_location_entry(
+        self, location_name: str, new_entry: Optional[WorkspaceLocationEntry]
+    ) -> None:
         # minimize lock time by only holding while swapping data old to new
         with self._lock:
-            previous_events = self._watch_thread_shutdown_events
-            self._watch_thread_shutdown_events = {}
-
-            previous_threads = self._watch_threads
-            self._watch_threads = {}
+            previous_event = self._watch_thread_shutdown_events.pop(location_name, None)
+            previous_thread = self._watch_threads.pop(location_name, None)
 
-            previous_locations = self._location_entry_dict
-            self._location_entry_dict = new_locations
+            if new_entry:
+                previous_entry = self._location_entry_dict.get(location_name)
+                self._location_entry_dict[location_name] = new_entry
 
-            # start monitoring for new locations
-            for entry in self._location_entry_dict.values():
-                if isinstance(entry.origin, GrpcServerRepositoryLocationOrigin):
-                    self._start_watch_thread(entry.origin)
+                # start monitoring the new location once it has loaded
+                if new_entry.load_status == WorkspaceLocationLoadStatus.LOADED and isinstance(
+                    new_entry.origin, GrpcServerRepositoryLocationOrigin
+                ):
+                    self._start_watch_thread(new_entry.origin)
+            else:
+                previous_entry = self._location_entry_dict.pop(location_name, None)
 
-        # clean up previous locations
-        for event in previous_events.values():
-            event.set()
+        # clean up the previous location
+        if previous_event:
+            previous_event.set()
 
-        for watch_thread in previous_threads.values():
-            watch_thread.join()
+        if previous_thread:
+            previous_thread.join()
 
-        for entry in previous_locations.values():
-            if entry.repository_location:
-                entry.repository_location.cleanup()
+        if previous_entry and previous_entry.repository_location:
+            previous_entry.repository_location.cleanup()
 
     def create_request_context(self, source=None) -> WorkspaceRequestContext:
         return WorkspaceRequestContext(
@@ -650,7 +707,9 @@ def __enter__(self):
         return self
 
     def __exit__(self, exception_type, exception_value, traceback):
-        self._update_workspace({})  # update to empty to close all current locations
+        # close all current locations
+        for name in self.repository_location_names:
+            self._update_location_entry(name, None)
         self._stack.close()
 
     def copy_for_test_instance(self, instance: DagsterInstance) -> "WorkspaceProcessContext":
@@ -661,4 +720,5 @@ def copy_for_test_instance(self, instance: DagsterInstance) -> "WorkspaceProcess
             version=self.version,
             read_only=self.read_only,
             grpc_server_registry=self._grpc_server_registry,
+            max_concurrent_location_loads=self._max_concurrent_location_loads,
         )
@@ -20,6 +20,8 @@ class WorkspaceLocationEntry(NamedTuple):
     load_status: WorkspaceLocationLoadStatus
     display_metadata: Mapping[str, str]
     update_timestamp: float
+    # How long it took to load the location, in seconds. None while the location is still loading.
+    load_duration: Optional[float] = None
 
 
 class IWorkspace(ABC):
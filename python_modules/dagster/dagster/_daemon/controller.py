@@ -65,6 +65,8 @@ def create_daemon_grpc_server_registry(instance):
         reload_interval=DAEMON_GRPC_SERVER_RELOAD_INTERVAL,
         heartbeat_ttl=DAEMON_GRPC_SERVER_HEARTBEAT_TTL,
         startup_timeout=instance.code_server_process_startup_timeout,
+        lazy_load_definitions=instance.code_server_lazy_load_definitions,
+        use_zygotes=instance.code_server_use_zygotes,
     )
 
 
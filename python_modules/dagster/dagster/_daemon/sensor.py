@@ -7,7 +7,18 @@
 from collections import defaultdict
 from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import ExitStack
-from typing import Dict, Generator, List, Mapping, NamedTuple, Optional, Sequence, Union
+from typing import (
+    Dict,
+    Generator,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 import pendulum
 
@@ -16,10 +27,13 @@
 from dagster._core.definitions.run_request import InstigatorType, RunRequest
 from dagster._core.definitions.sensor_definition import DefaultSensorStatus, SensorExecutionData
 from dagster._core.definitions.utils import validate_tags
-from dagster._core.errors import DagsterError
+from dagster._core.errors import DagsterError, DagsterUserCodeProcessError
 from dagster._core.host_representation import PipelineSelector
 from dagster._core.host_representation.external import ExternalPipeline, ExternalSensor
-from dagster._core.host_representation.external_data import ExternalTargetData
+from dagster._core.host_representation.external_data import (
+    ExternalSensorExecutionErrorData,
+    ExternalTargetData,
+)
 from dagster._core.host_representation.repository_location import RepositoryLocation
 from dagster._core.instance import DagsterInstance
 from dagster._core.scheduler.instigation import (
@@ -34,6 +48,7 @@
 from dagster._core.storage.tags import RUN_KEY_TAG, SENSOR_NAME_TAG
 from dagster._core.telemetry import SENSOR_RUN_CREATED, hash_name, log_action
 from dagster._core.workspace.context import IWorkspaceProcessContext
+from dagster._grpc.types import SensorExecutionArgs
 from dagster._utils import merge_dicts
 from dagster._utils.error import SerializableErrorInfo, serializable_error_info_from_exc_info
 
@@ -355,6 +370,9 @@ def execute_sensor_iteration(
         yield
         return
 
+    # Sensors from the same location are evaluated together in a single request
+    sensor_batches: Dict[str, List[Tuple[ExternalSensor, Optional[Mapping]]]] = defaultdict(list)
+
     for external_sensor in sensors.values():
         sensor_name = external_sensor.name
         sensor_debug_crash_flags = debug_crash_flags.get(sensor_name) if debug_crash_flags else None
@@ -382,52 +400,177 @@ def execute_sensor_iteration(
             ):
                 continue
 
-            future = threadpool_executor.submit(
-                _process_tick,
+        sensor_batches[external_sensor.handle.location_name].append(
+            (external_sensor, sensor_debug_crash_flags)
+        )
+
+    for sensor_batch in sensor_batches.values():
+        if threadpool_executor:
+            # each sensor gets its own future, which is done once the tick of that sensor has been
+            # processed, however long the other sensors from its location take to evaluate
+            tick_futures: Dict[str, Future] = {}
+            for external_sensor, _ in sensor_batch:
+                selector_id = external_sensor.selector_id
+                tick_futures[selector_id] = Future()
+                check.not_none(sensor_tick_futures)[selector_id] = tick_futures[selector_id]
+
+            threadpool_executor.submit(
+                _process_tick_batch,
                 workspace_process_context,
                 logger,
-                external_sensor,
-                sensor_state,
+                sensor_batch,
                 sensor_state_lock,
-                sensor_debug_crash_flags,
                 tick_retention_settings,
+                threadpool_executor,
+                tick_futures,
             )
-            sensor_tick_futures[external_sensor.selector_id] = future
             yield
 
         else:
             # evaluate the sensors in a loop, synchronously, yielding to allow the sensor daemon to
             # heartbeat
-            yield from _process_tick_generator(
+            yield from _process_tick_batch_generator(
                 workspace_process_context,
                 logger,
-                external_sensor,
-                sensor_state,
+                sensor_batch,
                 sensor_state_lock,
-                sensor_debug_crash_flags,
                 tick_retention_settings,
             )
 
 
+_SensorResult = Union[SensorExecutionData, ExternalSensorExecutionErrorData, Exception]
+
+
+class _SensorToEvaluate(NamedTuple):
+    external_sensor: ExternalSensor
+    sensor_state: InstigatorState
+    tick_timestamp: float
+    sensor_debug_crash_flags: Optional[Mapping]
+
+
+def _process_tick_batch(
+    workspace_process_context: IWorkspaceProcessContext,
+    logger: logging.Logger,
+    sensor_batch: Sequence[Tuple[ExternalSensor, Optional[Mapping]]],
+    sensor_state_lock: threading.Lock,
+    tick_retention_settings,
+    threadpool_executor: ThreadPoolExecutor,
+    tick_futures: Mapping[str, Future],
+):
+    # evaluate the sensors from within a thread, so that the main thread is able to heartbeat to
+    # keep the daemon alive. The tick of each sensor is processed in a thread of its own as soon as
+    # the result of that sensor arrives
+    pending_tick_futures = dict(tick_futures)
+    try:
+        sensors_to_evaluate = _get_sensors_to_evaluate(
+            workspace_process_context.instance, sensor_batch, sensor_state_lock
+        )
+        for sensor_to_evaluate, sensor_result in _get_sensor_execution_results(
+            workspace_process_context, sensors_to_evaluate
+        ):
+            future = threadpool_executor.submit(
+                _process_tick,
+                workspace_process_context,
+                logger,
+                sensor_to_evaluate,
+                sensor_result,
+                sensor_state_lock,
+                tick_retention_settings,
+            )
+            tick_future = pending_tick_futures.pop(sensor_to_evaluate.external_sensor.selector_id)
+            future.add_done_callback(
+                lambda _, tick_future=tick_future: tick_future.set_result(None)
+            )
+    except Exception:
+        error_info = serializable_error_info_from_exc_info(sys.exc_info())
+        logger.error(f"Sensor daemon caught an error evaluating sensors: {error_info.to_string()}")
+    finally:
+        # no tick is processed for the sensors that weren't evaluated, e.g. because they were
+        # still within their minimum interval
+        for tick_future in pending_tick_futures.values():
+            tick_future.set_result(None)
+
+
+def _process_tick_batch_generator(
+    workspace_process_context: IWorkspaceProcessContext,
+    logger: logging.Logger,
+    sensor_batch: Sequence[Tuple[ExternalSensor, Optional[Mapping]]],
+    sensor_state_lock: threading.Lock,
+    tick_retention_settings,
+):
+    """Evaluates a batch of sensors from the same location with a single request to the location,
+    then creates the tick and launches the runs for each sensor in turn."""
+    sensors_to_evaluate = _get_sensors_to_evaluate(
+        workspace_process_context.instance, sensor_batch, sensor_state_lock
+    )
+    if not sensors_to_evaluate:
+        return
+
+    # the ticks are only created once the batch has been evaluated, so that an interrupted
+    # evaluation does not leave the ticks of the whole batch in the started state
+    sensor_results = list(
+        _get_sensor_execution_results(workspace_process_context, sensors_to_evaluate)
+    )
+    yield
+
+    for sensor_to_evaluate, sensor_result in sensor_results:
+        yield from _process_tick_generator(
+            workspace_process_context,
+            logger,
+            sensor_to_evaluate,
+            sensor_result,
+            sensor_state_lock,
+            tick_retention_settings,
+        )
+
+
+def _get_sensors_to_evaluate(
+    instance: DagsterInstance,
+    sensor_batch: Sequence[Tuple[ExternalSensor, Optional[Mapping]]],
+    sensor_state_lock: threading.Lock,
+) -> Sequence[_SensorToEvaluate]:
+    sensors_to_evaluate: List[_SensorToEvaluate] = []
+    for external_sensor, sensor_debug_crash_flags in sensor_batch:
+        with sensor_state_lock:
+            # acquire the lock to avoid a race condition where we're updating the recently touched
+            # timestamp on the sensor state, but clobbering it with an older timestamp which might
+            # open us up to a new evaluation being delegated within the minimum interval
+            now = pendulum.now("UTC")
+            sensor_state = check.not_none(
+                instance.get_instigator_state(
+                    external_sensor.get_external_origin_id(), external_sensor.selector_id
+                )
+            )
+            if _is_under_min_interval(sensor_state, external_sensor):
+                # check the since we might have been queued before processing
+                continue
+            else:
+                _mark_sensor_state_for_tick(instance, external_sensor, sensor_state, now)
+
+        sensors_to_evaluate.append(
+            _SensorToEvaluate(
+                external_sensor, sensor_state, now.timestamp(), sensor_debug_crash_flags
+            )
+        )
+
+    return sensors_to_evaluate
+
+
 def _process_tick(
     workspace_process_context: IWorkspaceProcessContext,
     logger: logging.Logger,
-    external_sensor: ExternalSensor,
-    sensor_state: InstigatorState,
+    sensor_to_evaluate: _SensorToEvaluate,
+    sensor_result: _SensorResult,
     sensor_state_lock: threading.Lock,
-    sensor_debug_crash_flags,
     tick_retention_settings,
 ):
-    # evaluate the tick immediately, but from within a thread.  The main thread should be able to
-    # heartbeat to keep the daemon alive
     list(
         _process_tick_generator(
             workspace_process_context,
             logger,
-            external_sensor,
-            sensor_state,
+            sensor_to_evaluate,
+            sensor_result,
             sensor_state_lock,
-            sensor_debug_crash_flags,
             tick_retention_settings,
         )
     )
@@ -436,38 +579,23 @@ def _process_tick(
 def _process_tick_generator(
     workspace_process_context: IWorkspaceProcessContext,
     logger: logging.Logger,
-    external_sensor: ExternalSensor,
-    sensor_state: InstigatorState,
+    sensor_to_evaluate: _SensorToEvaluate,
+    sensor_result: _SensorResult,
     sensor_state_lock: threading.Lock,
-    sensor_debug_crash_flags,
     tick_retention_settings,
 ):
     instance = workspace_process_context.instance
+    external_sensor = sensor_to_evaluate.external_sensor
+    sensor_debug_crash_flags = sensor_to_evaluate.sensor_debug_crash_flags
     error_info = None
-    with sensor_state_lock:
-        # acquire the lock to avoid a race condition where we're updating the recently touched
-        # timestamp on the sensor state, but clobbering it with an older timestamp which might open
-        # us up to a new evaluation being delegated within the minimum interval
-        now = pendulum.now("UTC")
-        sensor_state = check.not_none(
-            instance.get_instigator_state(
-                external_sensor.get_external_origin_id(), external_sensor.selector_id
-            )
-        )
-        if _is_under_min_interval(sensor_state, external_sensor):
-            # check the since we might have been queued before processing
-            return
-        else:
-            _mark_sensor_state_for_tick(instance, external_sensor, sensor_state, now)
-
     try:
         tick = instance.create_tick(
             TickData(
-                instigator_origin_id=sensor_state.instigator_origin_id,
-                instigator_name=sensor_state.instigator_name,
+                instigator_origin_id=sensor_to_evaluate.sensor_state.instigator_origin_id,
+                instigator_name=sensor_to_evaluate.sensor_state.instigator_name,
                 instigator_type=InstigatorType.SENSOR,
                 status=TickStatus.STARTED,
-                timestamp=now.timestamp(),
+                timestamp=sensor_to_evaluate.tick_timestamp,
                 selector_id=external_sensor.selector_id,
             )
         )
@@ -475,14 +603,19 @@ def _process_tick_generator(
         _check_for_debug_crash(sensor_debug_crash_flags, "TICK_CREATED")
 
         with SensorLaunchContext(
-            external_sensor, tick, instance, logger, tick_retention_settings, sensor_state_lock
+            external_sensor,
+            tick,
+            instance,
+            logger,
+            tick_retention_settings,
+            sensor_state_lock,
         ) as tick_context:
             _check_for_debug_crash(sensor_debug_crash_flags, "TICK_HELD")
             yield from _evaluate_sensor(
                 workspace_process_context,
                 tick_context,
                 external_sensor,
-                sensor_state,
+                sensor_result,
                 sensor_debug_crash_flags,
             )
 
@@ -495,6 +628,47 @@ def _process_tick_generator(
     yield error_info
 
 
+def _get_sensor_execution_results(
+    workspace_process_context: IWorkspaceProcessContext,
+    sensors_to_evaluate: Sequence[_SensorToEvaluate],
+) -> Iterator[Tuple[_SensorToEvaluate, _SensorResult]]:
+    """Evaluates sensors from the same location with a single request to the location, yielding
+    each sensor along with its result as soon as that result arrives. If the request fails, the
+    error is the result of every sensor that wasn't evaluated yet."""
+    if not sensors_to_evaluate:
+        return
+
+    sensor_execution_args = []
+    for sensor_to_evaluate in sensors_to_evaluate:
+        instigator_data = _sensor_instigator_data(sensor_to_evaluate.sensor_state)
+        sensor_execution_args.append(
+            SensorExecutionArgs(
+                repository_origin=sensor_to_evaluate.external_sensor.get_external_origin().external_repository_origin,
+                # the instance ref is sent once for the whole batch
+                instance_ref=None,
+                sensor_name=sensor_to_evaluate.external_sensor.name,
+                last_completion_time=instigator_data.last_tick_timestamp
+                if instigator_data
+                else None,
+                last_run_key=instigator_data.last_run_key if instigator_data else None,
+                cursor=instigator_data.cursor if instigator_data else None,
+            )
+        )
+
+    unevaluated_sensors = dict(enumerate(sensors_to_evaluate))
+    try:
+        repo_location = workspace_process_context.create_request_context().get_repository_location(
+            sensors_to_evaluate[0].external_sensor.handle.location_name
+        )
+        for index, sensor_result in repo_location.get_external_sensor_execution_data_batch(
+            workspace_process_context.instance, sensor_execution_args
+        ):
+            yield unevaluated_sensors.pop(index), sensor_result
+    except Exception as e:
+        for sensor_to_evaluate in unevaluated_sensors.values():
+            yield sensor_to_evaluate, e
+
+
 def _sensor_instigator_data(state: InstigatorState) -> Optional[SensorInstigatorData]:
     instigator_data = state.instigator_data
     if instigator_data is None or isinstance(instigator_data, SensorInstigatorData):
@@ -529,30 +703,23 @@ def _evaluate_sensor(
     workspace_process_context: IWorkspaceProcessContext,
     context: SensorLaunchContext,
     external_sensor: ExternalSensor,
-    state: InstigatorState,
+    sensor_result: Union[SensorExecutionData, ExternalSensorExecutionErrorData, Exception],
     sensor_debug_crash_flags=None,
 ):
     instance = workspace_process_context.instance
     context.logger.info(f"Checking for new runs for sensor: {external_sensor.name}")
 
     sensor_origin = external_sensor.get_external_origin()
-    repository_handle = external_sensor.handle.repository_handle
     repo_location = workspace_process_context.create_request_context().get_repository_location(
         sensor_origin.external_repository_origin.repository_location_origin.location_name
     )
 
-    instigator_data = _sensor_instigator_data(state)
-
-    sensor_runtime_data = repo_location.get_external_sensor_execution_data(
-        instance,
-        repository_handle,
-        external_sensor.name,
-        instigator_data.last_tick_timestamp if instigator_data else None,
-        instigator_data.last_run_key if instigator_data else None,
-        instigator_data.cursor if instigator_data else None,
-    )
+    if isinstance(sensor_result, Exception):
+        raise sensor_result
+    elif isinstance(sensor_result, ExternalSensorExecutionErrorData):
+        raise DagsterUserCodeProcessError.from_error_info(sensor_result.error)
 
-    yield
+    sensor_runtime_data = sensor_result
 
     if sensor_runtime_data.captured_log_key:
         context.add_log_info(sensor_runtime_data.captured_log_key)
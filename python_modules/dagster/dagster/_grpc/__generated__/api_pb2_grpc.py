@@ -137,6 +137,16 @@ def __init__(self, channel):
             request_serializer=api__pb2.Empty.SerializeToString,
             response_deserializer=api__pb2.GetCurrentRunsReply.FromString,
         )
+        self.ExternalScheduleExecutionBatch = channel.unary_stream(
+            "/api.DagsterApi/ExternalScheduleExecutionBatch",
+            request_serializer=api__pb2.ExternalScheduleExecutionBatchRequest.SerializeToString,
+            response_deserializer=api__pb2.StreamingChunkEvent.FromString,
+        )
+        self.ExternalSensorExecutionBatch = channel.unary_stream(
+            "/api.DagsterApi/ExternalSensorExecutionBatch",
+            request_serializer=api__pb2.ExternalSensorExecutionBatchRequest.SerializeToString,
+            response_deserializer=api__pb2.StreamingChunkEvent.FromString,
+        )
 
 
 class DagsterApiServicer(object):
@@ -280,6 +290,18 @@ def GetCurrentRuns(self, request, context):
         context.set_details("Method not implemented!")
         raise NotImplementedError("Method not implemented!")
 
+    def ExternalScheduleExecutionBatch(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
+    def ExternalSensorExecutionBatch(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
 
 def add_DagsterApiServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -398,6 +420,16 @@ def add_DagsterApiServicer_to_server(servicer, server):
             request_deserializer=api__pb2.Empty.FromString,
             response_serializer=api__pb2.GetCurrentRunsReply.SerializeToString,
         ),
+        "ExternalScheduleExecutionBatch": grpc.unary_stream_rpc_method_handler(
+            servicer.ExternalScheduleExecutionBatch,
+            request_deserializer=api__pb2.ExternalScheduleExecutionBatchRequest.FromString,
+            response_serializer=api__pb2.StreamingChunkEvent.SerializeToString,
+        ),
+        "ExternalSensorExecutionBatch": grpc.unary_stream_rpc_method_handler(
+            servicer.ExternalSensorExecutionBatch,
+            request_deserializer=api__pb2.ExternalSensorExecutionBatchRequest.FromString,
+            response_serializer=api__pb2.StreamingChunkEvent.SerializeToString,
+        ),
     }
     generic_handler = grpc.method_handlers_generic_handler("api.DagsterApi", rpc_method_handlers)
     server.add_generic_rpc_handlers((generic_handler,))
@@ -1073,3 +1105,61 @@ def GetCurrentRuns(
             timeout,
             metadata,
         )
+
+    @staticmethod
+    def ExternalScheduleExecutionBatch(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            "/api.DagsterApi/ExternalScheduleExecutionBatch",
+            api__pb2.ExternalScheduleExecutionBatchRequest.SerializeToString,
+            api__pb2.StreamingChunkEvent.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+        )
+
+    @staticmethod
+    def ExternalSensorExecutionBatch(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            "/api.DagsterApi/ExternalSensorExecutionBatch",
+            api__pb2.ExternalSensorExecutionBatchRequest.SerializeToString,
+            api__pb2.StreamingChunkEvent.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+        )
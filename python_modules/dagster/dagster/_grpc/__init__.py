@@ -7,33 +7,77 @@
 The GRPC layer is not intended to supplant the dagster-graphql layer, which should still be used to
 drive web frontends like dagit.
 """
+import importlib
+from typing import TYPE_CHECKING, Any, Mapping
 
-from .client import DagsterGrpcClient, client_heartbeat_thread, ephemeral_grpc_api_client
-from .impl import core_execute_run
-from .server import DagsterGrpcServer, GrpcServerProcess
-from .types import (
-    CanCancelExecutionRequest,
-    CanCancelExecutionResult,
-    CancelExecutionRequest,
-    CancelExecutionResult,
-    ExecuteExternalPipelineArgs,
-    ExecuteRunArgs,
-    ExecuteStepArgs,
-    ExecutionPlanSnapshotArgs,
-    ExternalJobArgs,
-    ExternalScheduleExecutionArgs,
-    GetCurrentImageResult,
-    ListRepositoriesInput,
-    ListRepositoriesResponse,
-    LoadableRepositorySymbol,
-    NotebookPathArgs,
-    PartitionArgs,
-    PartitionNamesArgs,
-    PartitionSetExecutionParamArgs,
-    PipelineSubsetSnapshotArgs,
-    ResumeRunArgs,
-    SensorExecutionArgs,
-    ShutdownServerResult,
-    StartRunResult,
-)
-from .utils import get_loadable_targets
+if TYPE_CHECKING:
+    from .client import DagsterGrpcClient, client_heartbeat_thread, ephemeral_grpc_api_client
+    from .impl import core_execute_run
+    from .server import DagsterGrpcServer, GrpcServerProcess
+    from .types import (
+        CanCancelExecutionRequest,
+        CanCancelExecutionResult,
+        CancelExecutionRequest,
+        CancelExecutionResult,
+        ExecuteExternalPipelineArgs,
+        ExecuteRunArgs,
+        ExecuteStepArgs,
+        ExecutionPlanSnapshotArgs,
+        ExternalJobArgs,
+        ExternalScheduleExecutionArgs,
+        GetCurrentImageResult,
+        ListRepositoriesInput,
+        ListRepositoriesResponse,
+        LoadableRepositorySymbol,
+        NotebookPathArgs,
+        PartitionArgs,
+        PartitionNamesArgs,
+        PartitionSetExecutionParamArgs,
+        PipelineSubsetSnapshotArgs,
+        ResumeRunArgs,
+        SensorExecutionArgs,
+        ShutdownServerResult,
+        StartRunResult,
+    )
+    from .utils import get_loadable_targets
+
+# Submodules are imported on first access, so that importing e.g. `dagster._grpc.types` to
+# (de)serialize API arguments does not import grpc and the generated protobuf modules.
+_EXPORTS: Mapping[str, str] = {
+    "DagsterGrpcClient": ".client",
+    "client_heartbeat_thread": ".client",
+    "ephemeral_grpc_api_client": ".client",
+    "core_execute_run": ".impl",
+    "DagsterGrpcServer": ".server",
+    "GrpcServerProcess": ".server",
+    "CanCancelExecutionRequest": ".types",
+    "CanCancelExecutionResult": ".types",
+    "CancelExecutionRequest": ".types",
+    "CancelExecutionResult": ".types",
+    "ExecuteExternalPipelineArgs": ".types",
+    "ExecuteRunArgs": ".types",
+    "ExecuteStepArgs": ".types",
+    "ExecutionPlanSnapshotArgs": ".types",
+    "ExternalJobArgs": ".types",
+    "ExternalScheduleExecutionArgs": ".types",
+    "GetCurrentImageResult": ".types",
+    "ListRepositoriesInput": ".types",
+    "ListRepositoriesResponse": ".types",
+    "LoadableRepositorySymbol": ".types",
+    "NotebookPathArgs": ".types",
+    "PartitionArgs": ".types",
+    "PartitionNamesArgs": ".types",
+    "PartitionSetExecutionParamArgs": ".types",
+    "PipelineSubsetSnapshotArgs": ".types",
+    "ResumeRunArgs": ".types",
+    "SensorExecutionArgs": ".types",
+    "ShutdownServerResult": ".types",
+    "StartRunResult": ".types",
+    "get_loadable_targets": ".utils",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    raise AttributeError("module '{}' has no attribute '{}'".format(__name__, name))
@@ -1,6 +1,7 @@
 import os
 import subprocess
 import sys
+import threading
 import warnings
 from contextlib import contextmanager
 from typing import Iterator, Optional, Sequence, Tuple
@@ -27,11 +28,13 @@
     ExecuteExternalPipelineArgs,
     ExecutionPlanSnapshotArgs,
     ExternalScheduleExecutionArgs,
+    ExternalScheduleExecutionBatchArgs,
     PartitionArgs,
     PartitionNamesArgs,
     PartitionSetExecutionParamArgs,
     PipelineSubsetSnapshotArgs,
     SensorExecutionArgs,
+    SensorExecutionBatchArgs,
 )
 from .utils import default_grpc_timeout, max_rx_bytes, max_send_bytes
 
@@ -52,6 +55,11 @@ def client_heartbeat_thread(client, shutdown_event):
             continue
 
 
+def _is_unimplemented_error(error: DagsterUserCodeUnreachableError) -> bool:
+    cause = error.__cause__
+    return isinstance(cause, grpc.Call) and cause.code() == grpc.StatusCode.UNIMPLEMENTED
+
+
 class DagsterGrpcClient:
     def __init__(
         self,
@@ -340,7 +348,9 @@ def streaming_external_repository(
                 "serialized_external_repository_chunk": res.serialized_external_repository_chunk,
             }
 
-    def external_schedule_execution(self, external_schedule_execution_args):
+    def external_schedule_execution(
+        self, external_schedule_execution_args, timeout=DEFAULT_GRPC_TIMEOUT
+    ):
         check.inst_param(
             external_schedule_execution_args,
             "external_schedule_execution_args",
@@ -351,6 +361,7 @@ def external_schedule_execution(self, external_schedule_execution_args):
             self._streaming_query(
                 "ExternalScheduleExecution",
                 api_pb2.ExternalScheduleExecutionRequest,
+                timeout=timeout,
                 serialized_external_schedule_execution_args=serialize_dagster_namedtuple(
                     external_schedule_execution_args
                 ),
@@ -379,6 +390,94 @@ def external_sensor_execution(self, sensor_execution_args, timeout=DEFAULT_GRPC_
 
         return "".join([chunk.serialized_chunk for chunk in chunks])
 
+    def _streaming_batch_query(self, method, request_type, timeout=DEFAULT_GRPC_TIMEOUT, **kwargs):
+        """Yields the index in the batch and the serialized result of each item of a batched
+        request, as soon as the server finishes evaluating it. Rather than bounding the whole
+        request with a single deadline, the request is cancelled once no result has arrived for
+        ``timeout`` seconds, so that the time allowed for a batch doesn't depend on its size.
+        """
+        try:
+            with self._channel() as channel:
+                stub = DagsterApiStub(channel)
+                response = getattr(stub, method)(request_type(**kwargs), metadata=self._metadata)
+                timer = threading.Timer(timeout, response.cancel)
+                timer.start()
+                try:
+                    chunks = []
+                    for chunk in response:
+                        if chunk.serialized_chunk:
+                            chunks.append(chunk.serialized_chunk)
+                            continue
+
+                        # an empty chunk marks the end of the result for an item
+                        timer.cancel()
+                        timer = threading.Timer(timeout, response.cancel)
+                        timer.start()
+                        yield chunk.sequence_number, "".join(chunks)
+                        chunks = []
+                finally:
+                    timer.cancel()
+        except Exception as e:
+            raise DagsterUserCodeUnreachableError("Could not reach user code server") from e
+
+    def external_schedule_execution_batch(
+        self, external_schedule_execution_batch_args, timeout=DEFAULT_GRPC_TIMEOUT
+    ) -> Iterator[Tuple[int, str]]:
+        check.inst_param(
+            external_schedule_execution_batch_args,
+            "external_schedule_execution_batch_args",
+            ExternalScheduleExecutionBatchArgs,
+        )
+
+        try:
+            yield from self._streaming_batch_query(
+                "ExternalScheduleExecutionBatch",
+                api_pb2.ExternalScheduleExecutionBatchRequest,
+                timeout=timeout,
+                serialized_external_schedule_execution_batch_args=serialize_dagster_namedtuple(
+                    external_schedule_execution_batch_args
+                ),
+            )
+        except DagsterUserCodeUnreachableError as e:
+            if not _is_unimplemented_error(e):
+                raise
+
+            # Servers from older versions of dagster can only evaluate one schedule per request
+            batch_args = external_schedule_execution_batch_args
+            for i, args in enumerate(batch_args.schedule_execution_args):
+                yield i, self.external_schedule_execution(
+                    args._replace(instance_ref=batch_args.instance_ref), timeout=timeout
+                )
+
+    def external_sensor_execution_batch(
+        self, sensor_execution_batch_args, timeout=DEFAULT_GRPC_TIMEOUT
+    ) -> Iterator[Tuple[int, str]]:
+        check.inst_param(
+            sensor_execution_batch_args,
+            "sensor_execution_batch_args",
+            SensorExecutionBatchArgs,
+        )
+
+        try:
+            yield from self._streaming_batch_query(
+                "ExternalSensorExecutionBatch",
+                api_pb2.ExternalSensorExecutionBatchRequest,
+                timeout=timeout,
+                serialized_external_sensor_execution_batch_args=serialize_dagster_namedtuple(
+                    sensor_execution_batch_args
+                ),
+            )
+        except DagsterUserCodeUnreachableError as e:
+            if not _is_unimplemented_error(e):
+                raise
+
+            # Servers from older versions of dagster can only evaluate one sensor per request
+            for i, args in enumerate(sensor_execution_batch_args.sensor_execution_args):
+                yield i, self.external_sensor_execution(
+                    args._replace(instance_ref=sensor_execution_batch_args.instance_ref),
+                    timeout=timeout,
+                )
+
     def external_notebook_data(self, notebook_path: str):
         check.str_param(notebook_path, "notebook_path")
         res = self._query(
@@ -480,7 +579,11 @@ class EphemeralDagsterGrpcClient(DagsterGrpcClient):
     def __init__(
         self, server_process=None, *args, **kwargs
     ):  # pylint: disable=keyword-arg-before-vararg
-        self._server_process = check.inst_param(server_process, "server_process", subprocess.Popen)
+        from .zygote import ForkedProcessHandle
+
+        self._server_process = check.inst_param(
+            server_process, "server_process", (subprocess.Popen, ForkedProcessHandle)
+        )
         super(EphemeralDagsterGrpcClient, self).__init__(*args, **kwargs)
 
     def cleanup_server(self):
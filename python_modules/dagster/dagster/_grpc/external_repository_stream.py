@@ -0,0 +1,182 @@
+"""Streams an ExternalRepositoryData from the gRPC server to its clients as a sequence of records,
+one per schedule, partition set, sensor, asset node and job, that the client decodes as they arrive.
+
+Serializing the whole ExternalRepositoryData into a single string and reassembling that string
+on the client means that both the server and the client hold the complete serialized repository
+in memory in addition to the objects it was serialized from or is deserialized into. With a
+record stream, only one record is held in its serialized form at a time.
+
+The stream is made up of newline-terminated frames, several of which may be packed into a single
+chunk, and any of which may be split across chunks if it is too large for one. Frames are laid out
+so that concatenating every chunk produces the same JSON document (give or take whitespace and a
+marker field that deserialization ignores) as serializing the ExternalRepositoryData at once, so
+that clients that reassemble the whole string before deserializing it keep working:
+
+    {"__record_stream__": 1, "__class__": "ExternalRepositoryData", "name": "my_repo", ...
+    , "external_schedule_datas": [
+    {"__class__": "ExternalScheduleData", ...}
+    , {"__class__": "ExternalScheduleData", ...}
+    ]
+    ...
+    }
+"""
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
+
+import dagster._check as check
+import dagster._seven as seven
+from dagster._core.host_representation.external_data import (
+    ExternalRepositoryData,
+    ExternalRepositoryErrorData,
+)
+from dagster._serdes import (
+    deserialize_as,
+    deserialize_json_to_dagster_namedtuple,
+    pack_value,
+    serialize_dagster_namedtuple,
+    unpack_value,
+)
+
+# The first frame of a record stream starts with this field, which is never produced by serializing
+# an ExternalRepositoryData at once, and which is ignored when deserializing the concatenated chunks
+RECORD_STREAM_PREFIX = '{"__record_stream__": 1, '
+
+_FRAME_END = "\n"
+_CLOSE_FIELD_FRAME = "]"
+_CLOSE_REPOSITORY_FRAME = "}"
+
+
+def serialize_external_repository_data_in_chunks(
+    external_repository_data: Union[ExternalRepositoryData, ExternalRepositoryErrorData],
+    max_chunk_size: int,
+) -> Iterator[str]:
+    """Serializes the external repository data into a record stream, packed into chunks of at
+    most max_chunk_size characters.
+    """
+    check.int_param(max_chunk_size, "max_chunk_size")
+    if isinstance(external_repository_data, ExternalRepositoryErrorData):
+        frames: Iterable[str] = [serialize_dagster_namedtuple(external_repository_data)]
+    else:
+        frames = _iter_external_repository_data_frames(external_repository_data)
+    return _pack_frames_into_chunks(frames, max_chunk_size)
+
+
+def _iter_external_repository_data_frames(
+    external_repository_data: ExternalRepositoryData,
+) -> Iterator[str]:
+    # fields that hold a sequence of records are streamed one record at a time, and every other
+    # field (e.g. the name, or a sequence field that is None) is sent up front in the first frame
+    streamed_fields = {
+        field_name: records
+        for field_name, records in external_repository_data._asdict().items()
+        if isinstance(records, (list, tuple))
+    }
+    header = {
+        field_name: pack_value(value)
+        for field_name, value in external_repository_data._asdict().items()
+        if field_name not in streamed_fields
+    }
+    header["__class__"] = "ExternalRepositoryData"
+    yield RECORD_STREAM_PREFIX + seven.json.dumps(header)[1:-1]
+
+    for field_name, records in streamed_fields.items():
+        yield f", {seven.json.dumps(field_name)}: ["
+        for i, record in enumerate(records):
+            serialized_record = serialize_dagster_namedtuple(record)
+            yield serialized_record if i == 0 else ", " + serialized_record
+        yield _CLOSE_FIELD_FRAME
+
+    yield _CLOSE_REPOSITORY_FRAME
+
+
+def _pack_frames_into_chunks(frames: Iterable[str], max_chunk_size: int) -> Iterator[str]:
+    chunk: List[str] = []
+    chunk_size = 0
+    for frame in frames:
+        frame = frame + _FRAME_END
+        if chunk and chunk_size + len(frame) > max_chunk_size:
+            yield "".join(chunk)
+            chunk = []
+            chunk_size = 0
+
+        # frames that don't fit in a chunk of their own are split across several
+        while len(frame) > max_chunk_size:
+            yield frame[:max_chunk_size]
+            frame = frame[max_chunk_size:]
+
+        chunk.append(frame)
+        chunk_size += len(frame)
+
+    if chunk:
+        yield "".join(chunk)
+
+
+def deserialize_external_repository_data_chunks(
+    chunks: Iterable[str],
+) -> Union[ExternalRepositoryData, ExternalRepositoryErrorData]:
+    """Deserializes the external repository data from the chunks streamed by the server, decoding
+    each record as soon as it has been received.
+
+    Also accepts the chunks of a single serialized ExternalRepositoryData, as streamed by servers
+    running older versions of dagster.
+    """
+    chunk_iterator = iter(chunks)
+    first_chunk = next(chunk_iterator, "")
+    if not first_chunk.startswith(RECORD_STREAM_PREFIX):
+        return deserialize_as(
+            "".join([first_chunk, *chunk_iterator]),
+            (ExternalRepositoryData, ExternalRepositoryErrorData),
+        )
+
+    header: Optional[Dict[str, Any]] = None
+    records_by_field: Dict[str, List[Any]] = {}
+    current_records: Optional[List[Any]] = None
+    for frame in _iter_frames([first_chunk], chunk_iterator):
+        if header is None:
+            header = seven.json.loads(frame + "}")
+        elif frame == _CLOSE_REPOSITORY_FRAME:
+            break
+        elif frame == _CLOSE_FIELD_FRAME:
+            current_records = None
+        elif current_records is None:
+            # frames that open a field look like `, "field_name": [`
+            (field_name,) = seven.json.loads("{" + frame[2:] + "]}").keys()
+            current_records = records_by_field.setdefault(field_name, [])
+        else:
+            current_records.append(
+                deserialize_json_to_dagster_namedtuple(
+                    frame[2:] if frame.startswith(", ") else frame
+                )
+            )
+    else:
+        check.failed("External repository data stream ended before it was complete")
+
+    header_fields = {
+        field_name: unpack_value(value)
+        for field_name, value in check.not_none(header).items()
+        if field_name in ExternalRepositoryData._fields
+    }
+    return ExternalRepositoryData(
+        **header_fields,
+        **{
+            field_name: records
+            for field_name, records in records_by_field.items()
+            if field_name in ExternalRepositoryData._fields
+        },
+    )
+
+
+def _iter_frames(*chunk_iterables: Iterable[str]) -> Iterator[str]:
+    partial_frame: List[str] = []
+    for chunk_iterable in chunk_iterables:
+        for chunk in chunk_iterable:
+            frames = chunk.split(_FRAME_END)
+            # the last element is the start of a frame that continues in the next chunk, or an
+            # empty string if the chunk ends with a complete frame
+            for frame in frames[:-1]:
+                if partial_frame:
+                    partial_frame.append(frame)
+                    frame = "".join(partial_frame)
+                    partial_frame = []
+                yield frame
+            if frames[-1]:
+                partial_frame.append(frames[-1])
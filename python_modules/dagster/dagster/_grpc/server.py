@@ -6,11 +6,11 @@
 import threading
 import time
 import uuid
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from multiprocessing.synchronize import Event as MPEvent
 from threading import Event as ThreadingEventType
 from time import sleep
-from typing import Dict, List, Mapping, NamedTuple, Optional, Sequence, Tuple
+from typing import Dict, List, Mapping, NamedTuple, Optional, Sequence, Tuple, Union
 
 import grpc
 from grpc_health.v1 import health, health_pb2, health_pb2_grpc
@@ -22,7 +22,10 @@
 from dagster._core.definitions.repository_definition import RepositoryDefinition
 from dagster._core.errors import DagsterUserCodeUnreachableError
 from dagster._core.host_representation.external_data import (
+    ExternalRepositoryData,
     ExternalRepositoryErrorData,
+    ExternalScheduleExecutionErrorData,
+    ExternalSensorExecutionErrorData,
     external_pipeline_data_from_def,
     external_repository_data_from_def,
 )
@@ -30,13 +33,19 @@
 from dagster._core.instance import DagsterInstance, InstanceRef
 from dagster._core.origin import DEFAULT_DAGSTER_ENTRY_POINT, get_python_environment_entry_point
 from dagster._core.types.loadable_target_origin import LoadableTargetOrigin
-from dagster._serdes import deserialize_as, serialize_dagster_namedtuple, whitelist_for_serdes
+from dagster._serdes import (
+    deserialize_as,
+    serialize_dagster_namedtuple,
+    serialize_value,
+    whitelist_for_serdes,
+)
 from dagster._serdes.ipc import IPCErrorMessage, ipc_write_stream, open_ipc_subprocess
 from dagster._utils import find_free_port, frozenlist, safe_tempfile_path_unmanaged
 from dagster._utils.error import SerializableErrorInfo, serializable_error_info_from_exc_info
 
 from .__generated__ import api_pb2
 from .__generated__.api_pb2_grpc import DagsterApiServicer, add_DagsterApiServicer_to_server
+from .external_repository_stream import serialize_external_repository_data_in_chunks
 from .impl import (
     RunInSubprocessComplete,
     StartRunInSubprocessSuccessful,
@@ -59,6 +68,7 @@
     ExecuteExternalPipelineArgs,
     ExecutionPlanSnapshotArgs,
     ExternalScheduleExecutionArgs,
+    ExternalScheduleExecutionBatchArgs,
     GetCurrentImageResult,
     GetCurrentRunsResult,
     ListRepositoriesResponse,
@@ -68,6 +78,7 @@
     PartitionSetExecutionParamArgs,
     PipelineSubsetSnapshotArgs,
     SensorExecutionArgs,
+    SensorExecutionBatchArgs,
     ShutdownServerResult,
     StartRunResult,
 )
@@ -79,6 +90,9 @@
 
 STREAMING_CHUNK_SIZE = 4000000
 
+# Maximum number of schedules or sensors from a single batched request that are evaluated at once
+MAX_BATCH_EVALUATION_WORKERS = 8
+
 
 class CouldNotBindGrpcServerToAddress(Exception):
     pass
@@ -90,6 +104,7 @@ def __init__(
         loadable_target_origin: Optional[LoadableTargetOrigin],
         entry_point: Sequence[str],
         container_image: Optional[str] = None,
+        lazy_load_definitions: bool = False,
     ):
         self._loadable_target_origin = loadable_target_origin
 
@@ -118,10 +133,12 @@ def __init__(
                 entry_point=entry_point,
             )
             repo_def = recon_repo.get_definition()
-            # force load of all lazy constructed code artifacts to prevent
-            # any thread-safety issues loading them later on when serving
-            # definitions from multiple threads
-            repo_def.load_all_definitions()
+            if not lazy_load_definitions:
+                # force load of all lazy constructed code artifacts up front. When loading
+                # definitions lazily, each one is instead constructed the first time a request
+                # names it (guarded by a lock in the repository data, since requests are served
+                # from multiple threads)
+                repo_def.load_all_definitions()
 
             self._code_pointers_by_repo_name[repo_def.name] = pointer
             self._recon_repos_by_name[repo_def.name] = recon_repo
@@ -189,12 +206,15 @@ def __init__(
         inject_env_vars_from_instance: Optional[bool] = False,
         instance_ref: Optional[InstanceRef] = None,
         location_name: Optional[str] = None,
+        lazy_load_definitions: bool = False,
+        preloaded_repositories: Optional[Union[LoadedRepositories, SerializableErrorInfo]] = None,
     ):
         super(DagsterApiServer, self).__init__()
 
         check.bool_param(heartbeat, "heartbeat")
         check.int_param(heartbeat_timeout, "heartbeat_timeout")
         check.invariant(heartbeat_timeout > 0, "heartbeat_timeout must be greater than 0")
+        check.bool_param(lazy_load_definitions, "lazy_load_definitions")
 
         self._server_termination_event = check.inst_param(
             server_termination_event, "server_termination_event", ThreadingEventType
@@ -230,25 +250,42 @@ def __init__(
         self._container_image = check.opt_str_param(container_image, "container_image")
         self._container_context = check.opt_dict_param(container_context, "container_context")
 
-        try:
-            if inject_env_vars_from_instance:
-                # If arguments indicate it wants to load env vars, use the passed-in instance
-                # ref (or the dagster.yaml on the filesystem if no instance ref is provided)
-                with DagsterInstance.from_ref(
-                    instance_ref
-                ) if instance_ref else DagsterInstance.get() as instance:
-                    instance.inject_env_vars(location_name)
-
-            self._loaded_repositories: Optional[LoadedRepositories] = LoadedRepositories(
-                loadable_target_origin,
-                self._entry_point,
-                self._container_image,
+        self._loaded_repositories: Optional[LoadedRepositories] = None
+
+        if preloaded_repositories is not None:
+            # The code was already loaded (and any env vars injected) by the zygote process that
+            # this server was forked from
+            check.inst_param(
+                preloaded_repositories,
+                "preloaded_repositories",
+                (LoadedRepositories, SerializableErrorInfo),
             )
-        except Exception:
-            if not lazy_load_user_code:
-                raise
-            self._loaded_repositories = None
-            self._serializable_load_error = serializable_error_info_from_exc_info(sys.exc_info())
+            if isinstance(preloaded_repositories, SerializableErrorInfo):
+                self._serializable_load_error = preloaded_repositories
+            else:
+                self._loaded_repositories = preloaded_repositories
+        else:
+            try:
+                if inject_env_vars_from_instance:
+                    # If arguments indicate it wants to load env vars, use the passed-in instance
+                    # ref (or the dagster.yaml on the filesystem if no instance ref is provided)
+                    with DagsterInstance.from_ref(
+                        instance_ref
+                    ) if instance_ref else DagsterInstance.get() as instance:
+                        instance.inject_env_vars(location_name)
+
+                self._loaded_repositories = LoadedRepositories(
+                    loadable_target_origin,
+                    self._entry_point,
+                    self._container_image,
+                    lazy_load_definitions=lazy_load_definitions,
+                )
+            except Exception:
+                if not lazy_load_user_code:
+                    raise
+                self._serializable_load_error = serializable_error_info_from_exc_info(
+                    sys.exc_info()
+                )
 
         self.__last_heartbeat_time = time.time()
         if heartbeat:
@@ -479,28 +516,29 @@ def ExternalPipelineSubsetSnapshot(self, request, _context):
             )
         )
 
-    def _get_serialized_external_repository_data(self, request):
+    def _get_external_repository_data(
+        self, request
+    ) -> Union[ExternalRepositoryData, ExternalRepositoryErrorData]:
         try:
             repository_origin = deserialize_as(
                 request.serialized_repository_python_origin,
                 ExternalRepositoryOrigin,
             )
 
-            return serialize_dagster_namedtuple(
-                external_repository_data_from_def(
-                    self._get_repo_for_origin(repository_origin),
-                    defer_snapshots=request.defer_snapshots,
-                )
+            return external_repository_data_from_def(
+                self._get_repo_for_origin(repository_origin),
+                defer_snapshots=request.defer_snapshots,
             )
         except Exception:
-            return serialize_dagster_namedtuple(
-                ExternalRepositoryErrorData(serializable_error_info_from_exc_info(sys.exc_info()))
+            return ExternalRepositoryErrorData(
+                serializable_error_info_from_exc_info(sys.exc_info())
             )
 
     def ExternalRepository(self, request, _context):
-        serialized_external_repository_data = self._get_serialized_external_repository_data(request)
         return api_pb2.ExternalRepositoryReply(
-            serialized_external_repository_data=serialized_external_repository_data,
+            serialized_external_repository_data=serialize_dagster_namedtuple(
+                self._get_external_repository_data(request)
+            ),
         )
 
     def ExternalJob(self, request, _context):
@@ -521,24 +559,15 @@ def ExternalJob(self, request, _context):
             )
 
     def StreamingExternalRepository(self, request, _context):
-        serialized_external_repository_data = self._get_serialized_external_repository_data(request)
-
-        num_chunks = int(
-            math.ceil(float(len(serialized_external_repository_data)) / STREAMING_CHUNK_SIZE)
+        # streamed as a sequence of records rather than as slices of the whole serialized
+        # repository, so that neither side has to hold all of it in serialized form at once
+        chunks = serialize_external_repository_data_in_chunks(
+            self._get_external_repository_data(request), max_chunk_size=STREAMING_CHUNK_SIZE
         )
-
-        for i in range(num_chunks):
-            start_index = i * STREAMING_CHUNK_SIZE
-            end_index = min(
-                (i + 1) * STREAMING_CHUNK_SIZE,
-                len(serialized_external_repository_data),
-            )
-
+        for i, chunk in enumerate(chunks):
             yield api_pb2.StreamingExternalRepositoryEvent(
                 sequence_number=i,
-                serialized_external_repository_chunk=serialized_external_repository_data[
-                    start_index:end_index
-                ],
+                serialized_external_repository_chunk=chunk,
             )
 
     def _split_serialized_data_into_chunk_events(self, serialized_data):
@@ -591,6 +620,92 @@ def ExternalSensorExecution(self, request, _context):
 
         yield from self._split_serialized_data_into_chunk_events(serialized_sensor_data)
 
+    def _evaluate_batch(self, evaluate_fn, items):
+        # Yields the index and result of each item as soon as its evaluation finishes, so that a
+        # slow item does not hold back the results of the rest of the batch
+        if len(items) <= 1:
+            for i, item in enumerate(items):
+                yield i, evaluate_fn(item)
+            return
+
+        with ThreadPoolExecutor(
+            max_workers=min(len(items), MAX_BATCH_EVALUATION_WORKERS),
+            thread_name_prefix="grpc_batch_evaluation",
+        ) as executor:
+            futures = {executor.submit(evaluate_fn, item): i for i, item in enumerate(items)}
+            try:
+                for future in as_completed(futures):
+                    yield futures[future], future.result()
+            finally:
+                # don't start evaluating the rest of the batch if the request was cancelled
+                for future in futures:
+                    future.cancel()
+
+    def _split_batch_results_into_chunk_events(self, indexed_results):
+        # The chunks of each result are numbered with the index of its item in the batch and are
+        # followed by an empty chunk, which marks that the result is complete
+        for index, result in indexed_results:
+            for chunk_event in self._split_serialized_data_into_chunk_events(
+                serialize_value(result)
+            ):
+                yield api_pb2.StreamingChunkEvent(
+                    sequence_number=index, serialized_chunk=chunk_event.serialized_chunk
+                )
+            yield api_pb2.StreamingChunkEvent(sequence_number=index, serialized_chunk="")
+
+    def ExternalScheduleExecutionBatch(self, request, _context):
+        batch_args = deserialize_as(
+            request.serialized_external_schedule_execution_batch_args,
+            ExternalScheduleExecutionBatchArgs,
+        )
+
+        def _evaluate_schedule(args: ExternalScheduleExecutionArgs):
+            # An error for one schedule (including a schedule or repository that can't be found)
+            # should not fail the evaluation of the rest of the batch
+            try:
+                return get_external_schedule_execution(
+                    self._get_repo_for_origin(args.repository_origin),
+                    batch_args.instance_ref,
+                    args.schedule_name,
+                    args.scheduled_execution_timestamp,
+                    args.scheduled_execution_timezone,
+                )
+            except Exception:
+                return ExternalScheduleExecutionErrorData(
+                    serializable_error_info_from_exc_info(sys.exc_info())
+                )
+
+        yield from self._split_batch_results_into_chunk_events(
+            self._evaluate_batch(_evaluate_schedule, batch_args.schedule_execution_args)
+        )
+
+    def ExternalSensorExecutionBatch(self, request, _context):
+        batch_args = deserialize_as(
+            request.serialized_external_sensor_execution_batch_args,
+            SensorExecutionBatchArgs,
+        )
+
+        def _evaluate_sensor(args: SensorExecutionArgs):
+            # An error for one sensor (including a sensor or repository that can't be found)
+            # should not fail the evaluation of the rest of the batch
+            try:
+                return get_external_sensor_execution(
+                    self._get_repo_for_origin(args.repository_origin),
+                    batch_args.instance_ref,
+                    args.sensor_name,
+                    args.last_completion_time,
+                    args.last_run_key,
+                    args.cursor,
+                )
+            except Exception:
+                return ExternalSensorExecutionErrorData(
+                    serializable_error_info_from_exc_info(sys.exc_info())
+                )
+
+        yield from self._split_batch_results_into_chunk_events(
+            self._evaluate_batch(_evaluate_sensor, batch_args.sensor_execution_args)
+        )
+
     def ShutdownServer(self, request, _context):
         try:
             self._shutdown_once_executions_finish_event.set()
@@ -836,6 +951,8 @@ def __init__(
         inject_env_vars_from_instance=False,
         instance_ref=None,
         location_name=None,
+        lazy_load_definitions=False,
+        preloaded_repositories=None,
     ):
         check.opt_str_param(host, "host")
         check.opt_int_param(port, "port")
@@ -894,6 +1011,8 @@ def __init__(
                 inject_env_vars_from_instance=inject_env_vars_from_instance,
                 instance_ref=instance_ref,
                 location_name=location_name,
+                lazy_load_definitions=lazy_load_definitions,
+                preloaded_repositories=preloaded_repositories,
             )
         except Exception:
             if self._ipc_output_file:
@@ -1033,6 +1152,7 @@ def open_server_process(
     cwd: Optional[str] = None,
     log_level: str = "INFO",
     env: Optional[Dict[str, str]] = None,
+    lazy_load_definitions: bool = False,
 ):
     check.invariant((port or socket) and not (port and socket), "Set only port or socket")
     check.opt_inst_param(loadable_target_origin, "loadable_target_origin", LoadableTargetOrigin)
@@ -1061,6 +1181,7 @@ def open_server_process(
         + (["--inject-env-vars-from-instance"])
         + (["--instance-ref", serialize_dagster_namedtuple(instance_ref)])
         + (["--location-name", location_name] if location_name else [])
+        + (["--lazy-load-definitions"] if lazy_load_definitions else [])
     )
 
     if loadable_target_origin:
@@ -1099,6 +1220,7 @@ def _open_server_process_on_dynamic_port(
     cwd: Optional[str] = None,
     log_level: str = "INFO",
     env: Optional[Dict[str, str]] = None,
+    lazy_load_definitions: bool = False,
 ):
     server_process = None
     retries = 0
@@ -1119,6 +1241,7 @@ def _open_server_process_on_dynamic_port(
                 cwd=cwd,
                 log_level=log_level,
                 env=env,
+                lazy_load_definitions=lazy_load_definitions,
             )
         except CouldNotBindGrpcServerToAddress:
             pass
@@ -1144,6 +1267,7 @@ def __init__(
         cwd: Optional[str] = None,
         log_level: str = "INFO",
         env: Optional[Dict[str, str]] = None,
+        lazy_load_definitions: bool = False,
     ):
         self.port = None
         self.socket = None
@@ -1165,6 +1289,7 @@ def __init__(
             "max_workers must be greater than 1 or set to None if heartbeat is True. "
             "If set to None, the server will use the gRPC default.",
         )
+        check.bool_param(lazy_load_definitions, "lazy_load_definitions")
 
         if seven.IS_WINDOWS or force_port:
             self.server_process, self.port = _open_server_process_on_dynamic_port(
@@ -1180,6 +1305,7 @@ def __init__(
                 cwd=cwd,
                 log_level=log_level,
                 env=env,
+                lazy_load_definitions=lazy_load_definitions,
             )
         else:
             self.socket = safe_tempfile_path_unmanaged()
@@ -1198,6 +1324,7 @@ def __init__(
                 cwd=cwd,
                 log_level=log_level,
                 env=env,
+                lazy_load_definitions=lazy_load_definitions,
             )
 
         if self.server_process is None:
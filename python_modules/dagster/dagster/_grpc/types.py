@@ -558,6 +558,64 @@ def __new__(
         )
 
 
+@whitelist_for_serdes
+class ExternalScheduleExecutionBatchArgs(
+    NamedTuple(
+        "_ExternalScheduleExecutionBatchArgs",
+        [
+            ("instance_ref", Optional[InstanceRef]),
+            ("schedule_execution_args", Sequence[ExternalScheduleExecutionArgs]),
+        ],
+    )
+):
+    """Evaluates several schedules from the same location in a single request. The instance ref is
+    sent once for the whole batch and is used in place of the instance ref on each of the
+    individual schedule execution args."""
+
+    def __new__(
+        cls,
+        instance_ref: Optional[InstanceRef],
+        schedule_execution_args: Sequence[ExternalScheduleExecutionArgs],
+    ):
+        return super(ExternalScheduleExecutionBatchArgs, cls).__new__(
+            cls,
+            instance_ref=check.opt_inst_param(instance_ref, "instance_ref", InstanceRef),
+            schedule_execution_args=check.sequence_param(
+                schedule_execution_args,
+                "schedule_execution_args",
+                of_type=ExternalScheduleExecutionArgs,
+            ),
+        )
+
+
+@whitelist_for_serdes
+class SensorExecutionBatchArgs(
+    NamedTuple(
+        "_SensorExecutionBatchArgs",
+        [
+            ("instance_ref", Optional[InstanceRef]),
+            ("sensor_execution_args", Sequence[SensorExecutionArgs]),
+        ],
+    )
+):
+    """Evaluates several sensors from the same location in a single request. The instance ref is
+    sent once for the whole batch and is used in place of the instance ref on each of the
+    individual sensor execution args."""
+
+    def __new__(
+        cls,
+        instance_ref: Optional[InstanceRef],
+        sensor_execution_args: Sequence[SensorExecutionArgs],
+    ):
+        return super(SensorExecutionBatchArgs, cls).__new__(
+            cls,
+            instance_ref=check.opt_inst_param(instance_ref, "instance_ref", InstanceRef),
+            sensor_execution_args=check.sequence_param(
+                sensor_execution_args, "sensor_execution_args", of_type=SensorExecutionArgs
+            ),
+        )
+
+
 @whitelist_for_serdes
 class ExternalJobArgs(
     NamedTuple(
@@ -724,3 +782,74 @@ def __new__(
                 serializable_error_info, "serializable_error_info", SerializableErrorInfo
             ),
         )
+
+
+@whitelist_for_serdes
+class ForkGrpcServerRequest(
+    NamedTuple(
+        "_ForkGrpcServerRequest",
+        [
+            ("socket", str),
+            ("fixed_server_id", Optional[str]),
+            ("max_workers", Optional[int]),
+            ("heartbeat", bool),
+            ("heartbeat_timeout", int),
+        ],
+    )
+):
+    def __new__(
+        cls,
+        socket: str,
+        fixed_server_id: Optional[str],
+        max_workers: Optional[int],
+        heartbeat: bool,
+        heartbeat_timeout: int,
+    ):
+        return super(ForkGrpcServerRequest, cls).__new__(
+            cls,
+            socket=check.str_param(socket, "socket"),
+            fixed_server_id=check.opt_str_param(fixed_server_id, "fixed_server_id"),
+            max_workers=check.opt_int_param(max_workers, "max_workers"),
+            heartbeat=check.bool_param(heartbeat, "heartbeat"),
+            heartbeat_timeout=check.int_param(heartbeat_timeout, "heartbeat_timeout"),
+        )
+
+
+@whitelist_for_serdes
+class ForkGrpcServerResult(
+    NamedTuple(
+        "_ForkGrpcServerResult",
+        [
+            ("pid", Optional[int]),
+            ("serializable_error_info", Optional[SerializableErrorInfo]),
+        ],
+    )
+):
+    def __new__(cls, pid: Optional[int], serializable_error_info: Optional[SerializableErrorInfo]):
+        return super(ForkGrpcServerResult, cls).__new__(
+            cls,
+            pid=check.opt_int_param(pid, "pid"),
+            serializable_error_info=check.opt_inst_param(
+                serializable_error_info, "serializable_error_info", SerializableErrorInfo
+            ),
+        )
+
+
+@whitelist_for_serdes
+class ForkedGrpcServerExitCodeRequest(
+    NamedTuple("_ForkedGrpcServerExitCodeRequest", [("pid", int)])
+):
+    def __new__(cls, pid: int):
+        return super(ForkedGrpcServerExitCodeRequest, cls).__new__(
+            cls, pid=check.int_param(pid, "pid")
+        )
+
+
+@whitelist_for_serdes
+class ForkedGrpcServerExitCodeResult(
+    NamedTuple("_ForkedGrpcServerExitCodeResult", [("exit_code", Optional[int])])
+):
+    def __new__(cls, exit_code: Optional[int]):
+        return super(ForkedGrpcServerExitCodeResult, cls).__new__(
+            cls, exit_code=check.opt_int_param(exit_code, "exit_code")
+        )
@@ -0,0 +1,486 @@
+"""A zygote is a process that imports the code for a location once, and then forks gRPC servers
+that serve that code. Forked servers come up without paying the cost of starting a new Python
+interpreter and importing the user code again, which makes replacing a server (or starting an
+additional one) fast even for code that takes a long time to load.
+
+The zygote must never use gRPC itself before forking, since gRPC's internal state does not survive
+a fork - it only loads the code and listens for fork requests on a unix socket.
+"""
+
+import os
+import signal
+import socket
+import sys
+import time
+import traceback
+from typing import TYPE_CHECKING, Dict, Optional, Sequence, Union
+
+import dagster._check as check
+import dagster._seven as seven
+from dagster._core.instance import InstanceRef
+from dagster._core.origin import get_python_environment_entry_point
+from dagster._core.types.loadable_target_origin import LoadableTargetOrigin
+from dagster._serdes import deserialize_as, serialize_dagster_namedtuple
+from dagster._serdes.ipc import open_ipc_subprocess
+from dagster._utils import safe_tempfile_path_unmanaged
+from dagster._utils.error import SerializableErrorInfo, serializable_error_info_from_exc_info
+
+from .types import (
+    ForkedGrpcServerExitCodeRequest,
+    ForkedGrpcServerExitCodeResult,
+    ForkGrpcServerRequest,
+    ForkGrpcServerResult,
+)
+
+if TYPE_CHECKING:
+    from .server import LoadedRepositories
+
+# How often the zygote checks whether the process that launched it is still alive
+ZYGOTE_PARENT_CHECK_INTERVAL = 1.0
+
+# The return code of a forked server whose exit code the zygote no longer knows, e.g. because the
+# zygote exited before the server did
+UNKNOWN_FORKED_SERVER_RETURN_CODE = 255
+
+# The exit codes of the forked servers that the zygote has reaped, by pid
+_exit_codes_by_pid: Dict[int, int] = {}
+
+
+def _read_message(conn: socket.socket) -> Optional[str]:
+    with conn.makefile("r", encoding="utf8") as f:
+        line = f.readline()
+    return line.strip() or None
+
+
+def _write_message(conn: socket.socket, message: str) -> None:
+    conn.sendall((message + "\n").encode("utf8"))
+
+
+def _exit_on_signal(_signum, _frame):
+    # raise SystemExit so that the control socket is cleaned up
+    sys.exit(0)
+
+
+def _exit_code_from_status(status: int) -> int:
+    # in the manner of subprocess.Popen.returncode
+    if os.WIFSIGNALED(status):
+        return -os.WTERMSIG(status)
+    return os.WEXITSTATUS(status)
+
+
+def _reap_children(_signum, _frame):
+    # Forked servers are children of the zygote, so it is responsible for reaping them once they
+    # exit, and for reporting their exit codes to the processes that requested them
+    while True:
+        try:
+            pid, status = os.waitpid(-1, os.WNOHANG)
+        except ChildProcessError:
+            return
+        if pid == 0:
+            return
+        _exit_codes_by_pid[pid] = _exit_code_from_status(status)
+
+
+def run_zygote(
+    control_socket: str,
+    loadable_target_origin: Optional[LoadableTargetOrigin],
+    entry_point: Sequence[str],
+    lazy_load_definitions: bool = False,
+    inject_env_vars_from_instance: bool = False,
+    instance_ref: Optional[InstanceRef] = None,
+    location_name: Optional[str] = None,
+) -> None:
+    from dagster._core.instance import DagsterInstance
+
+    from .server import LoadedRepositories
+
+    parent_pid = os.getppid()
+
+    loaded_repositories: Union["LoadedRepositories", SerializableErrorInfo]
+    try:
+        if inject_env_vars_from_instance:
+            with DagsterInstance.from_ref(
+                instance_ref
+            ) if instance_ref else DagsterInstance.get() as instance:
+                instance.inject_env_vars(location_name)
+
+        loaded_repositories = LoadedRepositories(
+            loadable_target_origin,
+            entry_point,
+            lazy_load_definitions=lazy_load_definitions,
+        )
+    except Exception:
+        # Forked servers surface the error to clients, like a server with --lazy-load-user-code
+        loaded_repositories = serializable_error_info_from_exc_info(sys.exc_info())
+
+    signal.signal(signal.SIGCHLD, _reap_children)
+    signal.signal(signal.SIGTERM, _exit_on_signal)
+
+    # Only start listening once the code is loaded, so that clients can treat a successful
+    # connection as a sign that the zygote is ready to fork servers
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    listener.bind(control_socket)
+    listener.listen()
+    listener.settimeout(ZYGOTE_PARENT_CHECK_INTERVAL)
+
+    try:
+        while os.getppid() == parent_pid:
+            try:
+                conn, _ = listener.accept()
+            except socket.timeout:
+                continue
+
+            with conn:
+                conn.settimeout(None)
+                message = _read_message(conn)
+                if not message:
+                    # connection check from a client waiting for the zygote to start up
+                    continue
+
+                try:
+                    request = deserialize_as(
+                        message, (ForkGrpcServerRequest, ForkedGrpcServerExitCodeRequest)
+                    )
+                    if isinstance(request, ForkedGrpcServerExitCodeRequest):
+                        _write_message(
+                            conn,
+                            serialize_dagster_namedtuple(
+                                ForkedGrpcServerExitCodeResult(
+                                    exit_code=_exit_codes_by_pid.get(request.pid)
+                                )
+                            ),
+                        )
+                        continue
+
+                    # A new server may reuse the pid of a server that was reaped earlier. Its exit
+                    # code is forgotten before a quickly exiting new server can be reaped.
+                    signal.pthread_sigmask(signal.SIG_BLOCK, {signal.SIGCHLD})
+                    try:
+                        pid = os.fork()
+                        if pid == 0:
+                            listener.close()
+                            conn.close()
+                            _serve_forked_server(
+                                request,
+                                loadable_target_origin,
+                                entry_point,
+                                loaded_repositories,
+                                location_name,
+                            )
+                        _exit_codes_by_pid.pop(pid, None)
+                    finally:
+                        signal.pthread_sigmask(signal.SIG_UNBLOCK, {signal.SIGCHLD})
+                    result = ForkGrpcServerResult(pid=pid, serializable_error_info=None)
+                except Exception:
+                    result = ForkGrpcServerResult(
+                        pid=None,
+                        serializable_error_info=serializable_error_info_from_exc_info(
+                            sys.exc_info()
+                        ),
+                    )
+
+                _write_message(conn, serialize_dagster_namedtuple(result))
+    finally:
+        listener.close()
+        if os.path.exists(control_socket):
+            os.unlink(control_socket)
+
+
+def _serve_forked_server(
+    request: ForkGrpcServerRequest,
+    loadable_target_origin: Optional[LoadableTargetOrigin],
+    entry_point: Sequence[str],
+    loaded_repositories: Union["LoadedRepositories", SerializableErrorInfo],
+    location_name: Optional[str],
+):
+    from .server import DagsterGrpcServer
+
+    # The server launches (and waits on) its own subprocesses, and shuts down like any other
+    # server when signalled
+    signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.pthread_sigmask(signal.SIG_UNBLOCK, {signal.SIGCHLD})
+
+    exit_code = 0
+    try:
+        server = DagsterGrpcServer(
+            socket=request.socket,
+            loadable_target_origin=loadable_target_origin,
+            max_workers=request.max_workers,
+            heartbeat=request.heartbeat,
+            heartbeat_timeout=request.heartbeat_timeout,
+            lazy_load_user_code=True,
+            fixed_server_id=request.fixed_server_id,
+            entry_point=entry_point,
+            location_name=location_name,
+            preloaded_repositories=loaded_repositories,
+        )
+        server.serve()
+    except BaseException:
+        traceback.print_exc()
+        exit_code = 1
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        # Never return into the zygote's accept loop
+        os._exit(exit_code)  # pylint: disable=protected-access
+
+
+class ForkedProcessHandle:
+    """
+    A subset of the subprocess.Popen interface for a gRPC server forked by a zygote. The server
+    is a child of the zygote rather than of this process, so it can only be observed (and
+    signalled) by pid, and its exit code is requested from the zygote that reaped it. If the
+    zygote no longer knows the exit code, the return code is UNKNOWN_FORKED_SERVER_RETURN_CODE.
+    """
+
+    def __init__(self, pid: int, zygote: "GrpcServerZygote"):
+        self.pid = check.int_param(pid, "pid")
+        self._zygote = zygote
+        self.returncode: Optional[int] = None
+
+    def poll(self) -> Optional[int]:
+        if self.returncode is None:
+            try:
+                # succeeds until the zygote has reaped the server
+                os.kill(self.pid, 0)
+            except ProcessLookupError:
+                exit_code = self._zygote.get_forked_server_exit_code(self.pid)
+                self.returncode = (
+                    exit_code if exit_code is not None else UNKNOWN_FORKED_SERVER_RETURN_CODE
+                )
+        return self.returncode
+
+    def communicate(self, timeout: Optional[float] = None):
+        start_time = time.time()
+        while self.poll() is None:
+            if timeout and time.time() - start_time > timeout:
+                raise Exception(f"Timed out waiting for forked process {self.pid} to finish")
+            time.sleep(0.1)
+        return None, None
+
+    def wait(self, timeout: Optional[float] = None) -> Optional[int]:
+        self.communicate(timeout=timeout)
+        return self.returncode
+
+    def terminate(self) -> None:
+        if self.poll() is None:
+            try:
+                os.kill(self.pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+
+class ForkedGrpcServerProcess:
+    """A gRPC server forked from a GrpcServerZygote. Exposes the same interface as
+    GrpcServerProcess."""
+
+    def __init__(
+        self,
+        zygote: "GrpcServerZygote",
+        max_workers: Optional[int] = None,
+        heartbeat: bool = False,
+        heartbeat_timeout: int = 30,
+        fixed_server_id: Optional[str] = None,
+        startup_timeout: int = 20,
+    ):
+        from .server import wait_for_grpc_server
+
+        self.port = None
+        self.socket = safe_tempfile_path_unmanaged()
+        self.loadable_target_origin = zygote.loadable_target_origin
+
+        result = zygote.send_fork_request(
+            ForkGrpcServerRequest(
+                socket=self.socket,
+                fixed_server_id=fixed_server_id,
+                max_workers=max_workers,
+                heartbeat=heartbeat,
+                heartbeat_timeout=heartbeat_timeout,
+            )
+        )
+        if result.serializable_error_info:
+            raise Exception(
+                f"Error forking gRPC server: {result.serializable_error_info.to_string()}"
+            )
+
+        self.server_process = ForkedProcessHandle(check.not_none(result.pid), zygote)
+
+        from dagster._grpc.client import DagsterGrpcClient
+
+        try:
+            wait_for_grpc_server(
+                self.server_process,
+                DagsterGrpcClient(port=None, socket=self.socket, host="localhost"),
+                ["forked from zygote", str(zygote.zygote_process.pid)],
+                timeout=startup_timeout,
+            )
+        except:
+            self.server_process.terminate()
+            raise
+
+    @property
+    def pid(self):
+        return self.server_process.pid
+
+    def wait(self, timeout=30):
+        self.server_process.wait(timeout=timeout)
+
+    def create_ephemeral_client(self):
+        from dagster._grpc.client import EphemeralDagsterGrpcClient
+
+        return EphemeralDagsterGrpcClient(
+            port=self.port, socket=self.socket, server_process=self.server_process
+        )
+
+
+class GrpcServerZygote:
+    """Launches a zygote process that loads the code for a location, and forks gRPC servers
+    from it on request."""
+
+    def __init__(
+        self,
+        instance_ref: InstanceRef,
+        loadable_target_origin: LoadableTargetOrigin,
+        location_name: Optional[str] = None,
+        startup_timeout: int = 20,
+        log_level: str = "INFO",
+        lazy_load_definitions: bool = False,
+        cwd: Optional[str] = None,
+        env=None,
+    ):
+        check.invariant(
+            not seven.IS_WINDOWS, "Forking gRPC servers from a zygote is not supported on Windows."
+        )
+        self.loadable_target_origin = check.inst_param(
+            loadable_target_origin, "loadable_target_origin", LoadableTargetOrigin
+        )
+        self.location_name = check.opt_str_param(location_name, "location_name")
+        check.int_param(startup_timeout, "startup_timeout")
+
+        from dagster._core.test_utils import get_mocked_system_timezone
+
+        mocked_system_timezone = get_mocked_system_timezone()
+
+        self.control_socket = safe_tempfile_path_unmanaged()
+        self.creation_timestamp = time.time()
+
+        executable_path = loadable_target_origin.executable_path
+        subprocess_args = (
+            get_python_environment_entry_point(executable_path or sys.executable)
+            + ["api", "grpc-zygote"]
+            + ["--control-socket", self.control_socket]
+            + (
+                ["--override-system-timezone", mocked_system_timezone]
+                if mocked_system_timezone
+                else []
+            )
+            + ["--log-level", log_level]
+            # only use the Python environment if it has been explicitly set in the workspace
+            + (["--use-python-environment-entry-point"] if executable_path else [])
+            + ["--inject-env-vars-from-instance"]
+            + ["--instance-ref", serialize_dagster_namedtuple(instance_ref)]
+            + (["--location-name", location_name] if location_name else [])
+            + (["--lazy-load-definitions"] if lazy_load_definitions else [])
+            + list(loadable_target_origin.get_cli_args())
+        )
+
+        self.zygote_process = open_ipc_subprocess(subprocess_args, cwd=cwd, env=env)
+
+        try:
+            self._wait_for_zygote(subprocess_args, startup_timeout)
+        except:
+            self.shutdown()
+            raise
+
+    def _connect(self) -> socket.socket:
+        conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            conn.connect(self.control_socket)
+        except:
+            conn.close()
+            raise
+        return conn
+
+    def _wait_for_zygote(self, subprocess_args: Sequence[str], timeout: int) -> None:
+        start_time = time.time()
+        while True:
+            try:
+                self._connect().close()
+                return
+            except OSError:
+                pass
+
+            if self.zygote_process.poll() is not None:
+                raise Exception(
+                    f"gRPC server zygote exited with return code {self.zygote_process.returncode} "
+                    f"while starting up with the command: \"{' '.join(subprocess_args)}\""
+                )
+
+            if timeout > 0 and time.time() - start_time > timeout:
+                raise Exception(
+                    f"Timed out waiting for gRPC server zygote to start after {timeout}s with "
+                    f"arguments: \"{' '.join(subprocess_args)}\""
+                )
+
+            time.sleep(0.1)
+
+    def is_alive(self) -> bool:
+        return self.zygote_process.poll() is None
+
+    def send_fork_request(self, request: ForkGrpcServerRequest) -> ForkGrpcServerResult:
+        check.inst_param(request, "request", ForkGrpcServerRequest)
+        with self._connect() as conn:
+            _write_message(conn, serialize_dagster_namedtuple(request))
+            response = _read_message(conn)
+
+        if not response:
+            raise Exception("gRPC server zygote closed the connection without forking a server")
+
+        return deserialize_as(response, ForkGrpcServerResult)
+
+    def get_forked_server_exit_code(self, pid: int) -> Optional[int]:
+        """The exit code of a server forked by the zygote that has exited, or None if the zygote
+        doesn't know it."""
+        check.int_param(pid, "pid")
+        if not self.is_alive():
+            return None
+
+        try:
+            with self._connect() as conn:
+                _write_message(
+                    conn, serialize_dagster_namedtuple(ForkedGrpcServerExitCodeRequest(pid=pid))
+                )
+                response = _read_message(conn)
+        except OSError:
+            # the zygote exited in the meantime
+            return None
+
+        if not response:
+            return None
+
+        return deserialize_as(response, ForkedGrpcServerExitCodeResult).exit_code
+
+    def fork_server(
+        self,
+        max_workers: Optional[int] = None,
+        heartbeat: bool = False,
+        heartbeat_timeout: int = 30,
+        fixed_server_id: Optional[str] = None,
+        startup_timeout: int = 20,
+    ) -> ForkedGrpcServerProcess:
+        return ForkedGrpcServerProcess(
+            self,
+            max_workers=max_workers,
+            heartbeat=heartbeat,
+            heartbeat_timeout=heartbeat_timeout,
+            fixed_server_id=fixed_server_id,
+            startup_timeout=startup_timeout,
+        )
+
+    def shutdown(self) -> None:
+        # Servers that were already forked keep running until they are shut down or stop
+        # receiving heartbeats
+        if self.zygote_process.poll() is None:
+            self.zygote_process.terminate()
+            self.zygote_process.wait()
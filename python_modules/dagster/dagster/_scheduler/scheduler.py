@@ -7,17 +7,33 @@
 from collections import defaultdict
 from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import ExitStack
-from typing import Dict, List, Optional, cast
+from typing import (
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    cast,
+)
 
 import pendulum
 
 import dagster._check as check
 from dagster._core.definitions.run_request import RunRequest
-from dagster._core.definitions.schedule_definition import DefaultScheduleStatus
+from dagster._core.definitions.schedule_definition import (
+    DefaultScheduleStatus,
+    ScheduleExecutionData,
+)
 from dagster._core.definitions.utils import validate_tags
-from dagster._core.errors import DagsterUserCodeUnreachableError
+from dagster._core.errors import DagsterUserCodeProcessError, DagsterUserCodeUnreachableError
 from dagster._core.host_representation import ExternalSchedule, PipelineSelector
 from dagster._core.host_representation.external import ExternalPipeline
+from dagster._core.host_representation.external_data import ExternalScheduleExecutionErrorData
 from dagster._core.host_representation.repository_location import RepositoryLocation
 from dagster._core.instance import DagsterInstance
 from dagster._core.scheduler.instigation import (
@@ -34,9 +50,10 @@
 from dagster._core.storage.tags import RUN_KEY_TAG, SCHEDULED_EXECUTION_TIME_TAG
 from dagster._core.telemetry import SCHEDULED_RUN_CREATED, hash_name, log_action
 from dagster._core.workspace.context import IWorkspaceProcessContext
+from dagster._grpc.types import ExternalScheduleExecutionArgs
 from dagster._seven.compat.pendulum import to_timezone
 from dagster._utils import merge_dicts
-from dagster._utils.error import serializable_error_info_from_exc_info
+from dagster._utils.error import SerializableErrorInfo, serializable_error_info_from_exc_info
 from dagster._utils.log import default_date_format_string
 
 
@@ -271,8 +288,10 @@ def launch_scheduled_runs(
         schedule_names = ", ".join([schedule.name for schedule in schedules.values()])
         logger.info(f"Checking for new runs for the following schedules: {schedule_names}")
 
+    # Schedules from the same location are evaluated together in a single request
+    schedule_batches: Dict[str, List[_ScheduleToEvaluate]] = defaultdict(list)
+
     for external_schedule in schedules.values():
-        error_info = None
         try:
             schedule_state = all_schedule_states.get(external_schedule.selector_id)
             if not schedule_state:
@@ -305,95 +324,359 @@ def launch_scheduled_runs(
                 ):
                     continue
 
-                future = threadpool_executor.submit(
-                    launch_scheduled_runs_for_schedule,
-                    workspace_process_context,
-                    logger,
-                    external_schedule,
-                    schedule_state,
-                    schedule_state_lock,
-                    end_datetime_utc,
-                    max_catchup_runs,
-                    max_tick_retries,
-                    tick_retention_settings,
-                    schedule_debug_crash_flags,
-                    log_verbose_checks=log_verbose_checks,
-                )
-                scheduler_run_futures[external_schedule.selector_id] = future
-                yield
-
-            else:
-                # evaluate the sensors in a loop, synchronously, yielding to allow the sensor daemon to
-                # heartbeat
-                yield from launch_scheduled_runs_for_schedule_iterator(
-                    workspace_process_context,
-                    logger,
-                    external_schedule,
-                    schedule_state,
-                    schedule_state_lock,
-                    end_datetime_utc,
-                    max_catchup_runs,
-                    max_tick_retries,
-                    tick_retention_settings,
-                    schedule_debug_crash_flags,
-                    log_verbose_checks=log_verbose_checks,
-                )
+            schedule_batches[external_schedule.handle.location_name].append(
+                _ScheduleToEvaluate(external_schedule, schedule_state, schedule_debug_crash_flags)
+            )
         except Exception:
             error_info = serializable_error_info_from_exc_info(sys.exc_info())
             logger.error(
                 f"Scheduler caught an error for schedule {external_schedule.name} : {error_info.to_string()}"
             )
-        yield error_info
+            yield error_info
+
+    for schedule_batch in schedule_batches.values():
+        if threadpool_executor:
+            # each schedule gets its own future, which is done once the ticks of that schedule have
+            # been launched, however long the other schedules from its location take to evaluate
+            tick_futures: Dict[str, Future] = {}
+            for schedule_to_evaluate in schedule_batch:
+                selector_id = schedule_to_evaluate.external_schedule.selector_id
+                tick_futures[selector_id] = Future()
+                check.not_none(scheduler_run_futures)[selector_id] = tick_futures[selector_id]
+
+            threadpool_executor.submit(
+                launch_scheduled_runs_for_schedule_batch,
+                workspace_process_context,
+                logger,
+                schedule_batch,
+                schedule_state_lock,
+                end_datetime_utc,
+                max_catchup_runs,
+                max_tick_retries,
+                tick_retention_settings,
+                threadpool_executor,
+                tick_futures,
+                log_verbose_checks=log_verbose_checks,
+            )
+            yield
+
+        else:
+            # evaluate the schedules in a loop, synchronously, yielding to allow the scheduler
+            # daemon to heartbeat
+            yield from launch_scheduled_runs_for_schedule_batch_iterator(
+                workspace_process_context,
+                logger,
+                schedule_batch,
+                schedule_state_lock,
+                end_datetime_utc,
+                max_catchup_runs,
+                max_tick_retries,
+                tick_retention_settings,
+                log_verbose_checks=log_verbose_checks,
+            )
+
+
+class _ScheduleToEvaluate(NamedTuple):
+    external_schedule: ExternalSchedule
+    schedule_state: InstigatorState
+    schedule_debug_crash_flags: Optional[Mapping]
 
 
-def launch_scheduled_runs_for_schedule(
+class _ScheduleTicksToLaunch(NamedTuple):
+    schedule_to_evaluate: _ScheduleToEvaluate
+    latest_tick: Optional[InstigatorTick]
+    tick_times: Sequence[datetime.datetime]
+
+    @property
+    def external_schedule(self) -> ExternalSchedule:
+        return self.schedule_to_evaluate.external_schedule
+
+
+_ScheduleResult = Union[ScheduleExecutionData, ExternalScheduleExecutionErrorData, Exception]
+
+
+def launch_scheduled_runs_for_schedule_batch(
     workspace_process_context: IWorkspaceProcessContext,
     logger: logging.Logger,
-    external_schedule: ExternalSchedule,
-    schedule_state: InstigatorState,
+    schedule_batch: Sequence[_ScheduleToEvaluate],
     schedule_state_lock: threading.Lock,
     end_datetime_utc: datetime.datetime,
     max_catchup_runs: int,
     max_tick_retries: int,
     tick_retention_settings,
-    schedule_debug_crash_flags,
+    threadpool_executor: ThreadPoolExecutor,
+    tick_futures: Mapping[str, Future],
     log_verbose_checks,
 ):
-    # evaluate the tick immediately, but from within a thread.  The main thread should be able to
-    # heartbeat to keep the daemon alive
-    list(
-        launch_scheduled_runs_for_schedule_iterator(
-            workspace_process_context,
+    # evaluate the ticks immediately, but from within a thread.  The main thread should be able to
+    # heartbeat to keep the daemon alive. The ticks of each schedule are launched in a thread of
+    # their own as soon as the result of that schedule arrives
+    pending_tick_futures = dict(tick_futures)
+    try:
+        # the errors finding the ticks of each schedule have already been logged
+        schedules_to_launch, _ = _get_schedules_to_launch(
+            workspace_process_context.instance,
             logger,
-            external_schedule,
-            schedule_state,
+            schedule_batch,
             schedule_state_lock,
             end_datetime_utc,
             max_catchup_runs,
             max_tick_retries,
-            tick_retention_settings,
-            schedule_debug_crash_flags,
             log_verbose_checks,
         )
+        for index, schedule_result in _get_schedule_execution_results(
+            workspace_process_context,
+            [
+                (schedule_ticks.external_schedule, schedule_ticks.tick_times[0])
+                for schedule_ticks in schedules_to_launch
+            ],
+        ):
+            schedule_ticks = schedules_to_launch[index]
+            future = threadpool_executor.submit(
+                _launch_scheduled_runs_for_schedule,
+                workspace_process_context,
+                logger,
+                schedule_ticks,
+                schedule_result,
+                tick_retention_settings,
+            )
+            tick_future = pending_tick_futures.pop(schedule_ticks.external_schedule.selector_id)
+            future.add_done_callback(
+                lambda _, tick_future=tick_future: tick_future.set_result(None)
+            )
+    except Exception:
+        error_info = serializable_error_info_from_exc_info(sys.exc_info())
+        logger.error(f"Scheduler caught an error evaluating schedules: {error_info.to_string()}")
+    finally:
+        # no ticks are launched for the schedules that had no ticks to evaluate
+        for tick_future in pending_tick_futures.values():
+            tick_future.set_result(None)
+
+
+def launch_scheduled_runs_for_schedule_batch_iterator(
+    workspace_process_context: IWorkspaceProcessContext,
+    logger: logging.Logger,
+    schedule_batch: Sequence[_ScheduleToEvaluate],
+    schedule_state_lock: threading.Lock,
+    end_datetime_utc: datetime.datetime,
+    max_catchup_runs: int,
+    max_tick_retries: int,
+    tick_retention_settings,
+    log_verbose_checks,
+):
+    """Evaluates the first due tick of a batch of schedules from the same location with a single
+    request to the location, then launches the runs for each schedule in turn."""
+    schedules_to_launch, errors = _get_schedules_to_launch(
+        workspace_process_context.instance,
+        logger,
+        schedule_batch,
+        schedule_state_lock,
+        end_datetime_utc,
+        max_catchup_runs,
+        max_tick_retries,
+        log_verbose_checks,
     )
+    yield from errors
+    if not schedules_to_launch:
+        return
+
+    schedule_results = sorted(
+        _get_schedule_execution_results(
+            workspace_process_context,
+            [
+                (schedule_ticks.external_schedule, schedule_ticks.tick_times[0])
+                for schedule_ticks in schedules_to_launch
+            ],
+        ),
+        key=lambda index_and_result: index_and_result[0],
+    )
+    yield
+
+    for index, schedule_result in schedule_results:
+        yield from _launch_scheduled_runs_for_schedule_iterator(
+            workspace_process_context,
+            logger,
+            schedules_to_launch[index],
+            schedule_result,
+            tick_retention_settings,
+        )
 
 
-def launch_scheduled_runs_for_schedule_iterator(
+def _get_schedules_to_launch(
+    instance: DagsterInstance,
+    logger: logging.Logger,
+    schedule_batch: Sequence[_ScheduleToEvaluate],
+    schedule_state_lock: threading.Lock,
+    end_datetime_utc: datetime.datetime,
+    max_catchup_runs: int,
+    max_tick_retries: int,
+    log_verbose_checks,
+) -> Tuple[Sequence[_ScheduleTicksToLaunch], Sequence[SerializableErrorInfo]]:
+    schedules_to_launch: List[_ScheduleTicksToLaunch] = []
+    errors: List[SerializableErrorInfo] = []
+    for schedule_to_evaluate in schedule_batch:
+        try:
+            latest_tick, tick_times = _get_schedule_tick_times(
+                instance,
+                logger,
+                schedule_to_evaluate.external_schedule,
+                schedule_to_evaluate.schedule_state,
+                schedule_state_lock,
+                end_datetime_utc,
+                max_catchup_runs,
+                max_tick_retries,
+                log_verbose_checks,
+            )
+        except Exception:
+            error_info = serializable_error_info_from_exc_info(sys.exc_info())
+            logger.error(
+                f"Scheduler caught an error for schedule {schedule_to_evaluate.external_schedule.name} : {error_info.to_string()}"
+            )
+            errors.append(error_info)
+            continue
+
+        if tick_times:
+            schedules_to_launch.append(
+                _ScheduleTicksToLaunch(schedule_to_evaluate, latest_tick, tick_times)
+            )
+
+    return schedules_to_launch, errors
+
+
+def _launch_scheduled_runs_for_schedule(
+    workspace_process_context: IWorkspaceProcessContext,
+    logger: logging.Logger,
+    schedule_ticks: _ScheduleTicksToLaunch,
+    first_schedule_result: _ScheduleResult,
+    tick_retention_settings,
+):
+    list(
+        _launch_scheduled_runs_for_schedule_iterator(
+            workspace_process_context,
+            logger,
+            schedule_ticks,
+            first_schedule_result,
+            tick_retention_settings,
+        )
+    )
+
+
+def _launch_scheduled_runs_for_schedule_iterator(
     workspace_process_context: IWorkspaceProcessContext,
     logger: logging.Logger,
+    schedule_ticks: _ScheduleTicksToLaunch,
+    first_schedule_result: _ScheduleResult,
+    tick_retention_settings,
+):
+    external_schedule = schedule_ticks.schedule_to_evaluate.external_schedule
+    error_info = None
+    try:
+        yield from _launch_scheduled_runs_at_times(
+            workspace_process_context,
+            logger,
+            external_schedule,
+            schedule_ticks.latest_tick,
+            _get_schedule_results_at_times(
+                workspace_process_context,
+                external_schedule,
+                schedule_ticks.tick_times,
+                first_schedule_result,
+            ),
+            tick_retention_settings,
+            schedule_ticks.schedule_to_evaluate.schedule_debug_crash_flags,
+        )
+    except Exception:
+        error_info = serializable_error_info_from_exc_info(sys.exc_info())
+        logger.error(
+            f"Scheduler caught an error for schedule {external_schedule.name} : {error_info.to_string()}"
+        )
+    yield error_info
+
+
+def _get_schedule_results_at_times(
+    workspace_process_context: IWorkspaceProcessContext,
+    external_schedule: ExternalSchedule,
+    tick_times: Sequence[datetime.datetime],
+    first_schedule_result: _ScheduleResult,
+) -> Iterator[Tuple[datetime.datetime, _ScheduleResult]]:
+    # Each tick that the schedule is catching up on is only evaluated once the runs of the tick
+    # before it have been launched, so that no more ticks are evaluated after one fails
+    yield tick_times[0], first_schedule_result
+    for tick_time in tick_times[1:]:
+        yield tick_time, _get_schedule_execution_result(
+            workspace_process_context, external_schedule, tick_time
+        )
+
+
+def _get_schedule_execution_results(
+    workspace_process_context: IWorkspaceProcessContext,
+    schedule_ticks: Sequence[Tuple[ExternalSchedule, datetime.datetime]],
+) -> Iterator[Tuple[int, _ScheduleResult]]:
+    """Evaluates schedules from the same location with a single request to the location, yielding
+    the index of each schedule tick along with its result as soon as that result arrives. If the
+    request fails, the error is the result of every tick that wasn't evaluated yet."""
+    if not schedule_ticks:
+        return
+
+    schedule_execution_args = [
+        ExternalScheduleExecutionArgs(
+            repository_origin=external_schedule.get_external_origin().external_repository_origin,
+            # the instance ref is sent once for the whole batch
+            instance_ref=None,
+            schedule_name=external_schedule.name,
+            scheduled_execution_timestamp=schedule_time.timestamp(),
+            scheduled_execution_timezone=schedule_time.timezone.name,
+        )
+        for external_schedule, schedule_time in schedule_ticks
+    ]
+
+    unevaluated_indices = set(range(len(schedule_ticks)))
+    try:
+        repo_location = workspace_process_context.create_request_context().get_repository_location(
+            schedule_ticks[0][0].handle.location_name
+        )
+        for index, schedule_result in repo_location.get_external_schedule_execution_data_batch(
+            workspace_process_context.instance, schedule_execution_args
+        ):
+            unevaluated_indices.remove(index)
+            yield index, schedule_result
+    except Exception as e:
+        for index in sorted(unevaluated_indices):
+            yield index, e
+
+
+def _get_schedule_execution_result(
+    workspace_process_context: IWorkspaceProcessContext,
+    external_schedule: ExternalSchedule,
+    schedule_time: datetime.datetime,
+) -> _ScheduleResult:
+    try:
+        repo_location = workspace_process_context.create_request_context().get_repository_location(
+            external_schedule.handle.location_name
+        )
+        return repo_location.get_external_schedule_execution_data(
+            workspace_process_context.instance,
+            external_schedule.handle.repository_handle,
+            external_schedule.name,
+            schedule_time,
+        )
+    except Exception as e:
+        return e
+
+
+def _get_schedule_tick_times(
+    instance: DagsterInstance,
+    logger: logging.Logger,
     external_schedule: ExternalSchedule,
     schedule_state: InstigatorState,
     schedule_state_lock: threading.Lock,
     end_datetime_utc: datetime.datetime,
     max_catchup_runs: int,
     max_tick_retries: int,
-    tick_retention_settings,
-    schedule_debug_crash_flags,
     log_verbose_checks,
-):
+) -> Tuple[Optional[InstigatorTick], List]:
     schedule_state = check.inst_param(schedule_state, "schedule_state", InstigatorState)
     end_datetime_utc = check.inst_param(end_datetime_utc, "end_datetime_utc", datetime.datetime)
-    instance = workspace_process_context.instance
 
     with schedule_state_lock:
 
@@ -447,7 +730,7 @@ def launch_scheduled_runs_for_schedule_iterator(
     if not tick_times:
         if log_verbose_checks:
             logger.info(f"No new tick times to evaluate for {schedule_name}")
-        return
+        return latest_tick, []
 
     if not external_schedule.partition_set_name and len(tick_times) > 1:
         logger.warning(f"{schedule_name} has no partition set, so not trying to catch up")
@@ -463,7 +746,23 @@ def launch_scheduled_runs_for_schedule_iterator(
         times = ", ".join([time.strftime(default_date_format_string()) for time in tick_times])
         logger.info(f"Evaluating schedule `{schedule_name}` at the following times: {times}")
 
-    for schedule_time in tick_times:
+    return latest_tick, tick_times
+
+
+def _launch_scheduled_runs_at_times(
+    workspace_process_context: IWorkspaceProcessContext,
+    logger: logging.Logger,
+    external_schedule: ExternalSchedule,
+    latest_tick: Optional[InstigatorTick],
+    schedule_results: Iterable[Tuple[datetime.datetime, _ScheduleResult]],
+    tick_retention_settings,
+    schedule_debug_crash_flags,
+):
+    instance = workspace_process_context.instance
+    instigator_origin_id = external_schedule.get_external_origin_id()
+    schedule_name = external_schedule.name
+
+    for schedule_time, schedule_result in schedule_results:
         schedule_timestamp = schedule_time.timestamp()
         schedule_time_str = schedule_time.strftime(default_date_format_string())
         if latest_tick and latest_tick.timestamp == schedule_timestamp:
@@ -499,6 +798,7 @@ def launch_scheduled_runs_for_schedule_iterator(
                     logger,
                     external_schedule,
                     schedule_time,
+                    schedule_result,
                     tick_context,
                     schedule_debug_crash_flags,
                 )
@@ -550,25 +850,24 @@ def _schedule_runs_at_time(
     logger: logging.Logger,
     external_schedule: ExternalSchedule,
     schedule_time: datetime.datetime,
+    schedule_result: Union[ScheduleExecutionData, ExternalScheduleExecutionErrorData, Exception],
     tick_context: _ScheduleLaunchContext,
     debug_crash_flags,
 ):
     schedule_name = external_schedule.name
     instance = workspace_process_context.instance
     schedule_origin = external_schedule.get_external_origin()
-    repository_handle = external_schedule.handle.repository_handle
 
     repo_location = workspace_process_context.create_request_context().get_repository_location(
         schedule_origin.external_repository_origin.repository_location_origin.location_name
     )
 
-    schedule_execution_data = repo_location.get_external_schedule_execution_data(
-        instance=instance,
-        repository_handle=repository_handle,
-        schedule_name=external_schedule.name,
-        scheduled_execution_time=schedule_time,
-    )
-    yield None
+    if isinstance(schedule_result, Exception):
+        raise schedule_result
+    elif isinstance(schedule_result, ExternalScheduleExecutionErrorData):
+        raise DagsterUserCodeProcessError.from_error_info(schedule_result.error)
+
+    schedule_execution_data = schedule_result
 
     if schedule_execution_data.captured_log_key:
         tick_context.add_log_key(schedule_execution_data.captured_log_key)
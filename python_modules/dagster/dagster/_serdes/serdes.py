@@ -14,6 +14,7 @@
   (in memory, not human readable, etc) just handle the json case effectively.
 """
 
+import importlib
 from abc import ABC, abstractmethod
 from enum import Enum
 from inspect import Parameter, signature
@@ -485,6 +486,87 @@ def unpack_value(val: Any) -> Any:
     )
 
 
+# The modules that register the classes and enums of the whitelist when they are imported. Since
+# `import dagster` imports the modules of its API lazily, they are imported the first time that a
+# name missing from the whitelist is deserialized.
+_WHITELISTED_MODULES = [
+    "dagster._config.config_type",
+    "dagster._config.snap",
+    "dagster._core.assets",
+    "dagster._core.code_pointer",
+    "dagster._core.debug",
+    "dagster._core.definitions.cacheable_assets",
+    "dagster._core.definitions.dependency",
+    "dagster._core.definitions.events",
+    "dagster._core.definitions.freshness_policy",
+    "dagster._core.definitions.freshness_policy_sensor_definition",
+    "dagster._core.definitions.metadata",
+    "dagster._core.definitions.metadata.table",
+    "dagster._core.definitions.partition",
+    "dagster._core.definitions.reconstruct",
+    "dagster._core.definitions.repository_definition",
+    "dagster._core.definitions.run_request",
+    "dagster._core.definitions.run_status_sensor_definition",
+    "dagster._core.definitions.schedule_definition",
+    "dagster._core.definitions.sensor_definition",
+    "dagster._core.event_api",
+    "dagster._core.events",
+    "dagster._core.events.log",
+    "dagster._core.execution.backfill",
+    "dagster._core.execution.bulk_actions",
+    "dagster._core.execution.plan.handle",
+    "dagster._core.execution.plan.inputs",
+    "dagster._core.execution.plan.objects",
+    "dagster._core.execution.plan.outputs",
+    "dagster._core.execution.plan.state",
+    "dagster._core.execution.plan.step",
+    "dagster._core.execution.retries",
+    "dagster._core.execution.stats",
+    "dagster._core.host_representation.external_data",
+    "dagster._core.host_representation.origin",
+    "dagster._core.host_representation.selector",
+    "dagster._core.instance.ref",
+    "dagster._core.launcher.base",
+    "dagster._core.origin",
+    "dagster._core.scheduler.execution",
+    "dagster._core.scheduler.instigation",
+    "dagster._core.snap.dagster_types",
+    "dagster._core.snap.dep_snapshot",
+    "dagster._core.snap.execution_plan_snapshot",
+    "dagster._core.snap.mode",
+    "dagster._core.snap.pipeline_snapshot",
+    "dagster._core.snap.solid",
+    "dagster._core.storage.asset_store",
+    "dagster._core.storage.partition_status_cache",
+    "dagster._core.storage.pipeline_run",
+    "dagster._core.types.dagster_type",
+    "dagster._core.types.loadable_target_origin",
+    "dagster._daemon.types",
+    "dagster._grpc.server",
+    "dagster._grpc.types",
+    "dagster._serdes.config_class",
+    "dagster._serdes.ipc",
+    "dagster._utils.error",
+]
+
+_IMPORTED_WHITELISTED_MODULES = False
+
+
+def _import_whitelisted_modules(whitelist_map: WhitelistMap) -> bool:
+    """Imports the modules registering the whitelisted classes and enums the first time that a
+    name missing from the whitelist is deserialized, and returns whether it did.
+    """
+    global _IMPORTED_WHITELISTED_MODULES  # pylint: disable=global-statement
+
+    if _IMPORTED_WHITELISTED_MODULES or whitelist_map is not _WHITELIST_MAP:
+        return False
+
+    _IMPORTED_WHITELISTED_MODULES = True
+    for module_name in _WHITELISTED_MODULES:
+        importlib.import_module(module_name)
+    return True
+
+
 def unpack_inner_value(val: Any, whitelist_map: WhitelistMap, descent_path: str) -> Any:
     if isinstance(val, list):
         return [
@@ -498,6 +580,10 @@ def unpack_inner_value(val: Any, whitelist_map: WhitelistMap, descent_path: str)
             if whitelist_map.has_deserialized_name(klass_name)
             else klass_name
         )
+        if not whitelist_map.has_tuple_entry(lookup_name) and _import_whitelisted_modules(
+            whitelist_map
+        ):
+            return unpack_inner_value({**val, "__class__": klass_name}, whitelist_map, descent_path)
         if not whitelist_map.has_tuple_entry(lookup_name):
             name_str = (
                 f'"{klass_name}"'
@@ -521,6 +607,8 @@ def unpack_inner_value(val: Any, whitelist_map: WhitelistMap, descent_path: str)
         )
     if isinstance(val, dict) and val.get("__enum__"):
         name, member = val["__enum__"].split(".")
+        if not whitelist_map.has_enum_entry(name) and _import_whitelisted_modules(whitelist_map):
+            return unpack_inner_value(val, whitelist_map, descent_path)
         if not whitelist_map.has_enum_entry(name):
             raise DeserializationError(
                 f"Attempted to deserialize enum {name} which was not in the whitelist.\n"
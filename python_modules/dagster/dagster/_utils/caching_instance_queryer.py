@@ -6,8 +6,7 @@
 from dagster._core.definitions.asset_graph import AssetGraph
 from dagster._core.definitions.events import AssetKey, AssetKeyPartitionKey
 from dagster._core.errors import DagsterInvariantViolationError
-from dagster._core.storage.event_log import EventLogRecord, SqlEventLogStorage
-from dagster._core.storage.event_log.sql_event_log import AssetEventTagsTable
+from dagster._core.event_api import EventLogRecord
 from dagster._core.storage.pipeline_run import (
     IN_PROGRESS_RUN_STATUSES,
     DagsterRun,
@@ -246,6 +245,10 @@ def get_known_used_data(
         self, asset_key: AssetKey, record_id: int
     ) -> Dict[AssetKey, Tuple[Optional[int], Optional[float]]]:
         """Returns the known upstream ids and timestamps stored on the instance"""
+        # imported here to avoid importing sqlalchemy along with the asset reconciliation sensor
+        from dagster._core.storage.event_log import SqlEventLogStorage
+        from dagster._core.storage.event_log.sql_event_log import AssetEventTagsTable
+
         event_log_storage = self._instance.event_log_storage
         if isinstance(event_log_storage, SqlEventLogStorage) and event_log_storage.has_table(
             AssetEventTagsTable.name
@@ -11,14 +11,22 @@
     ManagedGrpcPythonEnvRepositoryLocationOrigin,
 )
 from dagster._core.host_representation.external import ExternalRepository
-from dagster._core.host_representation.external_data import ExternalPipelineData
+from dagster._core.host_representation.external_data import (
+    ExternalPipelineData,
+    external_repository_data_from_def,
+)
 from dagster._core.host_representation.handle import RepositoryHandle
 from dagster._core.host_representation.origin import ExternalRepositoryOrigin
 from dagster._core.test_utils import instance_for_test
 from dagster._core.types.loadable_target_origin import LoadableTargetOrigin
+from dagster._grpc.external_repository_stream import (
+    deserialize_external_repository_data_chunks,
+    serialize_external_repository_data_in_chunks,
+)
 from dagster._legacy import lambda_solid, pipeline
-from dagster._serdes.serdes import deserialize_as
+from dagster._serdes.serdes import deserialize_as, serialize_dagster_namedtuple
 
+from .api_tests_repo import bar_repo
 from .utils import get_bar_repo_repository_location
 
 
@@ -50,6 +58,40 @@ def test_streaming_external_repositories_error(instance):
             )
 
 
+@pytest.mark.parametrize("defer_snapshots", [True, False])
+@pytest.mark.parametrize("max_chunk_size", [50, 1000, 4000000])
+def test_external_repository_record_stream(defer_snapshots, max_chunk_size):
+    external_repository_data = external_repository_data_from_def(
+        bar_repo, defer_snapshots=defer_snapshots
+    )
+    serialized_external_repository_data = serialize_dagster_namedtuple(external_repository_data)
+
+    chunks = list(
+        serialize_external_repository_data_in_chunks(external_repository_data, max_chunk_size)
+    )
+    assert all(len(chunk) <= max_chunk_size for chunk in chunks)
+
+    result = deserialize_external_repository_data_chunks(iter(chunks))
+    assert serialize_dagster_namedtuple(result) == serialized_external_repository_data
+
+    # clients that join the chunks before deserializing them still get the same result
+    result = deserialize_as("".join(chunks), ExternalRepositoryData)
+    assert serialize_dagster_namedtuple(result) == serialized_external_repository_data
+
+
+def test_external_repository_record_stream_from_older_server():
+    # older servers stream slices of the whole serialized repository
+    serialized_external_repository_data = serialize_dagster_namedtuple(
+        external_repository_data_from_def(bar_repo)
+    )
+    chunks = [
+        serialized_external_repository_data[i : i + 1000]
+        for i in range(0, len(serialized_external_repository_data), 1000)
+    ]
+    result = deserialize_external_repository_data_chunks(chunks)
+    assert serialize_dagster_namedtuple(result) == serialized_external_repository_data
+
+
 @lambda_solid
 def do_something():
     return 1
@@ -1,9 +1,11 @@
 from dagster._api.snapshot_schedule import sync_get_external_schedule_execution_data_ephemeral_grpc
 from dagster._core.definitions.schedule_definition import ScheduleExecutionData
+from dagster._core.host_representation.external_data import ExternalScheduleExecutionErrorData
 from dagster._core.test_utils import instance_for_test
+from dagster._grpc.types import ExternalScheduleExecutionArgs
 from dagster._seven import get_current_datetime_in_utc
 
-from .utils import get_bar_repo_handle
+from .utils import get_bar_repo_handle, get_bar_repo_repository_location
 
 
 def test_external_schedule_execution_data_api_grpc():
@@ -51,3 +53,39 @@ def test_include_execution_time_grpc():
             to_launch = execution_data.run_requests[0]
             assert to_launch.run_config == {"passed_in_time": execution_time.isoformat()}
             assert to_launch.tags == {"dagster/schedule_name": "foo_schedule_echo_time"}
+
+
+def test_external_schedule_execution_data_batch_grpc():
+    with instance_for_test() as instance:
+        with get_bar_repo_repository_location(instance) as repository_location:
+            repository_origin = repository_location.get_repository("bar_repo").get_external_origin()
+            execution_time = get_current_datetime_in_utc()
+            # the results are keyed by the index of each schedule, in the order that they finish
+            results = dict(
+                repository_location.get_external_schedule_execution_data_batch(
+                    instance,
+                    [
+                        ExternalScheduleExecutionArgs(repository_origin, None, "foo_schedule"),
+                        ExternalScheduleExecutionArgs(
+                            repository_origin,
+                            None,
+                            "foo_schedule_echo_time",
+                            execution_time.timestamp(),
+                            execution_time.timezone.name,
+                        ),
+                        ExternalScheduleExecutionArgs(repository_origin, None, "missing_schedule"),
+                    ],
+                )
+            )
+
+            assert len(results) == 3
+            assert isinstance(results[0], ScheduleExecutionData)
+            assert results[0].run_requests[0].run_config == {"fizz": "buzz"}
+
+            assert isinstance(results[1], ScheduleExecutionData)
+            assert results[1].run_requests[0].run_config == {
+                "passed_in_time": execution_time.isoformat()
+            }
+
+            # errors for individual schedules don't fail the rest of the batch
+            assert isinstance(results[2], ExternalScheduleExecutionErrorData)
@@ -3,8 +3,10 @@
 from dagster._api.snapshot_sensor import sync_get_external_sensor_execution_data_ephemeral_grpc
 from dagster._core.definitions.sensor_definition import SensorExecutionData
 from dagster._core.errors import DagsterUserCodeProcessError
+from dagster._core.host_representation.external_data import ExternalSensorExecutionErrorData
+from dagster._grpc.types import SensorExecutionArgs
 
-from .utils import get_bar_repo_handle
+from .utils import get_bar_repo_handle, get_bar_repo_repository_location
 
 
 def test_external_sensor_grpc(instance):
@@ -33,3 +35,34 @@ def test_external_sensor_raises_dagster_error(instance):
             sync_get_external_sensor_execution_data_ephemeral_grpc(
                 instance, repository_handle, "sensor_raises_dagster_error", None, None, None
             )
+
+
+def test_external_sensor_batch_grpc(instance):
+    with get_bar_repo_repository_location(instance) as repository_location:
+        repository_origin = repository_location.get_repository("bar_repo").get_external_origin()
+        # the results are keyed by the index of each sensor, in the order that they finish
+        results = dict(
+            repository_location.get_external_sensor_execution_data_batch(
+                instance,
+                [
+                    SensorExecutionArgs(repository_origin, None, sensor_name, None, None, None)
+                    for sensor_name in [
+                        "sensor_foo",
+                        "sensor_error",
+                        "sensor_foo",
+                        "missing_sensor",
+                    ]
+                ],
+            )
+        )
+
+        assert len(results) == 4
+        for result in [results[0], results[2]]:
+            assert isinstance(result, SensorExecutionData)
+            assert len(result.run_requests) == 2
+            assert result.run_requests[0].run_config == {"foo": "FOO"}
+
+        # errors for individual sensors don't fail the rest of the batch
+        assert isinstance(results[1], ExternalSensorExecutionErrorData)
+        assert "womp womp" in results[1].error.to_string()
+        assert isinstance(results[3], ExternalSensorExecutionErrorData)
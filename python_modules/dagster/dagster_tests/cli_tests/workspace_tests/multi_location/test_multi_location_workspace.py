@@ -11,6 +11,8 @@
     load_workspace_process_context_from_yaml_paths,
     location_origins_from_config,
 )
+from dagster._core.workspace.load_target import WorkspaceFileTarget
+from dagster._core.workspace.workspace import WorkspaceLocationLoadStatus
 from dagster._utils import file_relative_path
 
 
@@ -32,6 +34,30 @@ def test_multi_location_workspace_foo(instance):
         assert grpc_workspace.has_repository_location("loaded_from_package")
 
 
+@pytest.mark.parametrize("max_concurrent_location_loads", [1, 3])
+def test_multi_location_workspace_concurrent_load(instance, max_concurrent_location_loads):
+    with WorkspaceProcessContext(
+        instance,
+        WorkspaceFileTarget(paths=[file_relative_path(__file__, "multi_location.yaml")]),
+        max_concurrent_location_loads=max_concurrent_location_loads,
+    ) as workspace:
+        snapshot = workspace.create_snapshot()
+
+        # locations keep the order of the workspace file, whichever one finished loading first
+        assert list(snapshot) == ["loaded_from_file", "loaded_from_module", "loaded_from_package"]
+
+        for entry in snapshot.values():
+            assert entry.repository_location
+            assert entry.load_status == WorkspaceLocationLoadStatus.LOADED
+            assert entry.load_duration is not None and entry.load_duration > 0
+
+        workspace.reload_workspace()
+        assert list(workspace.create_snapshot()) == list(snapshot)
+        for name, entry in workspace.create_snapshot().items():
+            assert entry.repository_location
+            assert entry.update_timestamp > snapshot[name].update_timestamp
+
+
 def test_multi_file_extend_workspace(instance):
     with load_workspace_process_context_from_yaml_paths(
         instance,
@@ -7,7 +7,8 @@
     asset,
 )
 from dagster._core.definitions.asset_graph import AssetGraph
-from dagster._core.definitions.events import AssetKeyPartitionKey
+from dagster._core.definitions.events import AssetKey, AssetKeyPartitionKey
+from dagster._core.selector.subset_selector import fetch_connected, fetch_sinks, fetch_sources
 
 
 def test_basics():
@@ -101,3 +102,113 @@ def child(parent):
             for hour in range(24)
         ]
     )
+
+
+def _diamond_chain_asset_graph():
+    # a -> b1, b2 -> c -> d1, d2 -> e, plus an unconnected asset in its own group
+    @asset(group_name="start")
+    def a():
+        ...
+
+    @asset(group_name="middle")
+    def b1(a):
+        ...
+
+    @asset(group_name="middle")
+    def b2(a):
+        ...
+
+    @asset(group_name="middle")
+    def c(b1, b2):
+        ...
+
+    @asset(group_name="end")
+    def d1(c):
+        ...
+
+    @asset(group_name="end")
+    def d2(c):
+        ...
+
+    @asset(group_name="end")
+    def e(d1, d2):
+        ...
+
+    @asset(group_name="other")
+    def unconnected():
+        ...
+
+    return AssetGraph.from_assets([a, b1, b2, c, d1, d2, e, unconnected])
+
+
+def _keys(*names):
+    return {AssetKey(name) for name in names}
+
+
+def test_get_asset_keys_in_groups():
+    asset_graph = _diamond_chain_asset_graph()
+    assert asset_graph.get_asset_keys_in_groups(["start", "end"]) == _keys("a", "d1", "d2", "e")
+    assert asset_graph.get_asset_keys_in_groups(["nonexistent"]) == set()
+
+
+def test_get_connected_asset_keys():
+    asset_graph = _diamond_chain_asset_graph()
+    assert asset_graph.get_upstream_asset_keys(_keys("c")) == _keys("a", "b1", "b2")
+    assert asset_graph.get_upstream_asset_keys(_keys("e"), depth=2) == _keys("c", "d1", "d2")
+    assert asset_graph.get_downstream_asset_keys(_keys("b1", "b2"), depth=1) == _keys("c")
+    # the given keys are only included if they're connected to one of the others
+    assert asset_graph.get_downstream_asset_keys(_keys("a", "c"), depth=1) == _keys(
+        "b1", "b2", "d1", "d2"
+    )
+    assert asset_graph.get_downstream_asset_keys(_keys("a", "c"), depth=2) == _keys(
+        "b1", "b2", "c", "d1", "d2", "e"
+    )
+    assert asset_graph.get_downstream_asset_keys(_keys("a"), depth=0) == set()
+
+
+def test_get_connected_asset_keys_matches_traversal():
+    asset_graph = _diamond_chain_asset_graph()
+    all_keys = set(asset_graph.all_asset_keys)
+    for selection in [_keys("a"), _keys("b1", "d2"), _keys("c", "unconnected"), all_keys]:
+        for depth in [None, 0, 1, 2, 3]:
+            for direction in ["upstream", "downstream"]:
+                expected = set().union(
+                    *(
+                        fetch_connected(
+                            key, asset_graph.asset_dep_graph, direction=direction, depth=depth
+                        )
+                        for key in selection
+                    )
+                )
+                if direction == "upstream":
+                    result = asset_graph.get_upstream_asset_keys(selection, depth=depth)
+                else:
+                    result = asset_graph.get_downstream_asset_keys(selection, depth=depth)
+                assert result == expected
+
+        assert asset_graph.get_sinks_within(selection) == fetch_sinks(
+            asset_graph.asset_dep_graph, selection
+        )
+        assert asset_graph.get_sources_within(selection) == fetch_sources(
+            asset_graph.asset_dep_graph, selection
+        )
+
+
+def test_sinks_and_sources_within_cyclic_graph():
+    a, b, c = AssetKey("a"), AssetKey("b"), AssetKey("c")
+    asset_graph = AssetGraph(
+        asset_dep_graph={
+            "upstream": {a: set(), b: {a, c}, c: {b}},
+            "downstream": {a: {b}, b: {c}, c: {b}},
+        },
+        source_asset_keys=set(),
+        partitions_defs_by_key={},
+        partition_mappings_by_key=None,
+        group_names_by_key={},
+        freshness_policies_by_key={},
+    )
+    # b is downstream of itself through c
+    assert asset_graph.get_sinks_within({a, b}) == set()
+    assert asset_graph.get_sinks_within({a}) == {a}
+    assert asset_graph.get_sources_within({a, b}) == {a}
+    assert asset_graph.get_downstream_asset_keys({a}) == {b, c}
@@ -1301,6 +1301,33 @@ def test_subset_of_build_assets_job():
             )
 
 
+def test_subset_job_reused_for_same_selection():
+    foo_job = build_assets_job("foo_job", assets=[foo, bar, foo_bar, baz])
+    selection = {AssetKey("foo"), AssetKey("bar"), AssetKey("foo_bar")}
+
+    subset_job = foo_job.get_job_def_for_subset_selection(asset_selection=selection)
+    assert foo_job.get_job_def_for_subset_selection(asset_selection=set(selection)) is subset_job
+    assert (
+        foo_job.get_job_def_for_subset_selection(asset_selection={AssetKey("foo")})
+        is not subset_job
+    )
+
+
+def test_long_asset_chain():
+    def _make_asset(i):
+        @asset(name=f"asset_{i}", non_argument_deps={f"asset_{i - 1}"} if i else None)
+        def _asset():
+            pass
+
+        return _asset
+
+    assets = [_make_asset(i) for i in range(1500)]
+
+    job = build_assets_job("long_chain", assets=assets)
+    assert len(job.graph.node_defs) == 1500
+    assert job.graph.dependency_structure.all_upstream_outputs_from_node("asset_1499")
+
+
 @resource
 def my_resource():
     return 1
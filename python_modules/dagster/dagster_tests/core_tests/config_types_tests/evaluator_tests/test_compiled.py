@@ -0,0 +1,109 @@
+import pytest
+
+from dagster import (
+    Any,
+    Array,
+    Enum,
+    EnumValue,
+    Field,
+    IntSource,
+    Map,
+    Noneable,
+    Permissive,
+    Selector,
+    Shape,
+    StringSource,
+)
+from dagster._config import post_process_config, resolve_to_config_type, validate_config
+from dagster._config.compiled import get_compiled_processor, process_config_compiled
+from dagster._core.test_utils import environ
+
+
+def _process_config_traversal(config_type, config_value):
+    validate_evr = validate_config(config_type, config_value)
+    if not validate_evr.success:
+        return validate_evr
+    return post_process_config(config_type, validate_evr.value)
+
+
+SCHEMAS_AND_VALUES = [
+    (int, [1, True, "1", None, 1.5]),
+    (float, [1, 1.5, "1.5", None]),
+    (Noneable(int), [None, 1, "1"]),
+    (Any, [None, 1, {"a": [1]}]),
+    ([int], [[], [1, 2], [1, None], None, {"a": 1}, 1]),
+    ([Noneable(str)], [["a", None]]),
+    (
+        Shape(
+            {
+                "required": int,
+                "optional": Field(str, is_required=False),
+                "defaulted": Field([int], default_value=[1, 2]),
+                "nested": Field(
+                    Shape({"inner": Field(int, default_value=3)}), is_required=False
+                ),
+            }
+        ),
+        [
+            {"required": 1},
+            {"required": 1, "optional": "a", "defaulted": [], "nested": {}},
+            {"required": 1, "nested": {"inner": 4}},
+            {"optional": "a"},
+            {"required": 1, "extra": 2},
+            {"required": "1"},
+            [],
+            None,
+        ],
+    ),
+    (
+        Shape({"solids": Field(Permissive(), is_required=False)}, field_aliases={"solids": "ops"}),
+        [{"ops": {"a": 1}}, {"solids": {}}, {"solids": {}, "ops": {}}, {}],
+    ),
+    (
+        Permissive({"known": Field(int, default_value=1)}),
+        [{}, {"unknown": [1]}, {"known": 2, "unknown": None}, {"known": "2"}],
+    ),
+    (
+        Selector({"a": Field(int), "b": Field(Shape({"c": Field(int, default_value=1)}))}),
+        [{"a": 1}, {"b": None}, {"b": {"c": 2}}, {}, {"a": 1, "b": {}}, {"d": 1}, "a", None],
+    ),
+    (
+        Selector({"only": Field(Shape({"c": Field(int, default_value=1)}), is_required=False)}),
+        [{}, {"only": {}}, {"only": None}],
+    ),
+    (Map(str, int), [{}, {"a": 1}, {1: 1}, {"a": "1"}, {"a": None}, []]),
+    (Map(int, Noneable(int)), [{1: None}]),
+    (
+        Enum("CompiledTestEnum", [EnumValue("red", python_value=1), EnumValue("blue")]),
+        ["red", "blue", "green", 1, None],
+    ),
+    (StringSource, ["a", {"env": "COMPILED_TEST_ENV"}, {"env": "MISSING_COMPILED_TEST_ENV"}, 1]),
+    (IntSource, [1, {"env": "COMPILED_TEST_INT_ENV"}, {"env": "COMPILED_TEST_ENV"}, {"a": 1}]),
+    (Array(Shape({"a": Field(int, default_value=0)})), [[{}, {"a": 1}], [{"a": "1"}]]),
+]
+
+
+@pytest.mark.parametrize(
+    "config_schema,config_value",
+    [(schema, value) for schema, values in SCHEMAS_AND_VALUES for value in values],
+)
+def test_compiled_processor_matches_traversal(config_schema, config_value):
+    config_type = resolve_to_config_type(config_schema)
+    with environ({"COMPILED_TEST_ENV": "foo", "COMPILED_TEST_INT_ENV": "5"}):
+        expected = _process_config_traversal(config_type, config_value)
+        result = process_config_compiled(config_type, config_value)
+
+    if expected.success:
+        assert result is not None
+        assert result.success
+        assert result.value == expected.value
+        assert type(result.value) == type(expected.value)  # pylint: disable=unidiomatic-typecheck
+    else:
+        assert result is None
+
+
+def test_compiled_processor_shared_by_identical_shapes():
+    first = resolve_to_config_type({"a": Field(int, default_value=1), "b": [str]})
+    second = resolve_to_config_type({"a": Field(int, default_value=1), "b": [str]})
+    assert get_compiled_processor(first) is get_compiled_processor(second)
+    assert first.get_schema_snapshot() is second.get_schema_snapshot()
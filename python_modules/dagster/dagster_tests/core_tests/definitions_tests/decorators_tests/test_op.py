@@ -684,8 +684,13 @@ def the_op(context):
 
     result = execute_op_in_graph(the_op, resources={"io_manager": fs_io_manager})
     materialization = result.asset_materializations_for_node("the_op")[0]
-    assert len(materialization.metadata_entries) == 2
-    assert materialization.metadata_entries[0].label == "bar"
+    assert [entry.label for entry in materialization.metadata_entries] == [
+        "bar",
+        "path",
+        "format",
+        "size (bytes)",
+        "serialization time (ms)",
+    ]
     assert materialization.metadata_entries[0].entry_data.text == "baz"
 
 
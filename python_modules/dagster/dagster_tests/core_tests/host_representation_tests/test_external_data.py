@@ -5,6 +5,7 @@
 
 from dagster import (
     AssetKey,
+    AssetSelection,
     AssetsDefinition,
     DailyPartitionsDefinition,
     GraphOut,
@@ -15,8 +16,10 @@
     graph,
     job,
     op,
+    repository,
 )
 from dagster._core.definitions import AssetIn, SourceAsset, asset, build_assets_job, multi_asset
+from dagster._core.definitions.asset_layer import AssetLayer
 from dagster._core.definitions.metadata import MetadataValue, normalize_metadata
 from dagster._core.definitions.multi_dimensional_partitions import MultiPartitionsDefinition
 from dagster._core.definitions.partition import ScheduleType
@@ -31,6 +34,7 @@
     ExternalTargetData,
     ExternalTimeWindowPartitionsDefinitionData,
     external_asset_graph_from_defs,
+    external_repository_data_from_def,
     external_multi_partitions_definition_from_def,
     external_time_window_partitions_definition_from_def,
 )
@@ -1042,3 +1046,102 @@ def test_external_multi_partitions_def():
     ).get_partitions_definition()
 
     assert external == partitions_def
+
+
+def _build_selection_job_repository(num_assets, num_groups, num_selection_jobs):
+    # a layered asset graph, in which each asset depends on up to two assets of the previous
+    # layer, and jobs that each select a single group of assets
+    layer_width = 5
+    assets = []
+    for i in range(num_assets):
+        layer_start = (i // layer_width) * layer_width
+        upstream = (
+            sorted({layer_start - layer_width + (i % layer_width), layer_start - 1})
+            if layer_start > 0
+            else []
+        )
+
+        @asset(
+            name=f"asset_{i}",
+            ins={f"asset_{j}": AssetIn(key=f"asset_{j}") for j in upstream},
+            group_name=f"group_{i % num_groups}",
+        )
+        def _layered_asset(**kwargs):
+            return len(kwargs)
+
+        assets.append(_layered_asset)
+
+    jobs = [
+        define_asset_job(
+            f"selection_job_{i}", selection=AssetSelection.groups(f"group_{i % num_groups}")
+        )
+        for i in range(num_selection_jobs)
+    ]
+
+    @repository
+    def selection_job_repo():
+        return [*assets, *jobs]
+
+    return selection_job_repo
+
+
+def _asset_deps_by_key(external_asset_nodes):
+    return {
+        node.asset_key: (
+            set(node.dependencies),
+            set(node.depended_by),
+            tuple(sorted(node.job_names)),
+        )
+        for node in external_asset_nodes
+    }
+
+
+def test_external_asset_graph_for_selection_jobs():
+    repo = _build_selection_job_repository(num_assets=40, num_groups=4, num_selection_jobs=8)
+    external_asset_nodes = external_asset_graph_from_defs(
+        repo.get_all_pipelines(), source_assets_by_key=repo.source_assets_by_key
+    )
+
+    assert len(external_asset_nodes) == 40
+    nodes_by_key = {node.asset_key: node for node in external_asset_nodes}
+
+    # each asset is part of the base asset job and the two selection jobs that select its group
+    node = nodes_by_key[AssetKey("asset_5")]
+    assert node.group_name == "group_1"
+    assert sorted(node.job_names) == sorted(
+        ["__ASSET_JOB", "selection_job_1", "selection_job_5"]
+    )
+
+    # dependencies are recorded once, regardless of the number of jobs containing the asset
+    for node in external_asset_nodes:
+        assert len(node.dependencies) == len(set(node.dependencies))
+        for dep in node.dependencies:
+            assert ExternalAssetDependedBy(downstream_asset_key=node.asset_key) in (
+                nodes_by_key[dep.upstream_asset_key].depended_by
+            )
+
+    # the asset graph of the repository gives the same dependencies
+    assert _asset_deps_by_key(
+        external_asset_graph_from_defs(
+            repo.get_all_pipelines(),
+            source_assets_by_key=repo.source_assets_by_key,
+            asset_graph=repo.asset_graph,
+        )
+    ) == _asset_deps_by_key(external_asset_nodes)
+
+
+def test_external_repository_asset_graph_uses_repository_index(monkeypatch):
+    repo = _build_selection_job_repository(num_assets=20, num_groups=2, num_selection_jobs=4)
+    expected_nodes = external_asset_graph_from_defs(
+        repo.get_all_pipelines(), source_assets_by_key=repo.source_assets_by_key
+    )
+
+    def _upstream_assets_for_asset(_self, _asset_key):
+        raise Exception("looked up the upstream assets within a job")
+
+    # the upstream assets of the assets of the repository aren't looked up within each job
+    monkeypatch.setattr(AssetLayer, "upstream_assets_for_asset", _upstream_assets_for_asset)
+    external_repo_data = external_repository_data_from_def(repo)
+    assert _asset_deps_by_key(external_repo_data.external_asset_graph_data) == _asset_deps_by_key(
+        expected_nodes
+    )
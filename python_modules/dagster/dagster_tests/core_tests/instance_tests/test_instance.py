@@ -15,7 +15,10 @@
 )
 from dagster._core.execution.api import create_execution_plan
 from dagster._core.instance import DagsterInstance, InstanceRef
-from dagster._core.instance.config import DEFAULT_LOCAL_CODE_SERVER_STARTUP_TIMEOUT
+from dagster._core.instance.config import (
+    DEFAULT_LOCAL_CODE_SERVER_STARTUP_TIMEOUT,
+    DEFAULT_MAX_CONCURRENT_LOCATION_LOADS,
+)
 from dagster._core.launcher import LaunchRunContext, RunLauncher
 from dagster._core.run_coordinator.queued_run_coordinator import QueuedRunCoordinator
 from dagster._core.secrets.env_file import EnvFileLoader
@@ -261,11 +264,29 @@ def test_grpc_default_settings():
             instance.code_server_process_startup_timeout
             == DEFAULT_LOCAL_CODE_SERVER_STARTUP_TIMEOUT
         )
+        assert (
+            instance.code_server_max_concurrent_location_loads
+            == DEFAULT_MAX_CONCURRENT_LOCATION_LOADS
+        )
+        assert not instance.code_server_use_zygotes
+        assert not instance.code_server_lazy_load_definitions
 
 
 def test_grpc_override_settings():
-    with instance_for_test(overrides={"code_servers": {"local_startup_timeout": 60}}) as instance:
+    with instance_for_test(
+        overrides={
+            "code_servers": {
+                "local_startup_timeout": 60,
+                "max_concurrent_location_loads": 2,
+                "use_zygotes": True,
+                "lazy_load_definitions": True,
+            }
+        }
+    ) as instance:
         assert instance.code_server_process_startup_timeout == 60
+        assert instance.code_server_max_concurrent_location_loads == 2
+        assert instance.code_server_use_zygotes
+        assert instance.code_server_lazy_load_definitions
 
 
 def test_run_monitoring(capsys):  # pylint: disable=unused-argument
@@ -14,6 +14,7 @@
     GraphDefinition,
     Int,
     ResourceDefinition,
+    ResourceScope,
     String,
     build_op_context,
     configured,
@@ -30,6 +31,7 @@
 from dagster._core.errors import DagsterConfigMappingFunctionError, DagsterInvalidDefinitionError
 from dagster._core.events.log import EventLogEntry, construct_event_logger
 from dagster._core.execution.api import create_execution_plan, execute_plan
+from dagster._core.execution.resources_init import get_process_resource_cache
 from dagster._core.instance import DagsterInstance
 from dagster._core.test_utils import instance_for_test
 from dagster._core.utils import coerce_valid_log_level
@@ -1184,3 +1186,156 @@ def call_basic():
 
     assert call_basic.execute_in_process(resources={"cm": cm_resource}).success
     assert event_list == ["foo", "compute", "finally"]
+
+
+# the resource functions of the PER_RUN_PROCESS scope can't close over the state of a test
+per_run_process_events = []
+
+
+@resource(scope=ResourceScope.PER_RUN_PROCESS, config_schema={"size": Field(int)})
+def per_run_process_pool(init_context):
+    size = init_context.resource_config["size"]
+    per_run_process_events.append(f"init_pool_{size}")
+    try:
+        yield {"size": size}
+    finally:
+        per_run_process_events.append(f"teardown_pool_{size}")
+
+
+@resource(scope=ResourceScope.PER_RUN_PROCESS, required_resource_keys={"pool"})
+def per_run_process_client(init_context):
+    per_run_process_events.append("init_client")
+    return init_context.resources.pool
+
+
+def test_per_run_process_resource_reused_across_steps():
+    per_run_process_events.clear()
+    pool_ids = []
+
+    @op(required_resource_keys={"pool", "client"})
+    def first(context):
+        assert context.resources.client is context.resources.pool
+        pool_ids.append(id(context.resources.pool))
+
+    @op(required_resource_keys={"pool"})
+    def second(context, _first):
+        pool_ids.append(id(context.resources.pool))
+
+    @job(
+        resource_defs={
+            "pool": per_run_process_pool,
+            "client": per_run_process_client,
+            "io_manager": fs_io_manager,
+        }
+    )
+    def pool_job():
+        second(first())
+
+    run_config = {"resources": {"pool": {"config": {"size": 4}}}}
+    with instance_for_test() as instance:
+        run = instance.create_run_for_pipeline(pool_job, run_config=run_config)
+        for step_key in ["first", "second"]:
+            # each step is executed on its own, as by a step worker
+            execute_plan(
+                create_execution_plan(
+                    pool_job, run_config=run_config, step_keys_to_execute=[step_key]
+                ),
+                InMemoryPipeline(pool_job),
+                pipeline_run=run,
+                instance=instance,
+                run_config=run_config,
+            )
+
+        # the resources are initialized by the first step, reused by the second step, and torn
+        # down with the process
+        assert len(pool_ids) == 2 and len(set(pool_ids)) == 1
+        assert per_run_process_events == ["init_pool_4", "init_client"]
+
+        get_process_resource_cache().teardown()
+        assert per_run_process_events == ["init_pool_4", "init_client", "teardown_pool_4"]
+
+
+def test_per_run_process_resource_reused_across_runs():
+    per_run_process_events.clear()
+    pools = []
+
+    @op(required_resource_keys={"pool"})
+    def query(context):
+        pools.append(context.resources.pool)
+
+    @job(resource_defs={"pool": per_run_process_pool})
+    def pool_job():
+        query()
+
+    def _execute_step_in_new_run(instance, size):
+        run_config = {"resources": {"pool": {"config": {"size": size}}}}
+        execute_plan(
+            create_execution_plan(pool_job, run_config=run_config, step_keys_to_execute=["query"]),
+            InMemoryPipeline(pool_job),
+            pipeline_run=instance.create_run_for_pipeline(pool_job, run_config=run_config),
+            instance=instance,
+            run_config=run_config,
+        )
+
+    with instance_for_test() as instance:
+        _execute_step_in_new_run(instance, 4)
+        _execute_step_in_new_run(instance, 4)
+        # a single instance of the resource is held for the runs with the same config
+        assert per_run_process_events == ["init_pool_4"]
+        assert pools[0] is pools[1]
+
+        _execute_step_in_new_run(instance, 8)
+        assert per_run_process_events == ["init_pool_4", "init_pool_8"]
+        assert pools[2] is not pools[0]
+
+        get_process_resource_cache().teardown()
+        assert per_run_process_events == [
+            "init_pool_4",
+            "init_pool_8",
+            "teardown_pool_8",
+            "teardown_pool_4",
+        ]
+
+
+def test_per_run_process_resource_must_not_close_over_state():
+    def make_pool(size):
+        @resource(scope=ResourceScope.PER_RUN_PROCESS)
+        def pool(_):
+            return {"size": size}
+
+        return pool
+
+    # the resources that different calls of the factory return would otherwise be reused for
+    # each other
+    with pytest.raises(DagsterInvalidDefinitionError, match="PER_RUN_PROCESS scope"):
+        make_pool(4)
+
+    with pytest.raises(DagsterInvalidDefinitionError, match="PER_RUN_PROCESS scope"):
+
+        @resource(scope=ResourceScope.PER_RUN_PROCESS)
+        def pool_with_default(_, size=4):
+            return {"size": size}
+
+    # functions that don't close over state can be defined anywhere
+    @resource(scope=ResourceScope.PER_RUN_PROCESS)
+    def stateless_pool(init_context):
+        return {"size": init_context.resource_config}
+
+    assert stateless_pool.scope == ResourceScope.PER_RUN_PROCESS
+
+
+def test_per_run_process_resource_requires_per_run_process_resources():
+    @resource(scope=ResourceScope.PER_RUN_PROCESS, required_resource_keys={"config_value"})
+    def client(init_context):
+        return init_context.resources.config_value
+
+    @op(required_resource_keys={"client"})
+    def uses_client(_):
+        pass
+
+    @job(resource_defs={"client": client, "config_value": ResourceDefinition.none_resource()})
+    def client_job():
+        uses_client()
+
+    with pytest.raises(DagsterInvalidDefinitionError, match="PER_RUN_PROCESS scope"):
+        client_job.execute_in_process()
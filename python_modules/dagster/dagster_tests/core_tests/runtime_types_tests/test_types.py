@@ -20,6 +20,7 @@
     TypeCheck,
     check_dagster_type,
     fs_io_manager,
+    graph,
     job,
     make_python_type_usable_as_dagster_type,
     op,
@@ -691,3 +692,55 @@ def test_tuple_inner_types_not_mutable():
     assert isinstance(inner_types[0], ListType)
     assert inner_types[0].inner_type == inner_types[1]
     assert len(inner_types) == 2
+
+
+class Payload:
+    pass
+
+
+def test_type_check_skipped_for_values_that_passed_in_run():
+    checked = []
+
+    def _check_payload(_context, value):
+        checked.append(value)
+        return isinstance(value, Payload)
+
+    PayloadType = DagsterType(name="PayloadType", type_check_fn=_check_payload)
+    OtherPayloadType = DagsterType(name="OtherPayloadType", type_check_fn=_check_payload)
+
+    @op(out=Out(PayloadType))
+    def emit():
+        return Payload()
+
+    @op(ins={"payload": In(PayloadType)})
+    def consume(payload):
+        return payload
+
+    @op(ins={"payload": In(OtherPayloadType)})
+    def consume_as_other(payload):
+        return payload
+
+    @graph
+    def payload_job():
+        payload = emit()
+        consume(payload)
+        consume_as_other(payload)
+
+    result = payload_job.to_job().execute_in_process()
+    assert result.success
+    # the output is checked, and the input of consume_as_other, which has a different type
+    assert len(checked) == 2
+    input_events = {
+        event.step_key: event.event_specific_data.type_check_data
+        for event in result.all_events
+        if event.event_type == DagsterEventType.STEP_INPUT
+    }
+    assert input_events["consume"].success
+    assert "Skipped the type check" in input_events["consume"].description
+    assert input_events["consume_as_other"].description is None
+
+    # values loaded by the fs_io_manager are new objects, so are checked again
+    checked.clear()
+    result = payload_job.to_job(resource_defs={"io_manager": fs_io_manager}).execute_in_process()
+    assert result.success
+    assert len(checked) == 3
@@ -1,9 +1,17 @@
+import os
 import tempfile
+import time
+from collections import defaultdict
 
 import pytest
 
-from dagster._core.storage.local_compute_log_manager import LocalComputeLogManager
+from dagster._core.storage.compute_log_manager import ComputeIOType
+from dagster._core.storage.local_compute_log_manager import (
+    LocalComputeLogManager,
+    LocalLogFileTailer,
+)
 from dagster._core.test_utils import instance_for_test
+from dagster._utils import touch_file
 
 from .utils.captured_log_manager import TestCapturedLogManager
 
@@ -21,3 +29,84 @@ class TestLocalCapturedLogManager(TestCapturedLogManager):
     def captured_log_manager(self):
         with tempfile.TemporaryDirectory() as tmpdir_path:
             return LocalComputeLogManager(tmpdir_path)
+
+
+def test_log_file_tailer():
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        tailer = LocalLogFileTailer(max_open_files=1)
+        path = os.path.join(tmpdir_path, "foo.out")
+        other_path = os.path.join(tmpdir_path, "bar.out")
+
+        assert tailer.read(path) == (None, 0, 0)
+
+        with open(path, "wb") as f:
+            f.write(b"hello")
+            f.flush()
+            assert tailer.read(path) == (b"hello", 5, 5)
+            f.write(b" world")
+            f.flush()
+            # only the appended bytes are read from the previous offset
+            assert tailer.read(path, offset=5) == (b" world", 11, 11)
+            assert tailer.read(path, offset=0, max_bytes=2) == (b"he", 2, 11)
+
+        with tailer.batched_reads():
+            assert tailer.read(path, offset=5) == (b" world", 11, 11)
+            with open(path, "ab") as f:
+                f.write(b"!")
+            # reads within a batch are shared
+            assert tailer.read(path, offset=5) == (b" world", 11, 11)
+        assert tailer.read(path, offset=5) == (b" world!", 12, 12)
+
+        # replacing the file invalidates the open handle
+        os.remove(path)
+        assert tailer.read(path) == (None, 0, 0)
+        with open(path, "wb") as f:
+            f.write(b"new")
+        assert tailer.read(path) == (b"new", 3, 3)
+
+        # opening a second file evicts the least recently read handle
+        with open(other_path, "wb") as f:
+            f.write(b"other")
+        assert tailer.read(other_path) == (b"other", 5, 5)
+        assert tailer.read(path) == (b"new", 3, 3)
+
+        tailer.close_all()
+
+
+def test_subscriptions_share_directory_watch():
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        manager = LocalComputeLogManager(tmpdir_path, polling_timeout=0.1)
+        log_keys = [["run_id", "compute_logs", f"step_{i}"] for i in range(3)]
+        received = defaultdict(list)
+        subscriptions = []
+
+        for log_key in log_keys:
+            with manager.open_log_stream(log_key, ComputeIOType.STDOUT) as f:
+                f.write(f"{log_key[-1]} started\n")
+
+        for log_key in log_keys:
+            subscription = manager.subscribe(log_key)
+            subscription(received[log_key[-1]].append)
+            subscriptions.append(subscription)
+
+        # a single event handler is registered for the shared log directory
+        assert len(manager._subscription_manager._handlers) == 1  # pylint: disable=protected-access
+
+        for log_key in log_keys:
+            with manager.open_log_stream(log_key, ComputeIOType.STDOUT) as f:
+                f.write(f"{log_key[-1]} finished\n")
+            touch_file(manager.complete_artifact_path(log_key))
+
+        start_time = time.time()
+        while not all(subscription.is_complete for subscription in subscriptions):
+            assert time.time() - start_time < 15
+            time.sleep(0.1)
+
+        for log_key in log_keys:
+            step_key = log_key[-1]
+            assert b"".join(data.stdout or b"" for data in received[step_key]) == (
+                f"{step_key} started\n{step_key} finished\n".encode()
+            )
+
+        assert not manager._subscription_manager._handlers  # pylint: disable=protected-access
+        manager.dispose()
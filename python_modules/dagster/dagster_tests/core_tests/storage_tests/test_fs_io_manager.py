@@ -10,12 +10,15 @@
     AssetsDefinition,
     DailyPartitionsDefinition,
     In,
+    IOManagerDefinition,
     MetadataValue,
     Nothing,
     Out,
     Output,
     StaticPartitionsDefinition,
+    build_resources,
     graph,
+    io_manager,
     job,
     materialize,
     op,
@@ -26,7 +29,8 @@
 from dagster._core.errors import DagsterInvariantViolationError
 from dagster._core.execution.api import create_execution_plan
 from dagster._core.instance import DagsterInstance
-from dagster._core.storage.fs_io_manager import fs_io_manager
+from dagster._core.storage.fs_io_manager import PickledObjectFilesystemIOManager, fs_io_manager
+from dagster._core.storage.serialization_formats import SerializationFormat, UnsupportedValueError
 from dagster._core.test_utils import instance_for_test
 
 
@@ -419,3 +423,288 @@ def job1():
 
         for event in handled_output_events:
             assert len(event.event_specific_data.metadata_entries) == 0
+
+
+def test_fs_io_manager_output_metadata():
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        io_manager = fs_io_manager.configured({"base_dir": tmpdir_path})
+        result = define_pipeline(io_manager).execute_in_process()
+        assert result.success
+
+        handled_output_events = list(filter(lambda evt: evt.is_handled_output, result.all_events))
+        metadata = {
+            entry.label: entry.value
+            for entry in handled_output_events[0].event_specific_data.metadata_entries
+        }
+        filepath_a = os.path.join(tmpdir_path, result.run_id, "op_a", "result")
+        assert metadata["format"] == MetadataValue.text("pickle")
+        assert metadata["size (bytes)"] == MetadataValue.int(os.path.getsize(filepath_a))
+        assert metadata["serialization time (ms)"].value >= 0
+
+
+class TextFormat(SerializationFormat):
+    @property
+    def name(self):
+        return "text"
+
+    @property
+    def magic(self):
+        return b"TEXT:"
+
+    def dump(self, obj, file):
+        if obj == "unsupported":
+            raise UnsupportedValueError("not text")
+        file.write(self.magic + obj.encode("utf-8"))
+
+    def load(self, path):
+        with open(path, "rb") as file:
+            return "loaded " + file.read()[len(self.magic) :].decode("utf-8")
+
+
+def test_fs_io_manager_formats():
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+
+        @io_manager
+        def text_io_manager(_):
+            return PickledObjectFilesystemIOManager(
+                base_dir=tmpdir_path, formats={str: TextFormat()}
+            )
+
+        @op(out={"text": Out(), "unsupported": Out(), "number": Out()})
+        def emit():
+            yield Output("hello", "text")
+            yield Output("unsupported", "unsupported")
+            yield Output(1, "number")
+
+        @op
+        def combine(text, unsupported, number):
+            return [text, unsupported, number]
+
+        @job(resource_defs={"io_manager": text_io_manager})
+        def formats_job():
+            text, unsupported, number = emit()
+            combine(text, unsupported, number)
+
+        result = formats_job.execute_in_process()
+        assert result.success
+        assert result.output_for_node("combine") == ["loaded hello", "unsupported", 1]
+
+        with open(os.path.join(tmpdir_path, result.run_id, "emit", "text"), "rb") as read_obj:
+            assert read_obj.read() == b"TEXT:hello"
+
+        formats = {}
+        for event in result.all_events:
+            if event.is_handled_output:
+                metadata = {
+                    entry.label: entry.value for entry in event.event_specific_data.metadata_entries
+                }
+                formats[event.event_specific_data.output_name] = metadata["format"].value
+        assert formats == {
+            "text": "text",
+            "unsupported": "pickle",
+            "number": "pickle",
+            "result": "pickle",
+        }
+
+
+def test_fs_io_manager_loaded_values_mutable():
+    np = pytest.importorskip("numpy")
+    pd = pytest.importorskip("pandas")
+
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+
+        @op(out={"array": Out(), "df": Out()})
+        def make_values():
+            yield Output(np.arange(10, dtype=np.float64), "array")
+            yield Output(pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]}), "df")
+
+        @op
+        def mutate(array, df):
+            # values are pickled by default, so are loaded as they were stored
+            assert type(array) is np.ndarray  # pylint: disable=unidiomatic-typecheck
+            array *= 2
+            array[0] = 100
+            df.loc[0, "a"] = 10
+            df["a"] += 1
+            return array.sum() + df["a"].sum()
+
+        @job(resource_defs={"io_manager": fs_io_manager.configured({"base_dir": tmpdir_path})})
+        def mutate_job():
+            mutate(*make_values())
+
+        result = mutate_job.execute_in_process()
+        assert result.success
+        assert result.output_for_node("mutate") == 100 + 2 * sum(range(1, 10)) + 11 + 3 + 4
+
+        # stored as plain pickles that older versions of dagster can load
+        with open(os.path.join(tmpdir_path, result.run_id, "make_values", "array"), "rb") as f:
+            assert np.array_equal(pickle.load(f), np.arange(10))
+
+
+def test_fs_io_manager_memory_map_loaded_values_mutable():
+    np = pytest.importorskip("numpy")
+    pd = pytest.importorskip("pandas")
+    pytest.importorskip("pyarrow")
+
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+
+        @op(out={"array": Out(), "df": Out()})
+        def make_values():
+            yield Output(np.arange(10, dtype=np.float64), "array")
+            yield Output(pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]}), "df")
+
+        @op
+        def mutate(array, df):
+            array *= 2
+            # the columns of the DataFrame may share read-only mapped memory, so are copied to be
+            # modified in place
+            df = df.copy()
+            df.loc[0, "a"] = 10
+            return array.sum() + df["a"].sum()
+
+        @job(
+            resource_defs={
+                "io_manager": fs_io_manager.configured(
+                    {"base_dir": tmpdir_path, "memory_map": True}
+                )
+            }
+        )
+        def mutate_job():
+            mutate(*make_values())
+
+        result = mutate_job.execute_in_process()
+        assert result.success
+        assert result.output_for_node("mutate") == 2 * sum(range(10)) + 10 + 2 + 3
+
+        # the stored values are unchanged by the modifications of the loaded values
+        filepath = os.path.join(tmpdir_path, result.run_id, "make_values", "array")
+        assert np.array_equal(np.load(filepath), np.arange(10))
+
+
+def test_fs_io_manager_numpy():
+    np = pytest.importorskip("numpy")
+
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        io_manager = PickledObjectFilesystemIOManager(base_dir=tmpdir_path, memory_map=True)
+
+        @op
+        def make_array():
+            return np.arange(100, dtype=np.float64).reshape(10, 10)
+
+        @op
+        def double(array):
+            # loaded arrays are copy-on-write, so can be modified in place
+            assert isinstance(array, np.memmap)
+            array *= 2
+            return array.sum()
+
+        @job(resource_defs={"io_manager": IOManagerDefinition.hardcoded_io_manager(io_manager)})
+        def numpy_job():
+            double(make_array())
+
+        result = numpy_job.execute_in_process()
+        assert result.success
+        assert result.output_for_node("double") == 2 * sum(range(100))
+
+        filepath = os.path.join(tmpdir_path, result.run_id, "make_array", "result")
+        assert np.array_equal(np.load(filepath), np.arange(100).reshape(10, 10))
+
+
+def test_fs_io_manager_arrow():
+    pd = pytest.importorskip("pandas")
+    pa = pytest.importorskip("pyarrow")
+
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        io_manager = PickledObjectFilesystemIOManager(base_dir=tmpdir_path, memory_map=True)
+
+        @op(out={"df": Out(), "table": Out()})
+        def make_tables():
+            df = pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]})
+            yield Output(df, "df")
+            yield Output(pa.Table.from_pandas(df), "table")
+
+        @op
+        def check_tables(df, table):
+            assert isinstance(df, pd.DataFrame)
+            assert isinstance(table, pa.Table)
+            return df["a"].sum() + table.num_rows
+
+        @job(resource_defs={"io_manager": IOManagerDefinition.hardcoded_io_manager(io_manager)})
+        def arrow_job():
+            check_tables(*make_tables())
+
+        result = arrow_job.execute_in_process()
+        assert result.success
+        assert result.output_for_node("check_tables") == 9
+
+        filepath = os.path.join(tmpdir_path, result.run_id, "make_tables", "df")
+        with open(filepath, "rb") as read_obj:
+            assert read_obj.read(6) == b"ARROW1"
+
+
+@pytest.mark.parametrize(
+    "store_memory_map,load_memory_map", [(True, False), (False, True), (True, True)]
+)
+def test_fs_io_manager_load_across_configs(store_memory_map, load_memory_map):
+    np = pytest.importorskip("numpy")
+    pd = pytest.importorskip("pandas")
+    pytest.importorskip("pyarrow")
+
+    @asset
+    def array():
+        return np.arange(10, dtype=np.float64)
+
+    @asset
+    def df():
+        return pd.DataFrame({"a": [1, 2, 3]})
+
+    @asset
+    def total(array, df):
+        return array.sum() + df["a"].sum()
+
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        result = materialize(
+            [array, df],
+            resources={
+                "io_manager": fs_io_manager.configured(
+                    {"base_dir": tmpdir_path, "memory_map": store_memory_map}
+                )
+            },
+        )
+        assert result.success
+
+        result = materialize(
+            [array.to_source_assets()[0], df.to_source_assets()[0], total],
+            resources={
+                "io_manager": fs_io_manager.configured(
+                    {"base_dir": tmpdir_path, "memory_map": load_memory_map}
+                )
+            },
+        )
+        assert result.success
+        assert result.output_for_node("total") == sum(range(10)) + 6
+
+
+def test_fs_io_manager_max_concurrent_loads():
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        # inputs are loaded one at a time unless concurrent loads are opted into
+        assert PickledObjectFilesystemIOManager(base_dir=tmpdir_path).max_concurrent_loads == 1
+
+        class ConcurrentIOManager(PickledObjectFilesystemIOManager):
+            max_concurrent_loads = 2
+
+        assert ConcurrentIOManager(base_dir=tmpdir_path).max_concurrent_loads == 2
+
+        with build_resources(
+            {"io_manager": fs_io_manager},
+            resource_config={"io_manager": {"config": {"base_dir": tmpdir_path}}},
+        ) as resources:
+            assert resources.io_manager.max_concurrent_loads == 1
+
+        with build_resources(
+            {"io_manager": fs_io_manager},
+            resource_config={
+                "io_manager": {"config": {"base_dir": tmpdir_path, "max_concurrent_loads": 4}}
+            },
+        ) as resources:
+            assert resources.io_manager.max_concurrent_loads == 4
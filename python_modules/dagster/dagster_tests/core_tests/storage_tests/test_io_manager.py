@@ -1,5 +1,6 @@
 import os
 import tempfile
+import threading
 import time
 
 import mock
@@ -8,6 +9,7 @@
 from dagster import (
     AssetKey,
     AssetMaterialization,
+    DagsterEventType,
     DagsterInstance,
     DagsterInvariantViolationError,
     DynamicOut,
@@ -993,3 +995,50 @@ def job1():
 
     assert my_io_manager.handle_output_calls == 2
     assert my_io_manager.handle_input_calls == 1
+
+
+def test_fan_in_inputs_loaded_concurrently():
+    num_upstream = 4
+    barrier = threading.Barrier(num_upstream, timeout=30)
+
+    class ConcurrentIOManager(IOManager):
+        max_concurrent_loads = num_upstream
+
+        def __init__(self):
+            self.values = {}
+            self.loading_threads = set()
+
+        def handle_output(self, context, obj):
+            self.values[context.step_key] = obj
+
+        def load_input(self, context):
+            self.loading_threads.add(threading.get_ident())
+            # only passes once every input is loading at the same time
+            barrier.wait()
+            return self.values[context.upstream_output.step_key]
+
+    my_io_manager = ConcurrentIOManager()
+
+    @op(config_schema=int)
+    def emit(context):
+        return context.op_config
+
+    @op
+    def collect(values):
+        return values
+
+    @job(resource_defs={"io_manager": IOManagerDefinition.hardcoded_io_manager(my_io_manager)})
+    def fan_in_job():
+        collect([emit.alias(f"emit_{i}")() for i in range(num_upstream)])
+
+    result = fan_in_job.execute_in_process(
+        run_config={"ops": {f"emit_{i}": {"config": i} for i in range(num_upstream)}}
+    )
+    assert result.success
+    assert result.output_for_node("collect") == list(range(num_upstream))
+    assert len(my_io_manager.loading_threads) == num_upstream
+    assert threading.get_ident() not in my_io_manager.loading_threads
+    loaded_input_events = [
+        event for event in result.all_events if event.event_type == DagsterEventType.LOADED_INPUT
+    ]
+    assert len(loaded_input_events) == num_upstream
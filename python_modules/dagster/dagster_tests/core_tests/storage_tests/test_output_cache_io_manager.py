@@ -0,0 +1,307 @@
+import os
+from tempfile import TemporaryDirectory
+
+import pytest
+from dagster import (
+    DagsterEventType,
+    DagsterInvariantViolationError,
+    Field,
+    IOManagerDefinition,
+    build_init_resource_context,
+    build_input_context,
+    build_output_context,
+    job,
+    op,
+    output_cache_io_manager,
+)
+from dagster._core.storage.memoizable_io_manager import MemoizableIOManager
+from dagster._core.storage.tags import MEMOIZED_RUN_TAG
+from dagster._core.test_utils import instance_for_test
+from dagster._core.types.dagster_type import resolve_dagster_type
+
+
+def _output_metadata(result, event_type):
+    return {
+        (event.step_key, event.event_specific_data.output_name): {
+            entry.label: entry.value.value
+            for entry in event.event_specific_data.metadata_entries
+        }
+        for event in result.all_events
+        if event.event_type == event_type
+    }
+
+
+def _input_metadata(result):
+    return {
+        event.step_key: {
+            entry.label: entry.value.value for entry in event.event_specific_data.metadata_entries
+        }
+        for event in result.all_events
+        if event.event_type == DagsterEventType.LOADED_INPUT
+    }
+
+
+def _define_job(cache_dir, executions, max_size_bytes=None):
+    config = {"base_dir": cache_dir}
+    if max_size_bytes is not None:
+        config["max_size_bytes"] = max_size_bytes
+
+    @op(version="1")
+    def emit():
+        executions.append("emit")
+        return b"x" * 1000
+
+    @op(version="1", config_schema={"suffix": Field(str, default_value="")})
+    def append(context, value):
+        executions.append("append")
+        return value + context.op_config["suffix"].encode()
+
+    @op(version="1")
+    def length(value):
+        executions.append("length")
+        return value * 1
+
+    @job(
+        resource_defs={"io_manager": output_cache_io_manager.configured(config)},
+        tags={MEMOIZED_RUN_TAG: "true"},
+    )
+    def cached_job():
+        length(append(emit()))
+
+    return cached_job
+
+
+def test_output_cache_hits_and_misses():
+    executions = []
+    with TemporaryDirectory() as cache_dir, instance_for_test() as instance:
+        cached_job = _define_job(cache_dir, executions)
+
+        result = cached_job.execute_in_process(instance=instance)
+        assert result.success
+        assert executions == ["emit", "append", "length"]
+        handled_outputs = _output_metadata(result, DagsterEventType.HANDLED_OUTPUT)
+        assert {metadata["output cache"] for metadata in handled_outputs.values()} == {"miss"}
+        assert set(_input_metadata(result).keys()) == {"append", "length"}
+        assert {metadata["output cache"] for metadata in _input_metadata(result).values()} == {
+            "miss"
+        }
+
+        # every output is cached, so nothing is executed
+        executions.clear()
+        result = cached_job.execute_in_process(instance=instance)
+        assert result.success
+        assert executions == []
+
+        # changing the config of append changes its version and the version of length
+        executions.clear()
+        result = cached_job.execute_in_process(
+            instance=instance, run_config={"ops": {"append": {"config": {"suffix": "y"}}}}
+        )
+        assert result.success
+        assert executions == ["append", "length"]
+        input_metadata = _input_metadata(result)
+        assert input_metadata["append"]["output cache"] == "hit"
+        assert input_metadata["length"]["output cache"] == "miss"
+        assert result.output_for_node("length") == b"x" * 1000 + b"y"
+
+
+def test_output_cache_evicts_least_recently_used():
+    executions = []
+    with TemporaryDirectory() as cache_dir, instance_for_test() as instance:
+        cached_job = _define_job(cache_dir, executions, max_size_bytes=2500)
+
+        result = cached_job.execute_in_process(instance=instance)
+        assert result.success
+
+        # the output of emit was last used when append loaded it, before the output of append was
+        # stored, so it is evicted when the output of length takes the cache over its size
+        handled_outputs = _output_metadata(result, DagsterEventType.HANDLED_OUTPUT)
+        assert handled_outputs[("emit", "result")]["evicted outputs"] == 0
+        assert handled_outputs[("length", "result")]["evicted outputs"] == 1
+        assert {
+            op_dir: len(os.listdir(os.path.join(cache_dir, op_dir)))
+            for op_dir in os.listdir(cache_dir)
+        } == {"emit": 0, "append": 1, "length": 1}
+
+        executions.clear()
+        result = cached_job.execute_in_process(instance=instance)
+        assert result.success
+        assert executions == ["emit"]
+
+
+def test_output_cache_keeps_outputs_loaded_by_run():
+    executions = []
+
+    def _define_combine_job(max_size_bytes=None):
+        config = {"base_dir": cache_dir}
+        if max_size_bytes is not None:
+            config["max_size_bytes"] = max_size_bytes
+
+        @op(version="1")
+        def emit():
+            executions.append("emit")
+            return b"x" * 1000
+
+        @op(version="1", config_schema={"suffix": Field(str, default_value="")})
+        def other(context):
+            executions.append("other")
+            return b"y" * 1000 + context.op_config["suffix"].encode()
+
+        @op(version="1")
+        def combine(first, second):
+            executions.append("combine")
+            return first[:5] + second[:5]
+
+        @job(
+            resource_defs={"io_manager": output_cache_io_manager.configured(config)},
+            tags={MEMOIZED_RUN_TAG: "true"},
+        )
+        def combine_job():
+            combine(emit(), other())
+
+        return combine_job
+
+    with TemporaryDirectory() as cache_dir, instance_for_test() as instance:
+        result = _define_combine_job().execute_in_process(instance=instance)
+        assert result.success
+
+        # the output of emit is the least recently stored, and is loaded by combine after the new
+        # output of other takes the cache over its size
+        executions.clear()
+        result = _define_combine_job(max_size_bytes=1500).execute_in_process(
+            instance=instance, run_config={"ops": {"other": {"config": {"suffix": "z"}}}}
+        )
+        assert result.success
+        assert executions == ["other", "combine"]
+        assert result.output_for_node("combine") == b"xxxxxyyyyy"
+
+        handled_outputs = _output_metadata(result, DagsterEventType.HANDLED_OUTPUT)
+        assert handled_outputs[("other", "result")]["evicted outputs"] == 2
+        # once combine has loaded its inputs, the least recently loaded one can be evicted
+        assert handled_outputs[("combine", "result")]["evicted outputs"] == 1
+        assert os.listdir(os.path.join(cache_dir, "combine"))
+
+
+def test_output_cache_only_lists_outputs_to_evict(monkeypatch):
+    @op
+    def my_op():
+        pass
+
+    with TemporaryDirectory() as cache_dir:
+        io_manager = output_cache_io_manager(
+            build_init_resource_context(config={"base_dir": cache_dir, "max_size_bytes": 3500})
+        )
+        list_outputs = io_manager._list_outputs  # pylint: disable=protected-access
+        num_listings = []
+
+        def _list_outputs():
+            num_listings.append(1)
+            return list_outputs()
+
+        monkeypatch.setattr(io_manager, "_list_outputs", _list_outputs)
+
+        def _store(version):
+            context = build_output_context(
+                step_key="my_op",
+                name="result",
+                version=version,
+                op_def=my_op,
+                dagster_type=resolve_dagster_type(bytes),
+            )
+            io_manager.handle_output(context, b"x" * 1000)
+            return {
+                entry.label: entry.value.value for entry in context.get_logged_metadata_entries()
+            }
+
+        # the size of the cache is measured once, and then tracked as outputs are stored
+        assert [_store(version)["evicted outputs"] for version in ["a", "b", "c"]] == [0, 0, 0]
+        assert len(num_listings) == 1
+
+        # the outputs are only listed again when the cache is full
+        assert _store("d")["evicted outputs"] == 1
+        assert len(num_listings) == 2
+        assert sorted(os.listdir(os.path.join(cache_dir, "my_op"))) == ["b", "c", "d"]
+
+
+def test_output_cache_requires_versions():
+    with TemporaryDirectory() as cache_dir:
+        io_manager = output_cache_io_manager.configured({"base_dir": cache_dir})
+
+        @op
+        def unversioned():
+            return 1
+
+        @job(resource_defs={"io_manager": io_manager})
+        def unversioned_job():
+            unversioned()
+
+        with pytest.raises(DagsterInvariantViolationError, match="memoized runs"):
+            unversioned_job.execute_in_process()
+
+
+def test_output_cache_has_outputs():
+    @op
+    def my_op():
+        pass
+
+    with TemporaryDirectory() as cache_dir:
+        io_manager = output_cache_io_manager(
+            build_init_resource_context(config={"base_dir": cache_dir})
+        )
+        contexts = [
+            build_output_context(step_key="my_op", name="result", version=version, op_def=my_op)
+            for version in ["a", "b"]
+        ]
+        assert io_manager.has_outputs(contexts) == [False, False]
+
+        os.makedirs(os.path.join(cache_dir, "my_op"))
+        with open(os.path.join(cache_dir, "my_op", "b"), "wb") as file:
+            file.write(b"")
+        assert io_manager.has_outputs(contexts) == [False, True]
+        assert not io_manager.has_output(contexts[0])
+
+        with pytest.raises(DagsterInvariantViolationError, match="memoized runs"):
+            io_manager.load_input(
+                build_input_context(upstream_output=build_output_context(op_def=my_op))
+            )
+
+
+def test_memoized_plan_checks_outputs_in_batches():
+    checked = []
+
+    class BatchedIOManager(MemoizableIOManager):
+        def handle_output(self, context, obj):
+            pass
+
+        def load_input(self, context):
+            pass
+
+        def has_output(self, context):
+            raise Exception("should check outputs in a batch")
+
+        def has_outputs(self, contexts):
+            checked.append(sorted(context.step_key for context in contexts))
+            return [context.step_key == "first" for context in contexts]
+
+    @op(version="1")
+    def first():
+        return 1
+
+    @op(version="1")
+    def second(_value):
+        return 2
+
+    @job(
+        resource_defs={"io_manager": IOManagerDefinition.hardcoded_io_manager(BatchedIOManager())},
+        tags={MEMOIZED_RUN_TAG: "true"},
+    )
+    def batched_job():
+        second(first())
+
+    with instance_for_test() as instance:
+        result = batched_job.execute_in_process(instance=instance)
+        assert result.success
+        assert checked == [["first", "second"]]
+        assert [event.step_key for event in result.all_events if event.is_step_start] == [
+            "second"
+        ]
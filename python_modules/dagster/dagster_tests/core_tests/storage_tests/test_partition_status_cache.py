@@ -0,0 +1,149 @@
+import tempfile
+
+from dagster import (
+    AssetKey,
+    DailyPartitionsDefinition,
+    StaticPartitionsDefinition,
+    asset,
+    materialize,
+)
+from dagster._core.definitions.assets_job import build_assets_job
+from dagster._core.storage.partition_status_cache import get_and_update_asset_status_cache_values
+from dagster._core.storage.tags import PARTITION_NAME_TAG
+from dagster._core.test_utils import instance_for_test
+
+
+def _get_status(instance, asset_key, partitions_def):
+    cache_value = get_and_update_asset_status_cache_values(instance, {asset_key: partitions_def})[
+        asset_key
+    ]
+    return tuple(
+        set(subset.get_partition_keys())
+        for subset in [
+            cache_value.deserialize_materialized_partition_subsets(partitions_def),
+            cache_value.deserialize_failed_partition_subsets(partitions_def),
+            cache_value.deserialize_in_progress_partition_subsets(partitions_def),
+        ]
+    )
+
+
+def test_static_partitions_status():
+    partitions_def = StaticPartitionsDefinition(["a", "b", "c", "d"])
+    fail_partitions = {"c"}
+
+    @asset(partitions_def=partitions_def)
+    def my_asset(context):
+        if context.partition_key in fail_partitions:
+            raise Exception("failed")
+        return 1
+
+    asset_key = AssetKey("my_asset")
+    with instance_for_test() as instance:
+        assert _get_status(instance, asset_key, partitions_def) == (set(), set(), set())
+
+        materialize([my_asset], instance=instance, partition_key="a")
+        materialize([my_asset], instance=instance, partition_key="c", raise_on_error=False)
+        assert _get_status(instance, asset_key, partitions_def) == ({"a"}, {"c"}, set())
+
+        cached_status = instance.get_asset_records([asset_key])[0].asset_entry.cached_status
+        assert cached_status
+        assert cached_status.latest_storage_id == instance.event_log_storage.get_maximum_record_id()
+
+        # a run that is planned but not yet finished is in progress
+        run = instance.create_run_for_pipeline(
+            build_assets_job("my_job", [my_asset]), tags={PARTITION_NAME_TAG: "d"}
+        )
+        assert _get_status(instance, asset_key, partitions_def) == ({"a"}, {"c"}, {"d"})
+        cached_status = instance.get_asset_records([asset_key])[0].asset_entry.cached_status
+        assert cached_status.earliest_in_progress_materialization_event_id
+
+        instance.report_run_failed(run)
+        fail_partitions.clear()
+        materialize([my_asset], instance=instance, partition_key="c")
+        assert _get_status(instance, asset_key, partitions_def) == ({"a", "c"}, {"d"}, set())
+
+        instance.wipe_assets([asset_key])
+        assert _get_status(instance, asset_key, partitions_def) == (set(), set(), set())
+
+
+def test_time_window_partitions_status():
+    partitions_def = DailyPartitionsDefinition(start_date="2022-01-01", end_offset=0)
+
+    @asset(partitions_def=partitions_def)
+    def daily_asset():
+        return 1
+
+    asset_key = AssetKey("daily_asset")
+    with instance_for_test() as instance:
+        for partition_key in ["2022-01-01", "2022-01-02", "2022-01-04"]:
+            materialize([daily_asset], instance=instance, partition_key=partition_key)
+
+        materialized, _, _ = _get_status(instance, asset_key, partitions_def)
+        assert materialized == {"2022-01-01", "2022-01-02", "2022-01-04"}
+
+        # new materializations are added to the cached subset
+        materialize([daily_asset], instance=instance, partition_key="2022-01-03")
+        materialized, _, _ = _get_status(instance, asset_key, partitions_def)
+        assert materialized == {"2022-01-01", "2022-01-02", "2022-01-03", "2022-01-04"}
+
+        # the cached subset is rebuilt when the partitions definition changes
+        reformatted_partitions_def = DailyPartitionsDefinition(
+            start_date="20220101", end_offset=0, fmt="%Y%m%d"
+        )
+        materialized, _, _ = _get_status(instance, asset_key, reformatted_partitions_def)
+        assert materialized == set()
+
+
+def test_many_assets_status():
+    partitions_def = StaticPartitionsDefinition(["a", "b"])
+
+    @asset(partitions_def=partitions_def)
+    def asset_one():
+        return 1
+
+    @asset(partitions_def=partitions_def)
+    def asset_two():
+        return 2
+
+    asset_keys = [AssetKey("asset_one"), AssetKey("asset_two")]
+    with tempfile.TemporaryDirectory() as temp_dir, instance_for_test(
+        overrides={
+            "event_log_storage": {
+                "module": "dagster._core.storage.event_log",
+                "class": "ConsolidatedSqliteEventLogStorage",
+                "config": {"base_dir": temp_dir},
+            }
+        }
+    ) as instance:
+        materialize([asset_one, asset_two], instance=instance, partition_key="a")
+        materialize([asset_two], instance=instance, partition_key="b")
+
+        event_log_storage = instance.event_log_storage
+        calls = []
+
+        def _record_calls(method_name):
+            method = getattr(event_log_storage, method_name)
+
+            def _recorded(*args, **kwargs):
+                calls.append(method_name)
+                return method(*args, **kwargs)
+
+            setattr(event_log_storage, method_name, _recorded)
+
+        _record_calls("get_event_records")
+        _record_calls("get_event_records_for_asset_keys")
+
+        cache_values = get_and_update_asset_status_cache_values(
+            instance, {asset_key: partitions_def for asset_key in asset_keys}
+        )
+        assert {
+            asset_key: set(
+                cache_value.deserialize_materialized_partition_subsets(
+                    partitions_def
+                ).get_partition_keys()
+            )
+            for asset_key, cache_value in cache_values.items()
+        } == {AssetKey("asset_one"): {"a"}, AssetKey("asset_two"): {"a", "b"}}
+
+        # the planned materializations of all of the assets are fetched in one query
+        assert calls == ["get_event_records_for_asset_keys"]
@@ -0,0 +1,205 @@
+import errno
+import os
+import pickle
+import tempfile
+
+import pytest
+from dagster import (
+    DagsterInvariantViolationError,
+    build_init_resource_context,
+    build_input_context,
+    build_output_context,
+    configured,
+    execute_job,
+    in_process_executor,
+    job,
+    multiprocess_executor,
+    op,
+    reconstructable,
+    shared_memory_io_manager,
+)
+from dagster._core.storage.pipeline_run import DagsterRunStatus
+from dagster._core.storage.serialization_formats import PickleFormat
+from dagster._core.storage.shared_memory_io_manager import SharedMemoryIOManager
+from dagster._core.test_utils import create_run_for_test, instance_for_test
+
+
+class Buffered:
+    """A value whose contents are pickled out of band, like a NumPy array."""
+
+    def __init__(self, data):
+        self.data = data
+
+    def __reduce_ex__(self, protocol):
+        if protocol >= 5:
+            return type(self)._from_buffer, (pickle.PickleBuffer(self.data),)
+        return type(self), (bytes(self.data),)
+
+    @classmethod
+    def _from_buffer(cls, buffer):
+        return cls(memoryview(buffer))
+
+
+@op
+def make_values():
+    return {"numbers": [1, 2, 3], "buffered": Buffered(bytearray(b"x" * 1000))}
+
+
+@op
+def count_values(values):
+    count = sum(values["numbers"]) + len(values["buffered"].data)
+    assert count == 1006
+    return count
+
+
+@job(executor_def=multiprocess_executor, resource_defs={"io_manager": shared_memory_io_manager})
+def shared_memory_job():
+    count_values(make_values())
+
+
+def _run_config(base_dir):
+    return {"resources": {"io_manager": {"config": {"base_dir": base_dir}}}}
+
+
+def test_shared_memory_io_manager_multiprocess():
+    with tempfile.TemporaryDirectory() as base_dir:
+        with instance_for_test() as instance:
+            with execute_job(
+                reconstructable(shared_memory_job),
+                instance=instance,
+                run_config=_run_config(base_dir),
+            ) as result:
+                assert result.success
+
+                handled_output_events = [
+                    event for event in result.all_node_events if event.is_handled_output
+                ]
+                assert len(handled_output_events) == 2
+                metadata = handled_output_events[0].event_specific_data.metadata_entries
+                path = next(entry for entry in metadata if entry.label == "path").value.path
+                assert path == os.path.join(base_dir, result.run_id, "make_values", "result")
+
+                # the values are removed once the run has finished
+                assert os.listdir(base_dir) == []
+                with pytest.raises(DagsterInvariantViolationError, match="No value found"):
+                    result.output_for_node("count_values")
+
+
+@op
+def fail():
+    raise Exception("failed")
+
+
+def test_removes_values_when_run_fails():
+    with tempfile.TemporaryDirectory() as base_dir:
+        io_manager_def = configured(shared_memory_io_manager)({"base_dir": base_dir})
+
+        @job(executor_def=in_process_executor, resource_defs={"io_manager": io_manager_def})
+        def failing_job():
+            count_values(make_values())
+            fail()
+
+        result = failing_job.execute_in_process(raise_on_error=False)
+        assert not result.success
+        assert result.output_for_node("count_values") == 1006
+        assert os.listdir(base_dir) == []
+
+
+@pytest.mark.skipif(pickle.HIGHEST_PROTOCOL < 5, reason="out-of-band buffers need pickle 5")
+def test_out_of_band_buffers_are_mapped():
+    with tempfile.TemporaryDirectory() as base_dir:
+        path = os.path.join(base_dir, "value")
+        with open(path, "wb") as file:
+            PickleFormat().dump(Buffered(bytearray(b"abc" * 100)), file)
+
+        loaded = PickleFormat().load(path)
+        assert isinstance(loaded.data, memoryview)
+        assert bytes(loaded.data) == b"abc" * 100
+
+        # the value is loaded from a private mapping, so writing to it doesn't change the file
+        loaded.data[0] = ord("z")
+        assert bytes(PickleFormat().load(path).data) == b"abc" * 100
+
+
+def test_round_trip_values():
+    with tempfile.TemporaryDirectory() as base_dir:
+        for value in [None, 1, "a string", {"a": [1.5, (2, 3)]}, b"bytes" * 64]:
+            path = os.path.join(base_dir, "value")
+            with open(path, "wb") as file:
+                PickleFormat().dump(value, file)
+            assert PickleFormat().load(path) == value
+
+
+def test_missing_value():
+    with tempfile.TemporaryDirectory() as base_dir:
+        io_manager = shared_memory_io_manager(
+            build_init_resource_context(config={"base_dir": base_dir})
+        )
+        context = build_input_context(
+            upstream_output=build_output_context(name="result", step_key="missing", run_id="abc")
+        )
+        with pytest.raises(DagsterInvariantViolationError, match="No value found"):
+            io_manager.load_input(context)
+
+
+def test_removes_values_of_finished_runs():
+    with tempfile.TemporaryDirectory() as base_dir:
+        with instance_for_test() as instance:
+            finished_run = create_run_for_test(instance, status=DagsterRunStatus.SUCCESS)
+            running_run = create_run_for_test(instance, status=DagsterRunStatus.STARTED)
+            current_run = create_run_for_test(instance, status=DagsterRunStatus.FAILURE)
+            run_ids = [finished_run.run_id, running_run.run_id, current_run.run_id, "unknown"]
+            for run_id in run_ids:
+                os.makedirs(os.path.join(base_dir, run_id, "step"))
+
+            SharedMemoryIOManager(base_dir).remove_finished_runs(
+                instance, exclude_run_ids=[current_run.run_id]
+            )
+            assert sorted(os.listdir(base_dir)) == sorted(run_ids[1:])
+
+            shared_memory_io_manager(
+                build_init_resource_context(config={"base_dir": base_dir}, instance=instance)
+            )
+            assert sorted(os.listdir(base_dir)) == sorted([running_run.run_id, "unknown"])
+
+
+class NoSpaceFormat(PickleFormat):
+    """Fails to write the values in a directory, as if it was full."""
+
+    def __init__(self, full_dir):
+        super().__init__()
+        self.full_dir = full_dir
+
+    def dump(self, obj, file):
+        if file.name.startswith(self.full_dir):
+            raise OSError(errno.ENOSPC, "No space left on device")
+        super().dump(obj, file)
+
+
+def test_falls_back_to_disk_when_out_of_space():
+    with tempfile.TemporaryDirectory() as base_dir, tempfile.TemporaryDirectory() as fallback_dir:
+        io_manager = SharedMemoryIOManager(base_dir, fallback_dir=fallback_dir)
+        io_manager._format = NoSpaceFormat(base_dir)  # pylint: disable=protected-access
+
+        output_context = build_output_context(name="result", step_key="upstream", run_id="abc")
+        io_manager.handle_output(output_context, [1, 2, 3])
+        path = output_context.get_logged_metadata_entries()[0].value.path
+        assert path == os.path.join(fallback_dir, "abc", "upstream", "result")
+        assert os.listdir(os.path.join(base_dir, "abc", "upstream")) == []
+
+        input_context = build_input_context(upstream_output=output_context)
+        assert io_manager.load_input(input_context) == [1, 2, 3]
+
+        io_manager.remove_run("abc")
+        assert os.listdir(fallback_dir) == []
+
+
+def test_out_of_space_without_fallback():
+    with tempfile.TemporaryDirectory() as base_dir:
+        io_manager = SharedMemoryIOManager(base_dir)
+        io_manager._format = NoSpaceFormat(base_dir)  # pylint: disable=protected-access
+
+        output_context = build_output_context(name="result", step_key="upstream", run_id="abc")
+        with pytest.raises(DagsterInvariantViolationError, match="not enough space"):
+            io_manager.handle_output(output_context, [1, 2, 3])
+        assert os.listdir(os.path.join(base_dir, "abc", "upstream")) == []
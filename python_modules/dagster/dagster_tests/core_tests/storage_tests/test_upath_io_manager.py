@@ -1,8 +1,10 @@
 import json
 import pickle
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List
 
 import pytest
 from upath import UPath
@@ -15,6 +17,7 @@
     Field,
     HourlyPartitionsDefinition,
     InitResourceContext,
+    IOManagerDefinition,
     InputContext,
     MetadataValue,
     OpExecutionContext,
@@ -347,3 +350,90 @@ def my_asset() -> Any:
     ].entry_data.value == get_length(
         json_data
     )
+
+
+class SlowIOManager(UPathIOManager):
+    """
+    This IOManager records the number of concurrent loads, and loads later partitions faster
+    """
+
+    def __init__(self, base_path: UPath):
+        super().__init__(base_path=base_path)
+        self.lock = threading.Lock()
+        self.num_loading = 0
+        self.max_num_loading = 0
+
+    def dump_to_path(self, context: OutputContext, obj: str, path: UPath):
+        pass
+
+    def load_from_path(self, context: InputContext, path: UPath) -> str:
+        with self.lock:
+            self.num_loading += 1
+            self.max_num_loading = max(self.max_num_loading, self.num_loading)
+        time.sleep(0.01 * (16 - int(path.stem.split("_")[-1], 16)))
+        with self.lock:
+            self.num_loading -= 1
+        return path.stem
+
+
+@pytest.mark.parametrize("max_concurrent_partition_loads", [1, 4])
+def test_upath_io_manager_concurrent_partition_loads(
+    tmp_path: Path, max_concurrent_partition_loads: int
+):
+    partitions_def = StaticPartitionsDefinition([f"partition_{i:x}" for i in range(16)])
+    manager = SlowIOManager(base_path=UPath(tmp_path))
+
+    @asset(partitions_def=partitions_def)
+    def upstream_asset(context: OpExecutionContext) -> str:
+        return context.partition_key
+
+    @asset(
+        ins={
+            "upstream_asset": AssetIn(
+                partition_mapping=AllPartitionMapping(),
+                metadata={"max_concurrent_partition_loads": max_concurrent_partition_loads},
+            )
+        }
+    )
+    def downstream_asset(upstream_asset: Dict[str, str]) -> Dict[str, str]:
+        return upstream_asset
+
+    result = materialize(
+        [*upstream_asset.to_source_assets(), downstream_asset],
+        resources={"io_manager": IOManagerDefinition.hardcoded_io_manager(manager)},
+    )
+    downstream_asset_data = result.output_for_node("downstream_asset", "result")
+    assert list(downstream_asset_data.items()) == [
+        (partition_key, partition_key) for partition_key in partitions_def.get_partition_keys()
+    ]
+    assert manager.max_num_loading == max_concurrent_partition_loads
+
+
+def test_upath_io_manager_stream_partitions(tmp_path: Path):
+    partitions_def = StaticPartitionsDefinition([f"partition_{i:x}" for i in range(16)])
+    manager = SlowIOManager(base_path=UPath(tmp_path))
+
+    @asset(partitions_def=partitions_def)
+    def upstream_asset(context: OpExecutionContext) -> str:
+        return context.partition_key
+
+    @asset(
+        ins={
+            "upstream_asset": AssetIn(
+                partition_mapping=AllPartitionMapping(),
+                metadata={"stream_partitions": True, "max_concurrent_partition_loads": 2},
+            )
+        }
+    )
+    def downstream_asset(upstream_asset) -> List[str]:
+        assert isinstance(upstream_asset, Iterator)
+        # only the partitions being loaded are held at any time
+        assert manager.max_num_loading == 0
+        return [partition_key for partition_key, _ in upstream_asset]
+
+    result = materialize(
+        [*upstream_asset.to_source_assets(), downstream_asset],
+        resources={"io_manager": IOManagerDefinition.hardcoded_io_manager(manager)},
+    )
+    assert result.output_for_node("downstream_asset") == partitions_def.get_partition_keys()
+    assert manager.max_num_loading == 2
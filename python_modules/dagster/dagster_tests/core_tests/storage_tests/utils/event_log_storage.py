@@ -761,6 +761,38 @@ def test_basic_get_logs_for_run_multiple_runs(self, instance, storage):
             stats_two = storage.get_stats_for_run(result_two.run_id)
             assert stats_two.steps_succeeded == 1
 
+    def test_get_logs_and_stats_for_runs(self, instance, storage):
+        events_one, result_one = _synthesize_events(return_one_solid_func)
+        events_two, result_two = _synthesize_events(return_one_solid_func)
+        run_ids = [result_one.run_id, result_two.run_id, "missing_run"]
+
+        with create_and_delete_test_runs(instance, [result_one.run_id, result_two.run_id]):
+            for event in events_one + events_two:
+                storage.store_event(event)
+
+            logs_by_run_id = storage.get_logs_for_runs(run_ids)
+            assert set(logs_by_run_id.keys()) == set(run_ids)
+            assert logs_by_run_id["missing_run"] == []
+            for run_id in run_ids:
+                assert [event.message for event in logs_by_run_id[run_id]] == [
+                    event.message for event in storage.get_logs_for_run(run_id)
+                ]
+
+            typed_logs_by_run_id = storage.get_logs_for_runs(
+                run_ids, of_type=DagsterEventType.STEP_SUCCESS
+            )
+            assert [len(typed_logs_by_run_id[run_id]) for run_id in run_ids] == [1, 1, 0]
+
+            stats_by_run_id = storage.get_stats_for_runs(run_ids)
+            for run_id in run_ids:
+                assert stats_by_run_id[run_id] == storage.get_stats_for_run(run_id)
+            assert stats_by_run_id[result_one.run_id].steps_succeeded == 1
+
+            step_stats_by_run_id = storage.get_step_stats_for_runs(run_ids)
+            for run_id in run_ids:
+                assert step_stats_by_run_id[run_id] == storage.get_step_stats_for_run(run_id)
+            assert len(step_stats_by_run_id[result_two.run_id]) == 1
+
     def test_basic_get_logs_for_run_multiple_runs_cursors(self, instance, storage):
 
         events_one, result_one = _synthesize_events(return_one_solid_func)
@@ -1938,6 +1970,53 @@ def _fetch_counts(storage):
                     assert materialization_count_by_partition.get(c)["a"] == 1
                     assert materialization_count_by_partition.get(d)["x"] == 2
 
+    def test_get_event_records_for_asset_keys(self, storage, test_run_id):
+        a = AssetKey("observed_asset")
+        b = AssetKey("materialized_asset")
+        c = AssetKey(["prefixed", "materialized_asset"])
+
+        @op
+        def materialize():
+            yield AssetObservation(a)
+            yield AssetMaterialization(b, partition="x")
+            yield AssetMaterialization(c)
+            yield AssetMaterialization(b, partition="y")
+            yield Output(None)
+
+        with instance_for_test() as created_instance:
+            if not storage._instance:  # pylint: disable=protected-access
+                storage.register_instance(created_instance)
+
+            events, _ = _synthesize_events(
+                lambda: materialize(), instance=created_instance, run_id=test_run_id
+            )
+            for event in events:
+                storage.store_event(event)
+
+            def _get_records(asset_key, after_cursor=None):
+                return storage.get_event_records(
+                    EventRecordsFilter(
+                        event_type=DagsterEventType.ASSET_MATERIALIZATION,
+                        asset_key=asset_key,
+                        after_cursor=after_cursor,
+                    ),
+                    ascending=True,
+                )
+
+            b_cursor = _get_records(b)[0].storage_id
+            records_by_asset_key = storage.get_event_records_for_asset_keys(
+                DagsterEventType.ASSET_MATERIALIZATION, {a: None, b: b_cursor, c: None}
+            )
+            assert set(records_by_asset_key.keys()) == {a, b, c}
+            assert records_by_asset_key[a] == []
+            assert records_by_asset_key[b] == _get_records(b, after_cursor=b_cursor)
+            assert [
+                record.event_log_entry.dagster_event.partition
+                for record in records_by_asset_key[b]
+            ] == ["y"]
+            assert records_by_asset_key[c] == _get_records(c)
+            assert len(records_by_asset_key[c]) == 1
+
     def test_get_observation(self, storage, test_run_id):
         a = AssetKey(["key_a"])
 
@@ -2172,6 +2251,56 @@ def never_materializes_asset():
                     assert len(records) == 1
                     assert result.run_id == records[0].asset_entry.last_run_id
 
+    def test_asset_record_latest_status(self, storage, test_run_id):
+        a = AssetKey(["key_a"])
+
+        @op
+        def gen_op():
+            yield AssetMaterialization(asset_key=a)
+            yield AssetObservation(asset_key=a, metadata={"foo": "bar"})
+            yield Output(1)
+
+        with instance_for_test() as instance:
+            if not storage._instance:  # pylint: disable=protected-access
+                storage.register_instance(instance)
+
+            events, _ = _synthesize_events(lambda: gen_op(), instance=instance, run_id=test_run_id)
+            for event in events:
+                storage.store_event(event)
+
+            [materialization_record] = storage.get_event_records(
+                EventRecordsFilter(event_type=DagsterEventType.ASSET_MATERIALIZATION, asset_key=a)
+            )
+            [observation_record] = storage.get_event_records(
+                EventRecordsFilter(event_type=DagsterEventType.ASSET_OBSERVATION, asset_key=a)
+            )
+
+            [asset_record] = storage.get_asset_records([a])
+            asset_entry = asset_record.asset_entry
+            assert asset_entry.last_run_id == test_run_id
+            assert asset_entry.last_materialization_storage_id == materialization_record.storage_id
+            assert asset_entry.last_observation == observation_record.event_log_entry
+
+            if self.can_wipe():
+                storage.wipe_asset(a)
+                events, _ = _synthesize_events(
+                    lambda: gen_op(), instance=instance, run_id=make_new_run_id()
+                )
+                for event in events:
+                    storage.store_event(event)
+
+                materialization_record = storage.get_event_records(
+                    EventRecordsFilter(
+                        event_type=DagsterEventType.ASSET_MATERIALIZATION, asset_key=a
+                    ),
+                    limit=1,
+                )[0]
+                [asset_record] = storage.get_asset_records([a])
+                assert (
+                    asset_record.asset_entry.last_materialization_storage_id
+                    == materialization_record.storage_id
+                )
+
     def test_get_logs_for_all_runs_by_log_id_of_type(self, storage):
         if not storage.supports_event_consumer_queries():
             pytest.skip("storage does not support event consumer queries")
@@ -1,9 +1,11 @@
+import logging
 import sys
 import tempfile
 from datetime import datetime
 
 import pendulum
 import pytest
+import sqlalchemy as db
 
 from dagster import _seven, job, op
 from dagster._core.definitions import GraphDefinition
@@ -32,8 +34,18 @@
     TagBucket,
 )
 from dagster._core.storage.root import LocalArtifactStorage
-from dagster._core.storage.runs.migration import REQUIRED_DATA_MIGRATIONS
-from dagster._core.storage.runs.sql_run_storage import SqlRunStorage
+from dagster._core.storage.runs.migration import (
+    PIPELINE_SNAPSHOT_COMPONENTS,
+    REQUIRED_DATA_MIGRATIONS,
+)
+from dagster._core.storage.runs.schema import SecondaryIndexMigrationTable, SnapshotsTable
+from dagster._core.storage.runs.sql_run_storage import (
+    _SNAPSHOT_COMPONENT_CACHE,
+    PIPELINE_SNAPSHOT_COMPONENT_FIELDS,
+    SnapshotType,
+    SqlRunStorage,
+    defensively_unpack_pipeline_snapshot_query,
+)
 from dagster._core.storage.tags import (
     PARENT_RUN_ID_TAG,
     PARTITION_NAME_TAG,
@@ -814,6 +826,106 @@ def test_add_get_snapshot(self, storage):
 
             assert not storage.has_pipeline_snapshot(pipeline_snapshot_id)
 
+    def test_pipeline_snapshot_components_are_shared(self, storage):
+        if not isinstance(storage, SqlRunStorage):
+            return
+
+        @op
+        def shared_op():
+            pass
+
+        @job
+        def first_job():
+            shared_op()
+
+        @job
+        def second_job():
+            shared_op()
+
+        storage.mark_index_built(PIPELINE_SNAPSHOT_COMPONENTS)
+
+        first_snapshot = first_job.get_pipeline_snapshot()
+        second_snapshot = second_job.get_pipeline_snapshot()
+        first_snapshot_id = storage.add_pipeline_snapshot(first_snapshot)
+        second_snapshot_id = storage.add_pipeline_snapshot(second_snapshot)
+        assert first_snapshot_id != second_snapshot_id
+
+        rows = storage.fetchall(
+            db.select([SnapshotsTable.c.snapshot_id, SnapshotsTable.c.snapshot_type])
+        )
+        assert sorted(snapshot_type for _, snapshot_type in rows) == [
+            SnapshotType.PIPELINE_COMPONENT.value
+        ] * len(PIPELINE_SNAPSHOT_COMPONENT_FIELDS) + [
+            SnapshotType.PIPELINE_WITH_COMPONENT_REFS.value
+        ] * 2
+
+        # read through an empty component cache, and then from a warm one
+        _SNAPSHOT_COMPONENT_CACHE.clear()
+        for _ in range(2):
+            assert serialize_pp(storage.get_pipeline_snapshot(first_snapshot_id)) == serialize_pp(
+                first_snapshot
+            )
+            assert serialize_pp(storage.get_pipeline_snapshot(second_snapshot_id)) == serialize_pp(
+                second_snapshot
+            )
+
+    def test_pipeline_snapshot_stored_whole_until_migrated(self, storage):
+        if not isinstance(storage, SqlRunStorage):
+            return
+
+        # storages created before the migration existed have not built it
+        with storage.connect() as conn:
+            conn.execute(
+                SecondaryIndexMigrationTable.delete()  # pylint: disable=no-value-for-parameter
+                .where(SecondaryIndexMigrationTable.c.name == PIPELINE_SNAPSHOT_COMPONENTS)
+            )
+        assert not storage.has_built_index(PIPELINE_SNAPSHOT_COMPONENTS)
+
+        pipeline_def = GraphDefinition(name="some_pipeline", node_defs=[]).to_job()
+        pipeline_snapshot = pipeline_def.get_pipeline_snapshot()
+        pipeline_snapshot_id = storage.add_pipeline_snapshot(pipeline_snapshot)
+
+        rows = storage.fetchall(
+            db.select([SnapshotsTable.c.snapshot_body, SnapshotsTable.c.snapshot_type])
+        )
+        assert len(rows) == 1
+        assert rows[0][1] == SnapshotType.PIPELINE.value
+
+        # readable by processes running older versions of dagster, which unpack the row as is
+        assert serialize_pp(
+            defensively_unpack_pipeline_snapshot_query(logging, rows[0])
+        ) == serialize_pp(pipeline_snapshot)
+        assert serialize_pp(storage.get_pipeline_snapshot(pipeline_snapshot_id)) == serialize_pp(
+            pipeline_snapshot
+        )
+
+        storage.optimize()
+        assert storage.has_built_index(PIPELINE_SNAPSHOT_COMPONENTS)
+
+        other_pipeline_def = GraphDefinition(name="other_pipeline", node_defs=[]).to_job()
+        storage.add_pipeline_snapshot(other_pipeline_def.get_pipeline_snapshot())
+        snapshot_types = {
+            row[0] for row in storage.fetchall(db.select([SnapshotsTable.c.snapshot_type]))
+        }
+        assert SnapshotType.PIPELINE_WITH_COMPONENT_REFS.value in snapshot_types
+
+    def test_get_pipeline_snapshot_stored_whole(self, storage):
+        if not isinstance(storage, SqlRunStorage):
+            return
+
+        pipeline_def = GraphDefinition(name="some_pipeline", node_defs=[]).to_job()
+        pipeline_snapshot = pipeline_def.get_pipeline_snapshot()
+        pipeline_snapshot_id = create_pipeline_snapshot_id(pipeline_snapshot)
+
+        # pipeline snapshots used to be stored with their components in a single row
+        storage._add_snapshot(  # pylint: disable=protected-access
+            pipeline_snapshot_id, pipeline_snapshot, SnapshotType.PIPELINE
+        )
+        assert storage.has_pipeline_snapshot(pipeline_snapshot_id)
+        assert serialize_pp(storage.get_pipeline_snapshot(pipeline_snapshot_id)) == serialize_pp(
+            pipeline_snapshot
+        )
+
     def test_single_write_read_with_snapshot(self, storage):
         run_with_snapshot_id = "lkasjdflkjasdf"
         pipeline_def = GraphDefinition(name="some_pipeline", node_defs=[]).to_job()
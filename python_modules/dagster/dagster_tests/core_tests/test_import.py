@@ -1,8 +1,187 @@
+import ast
+import json
+import subprocess
+import sys
+from typing import Mapping, Tuple
+
 import pytest
 
+import dagster
+
+# Third-party modules that are expensive to import, and that should only be imported once the parts
+# of dagster that need them are used.
+HEAVY_MODULES = ["alembic", "grpc", "sqlalchemy"]
+
+# Modules that `import dagster` should not import, since they are only needed once the API is used.
+MODULES_IMPORTED_ON_USE = [
+    "croniter",
+    "dagster._core.definitions.decorators",
+    "dagster._core.host_representation.external",
+    "dagster._core.instance",
+    "pendulum",
+]
+
+
+def _import_times(statement: str) -> Mapping[str, Tuple[int, int]]:
+    """Runs the statement in a new interpreter with `-X importtime`, and returns the self and
+    cumulative import time in microseconds of every module it imported."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    import_times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_us, cumulative_us, module = line[len("import time:") :].split("|")
+        if self_us.strip().isdigit():
+            import_times[module.strip()] = (int(self_us), int(cumulative_us))
+    return import_times
+
 
 def test_no_warnings_on_import():
     with pytest.warns(None) as record:
-        import dagster  # pylint: disable=unused-import
+        import dagster  # pylint: disable=unused-import,redefined-outer-name,reimported
 
     assert len(record) == 0
+
+
+def test_public_api_is_lazy():
+    with open(dagster.__file__, encoding="utf8") as f:
+        tree = ast.parse(f.read())
+
+    # names imported in the TYPE_CHECKING block with the `from x import X as X` form
+    statically_imported = {
+        alias.name: node.module
+        for statement in tree.body
+        if isinstance(statement, ast.If)
+        and isinstance(statement.test, ast.Name)
+        and statement.test.id == "TYPE_CHECKING"
+        for node in statement.body
+        if isinstance(node, ast.ImportFrom)
+        for alias in node.names
+        if alias.asname == alias.name
+    }
+    assert statically_imported == dagster._PUBLIC_API  # pylint: disable=protected-access
+
+    for name in dagster._PUBLIC_API:  # pylint: disable=protected-access
+        assert getattr(dagster, name) is not None
+        assert name in dir(dagster)
+
+
+def test_import_time():
+    import_times = _import_times("import dagster")
+
+    _, cumulative_us = import_times["dagster"]
+    eagerly_imported_modules = [
+        module
+        for module in import_times
+        if module in HEAVY_MODULES or module in MODULES_IMPORTED_ON_USE
+    ]
+    assert eagerly_imported_modules == [], f"import dagster took {cumulative_us / 1000:.1f}ms"
+
+
+def test_import_does_not_load_api():
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, dagster; print(sorted(set(sys.modules) & set(sys.argv[1:])))",
+            *HEAVY_MODULES,
+            *MODULES_IMPORTED_ON_USE,
+        ],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    assert result.stdout.strip() == "[]"
+
+
+@pytest.mark.parametrize(
+    "module",
+    [
+        "dagster._cli",
+        "dagster._config",
+        "dagster._core.events",
+        "dagster._core.execution.api",
+        "dagster._core.instance",
+        "dagster._grpc.server",
+        "dagster._utils.log",
+    ],
+)
+def test_submodule_imports_on_its_own(module):
+    subprocess.run([sys.executable, "-c", f"import {module}"], check=True)
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "from dagster import asset, op, job, Definitions",
+        "from dagster import DagsterInstance",
+        "from dagster import build_asset_reconciliation_sensor",
+    ],
+)
+def test_public_api_does_not_import_heavy_modules(statement):
+    import_times = _import_times(statement)
+
+    assert [module for module in HEAVY_MODULES if module in import_times] == []
+
+
+# imports every module of the dagster package, and prints the names of the whitelisted classes and
+# enums that they register
+PRINT_WHITELISTED_NAMES = """
+import json, pkgutil, dagster
+from dagster._serdes.serdes import _WHITELIST_MAP
+
+for module in pkgutil.walk_packages(dagster.__path__, "dagster."):
+    if module.name.endswith("__main__"):
+        continue
+    try:
+        __import__(module.name)
+    except Exception:  # modules that need optional dependencies
+        pass
+print(json.dumps({"tuples": sorted(_WHITELIST_MAP.tuples), "enums": sorted(_WHITELIST_MAP.enums)}))
+"""
+
+# deserializes each of the whitelisted names read from stdin after only `import dagster`, and prints
+# the names that were missing from the whitelist
+PRINT_NAMES_MISSING_FROM_WHITELIST = """
+import json, sys, dagster
+from dagster._serdes import deserialize_value
+from dagster._serdes.errors import DeserializationError
+
+names = json.load(sys.stdin)
+values = [{"__class__": name} for name in names["tuples"]]
+values += [{"__enum__": name + ".VALUE"} for name in names["enums"]]
+missing = []
+for value in values:
+    try:
+        deserialize_value(json.dumps(value))
+    except DeserializationError as e:
+        if "whitelist" in str(e):
+            missing.append(value)
+    except Exception:  # the values are missing their fields
+        pass
+print(json.dumps(missing))
+"""
+
+
+def test_deserialize_whitelisted_names_after_import():
+    whitelisted_names = subprocess.run(
+        [sys.executable, "-c", PRINT_WHITELISTED_NAMES],
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout
+    assert "PipelineSnapshot" in json.loads(whitelisted_names)["tuples"]
+
+    result = subprocess.run(
+        [sys.executable, "-c", PRINT_NAMES_MISSING_FROM_WHITELIST],
+        input=whitelisted_names,
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    assert json.loads(result.stdout) == []
@@ -4,7 +4,9 @@
 import tempfile
 import time
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import ExitStack, contextmanager
+from functools import partialmethod
 
 import pendulum
 import pytest
@@ -57,6 +59,7 @@
 )
 from dagster._daemon import get_default_daemon_logger
 from dagster._daemon.sensor import execute_sensor_iteration, execute_sensor_iteration_loop
+from dagster._grpc.client import DagsterGrpcClient
 from dagster._legacy import pipeline, solid
 from dagster._seven.compat.pendulum import create_pendulum_time, to_timezone
 
@@ -155,6 +158,12 @@ def failure_solid():
     raise Exception("womp womp")
 
 
+@sensor(job_name="the_pipeline")
+def slow_sensor(_context):
+    time.sleep(4)
+    return RunRequest(run_key=None, run_config={}, tags={})
+
+
 @pipeline
 def failure_pipeline():
     failure_solid()
@@ -510,6 +519,7 @@ def the_repo():
         large_sensor,
         simple_sensor,
         error_sensor,
+        slow_sensor,
         wrong_config_sensor,
         always_on_sensor,
         run_key_sensor,
@@ -1083,6 +1093,134 @@ def test_error_sensor(caplog, executor, instance, workspace_context, external_re
         assert state.instigator_data.last_tick_timestamp == freeze_datetime.timestamp()
 
 
+@pytest.mark.parametrize("executor", get_sensor_executors())
+def test_slow_sensor_in_batch(monkeypatch, executor, instance, workspace_context, external_repo):
+    # no result arrives from the location within the timeout while the slow sensor is evaluated,
+    # so the request is cancelled once the results of the other sensors have arrived
+    for method_name in ["external_sensor_execution", "external_sensor_execution_batch"]:
+        monkeypatch.setattr(
+            DagsterGrpcClient,
+            method_name,
+            partialmethod(getattr(DagsterGrpcClient, method_name), timeout=2),
+        )
+
+    freeze_datetime = to_timezone(
+        create_pendulum_time(year=2019, month=2, day=27, hour=23, minute=59, second=59, tz="UTC"),
+        "US/Central",
+    )
+    with pendulum.test(freeze_datetime):
+        external_sensors = [
+            external_repo.get_external_sensor(sensor_name)
+            for sensor_name in ["slow_sensor", "always_on_sensor", "error_sensor"]
+        ]
+        for external_sensor in external_sensors:
+            instance.add_instigator_state(
+                InstigatorState(
+                    external_sensor.get_external_origin(),
+                    InstigatorType.SENSOR,
+                    InstigatorStatus.RUNNING,
+                )
+            )
+
+        evaluate_sensors(workspace_context, executor)
+
+        slow_sensor_ticks, always_on_sensor_ticks, error_sensor_ticks = [
+            instance.get_ticks(
+                external_sensor.get_external_origin_id(), external_sensor.selector_id
+            )
+            for external_sensor in external_sensors
+        ]
+
+        # the timeout of the slow sensor is only reported on its own tick
+        assert len(slow_sensor_ticks) == 1
+        validate_tick(
+            slow_sensor_ticks[0],
+            external_sensors[0],
+            freeze_datetime,
+            TickStatus.FAILURE,
+            [],
+            "Could not reach user code server",
+        )
+
+        wait_for_all_runs_to_start(instance)
+        assert instance.get_runs_count() == 1
+        run = instance.get_runs()[0]
+        validate_run_started(run)
+        assert len(always_on_sensor_ticks) == 1
+        validate_tick(
+            always_on_sensor_ticks[0],
+            external_sensors[1],
+            freeze_datetime,
+            TickStatus.SUCCESS,
+            [run.run_id],
+        )
+
+        assert len(error_sensor_ticks) == 1
+        validate_tick(
+            error_sensor_ticks[0],
+            external_sensors[2],
+            freeze_datetime,
+            TickStatus.FAILURE,
+            [],
+            "Error occurred during the execution of evaluation_fn for sensor error_sensor",
+        )
+        assert slow_sensor_ticks[0].error is not error_sensor_ticks[0].error
+
+
+@pytest.mark.skipif(sys.version_info.minor != 9, reason="timeouts")
+def test_slow_sensor_does_not_hold_back_batch(instance, workspace_context, external_repo):
+    freeze_datetime = to_timezone(
+        create_pendulum_time(year=2019, month=2, day=27, hour=23, minute=59, second=59, tz="UTC"),
+        "US/Central",
+    )
+    with pendulum.test(freeze_datetime):
+        slow_sensor = external_repo.get_external_sensor("slow_sensor")
+        always_on_sensor = external_repo.get_external_sensor("always_on_sensor")
+        for external_sensor in [slow_sensor, always_on_sensor]:
+            instance.add_instigator_state(
+                InstigatorState(
+                    external_sensor.get_external_origin(),
+                    InstigatorType.SENSOR,
+                    InstigatorStatus.RUNNING,
+                )
+            )
+
+        futures = {}
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            list(
+                execute_sensor_iteration(
+                    workspace_context,
+                    get_default_daemon_logger("SensorDaemon"),
+                    threadpool_executor=executor,
+                    sensor_tick_futures=futures,
+                )
+            )
+
+            # each sensor has its own future, so the tick of a sensor is processed as soon as its
+            # result arrives, without waiting for the rest of the sensors from its location
+            futures[always_on_sensor.selector_id].result(timeout=75)
+            assert not futures[slow_sensor.selector_id].done()
+            assert (
+                len(
+                    instance.get_ticks(
+                        slow_sensor.get_external_origin_id(), slow_sensor.selector_id
+                    )
+                )
+                == 0
+            )
+
+            wait_for_futures(futures, timeout=75)
+
+        wait_for_all_runs_to_start(instance)
+        assert instance.get_runs_count() == 2
+        for external_sensor in [slow_sensor, always_on_sensor]:
+            ticks = instance.get_ticks(
+                external_sensor.get_external_origin_id(), external_sensor.selector_id
+            )
+            assert len(ticks) == 1
+            assert ticks[0].status == TickStatus.SUCCESS
+
+
 @pytest.mark.parametrize("executor", get_sensor_executors())
 def test_wrong_config_sensor(caplog, executor, instance, workspace_context, external_repo):
     freeze_datetime = to_timezone(
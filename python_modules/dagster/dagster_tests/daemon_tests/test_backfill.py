@@ -7,6 +7,7 @@
 import pendulum
 import pytest
 
+import dagster._core.execution.backfill as backfill_module
 from dagster import (
     Any,
     AssetKey,
@@ -200,6 +201,13 @@ def bar(a1):
     return a1
 
 
+@asset(partitions_def=static_partitions)
+def fails_on_y(context):
+    if context.partition_key == "y":
+        raise Exception("failed on y")
+    return 1
+
+
 @asset(
     config_schema={"myparam": Field(str, description="YYYY-MM-DD")},
 )
@@ -260,6 +268,7 @@ def the_repo():
         bar,
         ab1,
         ab2,
+        fails_on_y,
         define_asset_job("twisted_asset_mess", selection="*b2", partitions_def=static_partitions),
         # baz is a configurable asset which has no dependencies
         baz,
@@ -671,6 +680,69 @@ def test_backfill_with_asset_selection(instance, workspace_context, external_rep
         assert len(instance.run_ids_for_asset_key(asset_key)) == 0
 
 
+def test_asset_backfill_from_failure(instance, workspace_context, external_repo, monkeypatch):
+    partition_name_list = [partition.name for partition in static_partitions.get_partitions()]
+    asset_selection = [AssetKey("foo"), AssetKey("fails_on_y")]
+    asset_job_name = the_repo.get_base_job_for_assets(asset_selection).name
+    external_partition_set = external_repo.get_external_partition_set(
+        f"{asset_job_name}_partition_set"
+    )
+    instance.add_backfill(
+        PartitionBackfill(
+            backfill_id="asset_backfill",
+            partition_set_origin=external_partition_set.get_external_origin(),
+            status=BulkActionStatus.REQUESTED,
+            partition_names=partition_name_list,
+            from_failure=False,
+            reexecution_steps=None,
+            tags=None,
+            backfill_timestamp=pendulum.now().timestamp(),
+            asset_selection=asset_selection,
+        )
+    )
+    list(execute_backfill_iteration(workspace_context, get_default_daemon_logger("BackfillDaemon")))
+    wait_for_all_runs_to_finish(instance, timeout=30)
+    assert instance.get_runs_count() == 3
+    assert [
+        run.tags[PARTITION_NAME_TAG]
+        for run in instance.get_runs(filters=RunsFilter(statuses=[PipelineRunStatus.FAILURE]))
+    ] == ["y"]
+
+    fetched_partition_names = []
+    fetch_last_run = backfill_module._fetch_last_run
+
+    def _fetch_last_run(instance, external_partition_set, partition_name):
+        fetched_partition_names.append(partition_name)
+        return fetch_last_run(instance, external_partition_set, partition_name)
+
+    monkeypatch.setattr(backfill_module, "_fetch_last_run", _fetch_last_run)
+
+    instance.add_backfill(
+        PartitionBackfill(
+            backfill_id="asset_backfill_from_failure",
+            partition_set_origin=external_partition_set.get_external_origin(),
+            status=BulkActionStatus.REQUESTED,
+            partition_names=partition_name_list,
+            from_failure=True,
+            reexecution_steps=None,
+            tags=None,
+            backfill_timestamp=pendulum.now().timestamp(),
+            asset_selection=asset_selection,
+        )
+    )
+    list(execute_backfill_iteration(workspace_context, get_default_daemon_logger("BackfillDaemon")))
+    wait_for_all_runs_to_finish(instance, timeout=30)
+
+    # the partitions that did not fail are skipped without looking up their last run
+    assert fetched_partition_names == ["y"]
+    from_failure_runs = instance.get_runs(
+        filters=RunsFilter(tags={BACKFILL_ID_TAG: "asset_backfill_from_failure"})
+    )
+    assert [run.tags[PARTITION_NAME_TAG] for run in from_failure_runs] == ["y"]
+    assert step_did_not_run(instance, from_failure_runs[0], "foo")
+    assert step_failed(instance, from_failure_runs[0], "fails_on_y")
+
+
 def test_backfill_from_failure_for_subselection(instance, workspace_context, external_repo):
     partition = parallel_failure_partition_set.get_partition("one")
     run_config = parallel_failure_partition_set.run_config_for_partition(partition)
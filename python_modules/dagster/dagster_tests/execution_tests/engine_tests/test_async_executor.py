@@ -0,0 +1,202 @@
+import asyncio
+import threading
+import time
+
+import pytest
+from dagster import DynamicOut, DynamicOutput, In, Out, RetryPolicy, async_executor, job, op
+from dagster._core.definitions.decorators.hook_decorator import success_hook
+from dagster._core.test_utils import instance_for_test
+from dagster._legacy import execute_pipeline
+
+NUM_WAITING_OPS = 5
+
+
+def _run_config(max_concurrent=None):
+    config = {"max_concurrent": max_concurrent} if max_concurrent else {}
+    return {"execution": {"config": config}}
+
+
+def _step_keys_in_order(result, predicate):
+    return [event.step_key for event in result.event_list if predicate(event)]
+
+
+class _RunningCounter:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.running = 0
+        self.max_running = 0
+
+    def start(self):
+        with self._lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+
+    def stop(self):
+        with self._lock:
+            self.running -= 1
+
+
+def test_async_ops_run_concurrently():
+    counter = _RunningCounter()
+    event_loop_threads = set()
+
+    @op(out=DynamicOut())
+    def fan_out():
+        for i in range(NUM_WAITING_OPS):
+            yield DynamicOutput(i, mapping_key=str(i))
+
+    @op
+    async def wait_for_all(num):
+        # only finishes once every op is in flight at the same time
+        event_loop_threads.add(threading.current_thread().name)
+        counter.start()
+        deadline = time.time() + 30
+        while counter.max_running < NUM_WAITING_OPS and time.time() < deadline:
+            await asyncio.sleep(0.01)
+        counter.stop()
+        return num
+
+    @op
+    def total(nums):
+        return sum(nums)
+
+    @job(executor_def=async_executor)
+    def fan_out_job():
+        total(fan_out().map(wait_for_all).collect())
+
+    with instance_for_test() as instance:
+        result = execute_pipeline(fan_out_job, run_config=_run_config(), instance=instance)
+        assert result.success
+        assert result.result_for_solid("total").output_value() == sum(range(NUM_WAITING_OPS))
+        assert counter.max_running == NUM_WAITING_OPS
+        assert event_loop_threads == {"dagster_event_loop"}
+
+
+def test_max_concurrent():
+    counter = _RunningCounter()
+
+    @op
+    async def tracked():
+        counter.start()
+        await asyncio.sleep(0.05)
+        counter.stop()
+
+    @job(executor_def=async_executor)
+    def concurrent_job():
+        for i in range(4):
+            tracked.alias(f"tracked_{i}")()
+
+    with instance_for_test() as instance:
+        result = execute_pipeline(
+            concurrent_job, run_config=_run_config(max_concurrent=2), instance=instance
+        )
+        assert result.success
+        assert counter.max_running == 2
+
+
+def test_step_event_order():
+    @op
+    async def emit():
+        await asyncio.sleep(0.01)
+        return 1
+
+    @op
+    def add_one(num):
+        return num + 1
+
+    @op(ins={"first": In(), "second": In()})
+    def add(first, second):
+        return first + second
+
+    @job(executor_def=async_executor)
+    def order_job():
+        add(add_one(emit.alias("emit_a")()), add_one.alias("add_one_b")(emit.alias("emit_b")()))
+
+    with instance_for_test() as instance:
+        result = execute_pipeline(order_job, run_config=_run_config(), instance=instance)
+        assert result.success
+        assert result.result_for_solid("add").output_value() == 4
+
+        for step_key in ["emit_a", "emit_b", "add_one", "add_one_b", "add"]:
+            step_event_types = [
+                event.event_type_value
+                for event in result.event_list
+                if event.step_key == step_key and event.is_step_event
+            ]
+            assert step_event_types[0] == "STEP_START"
+            assert step_event_types[-1] == "STEP_SUCCESS"
+            assert step_event_types.index("STEP_OUTPUT") < step_event_types.index("HANDLED_OUTPUT")
+
+        successes = _step_keys_in_order(result, lambda event: event.is_step_success)
+        starts = _step_keys_in_order(result, lambda event: event.is_step_start)
+        assert starts.index("add") > successes.index("add_one")
+        assert starts.index("add") > successes.index("add_one_b")
+
+
+def test_failure_skips_downstream():
+    @op
+    async def fails():
+        raise Exception("oops")
+
+    @op
+    async def succeeds():
+        return 1
+
+    @op
+    def downstream(_num):
+        pass
+
+    @job(executor_def=async_executor)
+    def failure_job():
+        downstream(fails())
+        downstream.alias("other_downstream")(succeeds())
+
+    with instance_for_test() as instance:
+        result = execute_pipeline(
+            failure_job, run_config=_run_config(), instance=instance, raise_on_error=False
+        )
+        assert not result.success
+        assert result.result_for_solid("fails").failure_data
+        assert result.result_for_solid("other_downstream").success
+        assert "downstream" not in _step_keys_in_order(result, lambda event: event.is_step_start)
+
+
+def test_raise_on_error():
+    @op
+    async def fails():
+        raise ValueError("oops")
+
+    @job(executor_def=async_executor)
+    def raising_job():
+        fails()
+
+    with instance_for_test() as instance:
+        with pytest.raises(ValueError, match="oops"):
+            execute_pipeline(raising_job, run_config=_run_config(), instance=instance)
+
+
+def test_retries_and_hooks():
+    attempts = []
+    hooked = []
+
+    @success_hook
+    def record_success(context):
+        hooked.append(context.op.name)
+
+    @op(retry_policy=RetryPolicy(max_retries=2), out=Out(int))
+    async def flaky():
+        attempts.append(1)
+        if len(attempts) < 2:
+            raise Exception("not yet")
+        return 1
+
+    @job(executor_def=async_executor, hooks={record_success})
+    def retry_job():
+        flaky()
+
+    with instance_for_test() as instance:
+        result = execute_pipeline(retry_job, run_config=_run_config(), instance=instance)
+        assert result.success
+        assert len(attempts) == 2
+        assert hooked == ["flaky"]
+
@@ -0,0 +1,259 @@
+import asyncio
+import os
+import sys
+import tempfile
+import threading
+import time
+from threading import Thread
+
+import pytest
+from dagster import (
+    AssetObservation,
+    DagsterEventType,
+    IOManager,
+    IOManagerDefinition,
+    Output,
+    _seven,
+    job,
+    op,
+    resource,
+    threaded_executor,
+)
+from dagster._core.test_utils import instance_for_test
+from dagster._legacy import execute_pipeline, execute_pipeline_iterator
+from dagster._utils import send_interrupt
+
+NUM_OPS = 4
+
+
+def _run_config(max_concurrent=None):
+    config = {"max_concurrent": max_concurrent} if max_concurrent else {}
+    return {"execution": {"config": config}}
+
+
+def test_resources_shared_between_concurrent_steps():
+    init_count = []
+    barrier = threading.Barrier(NUM_OPS, timeout=30)
+
+    @resource
+    def counted_resource(_):
+        init_count.append(1)
+        return object()
+
+    @op(required_resource_keys={"shared"})
+    def wait_for_others(context):
+        # only passes once every op is executing at the same time
+        barrier.wait()
+        return id(context.resources.shared)
+
+    @op
+    def collect(ids):
+        return len(set(ids))
+
+    @job(executor_def=threaded_executor, resource_defs={"shared": counted_resource})
+    def shared_resource_job():
+        collect([wait_for_others.alias(f"wait_{i}")() for i in range(NUM_OPS)])
+
+    with instance_for_test() as instance:
+        result = execute_pipeline(
+            shared_resource_job, run_config=_run_config(NUM_OPS), instance=instance
+        )
+        assert result.success
+        assert len(init_count) == 1
+        assert result.result_for_solid("collect").output_value() == 1
+
+
+def test_events_stored_from_main_thread():
+    @op
+    def logging_op(context):
+        context.log.info(f"message from {context.op.name}")
+        return 1
+
+    @job(executor_def=threaded_executor)
+    def logging_job():
+        for i in range(NUM_OPS):
+            logging_op.alias(f"logging_{i}")()
+
+    with instance_for_test() as instance:
+        handle_new_event = instance.handle_new_event
+        storing_threads = set()
+
+        def _handle_new_event(event):
+            storing_threads.add(threading.current_thread())
+            handle_new_event(event)
+
+        instance.handle_new_event = _handle_new_event
+
+        result = execute_pipeline(logging_job, run_config=_run_config(), instance=instance)
+        assert result.success
+        assert storing_threads == {threading.current_thread()}
+
+        messages = [record.user_message for record in instance.all_logs(result.run_id)]
+        for i in range(NUM_OPS):
+            assert f"message from logging_{i}" in messages
+
+        # each step's messages and events are stored in the order the step logged them
+        step_event_types = [
+            record.dagster_event.event_type
+            for record in instance.all_logs(result.run_id)
+            if record.is_dagster_event and record.step_key == "logging_0"
+        ]
+        assert (
+            step_event_types.index(DagsterEventType.STEP_START)
+            < step_event_types.index(DagsterEventType.STEP_OUTPUT)
+            < step_event_types.index(DagsterEventType.STEP_SUCCESS)
+        )
+
+
+def test_per_step_log_capture():
+    @op
+    def noisy(context):
+        for _ in range(3):
+            print(f"stdout from {context.op.name}")  # pylint: disable=print-call
+            sys.stderr.write(f"stderr from {context.op.name}\n")
+            time.sleep(0.01)
+
+    @job(executor_def=threaded_executor)
+    def noisy_job():
+        for i in range(3):
+            noisy.alias(f"noisy_{i}")()
+
+    with instance_for_test() as instance:
+        result = execute_pipeline(noisy_job, run_config=_run_config(), instance=instance)
+        assert result.success
+
+        step_log_keys = {}
+        for event in instance.all_logs(result.run_id, of_type=DagsterEventType.LOGS_CAPTURED):
+            logs_captured_data = event.dagster_event.logs_captured_data
+            if len(logs_captured_data.step_keys) == 1:
+                step_log_keys[logs_captured_data.step_keys[0]] = [
+                    result.run_id,
+                    "compute_logs",
+                    logs_captured_data.file_key,
+                ]
+
+        assert set(step_log_keys.keys()) == {"noisy_0", "noisy_1", "noisy_2"}
+        for step_key, log_key in step_log_keys.items():
+            log_data = instance.compute_log_manager.get_log_data(log_key)
+            stdout = log_data.stdout.decode("utf-8")
+            stderr = log_data.stderr.decode("utf-8")
+            assert stdout == f"stdout from {step_key}\n" * 3
+            assert stderr.count(f"stderr from {step_key}\n") == 3
+            assert stderr.count("stderr from") == 3
+
+
+def test_async_ops():
+    @op
+    async def async_op():
+        await asyncio.sleep(0.01)
+        return 1
+
+    @op
+    def add(first, second):
+        return first + second
+
+    @job(executor_def=threaded_executor)
+    def async_job():
+        add(async_op.alias("first")(), async_op.alias("second")())
+
+    with instance_for_test() as instance:
+        result = execute_pipeline(async_job, run_config=_run_config(), instance=instance)
+        assert result.success
+        assert result.result_for_solid("add").output_value() == 2
+
+
+def _send_kbd_int(temp_files):
+    while not all(os.path.exists(temp_file) for temp_file in temp_files):
+        time.sleep(0.1)
+    send_interrupt()
+
+
+@pytest.mark.skipif(_seven.IS_WINDOWS, reason="Interrupts handled differently on windows")
+def test_interrupt_threaded():
+    with tempfile.TemporaryDirectory() as tempdir:
+        temp_files = [os.path.join(tempdir, f"file_{i}") for i in range(2)]
+
+        @op
+        def write_a_file(context):
+            with open(temp_files[int(context.op.name[-1])], "w", encoding="utf8") as ff:
+                ff.write("yup")
+
+            start_time = time.time()
+            while (time.time() - start_time) < 30:
+                time.sleep(0.1)
+                yield AssetObservation("still_running")
+            yield Output(None)
+
+        @op
+        def should_not_start(_in):
+            assert False
+
+        @job(executor_def=threaded_executor)
+        def interrupted_job():
+            should_not_start(write_a_file.alias("write_0")())
+            write_a_file.alias("write_1")()
+
+        with instance_for_test(temp_dir=tempdir) as instance:
+            Thread(target=_send_kbd_int, args=(temp_files,)).start()
+
+            results = []
+            for result in execute_pipeline_iterator(
+                interrupted_job, run_config=_run_config(), instance=instance
+            ):
+                results.append(result)
+
+            failed_steps = {result.step_key for result in results if result.is_step_failure}
+            assert failed_steps == {"write_0", "write_1"}
+            assert not any(result.step_key == "should_not_start" for result in results)
+            assert DagsterEventType.PIPELINE_FAILURE in [result.event_type for result in results]
+
+
+def test_prefetch_inputs_of_next_step():
+    loaded = {"first": threading.Event(), "second": threading.Event()}
+    load_count = []
+
+    class PrefetchIOManager(IOManager):
+        max_concurrent_loads = 2
+
+        def handle_output(self, context, obj):
+            pass
+
+        def load_input(self, context):
+            load_count.append(context.step_context.step.key)
+            loaded[context.step_context.step.key].set()
+            return 1
+
+    @op
+    def emit():
+        return 1
+
+    def _make_op(name, other_name):
+        @op(name=name)
+        def _op(_value):
+            # the inputs of the other op are loaded while the first op to execute computes
+            return loaded[other_name].wait(timeout=30)
+
+        return _op
+
+    first = _make_op("first", "second")
+    second = _make_op("second", "first")
+
+    @job(
+        executor_def=threaded_executor,
+        resource_defs={"io_manager": IOManagerDefinition.hardcoded_io_manager(PrefetchIOManager())},
+    )
+    def prefetch_job():
+        value = emit()
+        first(value)
+        second(value)
+
+    with instance_for_test() as instance:
+        result = execute_pipeline(
+            prefetch_job,
+            run_config={"execution": {"config": {"max_concurrent": 1, "prefetch_inputs": True}}},
+            instance=instance,
+        )
+        assert result.success
+        assert result.result_for_solid("first").output_value() is True
+        assert result.result_for_solid("second").output_value() is True
+        assert sorted(load_count) == ["first", "second"]
@@ -0,0 +1,105 @@
+import time
+
+from dagster import IOManager, io_manager, job, op
+from dagster._core.execution.plan.objects import StepSuccessData
+from dagster._core.storage.tags import PROFILE_STEPS_TAG
+from dagster._core.test_utils import instance_for_test
+from dagster._serdes import deserialize_as, serialize_dagster_namedtuple
+
+
+class SlowIOManager(IOManager):
+    def __init__(self):
+        self.values = {}
+
+    def handle_output(self, context, obj):
+        time.sleep(0.05)
+        self.values[tuple(context.get_output_identifier())] = obj
+
+    def load_input(self, context):
+        time.sleep(0.05)
+        return self.values[tuple(context.upstream_output.get_output_identifier())]
+
+
+@io_manager
+def slow_io_manager():
+    return SlowIOManager()
+
+
+def spin_for_profile(seconds):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+@op
+def emit_one():
+    return 1
+
+
+@op
+def add_one(num):
+    spin_for_profile(0.1)
+    return num + 1
+
+
+@job(resource_defs={"io_manager": slow_io_manager})
+def slow_job():
+    add_one(emit_one())
+
+
+def _profile_entries_by_label(result, step_key):
+    success_event = next(
+        event
+        for event in result.all_node_events
+        if event.is_step_success and event.step_key == step_key
+    )
+    return {entry.label: entry.value for entry in success_event.step_success_data.metadata_entries}
+
+
+def test_steps_not_profiled_by_default():
+    result = slow_job.execute_in_process()
+    assert result.success
+    assert _profile_entries_by_label(result, "add_one") == {}
+
+
+def test_step_profile():
+    with instance_for_test() as instance:
+        result = slow_job.execute_in_process(instance=instance, tags={PROFILE_STEPS_TAG: "true"})
+        assert result.success
+
+        entries = _profile_entries_by_label(result, "add_one")
+        assert set(entries.keys()) == {
+            "wall_time_ms",
+            "cpu_time_ms",
+            "load_inputs_ms",
+            "compute_ms",
+            "handle_outputs_ms",
+            "process_peak_rss_mb",
+        }
+        assert entries["load_inputs_ms"].value >= 50
+        assert entries["compute_ms"].value >= 100
+        assert entries["handle_outputs_ms"].value >= 50
+        assert entries["cpu_time_ms"].value > 0
+        # sleeping in the io manager and spinning in the op
+        assert entries["wall_time_ms"].value >= 200
+        assert entries["process_peak_rss_mb"].value > 0
+
+        step_stats = {stats.step_key: stats for stats in instance.get_run_step_stats(result.run_id)}
+        assert {
+            entry.label: entry.value for entry in step_stats["add_one"].profile_entries
+        } == entries
+        assert step_stats["emit_one"].profile_entries
+
+
+def test_step_profile_with_stacks():
+    result = slow_job.execute_in_process(tags={PROFILE_STEPS_TAG: "stacks"})
+    assert result.success
+
+    entries = _profile_entries_by_label(result, "add_one")
+    assert "spin_for_profile" in entries["stack_summary"].text
+
+
+def test_step_success_data_serialized_without_empty_metadata():
+    serialized = serialize_dagster_namedtuple(StepSuccessData(duration_ms=10.0))
+    assert serialized == '{"__class__": "StepSuccessData", "duration_ms": 10.0}'
+    assert deserialize_as(serialized, StepSuccessData) == StepSuccessData(duration_ms=10.0)
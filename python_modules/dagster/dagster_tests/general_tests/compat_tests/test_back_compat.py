@@ -12,13 +12,14 @@
 import pytest
 import sqlalchemy as db
 
-from dagster import AssetKey, AssetMaterialization, Output
+from dagster import AssetKey, AssetMaterialization, AssetObservation, Output
 from dagster import _check as check
 from dagster import file_relative_path, job, op
 from dagster._cli.debug import DebugRunPayload
 from dagster._core.definitions.dependency import NodeHandle
 from dagster._core.errors import DagsterInvalidInvocationError
-from dagster._core.events import DagsterEvent
+from dagster._core.event_api import EventRecordsFilter
+from dagster._core.events import DagsterEvent, DagsterEventType
 from dagster._core.events.log import EventLogEntry
 from dagster._core.execution.backfill import BulkActionStatus, PartitionBackfill
 from dagster._core.instance import DagsterInstance, InstanceRef
@@ -1074,3 +1075,54 @@ def test_1_0_17_add_cached_status_data_column():
         with DagsterInstance.from_ref(InstanceRef.from_dir(test_dir)) as instance:
             instance.upgrade()
             assert "cached_status_data" in set(get_sqlite3_columns(db_path, "asset_keys"))
+
+
+def test_add_asset_status_columns():
+    asset_key = AssetKey(["asset_status"])
+
+    @op
+    def observe_and_materialize():
+        yield AssetObservation(asset_key=asset_key)
+        yield AssetMaterialization(asset_key=asset_key)
+        yield Output(1)
+
+    @job
+    def asset_status_job():
+        observe_and_materialize()
+
+    src_dir = file_relative_path(
+        __file__, "snapshot_1_0_17_pre_add_cached_status_data_column/sqlite"
+    )
+    with copy_directory(src_dir) as test_dir:
+        db_path = os.path.join(test_dir, "history", "runs", "index.db")
+        assert get_current_alembic_version(db_path) == "958a9495162d"
+        columns = set(get_sqlite3_columns(db_path, "asset_keys"))
+        assert "last_materialization_storage_id" not in columns
+        assert "last_observation" not in columns
+
+        with DagsterInstance.from_ref(InstanceRef.from_dir(test_dir)) as instance:
+            # the latest status is not tracked before the storage is migrated
+            asset_status_job.execute_in_process(instance=instance)
+            [asset_record] = instance.get_asset_records([asset_key])
+            assert asset_record.asset_entry.last_materialization
+            assert asset_record.asset_entry.last_materialization_storage_id is None
+            assert asset_record.asset_entry.last_observation is None
+
+            instance.upgrade()
+            columns = set(get_sqlite3_columns(db_path, "asset_keys"))
+            assert "last_materialization_storage_id" in columns
+            assert "last_observation" in columns
+
+            result = asset_status_job.execute_in_process(instance=instance)
+            [materialization_record] = instance.get_event_records(
+                EventRecordsFilter(
+                    event_type=DagsterEventType.ASSET_MATERIALIZATION, asset_key=asset_key
+                ),
+                limit=1,
+            )
+            [asset_record] = instance.get_asset_records([asset_key])
+            assert (
+                asset_record.asset_entry.last_materialization_storage_id
+                == materialization_record.storage_id
+            )
+            assert asset_record.asset_entry.last_observation.run_id == result.run_id
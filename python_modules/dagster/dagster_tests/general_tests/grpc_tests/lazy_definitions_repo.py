@@ -0,0 +1,20 @@
+from dagster import job, op, repository
+
+
+@op
+def my_op():
+    return 1
+
+
+@job
+def good_job():
+    my_op()
+
+
+def define_broken_job():
+    raise Exception("broken_job was constructed")
+
+
+@repository
+def lazy_definitions_repo():
+    return {"jobs": {"good_job": lambda: good_job, "broken_job": define_broken_job}}
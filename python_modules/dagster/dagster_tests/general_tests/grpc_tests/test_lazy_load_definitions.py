@@ -0,0 +1,98 @@
+import sys
+from contextlib import ExitStack
+
+import pytest
+
+from dagster._api.list_repositories import sync_list_repositories_grpc
+from dagster._core.errors import DagsterUserCodeProcessError
+from dagster._core.host_representation.origin import (
+    ManagedGrpcPythonEnvRepositoryLocationOrigin,
+)
+from dagster._core.origin import DEFAULT_DAGSTER_ENTRY_POINT
+from dagster._core.test_utils import instance_for_test
+from dagster._core.types.loadable_target_origin import LoadableTargetOrigin
+from dagster._core.workspace.context import WorkspaceProcessContext
+from dagster._daemon.controller import create_daemon_grpc_server_registry
+from dagster._grpc.server import GrpcServerProcess, LoadedRepositories
+from dagster._utils import file_relative_path
+
+
+def _lazy_definitions_target_origin():
+    return LoadableTargetOrigin(
+        executable_path=sys.executable,
+        python_file=file_relative_path(__file__, "lazy_definitions_repo.py"),
+    )
+
+
+def test_loaded_repositories_lazy_load_definitions():
+    with pytest.raises(Exception, match="broken_job was constructed"):
+        LoadedRepositories(_lazy_definitions_target_origin(), DEFAULT_DAGSTER_ENTRY_POINT)
+
+    loaded_repositories = LoadedRepositories(
+        _lazy_definitions_target_origin(),
+        DEFAULT_DAGSTER_ENTRY_POINT,
+        lazy_load_definitions=True,
+    )
+    repo_def = loaded_repositories.definitions_by_name["lazy_definitions_repo"]
+    assert repo_def.get_job("good_job").name == "good_job"
+
+    # definitions are only constructed once a request refers to them
+    with pytest.raises(Exception, match="broken_job was constructed"):
+        repo_def.get_job("broken_job")
+
+
+@pytest.mark.parametrize("lazy_load_definitions", [True, False])
+def test_grpc_server_lazy_load_definitions(lazy_load_definitions):
+    with instance_for_test() as instance:
+        server_process = GrpcServerProcess(
+            instance_ref=instance.get_ref(),
+            loadable_target_origin=_lazy_definitions_target_origin(),
+            lazy_load_definitions=lazy_load_definitions,
+        )
+        try:
+            with server_process.create_ephemeral_client() as client:
+                if lazy_load_definitions:
+                    list_repositories_response = sync_list_repositories_grpc(client)
+                    assert [
+                        symbol.repository_name
+                        for symbol in list_repositories_response.repository_symbols
+                    ] == ["lazy_definitions_repo"]
+                else:
+                    with pytest.raises(
+                        DagsterUserCodeProcessError, match="broken_job was constructed"
+                    ):
+                        sync_list_repositories_grpc(client)
+        finally:
+            server_process.wait()
+
+
+@pytest.mark.parametrize("lazy_load_definitions", [True, False])
+def test_instance_lazy_load_definitions_setting(lazy_load_definitions):
+    origin = ManagedGrpcPythonEnvRepositoryLocationOrigin(
+        loadable_target_origin=_lazy_definitions_target_origin(),
+        location_name="lazy_definitions_location",
+    )
+    with instance_for_test(
+        overrides={"code_servers": {"lazy_load_definitions": lazy_load_definitions}}
+    ) as instance:
+        with ExitStack() as stack:
+            # the servers launched for the daemon and for dagit both follow the instance setting
+            registries = [
+                stack.enter_context(create_daemon_grpc_server_registry(instance)),
+                stack.enter_context(
+                    WorkspaceProcessContext(instance, workspace_load_target=None)
+                )._grpc_server_registry,  # pylint: disable=protected-access
+            ]
+            for registry in registries:
+                client = registry.get_grpc_endpoint(origin).create_client()
+                if lazy_load_definitions:
+                    list_repositories_response = sync_list_repositories_grpc(client)
+                    assert [
+                        symbol.repository_name
+                        for symbol in list_repositories_response.repository_symbols
+                    ] == ["lazy_definitions_repo"]
+                else:
+                    with pytest.raises(
+                        DagsterUserCodeProcessError, match="broken_job was constructed"
+                    ):
+                        sync_list_repositories_grpc(client)
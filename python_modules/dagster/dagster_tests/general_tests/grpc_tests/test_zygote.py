@@ -0,0 +1,119 @@
+import os
+import signal
+import sys
+
+import pytest
+
+from dagster import _seven as seven
+from dagster._api.list_repositories import sync_list_repositories_grpc
+from dagster._core.host_representation.grpc_server_registry import ProcessGrpcServerRegistry
+from dagster._core.host_representation.origin import ManagedGrpcPythonEnvRepositoryLocationOrigin
+from dagster._core.host_representation.repository_location import GrpcServerRepositoryLocation
+from dagster._core.test_utils import instance_for_test
+from dagster._core.types.loadable_target_origin import LoadableTargetOrigin
+from dagster._grpc.zygote import UNKNOWN_FORKED_SERVER_RETURN_CODE, GrpcServerZygote
+from dagster._utils import file_relative_path
+
+pytestmark = pytest.mark.skipif(seven.IS_WINDOWS, reason="zygotes are not supported on Windows")
+
+
+def _grpc_repo_target_origin():
+    return LoadableTargetOrigin(
+        executable_path=sys.executable,
+        python_file=file_relative_path(__file__, "grpc_repo.py"),
+        attribute="bar_repo",
+    )
+
+
+def test_fork_servers_from_zygote():
+    with instance_for_test() as instance:
+        zygote = GrpcServerZygote(
+            instance_ref=instance.get_ref(),
+            loadable_target_origin=_grpc_repo_target_origin(),
+        )
+        try:
+            first = zygote.fork_server()
+            second = zygote.fork_server()
+
+            assert first.pid != second.pid
+            assert zygote.zygote_process.pid not in (first.pid, second.pid)
+
+            for server_process in [first, second]:
+                client = server_process.create_ephemeral_client()
+                assert client.ping("foobar") == "foobar"
+                response = sync_list_repositories_grpc(client)
+                assert [symbol.repository_name for symbol in response.repository_symbols] == [
+                    "bar_repo"
+                ]
+                client.cleanup_server()
+                server_process.wait()
+                assert server_process.server_process.poll() == 0
+
+            # the zygote keeps running after the servers forked from it shut down
+            assert zygote.is_alive()
+        finally:
+            zygote.shutdown()
+
+        assert not zygote.is_alive()
+
+
+def test_forked_server_exit_codes():
+    with instance_for_test() as instance:
+        zygote = GrpcServerZygote(
+            instance_ref=instance.get_ref(),
+            loadable_target_origin=_grpc_repo_target_origin(),
+        )
+        try:
+            server_process = zygote.fork_server()
+            os.kill(server_process.pid, signal.SIGKILL)
+            server_process.wait()
+            # the zygote that reaped the server reports how it exited
+            assert server_process.server_process.returncode == -signal.SIGKILL
+
+            orphaned_server_process = zygote.fork_server()
+        finally:
+            zygote.shutdown()
+
+        # once the zygote has exited, the exit code of the servers forked from it is unknown
+        os.kill(orphaned_server_process.pid, signal.SIGKILL)
+        orphaned_server_process.wait()
+        assert (
+            orphaned_server_process.server_process.returncode == UNKNOWN_FORKED_SERVER_RETURN_CODE
+        )
+
+
+def test_registry_with_zygotes():
+    origin = ManagedGrpcPythonEnvRepositoryLocationOrigin(
+        loadable_target_origin=_grpc_repo_target_origin(),
+        location_name="bar_location",
+    )
+    with instance_for_test() as instance:
+        with ProcessGrpcServerRegistry(
+            instance=instance,
+            reload_interval=0,
+            heartbeat_ttl=30,
+            startup_timeout=20,
+            use_zygotes=True,
+        ) as registry:
+            endpoint = registry.get_grpc_endpoint(origin)
+            with GrpcServerRepositoryLocation(
+                origin=origin,
+                server_id=endpoint.server_id,
+                port=endpoint.port,
+                socket=endpoint.socket,
+                host=endpoint.host,
+                watch_server=False,
+            ) as location:
+                assert location.has_repository("bar_repo")
+
+            zygote = registry._zygotes[origin.get_id()]  # pylint: disable=protected-access
+
+            # reloading restarts the zygote so that code changes are picked up
+            new_endpoint = registry.reload_grpc_endpoint(origin)
+            assert new_endpoint.server_id != endpoint.server_id
+            assert not zygote.is_alive()
+            new_zygote = registry._zygotes[origin.get_id()]  # pylint: disable=protected-access
+            assert new_zygote.is_alive()
+
+        assert not new_zygote.is_alive()
+        registry.wait_for_processes()
@@ -7,6 +7,7 @@
 import pendulum
 import pytest
 
+import dagster._scheduler.scheduler as scheduler_module
 from dagster import (
     Any,
     AssetKey,
@@ -973,6 +974,68 @@ def test_bad_env_fn_with_retries(instance, workspace_context, external_repo, exe
         )
 
 
+@pytest.mark.parametrize("executor", get_schedule_executors())
+def test_no_catchup_evaluations_after_failure(
+    monkeypatch, instance, workspace_context, external_repo, executor
+):
+    evaluated_ticks = []
+
+    def _record_schedule_execution_results(workspace_process_context, schedule_ticks):
+        evaluated_ticks.extend(
+            (external_schedule.name, tick_time) for external_schedule, tick_time in schedule_ticks
+        )
+        return get_schedule_execution_results(workspace_process_context, schedule_ticks)
+
+    def _record_schedule_execution_result(workspace_process_context, external_schedule, tick_time):
+        evaluated_ticks.append((external_schedule.name, tick_time))
+        return get_schedule_execution_result(
+            workspace_process_context, external_schedule, tick_time
+        )
+
+    get_schedule_execution_results = scheduler_module._get_schedule_execution_results
+    get_schedule_execution_result = scheduler_module._get_schedule_execution_result
+    monkeypatch.setattr(
+        scheduler_module, "_get_schedule_execution_results", _record_schedule_execution_results
+    )
+    monkeypatch.setattr(
+        scheduler_module, "_get_schedule_execution_result", _record_schedule_execution_result
+    )
+
+    good_schedule = external_repo.get_external_schedule("simple_schedule")
+    bad_schedule = external_repo.get_external_schedule("bad_env_fn_schedule")
+    initial_datetime = create_pendulum_time(year=2019, month=2, day=27, hour=0, minute=0, second=0)
+    with pendulum.test(initial_datetime):
+        instance.start_schedule(good_schedule)
+        instance.start_schedule(bad_schedule)
+
+    with pendulum.test(initial_datetime.add(days=2)):
+        evaluate_schedules(workspace_context, executor, pendulum.now("UTC"))
+
+        # each tick that a schedule catches up on is only evaluated once the tick before it has
+        # succeeded
+        assert instance.get_runs_count() == 3
+        assert sorted(evaluated_ticks) == [
+            ("bad_env_fn_schedule", initial_datetime),
+            ("simple_schedule", initial_datetime),
+            ("simple_schedule", initial_datetime.add(days=1)),
+            ("simple_schedule", initial_datetime.add(days=2)),
+        ]
+
+        bad_ticks = instance.get_ticks(
+            bad_schedule.get_external_origin_id(), bad_schedule.selector_id
+        )
+        assert len(bad_ticks) == 1
+        validate_tick(
+            bad_ticks[0],
+            bad_schedule,
+            initial_datetime,
+            TickStatus.FAILURE,
+            [],
+            "Error occurred during the execution of run_config_fn for schedule bad_env_fn_schedule",
+            expected_failure_count=1,
+        )
+
+
 @pytest.mark.parametrize("executor", get_schedule_executors())
 def test_passes_on_retry(instance, workspace_context, external_repo, executor):
     # We need to use different keys across sync and async executors, as the dictionary is persisted across processes.
@@ -120,11 +120,16 @@ def create_clean_storage(conn_string):
         MySQLEventLogStorage.wipe_storage(conn_string)
         return MySQLEventLogStorage(conn_string)
 
-    def store_asset_event(self, event):
+    def store_asset_event(self, event, event_id=None):
         # last_materialization_timestamp is updated upon observation, materialization, materialization_planned
         # See SqlEventLogStorage.store_asset_event method for more details
 
-        values = self._get_asset_entry_values(event, self.has_secondary_index(ASSET_KEY_INDEX_COLS))
+        values = self._get_asset_entry_values(
+            event,
+            event_id,
+            self.has_secondary_index(ASSET_KEY_INDEX_COLS),
+            self.has_asset_status_cols(),
+        )
         with self.index_connection() as conn:
             if values:
                 conn.execute(
@@ -394,6 +394,53 @@ def apply_ignore_missing_data_to_mask(mask, column):
     return mask & ~column.isnull()
 
 
+def vectorized(vectorized_fn):
+    """
+    decorator for column validation functions, which supplies an implementation of the validation
+    that runs over a whole column at once, rather than calling the function on each value
+    Usage:
+        decorate column validators that are passed to
+        :py:class:'~dagster_pandas.constraints.ColumnConstraintWithMetadata'
+        or :py:class:'~dagster_pandas.constraints.MultiColumnConstraintWithMetadata'
+    Args:
+        vectorized_fn (Callable[[pd.Series], Optional[pd.Series]]): takes the column and returns a
+            boolean series that is True for the valid values, or None if it can't validate the
+            column, in which case the decorated function is called on each value instead
+    Example:
+        .. code-block:: python
+            @vectorized(lambda column: column > 0)
+            def positive_validation_fn(x):
+                return x > 0, {}
+    """
+
+    def decorator(validation_fn):
+        validation_fn.vectorized_fn = vectorized_fn
+        return validation_fn
+
+    return decorator
+
+
+def _invalid_values(validation_fn, column):
+    # returns a boolean series that is True for the values that fail the validation function
+    if len(column) == 0:
+        return pd.Series(False, index=column.index, dtype=bool)
+    vectorized_fn = getattr(validation_fn, "vectorized_fn", None)
+    valid = vectorized_fn(column) if vectorized_fn is not None else None
+    if valid is None:
+        return column.apply(lambda x: not validation_fn(x)[0])
+    return ~valid
+
+
+def _uniform_value_type(column):
+    """
+    The Python type of the values of a column of booleans or numbers, which validation functions
+    receive all values of the column as, or None for columns whose values may be of different types
+    """
+    if pd.api.types.is_extension_array_dtype(column.dtype) or column.dtype.kind not in "biuf":
+        return None
+    return type(column.iloc[:1].astype(object).iloc[0])
+
+
 class ColumnAggregateConstraintWithMetadata(ConstraintWithMetadata):
     """
     Similar to the base class, but now your validation functions should take in columns (pd.Series) not Dataframes.
@@ -473,9 +520,8 @@ def validate(self, data, *columns, **kwargs):
         offending = {}
         offending_values = {}
         # TODO:  grab metadata from here
-        inverse_validation = lambda x: not self.validation_fn(x)[0]
         for column in columns:
-            results = relevant_data[relevant_data[column].apply(inverse_validation)]
+            results = relevant_data[_invalid_values(self.validation_fn, relevant_data[column])]
             if len(results.index.tolist()) > 0:
                 offending[column] = ["row " + str(i) for i in (results.index.tolist())]
                 offending_values[column] = results[column].tolist()
@@ -619,6 +665,7 @@ def __init__(
         )
 
 
+@vectorized(lambda column: column.notnull())
 def non_null_validation(x):
     """
     validates that a particular value in a column is not null
@@ -690,6 +737,15 @@ def nvalidator(val):
 
     nvalidator.__doc__ += " and ensures no values are null"
 
+    vectorized_fn = getattr(func, "vectorized_fn", None)
+    if vectorized_fn is not None:
+
+        def vectorized_nvalidator(column):
+            valid = vectorized_fn(column)
+            return None if valid is None else valid & column.notnull()
+
+        nvalidator.vectorized_fn = vectorized_nvalidator
+
     return nvalidator
 
 
@@ -741,6 +797,19 @@ def create_dataframe(_):
         else:
             maxim = sys.maxsize
 
+    def vectorized_in_range_validation_fn(column):
+        value_type = _uniform_value_type(column)
+        if value_type is None:
+            return None
+        if issubclass(value_type, (type(minim), type(maxim))):
+            valid = (column >= minim) & (column <= maxim)
+        else:
+            valid = pd.Series(False, index=column.index)
+        if ignore_missing_vals:
+            valid |= column.isnull()
+        return valid
+
+    @vectorized(vectorized_in_range_validation_fn)
     def in_range_validation_fn(x):
         if ignore_missing_vals and pd.isnull(x):
             return True, {}
@@ -795,7 +864,24 @@ def create_dataframe(_):
     """
 
     categories = set(categories)
+    # isin matches missing values to missing categories, unlike membership of the set
+    can_vectorize = all(
+        isinstance(category, (str, int, float)) and category == category for category in categories
+    )
 
+    def vectorized_categorical_validation_fn(column):
+        if (
+            not can_vectorize
+            or pd.api.types.is_extension_array_dtype(column.dtype)
+            or column.dtype.kind not in "iufO"
+        ):
+            return None
+        valid = column.isin(categories)
+        if ignore_missing_vals:
+            valid |= column.isnull()
+        return valid
+
+    @vectorized(vectorized_categorical_validation_fn)
     def categorical_validation_fn(x):
         if ignore_missing_vals and pd.isnull(x):
             return True, {}
@@ -849,6 +935,16 @@ def create_dataframe(_):
 
     """
 
+    def vectorized_dtype_in_set_validation_fn(column):
+        value_type = _uniform_value_type(column)
+        if value_type is None:
+            return None
+        valid = pd.Series(issubclass(value_type, datatypes), index=column.index)
+        if ignore_missing_vals:
+            valid |= column.isnull()
+        return valid
+
+    @vectorized(vectorized_dtype_in_set_validation_fn)
     def dtype_in_set_validation_fn(x):
         if ignore_missing_vals and pd.isnull(x):
             return True, {}
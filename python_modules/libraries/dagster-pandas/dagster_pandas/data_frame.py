@@ -4,7 +4,7 @@
     ColumnDTypeInSetConstraint,
     ConstraintViolationException,
 )
-from dagster_pandas.validation import PandasColumn, validate_constraints
+from dagster_pandas.validation import PandasColumn, sample_rows, validate_constraints
 
 from dagster import (
     AssetMaterialization,
@@ -162,6 +162,7 @@ def create_dagster_pandas_dataframe_type(
     dataframe_constraints=None,
     loader=None,
     materializer=None,
+    sample_size=None,
 ):
     """
     Constructs a custom pandas dataframe dagster type.
@@ -182,12 +183,18 @@ def create_dagster_pandas_dataframe_type(
         materializer (Optional[DagsterTypeMaterializer]): An instance of a class
             that inherits from :py:class:`~dagster.DagsterTypeMaterializer`. If None, we will
             default to using `dataframe_materializer`.
+        sample_size (Optional[int]): If set, the column constraints are validated on a random
+            sample of this many rows of dataframes that have more rows, rather than on every row.
+            This makes type checks of large dataframes faster, but violations in the rows that are
+            not sampled go undetected. Uniqueness constraints and dataframe constraints are
+            validated on every row.
     """
     # We allow for the plugging in of dagster_type_loaders/materializers so that
     # Users can load and materialize their custom dataframes via configuration their own way if the default
     # configs don't suffice. This is purely optional.
     check.str_param(name, "name")
     event_metadata_fn = check.opt_callable_param(event_metadata_fn, "event_metadata_fn")
+    sample_size = check.opt_int_param(sample_size, "sample_size")
     description = create_dagster_pandas_dataframe_description(
         check.opt_str_param(description, "description", default=""),
         check.opt_list_param(columns, "columns", of_type=PandasColumn),
@@ -207,12 +214,14 @@ def _dagster_type_check(_, value):
                 value,
                 pandas_columns=columns,
                 dataframe_constraints=dataframe_constraints,
+                sample_size=sample_size,
             )
         except ConstraintViolationException as e:
             return TypeCheck(success=False, description=str(e))
 
         return TypeCheck(
             success=True,
+            description=_sample_description(value, sample_size),
             metadata_entries=_execute_summary_stats(name, value, event_metadata_fn)
             if event_metadata_fn
             else None,
@@ -236,6 +245,7 @@ def create_structured_dataframe_type(
     dataframe_validator=None,
     loader=None,
     materializer=None,
+    sample_size=None,
 ):
     """
 
@@ -258,11 +268,15 @@ def create_structured_dataframe_type(
         materializer (Optional[DagsterTypeMaterializer]): An instance of a class
             that inherits from :py:class:`~dagster.DagsterTypeMaterializer`. If None, we will
             default to using `dataframe_materializer`.
+        sample_size (Optional[int]): If set, the column validation is run on a random sample of
+            this many rows of dataframes that have more rows, rather than on every row. The column
+            aggregate and dataframe validations are run on every row.
 
     Returns:
         a DagsterType with the corresponding name and packaged validation.
 
     """
+    sample_size = check.opt_int_param(sample_size, "sample_size")
 
     def _dagster_type_check(_, value):
         if not isinstance(value, pd.DataFrame):
@@ -273,13 +287,16 @@ def _dagster_type_check(_, value):
                 ),
             )
         individual_result_dict = {}
+        sample = sample_rows(value, sample_size)
 
         if dataframe_validator is not None:
             individual_result_dict["dataframe"] = dataframe_validator.validate(value)
         if columns_validator is not None:
-            individual_result_dict["columns"] = columns_validator.validate(value)
+            individual_result_dict["columns"] = columns_validator.validate(sample)
 
         if columns_aggregate_validator is not None:
+            # aggregates such as uniqueness are properties of whole columns, not of each row, so
+            # they can't be validated on a sample
             individual_result_dict["column-aggregates"] = columns_aggregate_validator.validate(
                 value
             )
@@ -318,6 +335,14 @@ def _dagster_type_check(_, value):
     )
 
 
+def _sample_description(value, sample_size):
+    if sample_size is None or len(value) <= sample_size:
+        return None
+    return "Validated the per-row column constraints on a random sample of {} of {} rows.".format(
+        sample_size, len(value)
+    )
+
+
 def _execute_summary_stats(type_name, value, event_metadata_fn):
     if not event_metadata_fn:
         return []
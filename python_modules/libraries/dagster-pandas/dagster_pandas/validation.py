@@ -377,7 +377,25 @@ def categorical_column(
         )
 
 
-def validate_constraints(dataframe, pandas_columns=None, dataframe_constraints=None):
+def sample_rows(dataframe, sample_size):
+    """Returns a random sample of sample_size rows of the dataframe, or the whole dataframe if it
+    doesn't have more rows than that. The sampled rows keep their index labels, so that the
+    offending rows reported by constraints refer to the rows of the whole dataframe.
+
+    Only constraints that hold for each row on its own can be checked on a sample. Uniqueness, as
+    checked by UniqueColumnConstraint or all_unique_validator, is a property of the whole column
+    rather than of each row, so a sample can't show that it holds.
+    """
+    dataframe = check.inst_param(dataframe, "dataframe", DataFrame)
+    sample_size = check.opt_int_param(sample_size, "sample_size")
+    if sample_size is None or len(dataframe) <= sample_size:
+        return dataframe
+    return dataframe.sample(n=sample_size)
+
+
+def validate_constraints(
+    dataframe, pandas_columns=None, dataframe_constraints=None, sample_size=None
+):
     dataframe = check.inst_param(dataframe, "dataframe", DataFrame)
     pandas_columns = check.opt_list_param(
         pandas_columns, "column_constraints", of_type=PandasColumn
@@ -387,8 +405,15 @@ def validate_constraints(dataframe, pandas_columns=None, dataframe_constraints=N
     )
 
     if pandas_columns:
+        # column constraints other than uniqueness hold for every row, so can be checked on a sample
+        # of the rows, unlike dataframe constraints such as the row count
+        sample = sample_rows(dataframe, sample_size)
         for column in pandas_columns:
-            column.validate(dataframe)
+            column.validate(sample)
+            if sample is not dataframe and column.name in dataframe.columns:
+                for constraint in column.constraints:
+                    if isinstance(constraint, UniqueColumnConstraint):
+                        constraint.validate(dataframe, column.name)
 
     if dataframe_constraints:
         for dataframe_constraint in dataframe_constraints:
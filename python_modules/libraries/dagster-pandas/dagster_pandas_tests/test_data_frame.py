@@ -102,6 +102,33 @@ def test_bad_dataframe_type_returns_bad_stuff():
         check_dagster_type(BadDFBadSummaryStatsListItem, DataFrame({"num": [1]}))
 
 
+def test_create_dagster_pandas_dataframe_type_with_sample_size():
+    SampledDF = create_dagster_pandas_dataframe_type(
+        name="SampledDF",
+        columns=[PandasColumn.integer_column("pid", non_nullable=True, unique=True)],
+        sample_size=10,
+    )
+
+    type_check = check_dagster_type(SampledDF, DataFrame({"pid": range(100)}))
+    assert type_check.success
+    assert type_check.description == (
+        "Validated the per-row column constraints on a random sample of 10 of 100 rows."
+    )
+
+    # every sampled row violates the constraint
+    type_check = check_dagster_type(SampledDF, DataFrame({"pid": [None] * 100}))
+    assert not type_check.success
+
+    type_check = check_dagster_type(SampledDF, DataFrame({"pid": range(5)}))
+    assert type_check.success
+    assert type_check.description is None
+
+    # uniqueness isn't a property of each row, so is validated on every row
+    type_check = check_dagster_type(SampledDF, DataFrame({"pid": [*range(99), 0]}))
+    assert not type_check.success
+    assert "Column must be unique" in type_check.description
+
+
 def test_dataframe_description_generation_just_type_constraint():
     TestDataFrame = create_dagster_pandas_dataframe_type(
         name="TestDataFrame",
@@ -13,7 +13,7 @@
 from numpy import float64, int64
 from pandas import DataFrame
 
-from dagster import DagsterType, Out, Output, graph, op
+from dagster import DagsterType, Out, Output, check_dagster_type, graph, op
 
 dtype_is_num_validator = nonnull(dtype_in_set_validation_factory((int, float, int64, float64)))
 
@@ -148,6 +148,31 @@ def basic_graph():
     assert column_const_data["actual"] == {"bar": {"all_unique_validator": [10.0]}}
 
 
+def test_sampled_type_eval_aggregate():
+    ntype = create_structured_dataframe_type(
+        "NumericType",
+        columns_validator=column_validator,
+        columns_aggregate_validator=aggregate_validator,
+        sample_size=10,
+    )
+
+    type_check = check_dagster_type(ntype, DataFrame({"foo": [1] * 100, "bar": range(100)}))
+    assert type_check.success
+
+    # the aggregates are validated on every row rather than on the sample, since uniqueness isn't a
+    # property of each row
+    type_check = check_dagster_type(
+        ntype, DataFrame({"foo": [1] * 100, "bar": [*range(99), 0]})
+    )
+    assert not type_check.success
+    assert [entry.label for entry in type_check.metadata_entries] == [
+        "column-aggregates-constraint-metadata"
+    ]
+    assert type_check.metadata_entries[0].entry_data.data["actual"] == {
+        "bar": {"all_unique_validator": [0]}
+    }
+
+
 def test_failing_type_eval_dataframe():
     ntype = create_structured_dataframe_type(
         "NumericType",
@@ -1,12 +1,16 @@
 from dagster_pandas.constraints import (
+    ColumnConstraintWithMetadata,
+    ColumnWithMetadataException,
     all_unique_validator,
     categorical_column_validator_factory,
     column_range_validation_factory,
     dtype_in_set_validation_factory,
     non_null_validation,
     nonnull,
+    vectorized,
 )
 from numpy import nan as NaN
+from pandas import DataFrame, Series
 
 
 def test_unique():
@@ -52,3 +56,56 @@ def test_categorical():
     assert testfunc("b")[0]
     assert testfunc(NaN)[0]
     assert not testfunc("c")[0]
+
+
+def _invalid_rows(validation_fn, column):
+    validator = ColumnConstraintWithMetadata(
+        "test", validation_fn, ColumnWithMetadataException, raise_or_typecheck=False
+    )
+    result = validator.validate(DataFrame({"foo": column}), "foo")
+    if result.success:
+        return []
+    return result.metadata_entries[0].entry_data.data["offending"]["foo"]
+
+
+def test_vectorized_validators_match_values():
+    columns = [
+        [1, 5, 20, -3],
+        [1.0, 5.5, NaN, 20.0],
+        [True, False, True],
+        ["a", "b", "c", None],
+        [1, "a", 2.5, None],
+    ]
+    validation_fns = [
+        column_range_validation_factory(minim=0, maxim=10),
+        column_range_validation_factory(minim=0.0, maxim=10.0, ignore_missing_vals=True),
+        categorical_column_validator_factory(["a", "b", 1], ignore_missing_vals=True),
+        dtype_in_set_validation_factory((int, float)),
+        nonnull(dtype_in_set_validation_factory(float)),
+        non_null_validation,
+    ]
+    for validation_fn in validation_fns:
+        assert validation_fn.vectorized_fn is not None
+        for column in columns:
+            expected = [
+                "row " + str(i) for i, value in enumerate(column) if not validation_fn(value)[0]
+            ]
+            assert _invalid_rows(validation_fn, column) == expected
+
+
+def test_vectorized_decorator():
+    calls = []
+
+    def positive_column(column):
+        calls.append(len(column))
+        return None if column.dtype.kind == "O" else column > 0
+
+    @vectorized(positive_column)
+    def positive_validation_fn(x):
+        """checks whether values are positive"""
+        return x > 0, {}
+
+    assert _invalid_rows(positive_validation_fn, [1, -1, 2]) == ["row 1"]
+    # columns that the vectorized function can't validate are validated value by value
+    assert _invalid_rows(positive_validation_fn, Series([1, -1, 2], dtype=object)) == ["row 1"]
+    assert calls == [3, 3]
@@ -169,17 +169,17 @@ def store_event(self, event):
             and event.dagster_event_type in ASSET_EVENTS
             and event.dagster_event.asset_key
         ):
-            self.store_asset_event(event)
-
             if res[1] is None:
                 raise DagsterInvariantViolationError(
                     "Cannot store asset event tags for null event id."
                 )
 
+            self.store_asset_event(event, res[1])
             self.store_asset_event_tags(event, res[1])
 
-    def store_asset_event(self, event: EventLogEntry):
+    def store_asset_event(self, event: EventLogEntry, event_id: Optional[int] = None):
         check.inst_param(event, "event", EventLogEntry)
+        check.opt_int_param(event_id, "event_id")
         if not (event.dagster_event and event.dagster_event.asset_key):
             return
 
@@ -213,7 +213,12 @@ def store_asset_event(self, event: EventLogEntry):
         # run id for a set of assets in one roundtrip call to event log storage.
         # https://github.com/dagster-io/dagster/pull/7319
 
-        values = self._get_asset_entry_values(event, self.has_secondary_index(ASSET_KEY_INDEX_COLS))
+        values = self._get_asset_entry_values(
+            event,
+            event_id,
+            self.has_secondary_index(ASSET_KEY_INDEX_COLS),
+            self.has_asset_status_cols(),
+        )
         with self.index_connection() as conn:
             query = db.dialects.postgresql.insert(AssetKeyTable).values(
                 asset_key=event.dagster_event.asset_key.to_string(),